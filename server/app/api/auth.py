@@ -19,7 +19,7 @@ router = APIRouter()
 
 
 @router.post("/signup", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-async def signup(signup_data: SignUpRequest, db: Session = Depends(get_db)):
+def signup(signup_data: SignUpRequest, db: Session = Depends(get_db)):
     """
     Register a new user account.
     
@@ -44,7 +44,7 @@ async def signup(signup_data: SignUpRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/signin", response_model=TokenResponse)
-async def signin(signin_data: SignInRequest, db: Session = Depends(get_db)):
+def signin(signin_data: SignInRequest, db: Session = Depends(get_db)):
     """
     Authenticate user and generate access token.
     
@@ -1,17 +1,25 @@
 from io import BytesIO
 import re
+from typing import Tuple, cast
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
 
+from app.core.database import get_db
+from app.core.quota import COVER_LETTER_PROMPT_TOKENS, charge_llm_quota, estimate_tokens
 from app.core.rate_limit import limiter
 from app.models.database.user import User
-from app.models.cover_letter import CoverLetterGenerateRequest, CoverLetterGenerateResponse
+from app.models.cover_letter import CoverLetterGenerateRequest, CoverLetterGenerateResponse, CoverLetterJobResponse
+from app.services import cover_letter_job_service, resume_library_service
 from app.services.cover_letter_service import generate_cover_letter
 from app.services.cover_letter_store import get_cover_letter_store
 from app.services.pdf_service import render_cover_letter_pdf
 from app.utils.security import get_current_user
-from app.utils.sanitization import _INJECTION_PATTERNS, MAX_WORDS
+from app.utils.prompt_compaction import compact_for_prompt
+from app.utils.sanitization import MAX_WORDS, preflight
 
 
 router = APIRouter()
@@ -19,12 +27,6 @@ router = APIRouter()
 _FILENAME_UNSAFE = re.compile(r"[^A-Za-z0-9._-]+")
 
 
-def _raise_if_injection_detected(value: str) -> None:
-    for pattern, message in _INJECTION_PATTERNS:
-        if pattern.search(value):
-            raise HTTPException(status_code=400, detail=message)
-
-
 def _build_pdf_filename(job_title: str) -> str:
     safe_title = _FILENAME_UNSAFE.sub("-", job_title.strip()).strip("-")
     if not safe_title:
@@ -32,20 +34,20 @@ def _build_pdf_filename(job_title: str) -> str:
     return f"{safe_title.lower()}.pdf"
 
 
-@router.post("/cover-letter/generate", response_model=CoverLetterGenerateResponse)
-@limiter.limit("5/hour")
-async def generate_cover_letter_endpoint(
+def _check_request(
     request: Request,
+    response: Response,
     payload: CoverLetterGenerateRequest,
-    current_user: User = Depends(get_current_user),
-):
+    current_user: User,
+    db: Session,
+) -> Tuple[CoverLetterGenerateRequest, str, str]:
     """
-    Generate a tailored cover letter using AI.
+    Run the text-security and size checks and charge the caller's LLM quota.
 
-    Applies text-security validation and content-size checks before generation.
+    Returns the request and the applicant's name as normalized by preflight,
+    i.e. exactly the text that was scanned and is sent to the model, and the
+    text of the stored resume the request references, or "".
     """
-    del request
-
     if not payload.job_title:
         raise HTTPException(status_code=400, detail="Job title is required.")
 
@@ -60,23 +62,67 @@ async def generate_cover_letter_endpoint(
         *payload.requirements,
     ]
 
-    for value in fields_to_scan:
-        if value:
-            _raise_if_injection_detected(value)
+    checks = [preflight(value) for value in fields_to_scan]
+    for checked in checks:
+        if checked.disallowed:
+            raise HTTPException(status_code=400, detail=checked.disallowed)
 
-    combined_text = " ".join(fields_to_scan)
-    word_count = len(combined_text.split())
+    word_count = sum(checked.word_count for checked in checks)
     if word_count > MAX_WORDS:
         raise HTTPException(
             status_code=400,
             detail=f"Input exceeds the {MAX_WORDS:,} word limit ({word_count:,} words). Please shorten it and try again.",
         )
 
+    resume_text = ""
+    if payload.resume_id is not None:
+        stored = resume_library_service.get_resume(db, cast(UUID, current_user.id), payload.resume_id)
+        resume_text = compact_for_prompt(str(stored.text))
+
+    combined_text = " ".join(checked.text for checked in checks)
+    charge_llm_quota(
+        request,
+        response,
+        cost=COVER_LETTER_PROMPT_TOKENS + estimate_tokens(combined_text) + estimate_tokens(resume_text),
+    )
+
+    job_title, hiring_manager_name, email, phone, company, first_name, last_name, *requirements = (
+        checked.text for checked in checks
+    )
+    checked_payload = payload.model_copy(update={
+        "job_title": job_title,
+        "hiring_manager_name": hiring_manager_name,
+        "email": email,
+        "phone": phone,
+        "company": company,
+        "requirements": requirements,
+    })
+    return checked_payload, f"{first_name} {last_name}".strip(), resume_text
+
+
+@router.post("/cover-letter/generate", response_model=CoverLetterGenerateResponse)
+@limiter.limit("5/hour")
+async def generate_cover_letter_endpoint(
+    request: Request,
+    response: Response,
+    payload: CoverLetterGenerateRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Generate a tailored cover letter using AI.
+
+    Applies text-security validation and content-size checks before generation,
+    then charges the estimated input tokens against the caller's LLM quota.
+    Pass `resumeId` to ground the letter in a resume from the caller's library.
+    """
+    payload, applicant_full_name, resume_text = _check_request(request, response, payload, current_user, db)
+
     try:
-        applicant_full_name = f"{current_user.first_name} {current_user.last_name}".strip()
         document = await generate_cover_letter(
             request_data=payload,
             applicant_full_name=applicant_full_name,
+            resume_text=resume_text,
         )
     except ValueError as error:
         raise HTTPException(status_code=400, detail=str(error)) from error
@@ -97,6 +143,56 @@ async def generate_cover_letter_endpoint(
     return CoverLetterGenerateResponse(document_id=document.id, cover_letter=document.cover_letter)
 
 
+@router.post(
+    "/cover-letter/generate/jobs",
+    response_model=CoverLetterJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+@limiter.limit("5/hour")
+async def submit_cover_letter_job(
+    request: Request,
+    response: Response,
+    payload: CoverLetterGenerateRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Queue cover letter generation for a worker process.
+
+    Same checks, rate limit and quota charge as POST /cover-letter/generate.
+    Returns 202 with a job ID right away; poll the URL in the Location header.
+    """
+    payload, applicant_full_name, resume_text = _check_request(request, response, payload, current_user, db)
+    job = cover_letter_job_service.create_cover_letter_job(
+        db,
+        cast(UUID, current_user.id),
+        payload,
+        applicant_full_name,
+        resume_text,
+    )
+    response.headers["Location"] = str(request.url_for("get_cover_letter_job", job_id=str(job.id)).path)
+    return job
+
+
+@router.get("/cover-letter/generate/jobs/{job_id}", response_model=CoverLetterJobResponse)
+async def get_cover_letter_job(
+    job_id: UUID,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the status of a queued cover letter job.
+
+    Once it has succeeded, `result` holds the same document ID and text as
+    the synchronous endpoint, and the document can be exported as a PDF.
+    """
+    job = cover_letter_job_service.get_cover_letter_job(db, cast(UUID, current_user.id), job_id)
+    if job.status not in ("succeeded", "failed"):
+        response.headers["Retry-After"] = "1"
+    return job
+
+
 @router.get("/cover-letter/{document_id}/export-pdf")
 @limiter.limit("20/hour")
 async def export_cover_letter_pdf_endpoint(
@@ -117,7 +213,7 @@ async def export_cover_letter_pdf_endpoint(
         )
 
     try:
-        pdf_bytes = render_cover_letter_pdf(document)
+        pdf_bytes = await run_in_threadpool(render_cover_letter_pdf, document)
     except Exception as error:
         raise HTTPException(
             status_code=500,
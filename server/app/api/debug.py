@@ -0,0 +1,72 @@
+from fastapi import APIRouter, HTTPException, status
+
+from app.core.blocking_detector import blocking_detector
+from app.core.model_routing import model_router
+from app.models.health import BlockingReportResponse, LLMRouteReportResponse
+
+
+router = APIRouter()
+
+
+def _require_blocking_detector() -> None:
+    if not blocking_detector.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Blocking detector is disabled. Set BLOCKING_DETECTOR_ENABLED=1 to enable it."
+        )
+
+
+@router.get("/debug/blocking", response_model=BlockingReportResponse, include_in_schema=False)
+async def blocking_report():
+    """
+    List callbacks that blocked the event loop, with the route and stack responsible.
+
+    Only available when BLOCKING_DETECTOR_ENABLED is set.
+    """
+    _require_blocking_detector()
+    events = blocking_detector.events()
+    return BlockingReportResponse(
+        threshold_ms=blocking_detector.threshold * 1000,
+        events=[event.to_dict() for event in events],
+    )
+
+
+@router.delete("/debug/blocking", status_code=status.HTTP_204_NO_CONTENT, include_in_schema=False)
+async def clear_blocking_report():
+    """
+    Forget the reported events.
+
+    Only available when BLOCKING_DETECTOR_ENABLED is set.
+    """
+    _require_blocking_detector()
+    blocking_detector.clear()
+
+
+def _require_route_report() -> None:
+    if not model_router.report_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="LLM route report is disabled. Set LLM_ROUTE_REPORT_ENABLED=1 to enable it."
+        )
+
+
+@router.get("/debug/llm-routes", response_model=LLMRouteReportResponse, include_in_schema=False)
+async def llm_route_report():
+    """
+    Show the model routing table and what each route has cost since startup.
+
+    Only available when LLM_ROUTE_REPORT_ENABLED is set.
+    """
+    _require_route_report()
+    return model_router.report()
+
+
+@router.delete("/debug/llm-routes", status_code=status.HTTP_204_NO_CONTENT, include_in_schema=False)
+async def reset_llm_route_report():
+    """
+    Start the per-route accounting over.
+
+    Only available when LLM_ROUTE_REPORT_ENABLED is set.
+    """
+    _require_route_report()
+    model_router.reset_stats()
@@ -1,5 +1,6 @@
-from fastapi import APIRouter
-from app.models.health import HealthCheckResponse, WelcomeResponse
+from fastapi import APIRouter, Response, status
+from app.core.readiness import readiness_probe
+from app.models.health import HealthCheckResponse, ReadinessResponse, WelcomeResponse
 
 router = APIRouter()
 
@@ -18,6 +19,7 @@ async def root():
         description="AI-powered resume analysis API that matches resumes against job descriptions to provide insights, match scores, and recommendations.",
         endpoints=[
             "GET /health - Health check endpoint",
+            "GET /ready - Readiness check with dependency status",
             "GET /docs - Interactive API documentation",
             "POST /api/v1/resume/analyze - Analyze resume against job description"
         ]
@@ -36,3 +38,24 @@ async def health_check():
         status="healthy",
         message="Service is running"
     )
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse, "description": "A dependency is unavailable"}},
+)
+async def readiness_check(response: Response):
+    """
+    Readiness endpoint for load balancers
+
+    Checks database connectivity, connection pool saturation, the AI circuit
+    breaker and event-loop lag. Results are cached for a few seconds.
+
+    Returns:
+        ReadinessResponse: Overall status and per-dependency results (503 when not ready)
+    """
+    result = await readiness_probe.check()
+    if result.status != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return result
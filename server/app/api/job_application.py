@@ -4,23 +4,44 @@ Job Application API routes.
 This module defines endpoints for creating, retrieving, updating,
 and deleting job applications with authentication.
 """
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import cast
+from typing import List, Optional, cast
 from app.core.database import get_db
 from app.models.job_application import (
+    ALLOWED_STATUSES,
+    JobApplicationBulkCreate,
+    JobApplicationBulkDelete,
+    JobApplicationBulkDeleteResponse,
+    JobApplicationBulkUpdate,
     JobApplicationCreate,
     JobApplicationUpdate,
     JobApplicationResponse,
-    JobApplicationListResponse
+    JobApplicationListResponse,
+    JobApplicationSearchHit,
+    JobApplicationSearchResponse,
+    JobApplicationStatsResponse
 )
-from app.services import job_application_service
+from app.services import job_application_service, job_search_service
 from app.utils.security import get_current_user
 from app.models.database.user import User
 
 router = APIRouter()
 
+_DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
+
+def _check_status_filter(status_filter: Optional[List[str]]) -> None:
+    if status_filter:
+        unknown_statuses = sorted(set(status_filter) - set(ALLOWED_STATUSES))
+        if unknown_statuses:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Status must be one of: {', '.join(ALLOWED_STATUSES)}"
+            )
+
 
 @router.post(
     "/job-applications",
@@ -29,6 +50,10 @@ router = APIRouter()
 )
 async def create_job_application(
     application_data: JobApplicationCreate,
+    defer_enrichment: bool = Query(
+        False,
+        description="Return immediately with manual requirements and generate AI requirements in the background"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -37,6 +62,8 @@ async def create_job_application(
     
     Args:
         application_data: Job application details
+        defer_enrichment: Skip waiting for AI requirement generation; poll
+            the application's enrichment_status to see when it completes
         db: Database session
         current_user: Authenticated user
         
@@ -47,38 +74,163 @@ async def create_job_application(
     return await job_application_service.create_job_application(
         db=db,
         user_id=user_id,
-        application_data=application_data
+        application_data=application_data,
+        defer_enrichment=defer_enrichment
+    )
+
+
+@router.post(
+    "/job-applications/bulk",
+    response_model=JobApplicationListResponse,
+    status_code=status.HTTP_201_CREATED
+)
+def bulk_create_job_applications(
+    payload: JobApplicationBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create many job applications in one transaction (e.g. a spreadsheet import).
+    
+    Applications are stored with their manual requirements immediately; those
+    with fewer than the maximum are marked pending and enriched with AI
+    requirements on the background queue.
+    
+    Args:
+        payload: Job applications to create
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        Created job applications in request order with total count
+    """
+    user_id = cast(UUID, current_user.id)
+    applications = job_application_service.bulk_create_job_applications(
+        db=db,
+        user_id=user_id,
+        applications_data=payload.applications
+    )
+    response_applications = [
+        JobApplicationResponse.model_validate(application)
+        for application in applications
+    ]
+    return JobApplicationListResponse(applications=response_applications, total=len(response_applications))
+
+
+@router.patch(
+    "/job-applications/bulk",
+    response_model=JobApplicationListResponse
+)
+def bulk_update_job_applications(
+    payload: JobApplicationBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Update many job applications in one transaction.
+    
+    Args:
+        payload: Partial updates, each addressed by application ID
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        Updated job applications in request order with total count
+        
+    Raises:
+        404: If any application is not found or user doesn't have access
+    """
+    user_id = cast(UUID, current_user.id)
+    applications = job_application_service.bulk_update_job_applications(
+        db=db,
+        user_id=user_id,
+        updates=payload.applications
+    )
+    response_applications = [
+        JobApplicationResponse.model_validate(application)
+        for application in applications
+    ]
+    return JobApplicationListResponse(applications=response_applications, total=len(response_applications))
+
+
+@router.post(
+    "/job-applications/bulk-delete",
+    response_model=JobApplicationBulkDeleteResponse
+)
+def bulk_delete_job_applications(
+    payload: JobApplicationBulkDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Delete many job applications with a single statement.
+    
+    Args:
+        payload: IDs of the applications to delete
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        Number of applications deleted (unknown IDs are ignored)
+    """
+    user_id = cast(UUID, current_user.id)
+    deleted = job_application_service.bulk_delete_job_applications(
+        db=db,
+        user_id=user_id,
+        application_ids=payload.ids
     )
+    return JobApplicationBulkDeleteResponse(deleted=deleted)
 
 
 @router.get(
     "/job-applications",
     response_model=JobApplicationListResponse
 )
-async def get_job_applications(
+def get_job_applications(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return"),
+    status_filter: Optional[List[str]] = Query(
+        None,
+        alias="status",
+        description=f"Filter by status (repeatable): {', '.join(ALLOWED_STATUSES)}"
+    ),
+    company: Optional[str] = Query(None, min_length=1, max_length=255, description="Case-insensitive company name match"),
+    date_from: Optional[str] = Query(None, pattern=_DATE_PATTERN, description="Earliest application date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, pattern=_DATE_PATTERN, description="Latest application date (YYYY-MM-DD)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Retrieve all job applications for the authenticated user.
+    Retrieve job applications for the authenticated user.
     
     Args:
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
+        status_filter: Statuses to include (all when omitted)
+        company: Company name substring to match
+        date_from: Earliest application date to include
+        date_to: Latest application date to include
         db: Database session
         current_user: Authenticated user
         
     Returns:
-        List of job applications with total count
+        List of job applications with the total count matching the filters
+        
+    Raises:
+        400: If an unknown status is requested
     """
+    _check_status_filter(status_filter)
+
     user_id = cast(UUID, current_user.id)
     applications, total = job_application_service.get_user_job_applications(
         db=db,
         user_id=user_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        statuses=status_filter,
+        company=company,
+        date_from=date_from,
+        date_to=date_to
     )
     response_applications = [
         JobApplicationResponse.model_validate(application)
@@ -87,11 +239,135 @@ async def get_job_applications(
     return JobApplicationListResponse(applications=response_applications, total=total)
 
 
+@router.get(
+    "/job-applications/stats",
+    response_model=JobApplicationStatsResponse
+)
+def get_job_application_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Retrieve per-status application counts for the authenticated user.
+    
+    Args:
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        Count of applications for every status plus the overall total
+    """
+    user_id = cast(UUID, current_user.id)
+    counts = job_application_service.get_job_application_status_counts(
+        db=db,
+        user_id=user_id
+    )
+    return JobApplicationStatsResponse(counts=counts, total=sum(counts.values()))
+
+
+@router.get("/job-applications/export")
+def export_job_applications(
+    export_format: str = Query("csv", alias="format", pattern="^(csv|jsonl)$", description="Export format: csv or jsonl"),
+    status_filter: Optional[List[str]] = Query(
+        None,
+        alias="status",
+        description=f"Filter by status (repeatable): {', '.join(ALLOWED_STATUSES)}"
+    ),
+    company: Optional[str] = Query(None, min_length=1, max_length=255, description="Case-insensitive company name match"),
+    date_from: Optional[str] = Query(None, pattern=_DATE_PATTERN, description="Earliest application date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, pattern=_DATE_PATTERN, description="Latest application date (YYYY-MM-DD)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Download the authenticated user's job applications as CSV or JSONL.
+    
+    The body is streamed in chunks straight from a database cursor, so the
+    full history is never held in memory.
+    
+    Args:
+        export_format: Either "csv" or "jsonl"
+        status_filter: Statuses to include (all when omitted)
+        company: Company name substring to match
+        date_from: Earliest application date to include
+        date_to: Latest application date to include
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        Streaming attachment with one record per application
+        
+    Raises:
+        400: If an unknown status is requested
+    """
+    _check_status_filter(status_filter)
+
+    user_id = cast(UUID, current_user.id)
+    chunks = job_application_service.iter_job_application_export(
+        db=db,
+        user_id=user_id,
+        export_format=export_format,
+        statuses=status_filter,
+        company=company,
+        date_from=date_from,
+        date_to=date_to
+    )
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="job-applications.{export_format}"'}
+    )
+
+
+@router.get(
+    "/job-applications/search",
+    response_model=JobApplicationSearchResponse
+)
+def search_job_applications(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to search for"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results to return"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Full-text search over the authenticated user's job applications.
+    
+    Matches job title, company, requirements and description, ranked by relevance.
+    
+    Args:
+        q: Search query
+        limit: Maximum number of results to return
+        db: Database session
+        current_user: Authenticated user
+        
+    Returns:
+        Matching job applications ordered by descending rank
+    """
+    user_id = cast(UUID, current_user.id)
+    hits = job_search_service.search_job_applications(
+        db=db,
+        user_id=user_id,
+        query=q,
+        limit=limit
+    )
+    return JobApplicationSearchResponse(
+        query=q,
+        results=[
+            JobApplicationSearchHit(
+                application=JobApplicationResponse.model_validate(application),
+                rank=rank
+            )
+            for application, rank in hits
+        ]
+    )
+
+
 @router.get(
     "/job-applications/{application_id}",
     response_model=JobApplicationResponse
 )
-async def get_job_application(
+def get_job_application(
     application_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -122,7 +398,7 @@ async def get_job_application(
     "/job-applications/{application_id}",
     response_model=JobApplicationResponse
 )
-async def update_job_application(
+def update_job_application(
     application_id: UUID,
     update_data: JobApplicationUpdate,
     db: Session = Depends(get_db),
@@ -156,7 +432,7 @@ async def update_job_application(
     "/job-applications/{application_id}",
     status_code=status.HTTP_204_NO_CONTENT
 )
-async def delete_job_application(
+def delete_job_application(
     application_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import CONTENT_TYPE, render
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics_endpoint():
+    """
+    Expose request, LLM, PDF, password hashing and database metrics
+    in the Prometheus text format.
+    """
+    return PlainTextResponse(render(), media_type=CONTENT_TYPE)
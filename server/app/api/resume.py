@@ -1,32 +1,42 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request
-from app.models.resume import ResumeAnalysisRequest, ResumeAnalysisResponse
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import AsyncIterator, List, Optional, Tuple, cast
+import json
+from uuid import UUID
+from app.core.database import get_db
+from app.models.database.user import User
+from app.models.resume import (
+    ANALYSIS_FINISHED,
+    AnalysisJobResponse,
+    ResumeAnalysisRequest,
+    ResumeAnalysisResponse,
+    StoredResumeResponse,
+)
+from app.services import analysis_job_service, application_match_service, resume_library_service
+from app.services.pdf_service import extract_text_from_pdf
 from app.services.resume_service import analyze_resume, validate_job_description
+from app.core.llm import LLMUnavailableError
+from app.core.profiling import span
+from app.core.quota import (
+    JOB_VALIDATION_PROMPT_TOKENS,
+    RESUME_ANALYSIS_PROMPT_TOKENS,
+    charge_llm_quota,
+    estimate_tokens,
+)
 from app.core.rate_limit import limiter
-from app.utils.sanitization import _INJECTION_PATTERNS, MAX_PDF_BYTES, MAX_WORDS
+from app.utils.prompt_compaction import compact_for_prompt
+from app.utils.sanitization import MAX_PDF_BYTES, MAX_WORDS, preflight
+from app.utils.security import get_current_user, get_optional_current_user
 
 
 router = APIRouter()
 
+MAX_WAIT_SECONDS = 30
 
-@router.post("/resume/analyze", response_model=ResumeAnalysisResponse)
-@limiter.limit("5/hour")  # 10 requests per hour per IP
-async def analyze_resume_endpoint(
-    request: Request,
-    resume: UploadFile = File(..., description="Resume PDF file"),
-    job_description: str = Form(..., description="Job description text")
-):
-    """
-    Analyze resume against job description
-    
-    Rate limit: 10 requests per hour per IP address
-    
-    Parameters:
-        resume (UploadFile): PDF file of the resume
-        job_description (str): Text description of the job posting
-    
-    Returns:
-        ResumeAnalysisResponse: Analysis results with matching score and insights
-    """
+
+def _check_pdf_upload(resume: UploadFile) -> None:
     if not resume.filename or not resume.filename.endswith('.pdf'):
         raise HTTPException(
             status_code=400,
@@ -39,28 +49,146 @@ async def analyze_resume_endpoint(
             status_code=400,
             detail=f"PDF file is too large ({resume.size / (1024 * 1024):.1f} MB). Maximum allowed size is 10 MB."
         )
+
+
+def _check_resume_source(
+    resume: Optional[UploadFile],
+    resume_id: Optional[UUID],
+    current_user: Optional[User],
+) -> None:
+    """Require exactly one of an upload or a stored resume, and sign-in for the latter."""
+    if (resume is None) == (resume_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Upload a resume PDF or pass the resume_id of a stored resume, but not both."
+        )
+    if resume_id is not None and current_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Sign in to analyze a stored resume.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if resume is not None:
+        _check_pdf_upload(resume)
+
+
+async def _read_resume_text(
+    resume: Optional[UploadFile],
+    resume_id: Optional[UUID],
+    current_user: Optional[User],
+    db: Optional[Session],
+) -> str:
+    if resume_id is not None:
+        stored = await run_in_threadpool(
+            resume_library_service.get_resume, cast(Session, db), cast(UUID, cast(User, current_user).id), resume_id
+        )
+        resume_text = str(stored.text)
+    else:
+        try:
+            with span("pdf_extraction"):
+                resume_text = await extract_text_from_pdf(cast(UploadFile, resume))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    # What the model will see, and what the quota is charged for.
+    return compact_for_prompt(resume_text)
+
+
+async def _checked_submission(
+    request: Request,
+    response: Response,
+    resume: Optional[UploadFile],
+    job_description: str,
+    resume_id: Optional[UUID] = None,
+    current_user: Optional[User] = None,
+    db: Optional[Session] = None,
+) -> Tuple[str, str]:
+    """
+    Run the input checks shared by the synchronous and asynchronous endpoints.
+
+    Validates the upload and the job description, extracts the resume text
+    (or reads it from the caller's resume library when `resume_id` is given)
+    and charges the caller's LLM quota.
+
+    Returns:
+        Tuple[str, str]: (normalized job description, resume text)
+    """
+    _check_resume_source(resume, resume_id, current_user)
     
-    if not job_description or len(job_description.strip()) == 0:
+    # Normalize, count and scan the description once; the normalized text is what the model sees
+    checked = preflight(job_description)
+
+    if not checked.text:
         raise HTTPException(
             status_code=400,
             detail="Job description cannot be empty."
         )
 
     # Word count guard
-    word_count = len(job_description.split())
-    if word_count > MAX_WORDS:
+    if checked.word_count > MAX_WORDS:
         raise HTTPException(
             status_code=400,
-            detail=f"Your job description exceeds the {MAX_WORDS:,} word limit ({word_count:,} words). Please shorten it and try again."
+            detail=f"Your job description exceeds the {MAX_WORDS:,} word limit ({checked.word_count:,} words). Please shorten it and try again."
         )
 
     # Injection pattern guards
-    for pattern, message in _INJECTION_PATTERNS:
-        if pattern.search(job_description):
-            raise HTTPException(status_code=400, detail=message)
+    if checked.disallowed:
+        raise HTTPException(status_code=400, detail=checked.disallowed)
+    job_description = checked.text
+
+    resume_text = await _read_resume_text(resume, resume_id, current_user, db)
+
+    # The job description is sent twice: once to classify it, once for analysis.
+    description_tokens = estimate_tokens(job_description)
+    charge_llm_quota(
+        request,
+        response,
+        cost=(
+            JOB_VALIDATION_PROMPT_TOKENS + description_tokens
+            + RESUME_ANALYSIS_PROMPT_TOKENS + description_tokens
+            + estimate_tokens(resume_text)
+        ),
+    )
+    return job_description, resume_text
+
+
+@router.post("/resume/analyze", response_model=ResumeAnalysisResponse)
+@limiter.limit("5/hour")  # 10 requests per hour per IP
+async def analyze_resume_endpoint(
+    request: Request,
+    response: Response,
+    resume: Optional[UploadFile] = File(None, description="Resume PDF file"),
+    job_description: str = Form(..., description="Job description text"),
+    resume_id: Optional[UUID] = Form(None, description="ID of a resume in the caller's library, instead of a file"),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_current_user)
+):
+    """
+    Analyze resume against job description
+    
+    Rate limit: 10 requests per hour per IP address. Each request is also
+    charged its estimated input tokens against the caller's LLM quota; the
+    remaining budget is reported in X-Quota-* headers.
+    
+    Parameters:
+        resume (UploadFile): PDF file of the resume
+        job_description (str): Text description of the job posting
+        resume_id (UUID): Stored resume to analyze instead of an upload (requires sign-in)
+    
+    Returns:
+        ResumeAnalysisResponse: Analysis results with matching score and insights
+    """
+    job_description, resume_text = await _checked_submission(
+        request, response, resume, job_description, resume_id, current_user, db
+    )
 
     # AI classification — verify it looks like a real job description
-    is_valid, reason = await validate_job_description(job_description)
+    try:
+        is_valid, reason = await validate_job_description(job_description)
+    except LLMUnavailableError:
+        raise HTTPException(
+            status_code=503,
+            detail="Resume analysis is temporarily unavailable. Please try again shortly."
+        )
     if not is_valid:
         raise HTTPException(
             status_code=400,
@@ -68,10 +196,266 @@ async def analyze_resume_endpoint(
         )
 
     try:
-        result = await analyze_resume(resume, job_description)
+        result = await analyze_resume(resume, job_description, resume_text=resume_text)
         return result
+    except LLMUnavailableError:
+        raise HTTPException(
+            status_code=503,
+            detail="Resume analysis is temporarily unavailable. Please try again shortly."
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"An error occurred while analyzing the resume: {str(e)}"
         )
+
+
+@router.post("/resume/analyze/applications")
+@limiter.limit("5/hour")
+async def analyze_resume_against_applications(
+    request: Request,
+    response: Response,
+    resume: Optional[UploadFile] = File(None, description="Resume PDF file"),
+    resume_id: Optional[UUID] = Form(None, description="ID of a resume in the caller's library, instead of a file"),
+    top_k: int = Query(
+        3,
+        ge=1,
+        le=application_match_service.ANALYZE_ALL_MAX_TOP_K,
+        description="Best local matches to run the full AI analysis for"
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Find which of the caller's job applications a resume fits best
+    
+    Every stored application is scored against the resume locally (TF-IDF
+    cosine similarity); only the `top_k` best matches are analyzed by the
+    model, a few at a time. The response is NDJSON, one event per line:
+    
+    - `ranking`: every application with its `local_score`, best first
+    - `analysis`: a ResumeAnalysisResponse for one application, in the
+      order the analyses finish
+    - `error`: an application whose analysis failed, with `error_status`
+    - `done`: counts of analyses that succeeded and failed
+    
+    Only the `top_k` analyses are charged against the caller's LLM quota.
+    
+    Parameters:
+        resume (UploadFile): PDF file of the resume
+        resume_id (UUID): Stored resume to use instead of an upload
+        top_k (int): Number of applications to analyze with the model
+    
+    Returns:
+        StreamingResponse: application/x-ndjson event stream
+    """
+    _check_resume_source(resume, resume_id, current_user)
+    resume_text = await _read_resume_text(resume, resume_id, current_user, db)
+
+    # The query and the scoring both block; keep them off the event loop.
+    ranked = await run_in_threadpool(
+        application_match_service.rank_user_applications, db, cast(UUID, current_user.id), resume_text
+    )
+    if not ranked:
+        raise HTTPException(
+            status_code=400,
+            detail="You have no job applications to compare this resume against yet."
+        )
+    candidates = ranked[:top_k]
+
+    resume_tokens = estimate_tokens(resume_text)
+    quota = charge_llm_quota(
+        request,
+        response,
+        cost=sum(
+            RESUME_ANALYSIS_PROMPT_TOKENS + estimate_tokens(candidate.job_description) + resume_tokens
+            for candidate in candidates
+        ),
+    )
+
+    async def events() -> AsyncIterator[str]:
+        yield _ndjson({
+            "event": "ranking",
+            "applications": [candidate.summary() for candidate in ranked],
+        })
+        analyzed = failed = 0
+        async for event in application_match_service.iter_application_analyses(resume_text, candidates):
+            if event["event"] == "analysis":
+                analyzed += 1
+            else:
+                failed += 1
+            yield _ndjson(event)
+        yield _ndjson({"event": "done", "analyzed": analyzed, "failed": failed})
+
+    return StreamingResponse(events(), media_type="application/x-ndjson", headers=quota.headers())
+
+
+def _ndjson(event: dict) -> str:
+    return json.dumps(event, ensure_ascii=False) + "\n"
+
+
+@router.post(
+    "/resume/analyze/jobs",
+    response_model=AnalysisJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+@limiter.limit("5/hour")
+async def submit_analysis_job(
+    request: Request,
+    response: Response,
+    resume: Optional[UploadFile] = File(None, description="Resume PDF file"),
+    job_description: str = Form(..., description="Job description text"),
+    resume_id: Optional[UUID] = Form(None, description="ID of a resume in the caller's library, instead of a file"),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_current_user)
+):
+    """
+    Start a resume analysis without waiting for the model
+    
+    Runs the same input checks, rate limit and quota charge as
+    POST /resume/analyze, then returns 202 with a job ID right away. Poll
+    the URL in the Location header until the job has succeeded or failed.
+    A job submitted while signed in can only be polled by the same user.
+    
+    Parameters:
+        resume (UploadFile): PDF file of the resume
+        job_description (str): Text description of the job posting
+        resume_id (UUID): Stored resume to analyze instead of an upload (requires sign-in)
+    
+    Returns:
+        AnalysisJobResponse: The queued job
+    """
+    job_description, resume_text = await _checked_submission(
+        request, response, resume, job_description, resume_id, current_user, db
+    )
+    job = await run_in_threadpool(
+        analysis_job_service.create_analysis_job,
+        db,
+        job_description,
+        resume_text,
+        user_id=cast(UUID, current_user.id) if current_user is not None else None,
+    )
+    response.headers["Location"] = str(request.url_for("get_analysis_job", job_id=str(job.id)).path)
+    return job
+
+
+@router.get("/resume/analyze/jobs/{job_id}", response_model=AnalysisJobResponse)
+async def get_analysis_job(
+    job_id: UUID,
+    response: Response,
+    wait: float = Query(
+        0,
+        ge=0,
+        le=MAX_WAIT_SECONDS,
+        description="Seconds to hold the request open until the job finishes (long-poll)"
+    ),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_current_user)
+):
+    """
+    Get the status of a resume analysis job
+    
+    Once the job has succeeded, `result` holds the ResumeAnalysisResponse.
+    If it failed, `error` and `error_status` hold the message and status
+    code the synchronous endpoint would have returned. Unfinished jobs carry
+    a Retry-After hint.
+    
+    Parameters:
+        job_id (UUID): ID returned on submission
+        wait (float): Long-poll timeout in seconds; 0 answers immediately
+    
+    Returns:
+        AnalysisJobResponse: Current job status
+    
+    Raises:
+        404: If the job does not exist or was submitted by another user
+    """
+    user_id = cast(UUID, current_user.id) if current_user is not None else None
+    if wait > 0:
+        job = await analysis_job_service.wait_for_analysis_job(db, job_id, timeout=wait, user_id=user_id)
+    else:
+        job = await run_in_threadpool(analysis_job_service.get_analysis_job, db, job_id, user_id)
+    if job.status not in ANALYSIS_FINISHED:
+        response.headers["Retry-After"] = "1"
+    return job
+
+
+@router.post("/resumes", response_model=StoredResumeResponse, status_code=status.HTTP_201_CREATED)
+async def upload_resume(
+    response: Response,
+    resume: UploadFile = File(..., description="Resume PDF file"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Save a resume PDF to the caller's library
+    
+    The text is extracted once and kept with the file's SHA-256 digest.
+    Uploading a file that is already in the library returns the stored
+    entry with 200 instead of 201, without parsing it again. Pass the
+    returned `id` as `resume_id` to the analysis and cover letter endpoints.
+    
+    Parameters:
+        resume (UploadFile): PDF file of the resume
+    
+    Returns:
+        StoredResumeResponse: The stored resume
+    """
+    _check_pdf_upload(resume)
+    content = await resume.read()
+    try:
+        stored, created = await resume_library_service.store_resume(
+            db, cast(UUID, current_user.id), str(resume.filename), content
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not created:
+        response.status_code = status.HTTP_200_OK
+    return stored
+
+
+@router.get("/resumes", response_model=List[StoredResumeResponse])
+def list_resumes(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    List the resumes in the caller's library, newest first
+    
+    Returns:
+        List[StoredResumeResponse]: Stored resumes
+    """
+    return resume_library_service.list_resumes(db, cast(UUID, current_user.id))
+
+
+@router.get("/resumes/{resume_id}", response_model=StoredResumeResponse)
+def get_resume(
+    resume_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get a resume from the caller's library
+    
+    Parameters:
+        resume_id (UUID): ID returned on upload
+    
+    Returns:
+        StoredResumeResponse: The stored resume
+    """
+    return resume_library_service.get_resume(db, cast(UUID, current_user.id), resume_id)
+
+
+@router.delete("/resumes/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_resume(
+    resume_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Remove a resume from the caller's library
+    
+    Parameters:
+        resume_id (UUID): ID returned on upload
+    """
+    resume_library_service.delete_resume(db, cast(UUID, current_user.id), resume_id)
@@ -0,0 +1,276 @@
+"""
+Command-line tools that call the services directly, without HTTP.
+
+    python -m app.cli analyze-batch RESUME_DIR JOB_DESCRIPTION_FILE --output results.jsonl
+
+``analyze-batch`` analyzes every PDF in RESUME_DIR against the job
+description. Text is extracted in a process pool (PDF parsing is CPU-bound)
+while at most --concurrency model analyses run at once; each resume's
+outcome is appended to the output as one JSON line as soon as it is known.
+
+Running the same command again resumes from the output file: resumes with a
+result for the same file content and job description are skipped. Failed
+analyses are retried; resumes whose text could not be extracted are not,
+unless the file changes. The last line for a file is its current outcome.
+
+--fake-llm answers from the in-process fake in ``benchmarks.fake_gemini``
+instead of Gemini, for local runs without an API key.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, TextIO, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+OK = "ok"
+EXTRACTION_FAILED = "extraction_failed"
+ANALYSIS_FAILED = "analysis_failed"
+
+# Outcomes that would not change on a retry with the same file and job description.
+_FINAL_STATUSES = (OK, EXTRACTION_FAILED)
+
+_Key = Tuple[str, str, str]
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_checkpoint(output: Path) -> Set[_Key]:
+    """
+    Keys (file, sha256, job_description_sha256) of resumes already settled in `output`.
+
+    A line cut short by an interrupted run is ignored.
+    """
+    latest: Dict[_Key, str] = {}
+    if not output.exists():
+        return set()
+    with open(output, "r", encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+                key = (record["file"], record["sha256"], record["job_description_sha256"])
+                latest[key] = record["status"]
+            except (ValueError, KeyError, TypeError):
+                continue
+    return {key for key, status in latest.items() if status in _FINAL_STATUSES}
+
+
+def _open_output(output: Path) -> TextIO:
+    output.parent.mkdir(parents=True, exist_ok=True)
+    # Finish a line cut short by an interrupted run so the next record starts on its own line.
+    cut_short = False
+    if output.exists() and output.stat().st_size > 0:
+        with open(output, "rb") as existing:
+            existing.seek(-1, os.SEEK_END)
+            cut_short = existing.read(1) != b"\n"
+    handle = open(output, "a", encoding="utf-8")
+    if cut_short:
+        handle.write("\n")
+    return handle
+
+
+class BatchAnalyzer:
+    """Extract in a process pool, analyze with bounded concurrency, append results as JSON lines."""
+
+    def __init__(
+        self,
+        job_description: str,
+        output: TextIO,
+        pool: Executor,
+        concurrency: int,
+        window: int,
+    ) -> None:
+        self.job_description = job_description
+        self.job_description_sha256 = hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+        self.output = output
+        self.pool = pool
+        self.analyses = asyncio.Semaphore(max(1, concurrency))
+        # Caps resumes held in memory between extraction and a free analysis slot.
+        self.window = asyncio.Semaphore(max(1, window))
+        self.counts = {OK: 0, EXTRACTION_FAILED: 0, ANALYSIS_FAILED: 0}
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.output.flush()
+        self.counts[record["status"]] += 1
+
+    async def _process(self, path: Path, sha256: str) -> None:
+        from app.services.pdf_service import extract_pdf_file
+        from app.services.resume_service import analyze_resume
+        from app.utils.prompt_compaction import compact_for_prompt
+
+        record: Dict[str, Any] = {
+            "file": path.name,
+            "sha256": sha256,
+            "job_description_sha256": self.job_description_sha256,
+        }
+        started = time.perf_counter()
+        try:
+            try:
+                resume_text, page_count = await asyncio.get_running_loop().run_in_executor(
+                    self.pool, extract_pdf_file, str(path)
+                )
+            except ValueError as error:
+                self._write({**record, "status": EXTRACTION_FAILED, "error": str(error)})
+                return
+            record["page_count"] = page_count
+            resume_text = compact_for_prompt(resume_text)
+
+            async with self.analyses:
+                try:
+                    result = await analyze_resume(None, self.job_description, resume_text=resume_text)  # type: ignore[arg-type]
+                except Exception as error:
+                    self._write({**record, "status": ANALYSIS_FAILED, "error": f"{type(error).__name__}: {error}"})
+                    return
+            self._write({
+                **record,
+                "status": OK,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "result": result.model_dump(mode="json"),
+            })
+        finally:
+            self.window.release()
+
+    async def run(self, resumes: List[Tuple[Path, str]]) -> None:
+        tasks = []
+        for path, sha256 in resumes:
+            await self.window.acquire()
+            tasks.append(asyncio.create_task(self._process(path, sha256)))
+        await asyncio.gather(*tasks)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for the extraction pool.
+
+    Not fork: the parent runs an event loop and threads. A forkserver imports
+    the extraction code once and forks each worker from that, instead of
+    every spawned worker importing the application again.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(["app.services.pdf_service"])
+    return context
+
+
+def _install_llm_client(args: argparse.Namespace) -> Optional[Any]:
+    """Point the services at the fake LLM when asked to; returns the fake, if any."""
+    if not args.fake_llm:
+        return None
+    from benchmarks.fake_gemini import FakeClient
+    from app.services import resume_service
+
+    fake = FakeClient(latency=args.fake_llm_latency_ms / 1000)
+    resume_service.client = fake  # type: ignore[assignment]
+    return fake
+
+
+async def _analyze_batch(args: argparse.Namespace) -> int:
+    fake = _install_llm_client(args)
+    from app.core.model_routing import model_router, override_model
+    from app.services.resume_service import validate_job_description
+
+    resume_dir = Path(args.resume_dir)
+    if not resume_dir.is_dir():
+        logger.error("%s is not a directory", resume_dir)
+        return 2
+    job_description = Path(args.job_description).read_text(encoding="utf-8").strip()
+    if not job_description:
+        logger.error("%s is empty", args.job_description)
+        return 2
+
+    with override_model(args.model):
+        if not args.skip_validation:
+            is_valid, reason = await validate_job_description(job_description)
+            if not is_valid:
+                logger.error("The job description was rejected: %s", reason)
+                return 2
+
+        output = Path(args.output)
+        settled = load_checkpoint(output)
+        job_description_sha256 = hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+        pending: List[Tuple[Path, str]] = []
+        skipped = 0
+        for path in sorted(resume_dir.iterdir()):
+            if not path.is_file() or path.suffix.lower() != ".pdf":
+                continue
+            sha256 = _sha256_file(path)
+            if (path.name, sha256, job_description_sha256) in settled:
+                skipped += 1
+            else:
+                pending.append((path, sha256))
+        logger.info("%d resumes to analyze, %d already done", len(pending), skipped)
+
+        started = time.perf_counter()
+        context = _pool_context()
+        with ProcessPoolExecutor(max_workers=args.workers, mp_context=context) as pool, _open_output(output) as handle:
+            analyzer = BatchAnalyzer(
+                job_description,
+                handle,
+                pool,
+                concurrency=args.concurrency,
+                window=args.concurrency + args.workers,
+            )
+            await analyzer.run(pending)
+        elapsed = time.perf_counter() - started
+
+    counts = analyzer.counts
+    cost = sum(route["cost_usd"] for route in model_router.report()["stats"])
+    logger.info(
+        "Done in %.1fs: %d analyzed, %d extraction failures, %d analysis failures, %d skipped; "
+        "estimated model cost $%.4f%s",
+        elapsed,
+        counts[OK],
+        counts[EXTRACTION_FAILED],
+        counts[ANALYSIS_FAILED],
+        skipped,
+        cost,
+        f" (fake LLM: {fake.stats['requests']} requests)" if fake is not None else "",
+    )
+    return 1 if counts[ANALYSIS_FAILED] else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("analyze-batch", help="Analyze a directory of resume PDFs against one job description")
+    batch.add_argument("resume_dir", help="Directory of resume PDFs")
+    batch.add_argument("job_description", help="Text file holding the job description")
+    batch.add_argument("--output", default="analysis-results.jsonl", help="JSON Lines file to append results to")
+    batch.add_argument("--concurrency", type=int, default=4, help="Model analyses run at once")
+    batch.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="PDF extraction processes")
+    batch.add_argument("--model", help="Send every call to this model instead of the routing table")
+    batch.add_argument("--skip-validation", action="store_true", help="Do not check the job description first")
+    batch.add_argument("--fake-llm", action="store_true", help="Use the in-process fake LLM instead of Gemini")
+    batch.add_argument("--fake-llm-latency-ms", type=float, default=250, help="Fake LLM base latency")
+    args = parser.parse_args(argv)
+    if args.concurrency < 1 or args.workers < 1:
+        parser.error("--concurrency and --workers must be at least 1")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        return asyncio.run(_analyze_batch(args))
+    except KeyboardInterrupt:
+        logger.warning("Interrupted; run the same command again to continue from %s", args.output)
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
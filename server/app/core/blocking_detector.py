@@ -0,0 +1,224 @@
+"""
+Blocking-call detector for the event loop.
+
+A heartbeat task on each watched loop records when it last ran; a watchdog
+thread notices when the heartbeat stops for longer than a threshold and
+captures the loop thread's stack at that moment, i.e. the code that is
+holding the loop. The middleware remembers which request each task is
+serving, so each event also names the route responsible.
+
+This is a diagnostic mode and is off by default:
+
+    BLOCKING_DETECTOR_ENABLED        1 to watch the loop serving requests
+    BLOCKING_DETECTOR_THRESHOLD_MS   stall length that is reported
+
+Findings are available from ``GET /debug/blocking`` while enabled
+(``DELETE`` forgets them).
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import FrameType
+from typing import Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import REGISTRY, Counter
+
+
+EVENT_LOOP_BLOCKED = REGISTRY.register(Counter(
+    "event_loop_blocked_total",
+    "Times a callback held the event loop beyond the blocking threshold.",
+))
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class BlockingEvent:
+    detected_at: datetime
+    duration: float
+    route: Optional[str]
+    method: Optional[str]
+    location: Optional[str]
+    stack: List[str]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "detected_at": self.detected_at.isoformat(),
+            "duration_ms": round(self.duration * 1000, 2),
+            "route": self.route,
+            "method": self.method,
+            "location": self.location,
+            "stack": self.stack,
+        }
+
+
+@dataclass
+class _LoopState:
+    thread_id: int
+    last_beat: float
+    current: Optional[BlockingEvent] = None
+    handle: Optional[asyncio.TimerHandle] = field(default=None, repr=False)
+
+
+def _app_location(stack: traceback.StackSummary) -> Optional[str]:
+    """Innermost frame that belongs to this application rather than a library."""
+    for entry in reversed(stack):
+        if entry.filename.startswith(_APP_ROOT) and not entry.filename.endswith("blocking_detector.py"):
+            return f"{os.path.relpath(entry.filename, os.path.dirname(_APP_ROOT))}:{entry.lineno} in {entry.name}"
+    return None
+
+
+class BlockingCallDetector:
+    def __init__(self, threshold: float = 0.1, max_events: int = 100, enabled: bool = False) -> None:
+        if threshold <= 0:
+            raise ValueError("threshold must be positive.")
+        self.threshold = threshold
+        self.enabled = enabled
+        self._interval = min(threshold / 4, 0.05)
+        self._events: Deque[BlockingEvent] = deque(maxlen=max_events)
+        self._loops: Dict[asyncio.AbstractEventLoop, _LoopState] = {}
+        self._request_scopes: "weakref.WeakKeyDictionary[asyncio.Task, dict]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def events(self) -> List[BlockingEvent]:
+        with self._lock:
+            return list(self._events)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+
+    def watch_current_loop(self) -> None:
+        """Start watching the running loop; cheap no-op if it is already watched."""
+        loop = asyncio.get_running_loop()
+        if loop in self._loops:
+            return
+        with self._lock:
+            if loop in self._loops:
+                return
+            state = _LoopState(thread_id=threading.get_ident(), last_beat=time.monotonic())
+            self._loops[loop] = state
+        self._heartbeat(loop, state)
+        self._ensure_watchdog()
+
+    def track_request(self, scope: dict) -> None:
+        """Associate the current task with the request it is serving."""
+        task = asyncio.current_task()
+        if task is not None:
+            with self._lock:
+                self._request_scopes[task] = scope
+
+    def untrack_request(self) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            with self._lock:
+                self._request_scopes.pop(task, None)
+
+    def stop(self) -> None:
+        """Stop the watchdog thread and forget watched loops."""
+        self._stop.set()
+        watchdog, self._watchdog = self._watchdog, None
+        if watchdog is not None:
+            watchdog.join(timeout=1)
+        with self._lock:
+            loops = list(self._loops.items())
+            self._loops.clear()
+        for loop, state in loops:
+            if state.handle is not None and not loop.is_closed():
+                loop.call_soon_threadsafe(state.handle.cancel)
+
+    def _heartbeat(self, loop: asyncio.AbstractEventLoop, state: _LoopState) -> None:
+        # A timer callback rather than a task, so loops that close while
+        # watched (e.g. per-request test loops) are not left with pending tasks.
+        now = time.monotonic()
+        with self._lock:
+            if state.current is not None:
+                state.current.duration = max(state.current.duration, now - state.last_beat - self._interval)
+                state.current = None
+            state.last_beat = now
+            if loop not in self._loops:
+                return
+        state.handle = loop.call_later(self._interval, self._heartbeat, loop, state)
+
+    def _ensure_watchdog(self) -> None:
+        if self._watchdog is not None and self._watchdog.is_alive():
+            return
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="blocking-detector", daemon=True)
+        self._watchdog.start()
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self._interval):
+            now = time.monotonic()
+            with self._lock:
+                for loop, state in list(self._loops.items()):
+                    if loop.is_closed():
+                        del self._loops[loop]
+                        continue
+                    stalled = now - state.last_beat - self._interval
+                    if stalled < self.threshold:
+                        continue
+                    if state.current is not None:
+                        state.current.duration = stalled
+                        continue
+                    frame = sys._current_frames().get(state.thread_id)
+                    if frame is None:
+                        continue
+                    # current_task() only reads a dict keyed by loop, so it is safe here.
+                    task = asyncio.current_task(loop)
+                    scope = self._request_scopes.get(task) if task is not None else None
+                    state.current = self._capture(frame, stalled, scope)
+                    self._events.append(state.current)
+                    EVENT_LOOP_BLOCKED.inc()
+
+    def _capture(self, frame: FrameType, stalled: float, scope: Optional[dict]) -> BlockingEvent:
+        stack = traceback.extract_stack(frame)
+        route = None
+        method = None
+        if scope is not None:
+            method = scope.get("method")
+            route = getattr(scope.get("route"), "path", None) or scope.get("path")
+        return BlockingEvent(
+            detected_at=datetime.now(timezone.utc),
+            duration=stalled,
+            route=route,
+            method=method,
+            location=_app_location(stack),
+            stack=[line.rstrip() for line in traceback.format_list(stack)],
+        )
+
+
+class BlockingDetectorMiddleware:
+    """Attach the detector to whichever loop is serving requests."""
+
+    def __init__(self, app, detector: Optional[BlockingCallDetector] = None) -> None:
+        self.app = app
+        self.detector = detector or blocking_detector
+
+    async def __call__(self, scope, receive, send) -> None:
+        if not self.detector.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self.detector.watch_current_loop()
+        self.detector.track_request(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.detector.untrack_request()
+
+
+blocking_detector = BlockingCallDetector(
+    threshold=settings.blocking_detector_threshold_ms / 1000,
+    enabled=settings.blocking_detector_enabled,
+)
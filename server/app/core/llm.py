@@ -0,0 +1,200 @@
+"""
+Shared bookkeeping around Gemini calls.
+
+Every call to the model goes through ``llm_call`` so latency, outcome and
+in-flight counts are recorded in one place, and so a circuit breaker can stop
+sending traffic to the model after repeated failures. Calls made with a
+``Route`` (see ``app.core.model_routing``) are also accounted to that route.
+
+The services share one Gemini client, ``gemini_client``, which is built on
+first use: importing ``google.genai`` costs more than the rest of the
+application's imports together, and many processes (tests, the worker, the
+CLI with a fake model) never call Gemini at all.
+
+    GOOGLE_API_KEY                  Gemini API key
+    LLM_BREAKER_FAILURE_THRESHOLD   consecutive failures that open the circuit
+    LLM_BREAKER_RESET_SECONDS       how long the circuit stays open before a trial call
+"""
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import LLM_REQUEST_DURATION, LLM_REQUESTS_IN_FLIGHT, REGISTRY, Gauge
+from app.core.model_routing import Route, model_router
+
+
+T = TypeVar("T")
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class LLMUnavailableError(RuntimeError):
+    """Raised without calling the model while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After `failure_threshold` failures in a row the circuit opens and calls are
+    rejected immediately. Once `reset_timeout` seconds have passed, one trial
+    call is let through (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state_locked(time.monotonic())
+
+    def _state_locked(self, now: float) -> str:
+        if self._failures < self.failure_threshold:
+            return CLOSED
+        if now - self._opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return OPEN
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted now."""
+        with self._lock:
+            state = self._state_locked(time.monotonic())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Give back a half-open trial slot without counting an outcome."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def seconds_until_retry(self) -> float:
+        with self._lock:
+            if self._failures < self.failure_threshold:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+
+class LazyGeminiClient:
+    """``google.genai.Client`` proxy that builds the client on first attribute access."""
+
+    def __init__(self, api_key: Optional[str] = None) -> None:
+        self._api_key = api_key
+        self._client: Any = None
+        self._lock = threading.Lock()
+
+    def _get(self) -> Any:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from google import genai
+
+                    self._client = genai.Client(api_key=self._api_key)
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get(), name)
+
+
+gemini_client = LazyGeminiClient(api_key=settings.google_api_key)
+
+llm_breaker = CircuitBreaker(
+    failure_threshold=settings.llm_breaker_failure_threshold,
+    reset_timeout=settings.llm_breaker_reset_seconds,
+)
+
+REGISTRY.register(Gauge(
+    "llm_circuit_open",
+    "1 while the Gemini circuit breaker is rejecting calls.",
+    function=lambda: {(): 1.0 if llm_breaker.state == OPEN else 0.0},
+))
+
+
+class LLMCall:
+    """Handle yielded by ``llm_call``; hand it the response so its token usage is accounted."""
+
+    __slots__ = ("response",)
+
+    def __init__(self) -> None:
+        self.response: Any = None
+
+    def record(self, response: T) -> T:
+        self.response = response
+        return response
+
+
+@asynccontextmanager
+async def llm_call(operation: str, route: Optional[Route] = None) -> AsyncIterator[LLMCall]:
+    """
+    Wrap a single Gemini request.
+
+    Usage:
+        route = model_router.route(ANALYSIS, prompt)
+        async with llm_call("analyze_resume", route) as call:
+            response = call.record(await client.aio.models.generate_content(model=route.model, ...))
+
+    Raises:
+        LLMUnavailableError: If the circuit breaker is open
+    """
+    if not llm_breaker.allow():
+        LLM_REQUEST_DURATION.labels(operation=operation, outcome="rejected").observe(0.0)
+        if route is not None:
+            model_router.record(route, "rejected", 0.0)
+        raise LLMUnavailableError("AI service is temporarily unavailable.")
+
+    call = LLMCall()
+    outcome = "error"
+    start = time.perf_counter()
+    LLM_REQUESTS_IN_FLIGHT.inc()
+    try:
+        yield call
+    except Exception:
+        llm_breaker.record_failure()
+        raise
+    except BaseException:
+        # Cancellation says nothing about the model's health.
+        outcome = "cancelled"
+        llm_breaker.release()
+        raise
+    else:
+        outcome = "success"
+        llm_breaker.record_success()
+    finally:
+        LLM_REQUESTS_IN_FLIGHT.dec()
+        elapsed = time.perf_counter() - start
+        LLM_REQUEST_DURATION.labels(operation=operation, outcome=outcome).observe(elapsed)
+        if route is not None:
+            model_router.record(route, outcome, elapsed, call.response)
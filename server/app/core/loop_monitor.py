@@ -0,0 +1,71 @@
+"""
+Event-loop lag monitor.
+
+A background task sleeps for a fixed interval and measures how late it wakes
+up. Any delay beyond the interval is time the loop spent running other
+callbacks without yielding, which is latency every in-flight request pays.
+
+    LOOP_LAG_INTERVAL_SECONDS   how often lag is sampled
+"""
+import asyncio
+from collections import deque
+from typing import Deque, Optional
+
+from app.core.config import settings
+from app.core.metrics import REGISTRY, Histogram
+
+
+EVENT_LOOP_LAG = REGISTRY.register(Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop woke a sleeping task.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+))
+
+
+class EventLoopLagMonitor:
+    def __init__(self, interval: float = 0.25, window: int = 40) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        self.interval = interval
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def last_lag(self) -> Optional[float]:
+        return self._samples[-1] if self._samples else None
+
+    @property
+    def max_recent_lag(self) -> Optional[float]:
+        """Worst lag over the last `window` samples."""
+        return max(self._samples) if self._samples else None
+
+    def record(self, lag: float) -> None:
+        self._samples.append(lag)
+        EVENT_LOOP_LAG.observe(lag)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run(), name="event-loop-lag-monitor")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, loop.time() - expected))
+
+
+loop_lag_monitor = EventLoopLagMonitor(
+    interval=settings.loop_lag_interval_seconds,
+)
@@ -0,0 +1,491 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+Counters, gauges and histograms keep one shard of values per thread, so the
+hot path (``inc``/``observe``) never takes a lock: each thread only writes to
+its own shard, and a scrape sums the shards. Locks are only taken the first
+time a thread touches a metric or a new label combination appears.
+
+    from app.core.metrics import OPERATION_DURATION
+
+    with OPERATION_DURATION.labels(operation="pdf_extract").time():
+        ...
+
+``render()`` produces the text served by ``GET /metrics``.
+"""
+import functools
+import inspect
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import QueuePool
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+class _ShardedValues:
+    """A fixed-size vector of floats split into per-thread shards."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._shards: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def shard(self) -> List[float]:
+        try:
+            return self._local.values
+        except AttributeError:
+            values = [0.0] * self._size
+            with self._lock:
+                self._shards.append(values)
+            self._local.values = values
+            return values
+
+    def totals(self) -> List[float]:
+        with self._lock:
+            shards = list(self._shards)
+        totals = [0.0] * self._size
+        for values in shards:
+            for index, value in enumerate(values):
+                totals[index] += value
+        return totals
+
+
+class CounterChild:
+    def __init__(self) -> None:
+        self._values = _ShardedValues(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._values.shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._values.totals()[0]
+
+
+class GaugeChild(CounterChild):
+    def dec(self, amount: float = 1.0) -> None:
+        self._values.shard()[0] -= amount
+
+    @contextmanager
+    def track_inprogress(self) -> Iterator[None]:
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+
+class HistogramChild:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self._bounds = tuple(buckets)
+        # One slot per bucket, one for +Inf, then the running sum.
+        self._values = _ShardedValues(len(self._bounds) + 2)
+
+    def observe(self, value: float) -> None:
+        values = self._values.shard()
+        values[bisect_left(self._bounds, value)] += 1
+        values[-1] += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> Tuple[List[Tuple[float, float]], float, float]:
+        """Return (cumulative buckets, count, sum)."""
+        totals = self._values.totals()
+        cumulative: List[Tuple[float, float]] = []
+        running = 0.0
+        for bound, count in zip((*self._bounds, math.inf), totals[:-1]):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative, running, totals[-1]
+
+    @property
+    def count(self) -> float:
+        return self.snapshot()[1]
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_child(self):
+        """One time series; created the first time a label combination is used."""
+
+    def labels(self, **labels: str):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} requires labels {self.labelnames}")
+        return self.labels()
+
+    def children(self) -> List[Tuple[Dict[str, str], object]]:
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.labelnames, key)), child) for key, child in items]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+
+class Gauge(_Metric):
+    """A gauge that is either incremented/decremented or computed at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        function: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._function = function
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set_function(self, function: Callable[[], Dict[Tuple[str, ...], float]]) -> None:
+        """Compute values at scrape time; keys are label value tuples."""
+        self._function = function
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabelled().dec(amount)
+
+    def samples(self) -> List[Tuple[Dict[str, str], float]]:
+        if self._function is not None:
+            return [(dict(zip(self.labelnames, key)), value) for key, value in self._function().items()]
+        return [(labels, child.value) for labels, child in self.children()]  # type: ignore[attr-defined]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def time(self):
+        return self._unlabelled().time()
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: MetricT) -> MetricT:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            if isinstance(metric, Histogram):
+                for labels, child in metric.children():
+                    buckets, count, total = child.snapshot()  # type: ignore[attr-defined]
+                    for bound, cumulative in buckets:
+                        bucket_labels = {**labels, "le": _format_bound(bound)}
+                        lines.append(f"{metric.name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}")
+                    lines.append(f"{metric.name}_count{_format_labels(labels)} {_format_value(count)}")
+                    lines.append(f"{metric.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            elif isinstance(metric, Gauge):
+                for labels, value in metric.samples():
+                    lines.append(f"{metric.name}{_format_labels(labels)} {_format_value(value)}")
+            else:
+                for labels, child in metric.children():
+                    lines.append(f"{metric.name}{_format_labels(labels)} {_format_value(child.value)}")  # type: ignore[attr-defined]
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(float(bound))
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route", "status"),
+))
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+))
+OPERATION_DURATION = REGISTRY.register(Histogram(
+    "operation_duration_seconds",
+    "Latency of expensive in-process operations (PDF parsing and rendering, password hashing).",
+    ("operation",),
+))
+LLM_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "llm_request_duration_seconds",
+    "Latency of Gemini calls by operation and outcome.",
+    ("operation", "outcome"),
+))
+LLM_REQUESTS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "llm_requests_in_flight",
+    "Gemini calls currently awaiting a response.",
+))
+LLM_COALESCED_CALLS = REGISTRY.register(Counter(
+    "llm_coalesced_calls_total",
+    "Gemini calls answered by joining an identical call already in flight.",
+    ("operation",),
+))
+LLM_ROUTE_REQUESTS = REGISTRY.register(Counter(
+    "llm_route_requests_total",
+    "Gemini calls by task, routed model, routing rule and outcome.",
+    ("task", "model", "tier", "outcome"),
+))
+LLM_ROUTE_DURATION = REGISTRY.register(Histogram(
+    "llm_route_duration_seconds",
+    "Latency of Gemini calls by task and routed model.",
+    ("task", "model"),
+))
+LLM_ROUTE_TOKENS = REGISTRY.register(Counter(
+    "llm_route_tokens_total",
+    "Gemini tokens by task, routed model and direction (input or output).",
+    ("task", "model", "direction"),
+))
+LLM_ROUTE_COST = REGISTRY.register(Counter(
+    "llm_route_cost_usd_total",
+    "Estimated Gemini spend in USD by task and routed model.",
+    ("task", "model"),
+))
+REQUIREMENTS_CACHE_LOOKUPS = REGISTRY.register(Counter(
+    "requirements_cache_lookups_total",
+    "Requirement cache lookups by where they were answered (memory, database or miss).",
+    ("result",),
+))
+PROMPT_COMPACTION_TOKENS = REGISTRY.register(Counter(
+    "prompt_compaction_tokens_total",
+    "Estimated resume tokens before (input) and after (output) prompt compaction.",
+    ("stage",),
+))
+RESUME_UPLOADS = REGISTRY.register(Counter(
+    "resume_uploads_total",
+    "Resume library uploads by outcome (stored, or duplicate of a file already in the library).",
+    ("result",),
+))
+DB_QUERY_DURATION = REGISTRY.register(Histogram(
+    "db_query_duration_seconds",
+    "Database statement execution time by statement type.",
+    ("statement",),
+))
+DB_POOL_CHECKOUT_WAIT = REGISTRY.register(Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool.",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+))
+DB_POOL_CONNECTIONS = REGISTRY.register(Gauge(
+    "db_pool_connections",
+    "Database pool connections by state.",
+    ("state",),
+))
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+def track_operation(operation: str):
+    """Time a block of work under ``operation_duration_seconds``."""
+    return OPERATION_DURATION.labels(operation=operation).time()
+
+
+def timed_operation(operation: str):
+    """Decorator form of ``track_operation`` for sync and async functions."""
+    child = OPERATION_DURATION.labels(operation=operation)
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with child.time():
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with child.time():
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def _statement_type(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    if keyword in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH"):
+        return keyword
+    return "OTHER"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record query timings and expose pool usage for `engine`."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start_times = conn.info.get("query_start_times")
+        if start_times:
+            DB_QUERY_DURATION.labels(statement=_statement_type(statement)).observe(
+                time.perf_counter() - start_times.pop()
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start_times"):
+            connection.info["query_start_times"].pop()
+
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        def _pool_connections() -> Dict[Tuple[str, ...], float]:
+            return {
+                ("checked_out",): float(pool.checkedout()),
+                ("idle",): float(pool.checkedin()),
+                ("overflow",): float(max(pool.overflow(), 0)),
+                ("size",): float(pool.size()),
+            }
+
+        DB_POOL_CONNECTIONS.set_function(_pool_connections)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency per route template and status."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            # Label by template rather than raw path to keep cardinality bounded.
+            route_label = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.labels(
+                method=scope["method"],
+                route=route_label,
+                status=str(status_code),
+            ).observe(time.perf_counter() - start)
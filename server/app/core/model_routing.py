@@ -0,0 +1,288 @@
+"""
+Choice of Gemini model per task and prompt size.
+
+Every model call names its task: ``classification`` (is this a job
+description?), ``extraction`` (requirements from a posting), ``analysis``
+(resume against a job) or ``generation`` (cover letters). Each task starts
+on GEMINI_MODEL; LLM_ROUTES moves tasks, or only their large prompts, to
+other models:
+
+    LLM_ROUTES="classification=gemini-2.5-flash-lite;analysis>6000=gemini-2.5-pro"
+
+``task=model`` sets the task's model; ``task>N=model`` applies once the
+prompt is estimated at more than N tokens. The largest threshold a prompt
+exceeds wins.
+
+Every routed call is accounted per route (task, model and the rule that
+chose it): calls, failures, latency, tokens and estimated cost, both as
+metrics and, when LLM_ROUTE_REPORT_ENABLED is set, in the
+``GET /debug/llm-routes`` summary (``DELETE`` starts the accounting over).
+
+    GEMINI_MODEL                default model for every task
+    LLM_ROUTES                  per-task and per-size routes (see above)
+    LLM_MODEL_PRICES            USD per million input/output tokens, "model=input/output;..."
+    LLM_MODEL_OVERRIDE_ENABLED  1 to honour the X-LLM-Model request header (testing only)
+    LLM_ROUTE_REPORT_ENABLED    1 to serve /debug/llm-routes
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import LLM_ROUTE_COST, LLM_ROUTE_DURATION, LLM_ROUTE_REQUESTS, LLM_ROUTE_TOKENS
+from app.core.quota import estimate_tokens
+
+
+CLASSIFICATION = "classification"
+EXTRACTION = "extraction"
+ANALYSIS = "analysis"
+GENERATION = "generation"
+TASKS = (CLASSIFICATION, EXTRACTION, ANALYSIS, GENERATION)
+
+DEFAULT_TIER = "default"
+OVERRIDE_TIER = "override"
+
+MODEL_OVERRIDE_HEADER = b"x-llm-model"
+
+# Published list prices, USD per million tokens (input, output); LLM_MODEL_PRICES takes precedence.
+DEFAULT_PRICES: Dict[str, Tuple[float, float]] = {
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+}
+
+_model_override: ContextVar[Optional[str]] = ContextVar("llm_model_override", default=None)
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    The model chosen for one call.
+
+    Attributes:
+        task: One of TASKS
+        model: Gemini model name
+        tier: Rule that chose the model: "default", ">N" for a size threshold, or "override"
+        prompt_tokens: Estimated prompt tokens, used when the response reports no usage
+    """
+    task: str
+    model: str
+    tier: str
+    prompt_tokens: int
+
+
+@dataclass
+class RouteStats:
+    calls: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+
+def parse_routes(spec: str) -> Dict[str, List[Tuple[int, str]]]:
+    """
+    Parse LLM_ROUTES into ``{task: [(min_tokens, model), ...]}``, thresholds ascending.
+
+    Raises:
+        ValueError: If an entry is malformed or names an unknown task
+    """
+    routes: Dict[str, Dict[int, str]] = {}
+    for entry in filter(None, (part.strip() for part in spec.split(";"))):
+        target, separator, model = entry.partition("=")
+        task, _, threshold = target.partition(">")
+        task, model = task.strip(), model.strip()
+        if not separator or not model:
+            raise ValueError(f"LLM_ROUTES entry {entry!r} must look like task=model or task>tokens=model.")
+        if task not in TASKS:
+            raise ValueError(f"LLM_ROUTES entry {entry!r} names unknown task {task!r}; expected one of {TASKS}.")
+        try:
+            min_tokens = int(threshold) if threshold.strip() else 0
+        except ValueError:
+            raise ValueError(f"LLM_ROUTES entry {entry!r} has a non-integer token threshold.") from None
+        routes.setdefault(task, {})[min_tokens] = model
+    return {task: sorted(thresholds.items()) for task, thresholds in routes.items()}
+
+
+def parse_prices(spec: str) -> Dict[str, Tuple[float, float]]:
+    """
+    Parse LLM_MODEL_PRICES into ``{model: (input_usd, output_usd)}`` per million tokens.
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    prices: Dict[str, Tuple[float, float]] = {}
+    for entry in filter(None, (part.strip() for part in spec.split(";"))):
+        model, _, pair = entry.partition("=")
+        input_price, _, output_price = pair.partition("/")
+        try:
+            prices[model.strip()] = (float(input_price), float(output_price))
+        except ValueError:
+            raise ValueError(f"LLM_MODEL_PRICES entry {entry!r} must look like model=input/output.") from None
+    return prices
+
+
+def _usage_count(usage: Any, field: str) -> Optional[int]:
+    value = getattr(usage, field, None)
+    return value if isinstance(value, int) else None
+
+
+class ModelRouter:
+    """Pick a model per call and account for what each route costs."""
+
+    def __init__(
+        self,
+        default_model: str,
+        routes: Optional[Dict[str, List[Tuple[int, str]]]] = None,
+        prices: Optional[Dict[str, Tuple[float, float]]] = None,
+        override_enabled: bool = False,
+        report_enabled: bool = False,
+    ) -> None:
+        self.default_model = default_model
+        self.routes = routes or {}
+        self.prices = {**DEFAULT_PRICES, **(prices or {})}
+        self.override_enabled = override_enabled
+        self.report_enabled = report_enabled
+        self._stats: Dict[Tuple[str, str, str], RouteStats] = {}
+        self._lock = threading.Lock()
+
+    def route(self, task: str, prompt: str) -> Route:
+        """
+        Choose the model for a call.
+
+        Args:
+            task: One of TASKS
+            prompt: The full prompt; its estimated size selects the threshold
+
+        Returns:
+            Route: The model to call and why it was chosen
+        """
+        if task not in TASKS:
+            raise ValueError(f"Unknown task {task!r}; expected one of {TASKS}.")
+        prompt_tokens = estimate_tokens(prompt)
+
+        override = _model_override.get()
+        if override:
+            return Route(task=task, model=override, tier=OVERRIDE_TIER, prompt_tokens=prompt_tokens)
+
+        model, tier = self.default_model, DEFAULT_TIER
+        for min_tokens, routed_model in self.routes.get(task, ()):
+            if min_tokens and prompt_tokens <= min_tokens:
+                break
+            model, tier = routed_model, f">{min_tokens}" if min_tokens else DEFAULT_TIER
+        return Route(task=task, model=model, tier=tier, prompt_tokens=prompt_tokens)
+
+    def cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        """Estimated USD cost of a call; 0 for models without a known price."""
+        input_price, output_price = self.prices.get(model, (0.0, 0.0))
+        return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+    def record(self, route: Route, outcome: str, seconds: float, response: Any = None) -> None:
+        """
+        Account one call against its route.
+
+        Token counts come from the response's usage metadata when present;
+        otherwise the prompt estimate is used and no output tokens are counted.
+        """
+        usage = getattr(response, "usage_metadata", None)
+        input_tokens = _usage_count(usage, "prompt_token_count")
+        if input_tokens is None:
+            input_tokens = route.prompt_tokens if outcome == "success" else 0
+        output_tokens = _usage_count(usage, "candidates_token_count") or 0
+        cost = self.cost(route.model, input_tokens, output_tokens)
+
+        LLM_ROUTE_REQUESTS.labels(task=route.task, model=route.model, tier=route.tier, outcome=outcome).inc()
+        if outcome != "rejected":
+            LLM_ROUTE_DURATION.labels(task=route.task, model=route.model).observe(seconds)
+        LLM_ROUTE_TOKENS.labels(task=route.task, model=route.model, direction="input").inc(input_tokens)
+        LLM_ROUTE_TOKENS.labels(task=route.task, model=route.model, direction="output").inc(output_tokens)
+        LLM_ROUTE_COST.labels(task=route.task, model=route.model).inc(cost)
+
+        with self._lock:
+            stats = self._stats.setdefault((route.task, route.model, route.tier), RouteStats())
+            stats.calls += 1
+            stats.failures += outcome != "success"
+            stats.seconds += seconds
+            stats.input_tokens += input_tokens
+            stats.output_tokens += output_tokens
+            stats.cost_usd += cost
+
+    def report(self) -> Dict[str, Any]:
+        """Routing table and per-route accounting since startup (or the last reset)."""
+        with self._lock:
+            snapshot = sorted(self._stats.items())
+        return {
+            "default_model": self.default_model,
+            "routes": {
+                task: [{"min_tokens": min_tokens, "model": model} for min_tokens, model in thresholds]
+                for task, thresholds in sorted(self.routes.items())
+            },
+            "override_enabled": self.override_enabled,
+            "stats": [
+                {
+                    "task": task,
+                    "model": model,
+                    "tier": tier,
+                    "calls": stats.calls,
+                    "failures": stats.failures,
+                    "mean_latency_ms": round(stats.seconds / stats.calls * 1000, 1),
+                    "input_tokens": stats.input_tokens,
+                    "output_tokens": stats.output_tokens,
+                    "cost_usd": round(stats.cost_usd, 6),
+                    "cost_usd_per_call": round(stats.cost_usd / stats.calls, 6),
+                }
+                for (task, model, tier), stats in snapshot
+            ],
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+@contextmanager
+def override_model(model: Optional[str]) -> Iterator[None]:
+    """
+    Send every call in this context to `model`, whatever the routing table says.
+
+        with override_model("gemini-2.5-pro"):
+            await analyze_resume(...)
+    """
+    token = _model_override.set(model)
+    try:
+        yield
+    finally:
+        _model_override.reset(token)
+
+
+class ModelOverrideMiddleware:
+    """Apply the ``X-LLM-Model`` header to the request's calls when overrides are enabled."""
+
+    def __init__(self, app, router: Optional[ModelRouter] = None) -> None:
+        self.app = app
+        self.router = router or model_router
+
+    async def __call__(self, scope, receive, send) -> None:
+        model = None
+        if self.router.override_enabled and scope["type"] == "http":
+            for name, value in scope.get("headers", ()):
+                if name == MODEL_OVERRIDE_HEADER:
+                    model = value.decode("latin-1").strip() or None
+                    break
+        if model is None:
+            await self.app(scope, receive, send)
+            return
+        with override_model(model):
+            await self.app(scope, receive, send)
+
+
+model_router = ModelRouter(
+    default_model=settings.gemini_model,
+    routes=parse_routes(settings.llm_routes),
+    prices=parse_prices(settings.llm_model_prices),
+    override_enabled=settings.llm_model_override_enabled,
+    report_enabled=settings.llm_route_report_enabled,
+)
@@ -0,0 +1,295 @@
+"""
+Opt-in per-request sampling profiler.
+
+When enabled, selected requests are profiled by a sampler thread that
+periodically inspects the event-loop thread. Samples taken while the request's
+task is running record its Python stack; samples taken while it is suspended
+are recorded as ``<await>``. Both are prefixed with the spans open at the time
+(see ``span``), so time spent waiting on the model or in the threadpool shows
+up under the span that caused it.
+
+    PROFILING_ENABLED       1 to allow profiling at all (off: middleware is a pass-through)
+    PROFILING_SAMPLE_RATE   fraction of requests profiled automatically (0.0-1.0)
+    PROFILING_INTERVAL_MS   sampling interval
+    PROFILING_FORMAT        speedscope (default) or collapsed
+    PROFILING_OUTPUT_DIR    where profiles are written
+    PROFILING_SECRET        value of ``X-Profile`` that selects a request (unset: header ignored)
+    PROFILING_MAX_FILES     profiles kept in the output directory; the oldest are deleted
+
+A request can also ask to be profiled by sending ``X-Profile: <PROFILING_SECRET>``.
+The response carries ``X-Profile-Id``, the stem of the file written.
+"""
+import asyncio
+import hmac
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+FORMATS = ("speedscope", "collapsed")
+
+_MAX_DEPTH = 128
+_SERVER_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar("current_profile", default=None)
+
+
+class RequestProfile:
+    def __init__(self, profile_id: str, loop: asyncio.AbstractEventLoop, task: Optional[asyncio.Task]) -> None:
+        self.id = profile_id
+        self.name = ""
+        self.loop = loop
+        self.task = task
+        self.thread_id = threading.get_ident()
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.spans: List[str] = []
+        self.samples: Dict[Tuple[str, ...], int] = {}
+
+    def record(self, stack: Tuple[str, ...]) -> None:
+        self.samples[stack] = self.samples.get(stack, 0) + 1
+
+
+class span:
+    """
+    Label a block of work in the active request profile.
+
+    Costs a single context variable lookup when the request is not profiled.
+
+        with span("llm_wait"):
+            response = await client.aio.models.generate_content(...)
+    """
+
+    __slots__ = ("name", "_profile", "_label")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._profile: Optional[RequestProfile] = None
+
+    def __enter__(self) -> "span":
+        self._profile = _current_profile.get()
+        if self._profile is not None:
+            self._label = f"[{self.name}]"
+            self._profile.spans.append(self._label)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        profile = self._profile
+        if profile is not None:
+            # Remove this span specifically; concurrent subtasks may have nested their own.
+            for index in range(len(profile.spans) - 1, -1, -1):
+                if profile.spans[index] == self._label:
+                    del profile.spans[index]
+                    break
+
+
+def _frame_label(code) -> str:
+    filename = code.co_filename
+    if filename.startswith(_SERVER_ROOT):
+        filename = os.path.relpath(filename, _SERVER_ROOT)
+    else:
+        marker = filename.rfind("site-packages" + os.sep)
+        if marker != -1:
+            filename = filename[marker + len("site-packages") + 1:]
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _stack_of(frame) -> List[str]:
+    labels: List[str] = []
+    while frame is not None and len(labels) < _MAX_DEPTH:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+class Profiler:
+    def __init__(
+        self,
+        enabled: bool = False,
+        sample_rate: float = 0.0,
+        interval: float = 0.005,
+        output_format: str = "speedscope",
+        output_dir: str = "profiles",
+        secret: str = "",
+        max_files: int = 100,
+    ) -> None:
+        if output_format not in FORMATS:
+            raise ValueError(f"output_format must be one of {FORMATS}.")
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.output_format = output_format
+        self.output_dir = output_dir
+        self.secret = secret
+        self.max_files = max_files
+        self._active: Dict[str, RequestProfile] = {}
+        self._lock = threading.Lock()
+        self._sampler: Optional[threading.Thread] = None
+
+    def should_profile(self, scope) -> bool:
+        for name, value in scope.get("headers", ()):
+            if name == PROFILE_HEADER:
+                return bool(self.secret) and hmac.compare_digest(value.strip(), self.secret.encode())
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start(self) -> RequestProfile:
+        profile = RequestProfile(uuid.uuid4().hex[:16], asyncio.get_running_loop(), asyncio.current_task())
+        with self._lock:
+            self._active[profile.id] = profile
+            if self._sampler is None or not self._sampler.is_alive():
+                self._sampler = threading.Thread(target=self._sample_loop, name="request-profiler", daemon=True)
+                self._sampler.start()
+        return profile
+
+    def finish(self, profile: RequestProfile) -> None:
+        profile.duration = time.perf_counter() - profile.started
+        with self._lock:
+            self._active.pop(profile.id, None)
+
+    def _sample_loop(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            # Holding the lock while recording means no sample lands after finish().
+            with self._lock:
+                if not self._active:
+                    self._sampler = None
+                    return
+                frames = sys._current_frames()
+                for profile in self._active.values():
+                    spans = tuple(profile.spans)
+                    # current_task() only reads a dict keyed by loop, so it is safe here.
+                    if asyncio.current_task(profile.loop) is profile.task:
+                        frame = frames.get(profile.thread_id)
+                        stack = tuple(_stack_of(frame)) if frame is not None else ()
+                        profile.record(spans + stack)
+                    else:
+                        profile.record(spans + ("<await>",))
+
+    def render(self, profile: RequestProfile) -> str:
+        if self.output_format == "collapsed":
+            return self.render_collapsed(profile)
+        return json.dumps(self.render_speedscope(profile))
+
+    def render_collapsed(self, profile: RequestProfile) -> str:
+        """Brendan Gregg's folded format: one ``frame;frame;frame count`` line per stack."""
+        root = profile.name or "request"
+        lines = [
+            ";".join((root, *stack)) + f" {count}"
+            for stack, count in sorted(profile.samples.items())
+        ]
+        return "\n".join(lines) + "\n"
+
+    def render_speedscope(self, profile: RequestProfile) -> dict:
+        frames: List[dict] = []
+        index: Dict[str, int] = {}
+        samples: List[List[int]] = []
+        weights: List[float] = []
+        for stack, count in profile.samples.items():
+            indices = []
+            for label in (profile.name or "request", *stack):
+                if label not in index:
+                    index[label] = len(frames)
+                    frames.append({"name": label})
+                indices.append(index[label])
+            samples.append(indices)
+            weights.append(count * self.interval)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "recruiter-first-profiler",
+            "name": profile.name,
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": profile.name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": max(profile.duration, sum(weights)),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+    def write(self, profile: RequestProfile) -> str:
+        """Write the profile to the output directory and return its path."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        suffix = ".speedscope.json" if self.output_format == "speedscope" else ".collapsed"
+        slug = _UNSAFE_NAME.sub("_", profile.name).strip("_") or "request"
+        path = os.path.join(self.output_dir, f"{profile.id}-{slug}{suffix}")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(self.render(profile))
+        self._rotate()
+        return path
+
+    def _rotate(self) -> None:
+        """Delete the oldest profiles beyond ``max_files``."""
+        paths = [
+            entry for entry in os.scandir(self.output_dir)
+            if entry.is_file() and entry.name.endswith((".speedscope.json", ".collapsed"))
+        ]
+        if len(paths) <= self.max_files:
+            return
+        paths.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in paths[:len(paths) - self.max_files]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+class ProfilingMiddleware:
+    """Profile requests selected by ``Profiler.should_profile``."""
+
+    def __init__(self, app, profiler: Optional[Profiler] = None) -> None:
+        self.app = app
+        self.profiler = profiler or request_profiler
+
+    async def __call__(self, scope, receive, send) -> None:
+        profiler = self.profiler
+        if not profiler.enabled or scope["type"] != "http" or not profiler.should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = profiler.start()
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = [*message["headers"], (PROFILE_ID_HEADER, profile.id.encode())]
+            await send(message)
+
+        token = _current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_profile.reset(token)
+            profiler.finish(profile)
+            route = getattr(scope.get("route"), "path", None) or scope.get("path", "")
+            profile.name = f"{scope.get('method', '')} {route}".strip()
+            await run_in_threadpool(profiler.write, profile)
+
+
+request_profiler = Profiler(
+    enabled=settings.profiling_enabled,
+    sample_rate=settings.profiling_sample_rate,
+    interval=settings.profiling_interval_ms / 1000,
+    output_format=settings.profiling_format,
+    output_dir=settings.profiling_output_dir,
+    secret=settings.profiling_secret,
+    max_files=settings.profiling_max_files,
+)
@@ -0,0 +1,226 @@
+"""
+Cost-aware quota for LLM endpoints.
+
+Flat request limits treat a one-page resume and a thirty-page resume the
+same. This module charges each request by its estimated input tokens against
+a per-client token bucket that refills continuously, so many small requests
+are admitted while large ones draw down the budget faster.
+
+    LLM_QUOTA_STORAGE_URI           memory:// (default, per process) or sql://,
+                                    sql+postgresql://..., sql+sqlite:///... (shared)
+    LLM_QUOTA_CAPACITY              bucket size in tokens
+    LLM_QUOTA_REFILL_PER_SECOND     tokens restored per second
+"""
+import math
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Optional, Protocol, Tuple
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import Column, Engine, Float, MetaData, String, Table, case, create_engine, select, update
+
+from app.core.config import settings
+from app.core.rate_limit import get_rate_limit_key
+
+
+CHARS_PER_TOKEN = 4
+
+# Fixed prompt text wrapped around user input, in estimated tokens.
+RESUME_ANALYSIS_PROMPT_TOKENS = 250
+JOB_VALIDATION_PROMPT_TOKENS = 80
+COVER_LETTER_PROMPT_TOKENS = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough input token estimate for Gemini models (about four characters per token)."""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass(frozen=True)
+class QuotaDecision:
+    allowed: bool
+    cost: int
+    remaining: int
+    capacity: int
+    retry_after: Optional[float]
+
+    def headers(self) -> Dict[str, str]:
+        headers = {
+            "X-Quota-Limit": str(self.capacity),
+            "X-Quota-Remaining": str(self.remaining),
+            "X-Quota-Cost": str(self.cost),
+        }
+        if self.retry_after is not None:
+            headers["Retry-After"] = str(math.ceil(self.retry_after))
+        return headers
+
+
+class TokenBucketStore(Protocol):
+    def consume(self, key: str, cost: float, capacity: float, refill_per_second: float) -> Tuple[bool, float]:
+        """Atomically take `cost` tokens if available; returns (allowed, tokens left)."""
+        ...
+
+
+class InMemoryTokenBucketStore:
+    """
+    Per-process buckets. Each worker keeps its own budget.
+
+    A bucket that has refilled to capacity is the same as no bucket, so such
+    buckets are dropped every `sweep_interval` seconds; memory stays bounded
+    by the callers active within one refill period, not by every caller seen.
+    """
+
+    def __init__(self, sweep_interval: float = 60) -> None:
+        # key -> (tokens, updated_at, full_at)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._lock = Lock()
+        self._sweep_interval = sweep_interval
+        self._next_sweep = time.monotonic() + sweep_interval
+
+    def consume(self, key: str, cost: float, capacity: float, refill_per_second: float) -> Tuple[bool, float]:
+        now = time.monotonic()
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+            tokens, updated_at, _ = self._buckets.get(key, (capacity, now, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_per_second)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            full_at = now + (capacity - tokens) / refill_per_second if refill_per_second > 0 else math.inf
+            self._buckets[key] = (tokens, now, full_at)
+        return allowed, tokens
+
+    def _sweep(self, now: float) -> None:
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if bucket[2] > now}
+        self._next_sweep = now + self._sweep_interval
+
+
+_metadata = MetaData()
+
+_token_buckets = Table(
+    "llm_token_buckets",
+    _metadata,
+    Column("key", String(512), primary_key=True),
+    Column("tokens", Float, nullable=False),
+    Column("updated_at", Float, nullable=False),
+)
+
+
+class SQLTokenBucketStore:
+    """Buckets in a shared table so every worker draws from the same budget."""
+
+    def __init__(self, uri: str = "sql://", engine: Optional[Engine] = None) -> None:
+        self._uri = uri
+        self._engine = engine
+        self._table_ready = False
+        self._setup_lock = Lock()
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            if self._uri in ("sql://", "sql:///"):
+                from app.core.database import engine
+                self._engine = engine
+            else:
+                self._engine = create_engine(self._uri.removeprefix("sql+"), pool_pre_ping=True)
+        if not self._table_ready:
+            with self._setup_lock:
+                if not self._table_ready:
+                    _metadata.create_all(bind=self._engine, checkfirst=True)
+                    self._table_ready = True
+        return self._engine
+
+    def consume(self, key: str, cost: float, capacity: float, refill_per_second: float) -> Tuple[bool, float]:
+        engine = self.engine
+        if engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        now = time.time()
+        refilled = _token_buckets.c.tokens + (now - _token_buckets.c.updated_at) * refill_per_second
+        available = case((refilled > capacity, capacity), else_=refilled)
+
+        with engine.begin() as connection:
+            connection.execute(
+                insert(_token_buckets)
+                .values(key=key, tokens=capacity, updated_at=now)
+                .on_conflict_do_nothing(index_elements=[_token_buckets.c.key])
+            )
+            # The refill and the deduction happen in one conditional UPDATE, so
+            # concurrent workers can never spend the same tokens twice.
+            remaining = connection.execute(
+                update(_token_buckets)
+                .where(_token_buckets.c.key == key, available >= cost)
+                .values(tokens=available - cost, updated_at=now)
+                .returning(_token_buckets.c.tokens)
+            ).scalar()
+            if remaining is not None:
+                return True, float(remaining)
+
+            current = connection.execute(select(available).where(_token_buckets.c.key == key)).scalar()
+        return False, float(current or 0.0)
+
+
+def _store_from_uri(uri: str) -> TokenBucketStore:
+    if uri.startswith("memory://"):
+        return InMemoryTokenBucketStore()
+    if uri.startswith("sql"):
+        return SQLTokenBucketStore(uri)
+    raise ValueError(f"Unsupported LLM quota storage: {uri}")
+
+
+class TokenBucketQuota:
+    def __init__(self, store: TokenBucketStore, capacity: int, refill_per_second: float) -> None:
+        if capacity < 1 or refill_per_second <= 0:
+            raise ValueError("capacity and refill_per_second must be positive.")
+        self.store = store
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+
+    def consume(self, key: str, cost: int) -> QuotaDecision:
+        """Charge `cost` tokens to `key` if the bucket holds enough."""
+        if cost > self.capacity:
+            return QuotaDecision(False, cost, 0, self.capacity, None)
+
+        allowed, tokens = self.store.consume(key, cost, self.capacity, self.refill_per_second)
+        retry_after = None if allowed else (cost - tokens) / self.refill_per_second
+        return QuotaDecision(allowed, cost, max(0, math.floor(tokens)), self.capacity, retry_after)
+
+
+llm_quota = TokenBucketQuota(
+    _store_from_uri(settings.llm_quota_storage_uri),
+    capacity=settings.llm_quota_capacity,
+    refill_per_second=settings.llm_quota_refill_per_second,
+)
+
+
+def charge_llm_quota(request: Request, response: Response, cost: int) -> QuotaDecision:
+    """
+    Charge an LLM request against the caller's token budget.
+
+    Adds quota headers to the response on success.
+
+    Raises:
+        HTTPException: 413 if the request alone exceeds the bucket size,
+            429 with Retry-After if the budget is temporarily exhausted
+    """
+    decision = llm_quota.consume(get_rate_limit_key(request), cost)
+    if not decision.allowed:
+        if decision.retry_after is None:
+            raise HTTPException(
+                status_code=413,
+                detail="This request is too large to process. Please shorten your input and try again.",
+                headers=decision.headers(),
+            )
+        raise HTTPException(
+            status_code=429,
+            detail="You have used up your AI processing budget for now. Please try again later.",
+            headers=decision.headers(),
+        )
+    response.headers.update(decision.headers())
+    return decision
@@ -1,8 +1,45 @@
 """
 Rate limiting configuration
+
+Storage and strategy are configurable so that limits can be shared across
+worker processes:
+
+    RATE_LIMIT_STORAGE_URI   memory:// (default, per process), sql:// (shared
+                             table in DATABASE_URL), redis://host:6379, ...
+    RATE_LIMIT_STRATEGY      sliding-window-counter (default), fixed-window,
+                             moving-window
 """
+from fastapi import HTTPException, Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-# Initialize rate limiter with IP-based limiting
-limiter = Limiter(key_func=get_remote_address)
+import app.core.rate_limit_storage  # noqa: F401 - registers the sql:// storage scheme
+from app.core.config import settings
+
+RATE_LIMIT_STORAGE_URI = settings.rate_limit_storage_uri
+RATE_LIMIT_STRATEGY = settings.rate_limit_strategy
+
+
+def get_rate_limit_key(request: Request) -> str:
+    """
+    Key requests by authenticated user when a valid bearer token is present,
+    falling back to the client IP address otherwise.
+    """
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        from app.utils.security import decode_access_token
+        try:
+            user_id = decode_access_token(token).user_id
+        except HTTPException:
+            user_id = None
+        if user_id:
+            return f"user:{user_id}"
+    return f"ip:{get_remote_address(request)}"
+
+
+limiter = Limiter(
+    key_func=get_rate_limit_key,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy=RATE_LIMIT_STRATEGY,
+)
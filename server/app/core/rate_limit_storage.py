@@ -0,0 +1,226 @@
+"""
+Shared SQL storage backend for the rate limiter.
+
+The default slowapi storage keeps counters in process memory, so every worker
+enforces its own limits. This backend keeps counters in a database table that
+all workers share. Importing this module registers it with ``limits`` under
+the ``sql://`` scheme:
+
+    sql://                      -> reuse the application's DATABASE_URL engine
+    sql+postgresql://u:p@h/db   -> dedicated database for rate limit counters
+    sql+sqlite:///limits.db     -> local file, shared by workers on one host
+
+Counters are incremented with a single atomic upsert, and the sliding window
+counter strategy is supported on top of them.
+"""
+import time
+from math import floor
+from threading import Lock
+from typing import Optional
+
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+from sqlalchemy import (
+    Column,
+    Engine,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    case,
+    create_engine,
+    delete,
+    select,
+    update,
+)
+from sqlalchemy.exc import SQLAlchemyError
+
+
+metadata = MetaData()
+
+rate_limit_counters = Table(
+    "rate_limit_counters",
+    metadata,
+    Column("key", String(512), primary_key=True),
+    Column("count", Integer, nullable=False),
+    Column("expires_at", Float, nullable=False, index=True),
+)
+
+# Expired rows are purged opportunistically once every this many increments.
+_PURGE_INTERVAL = 1000
+
+
+def _insert_for(engine: Engine):
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif engine.dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Unsupported rate limit storage dialect: {engine.dialect.name}")
+    return insert
+
+
+class SQLStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """Rate limit storage backed by a shared PostgreSQL or SQLite table."""
+
+    STORAGE_SCHEME = ["sql", "sql+postgresql", "sql+sqlite"]
+
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        wrap_exceptions: bool = False,
+        engine: Optional[Engine] = None,
+        **options: float | str | bool,
+    ) -> None:
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self._uri = uri or "sql://"
+        self._engine = engine
+        self._table_ready = False
+        self._setup_lock = Lock()
+        self._increments = 0
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return SQLAlchemyError
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            if self._uri in ("sql://", "sql:///"):
+                from app.core.database import engine
+                self._engine = engine
+            else:
+                self._engine = create_engine(self._uri.removeprefix("sql+"), pool_pre_ping=True)
+        if not self._table_ready:
+            with self._setup_lock:
+                if not self._table_ready:
+                    metadata.create_all(bind=self._engine, checkfirst=True)
+                    self._table_ready = True
+        return self._engine
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        """Atomically add `amount` to a counter, restarting it if it has expired."""
+        engine = self.engine
+        now = time.time()
+        insert = _insert_for(engine)
+        statement = insert(rate_limit_counters).values(key=key, count=amount, expires_at=now + expiry)
+        expired = rate_limit_counters.c.expires_at <= now
+        statement = statement.on_conflict_do_update(
+            index_elements=[rate_limit_counters.c.key],
+            set_={
+                "count": case((expired, amount), else_=rate_limit_counters.c.count + amount),
+                "expires_at": case((expired, now + expiry), else_=rate_limit_counters.c.expires_at),
+            },
+        ).returning(rate_limit_counters.c.count)
+
+        with engine.begin() as connection:
+            count = connection.execute(statement).scalar_one()
+
+        self._increments += 1
+        if self._increments % _PURGE_INTERVAL == 0:
+            self._purge_expired(now)
+        return int(count)
+
+    def decr(self, key: str, amount: int = 1) -> int:
+        """Subtract `amount` from a live counter, never going below zero."""
+        now = time.time()
+        statement = update(rate_limit_counters).where(
+            rate_limit_counters.c.key == key,
+            rate_limit_counters.c.expires_at > now,
+        ).values(
+            count=case(
+                (rate_limit_counters.c.count > amount, rate_limit_counters.c.count - amount),
+                else_=0,
+            )
+        ).returning(rate_limit_counters.c.count)
+
+        with self.engine.begin() as connection:
+            count = connection.execute(statement).scalar()
+        return int(count or 0)
+
+    def get(self, key: str) -> int:
+        now = time.time()
+        with self.engine.connect() as connection:
+            count = connection.execute(
+                select(rate_limit_counters.c.count).where(
+                    rate_limit_counters.c.key == key,
+                    rate_limit_counters.c.expires_at > now,
+                )
+            ).scalar()
+        return int(count or 0)
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self.engine.connect() as connection:
+            expires_at = connection.execute(
+                select(rate_limit_counters.c.expires_at).where(
+                    rate_limit_counters.c.key == key,
+                    rate_limit_counters.c.expires_at > now,
+                )
+            ).scalar()
+        return float(expires_at) if expires_at is not None else now
+
+    def check(self) -> bool:
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(select(1))
+            return True
+        except SQLAlchemyError:
+            return False
+
+    def reset(self) -> Optional[int]:
+        with self.engine.begin() as connection:
+            return connection.execute(delete(rate_limit_counters)).rowcount
+
+    def clear(self, key: str) -> None:
+        with self.engine.begin() as connection:
+            connection.execute(delete(rate_limit_counters).where(rate_limit_counters.c.key == key))
+
+    def _purge_expired(self, now: float) -> None:
+        with self.engine.begin() as connection:
+            connection.execute(delete(rate_limit_counters).where(rate_limit_counters.c.expires_at <= now))
+
+    # Sliding window counter support: one counter per fixed window, weighted
+    # by how much of the previous window still overlaps the sliding window.
+
+    def _window_counts(self, key: str, expiry: int, now: float) -> tuple[int, float, int, float]:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        with self.engine.connect() as connection:
+            rows = dict(connection.execute(
+                select(rate_limit_counters.c.key, rate_limit_counters.c.count).where(
+                    rate_limit_counters.c.key.in_([previous_key, current_key]),
+                    rate_limit_counters.c.expires_at > now,
+                )
+            ).all())
+        previous_count = int(rows.get(previous_key, 0))
+        current_count = int(rows.get(current_key, 0))
+        previous_ttl = 0.0 if previous_count == 0 else (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        previous_count, previous_ttl, current_count, _ = self._window_counts(key, expiry, now)
+        if floor(previous_count * previous_ttl / expiry + current_count) + amount > limit:
+            return False
+
+        _, current_key = self.sliding_window_keys(key, expiry, now)
+        current_count = self.incr(current_key, 2 * expiry, amount=amount)
+        if floor(previous_count * previous_ttl / expiry + current_count) > limit:
+            # A concurrent hit from another worker won the race; give the slot back.
+            self.decr(current_key, amount)
+            return False
+        return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        return self._window_counts(key, expiry, time.time())
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(key, expiry, time.time())
+        with self.engine.begin() as connection:
+            connection.execute(
+                delete(rate_limit_counters).where(rate_limit_counters.c.key.in_([previous_key, current_key]))
+            )
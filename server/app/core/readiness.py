@@ -0,0 +1,177 @@
+"""
+Readiness probe.
+
+Unlike ``/health`` (liveness), readiness reports whether this worker should
+receive traffic: the database answers within a bounded time, the connection
+pool is not saturated, the Gemini circuit breaker is closed and the event
+loop is not falling behind. Results are cached briefly so frequent probes
+from several load balancers cost one check per interval.
+
+The database ping runs on a dedicated thread, not the default executor
+shared with ``run_in_threadpool``. A ping that outlives its timeout keeps
+that thread, and later probes fail at once instead of queueing another
+ping behind it, so a hung database costs one thread in total.
+
+    READINESS_CACHE_SECONDS         how long a result is reused
+    READINESS_DB_TIMEOUT_SECONDS    upper bound for the database round trip
+    READINESS_POOL_SATURATION       fraction of pool capacity in use that fails the probe
+    READINESS_MAX_LOOP_LAG_SECONDS  event-loop lag that fails the probe
+    DATABASE_MAX_OVERFLOW           counted with the pool size as the pool's capacity
+"""
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import Engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.core.llm import CLOSED, HALF_OPEN, CircuitBreaker, llm_breaker
+from app.core.loop_monitor import EventLoopLagMonitor, loop_lag_monitor
+from app.models.health import DependencyCheck, ReadinessResponse
+
+
+CHECK_OK = "ok"
+CHECK_DEGRADED = "degraded"
+CHECK_FAIL = "fail"
+
+
+class ReadinessProbe:
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        breaker: CircuitBreaker = llm_breaker,
+        loop_monitor: EventLoopLagMonitor = loop_lag_monitor,
+        cache_seconds: float = 2.0,
+        db_timeout: float = 1.0,
+        pool_saturation_limit: float = 0.9,
+        max_loop_lag: float = 0.5,
+        pool_max_overflow: int = 20,
+    ) -> None:
+        self._engine = engine
+        self.breaker = breaker
+        self.loop_monitor = loop_monitor
+        self.cache_seconds = cache_seconds
+        self.db_timeout = db_timeout
+        self.pool_saturation_limit = pool_saturation_limit
+        self.max_loop_lag = max_loop_lag
+        self.pool_max_overflow = pool_max_overflow
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="readiness-db")
+        self._ping: Optional[Future] = None
+        self._cached: Optional[ReadinessResponse] = None
+        self._cached_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            from app.core.database import engine
+            self._engine = engine
+        return self._engine
+
+    @engine.setter
+    def engine(self, value: Engine) -> None:
+        self._engine = value
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self._cached = None
+
+    async def check(self) -> ReadinessResponse:
+        """Return the cached result if it is fresh, otherwise run every check once."""
+        if self._cached is not None and time.monotonic() - self._cached_at < self.cache_seconds:
+            return self._cached
+
+        async with self._lock:
+            # Another probe may have refreshed the result while this one waited.
+            if self._cached is not None and time.monotonic() - self._cached_at < self.cache_seconds:
+                return self._cached
+
+            checks: Dict[str, DependencyCheck] = {
+                "database": await self._check_database(),
+                "database_pool": self._check_pool(),
+                "llm": self._check_llm(),
+                "event_loop": self._check_event_loop(),
+            }
+            ready = all(check.status != CHECK_FAIL for check in checks.values())
+            self._cached = ReadinessResponse(
+                status="ready" if ready else "not_ready",
+                checked_at=datetime.now(timezone.utc),
+                checks=checks,
+            )
+            self._cached_at = time.monotonic()
+            return self._cached
+
+    def _ping_database(self) -> None:
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    async def _check_database(self) -> DependencyCheck:
+        start = time.perf_counter()
+        if self._ping is not None and not self._ping.done():
+            return DependencyCheck(
+                status=CHECK_FAIL,
+                latency_ms=0.0,
+                detail="The previous check has not answered yet.",
+            )
+        self._ping = self._executor.submit(self._ping_database)
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(self._ping), timeout=self.db_timeout)
+        except asyncio.TimeoutError:
+            return DependencyCheck(
+                status=CHECK_FAIL,
+                latency_ms=round((time.perf_counter() - start) * 1000, 2),
+                detail=f"No response within {self.db_timeout:g}s.",
+            )
+        except Exception as e:
+            return DependencyCheck(
+                status=CHECK_FAIL,
+                latency_ms=round((time.perf_counter() - start) * 1000, 2),
+                detail=type(e).__name__,
+            )
+        return DependencyCheck(status=CHECK_OK, latency_ms=round((time.perf_counter() - start) * 1000, 2))
+
+    def _check_pool(self) -> DependencyCheck:
+        pool = self.engine.pool
+        if not isinstance(pool, QueuePool):
+            return DependencyCheck(status=CHECK_OK, detail="Connection pool is not bounded.")
+
+        capacity = pool.size() + max(self.pool_max_overflow, 0)
+        in_use = pool.checkedout()
+        saturation = in_use / capacity if capacity else 0.0
+        return DependencyCheck(
+            status=CHECK_FAIL if saturation >= self.pool_saturation_limit else CHECK_OK,
+            detail=f"{in_use}/{capacity} connections in use.",
+        )
+
+    def _check_llm(self) -> DependencyCheck:
+        state = self.breaker.state
+        if state == CLOSED:
+            return DependencyCheck(status=CHECK_OK, detail="Circuit closed.")
+        if state == HALF_OPEN:
+            return DependencyCheck(status=CHECK_DEGRADED, detail="Circuit half-open; trial call allowed.")
+        return DependencyCheck(
+            status=CHECK_FAIL,
+            detail=f"Circuit open; retrying in {self.breaker.seconds_until_retry():.0f}s.",
+        )
+
+    def _check_event_loop(self) -> DependencyCheck:
+        lag = self.loop_monitor.max_recent_lag
+        if lag is None:
+            return DependencyCheck(status=CHECK_OK, detail="No lag samples yet.")
+        return DependencyCheck(
+            status=CHECK_FAIL if lag >= self.max_loop_lag else CHECK_OK,
+            latency_ms=round(lag * 1000, 2),
+            detail="Worst recent event-loop lag.",
+        )
+
+
+readiness_probe = ReadinessProbe(
+    cache_seconds=settings.readiness_cache_seconds,
+    db_timeout=settings.readiness_db_timeout_seconds,
+    pool_saturation_limit=settings.readiness_pool_saturation,
+    max_loop_lag=settings.readiness_max_loop_lag_seconds,
+    pool_max_overflow=settings.database_max_overflow,
+)
@@ -0,0 +1,75 @@
+"""
+Single-flight coalescing of identical in-flight calls.
+
+When a posting is shared, many users submit the same job description at
+once. ``SingleFlight.do`` lets the first caller for a key start the work and
+every caller that arrives while it is still running await that same result
+(or exception) instead of starting its own. Nothing is cached: once the call
+finishes, the next caller for the key starts a fresh one.
+
+    from app.core.single_flight import llm_flights, prompt_key
+
+    response = await llm_flights.do(
+        prompt_key("generate_requirements", route.model, prompt),
+        lambda: client.aio.models.generate_content(...),
+        operation="generate_requirements",
+    )
+"""
+import asyncio
+import hashlib
+from typing import Awaitable, Callable, Dict, TypeVar
+
+from app.core.metrics import LLM_COALESCED_CALLS
+from app.utils.sanitization import preflight
+
+
+T = TypeVar("T")
+
+
+def prompt_key(operation: str, model: str, prompt: str) -> str:
+    """
+    Hash a prompt for coalescing.
+
+    Built on the prompt's preflight digest, the canonical key for request
+    text, so prompts that only differ in formatting of the user's text share
+    a key.
+    """
+    digest = preflight(prompt).digest
+    return hashlib.sha256(f"{operation}\0{model}\0{digest}".encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, asyncio.Task] = {}
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[T]], operation: str) -> T:
+        """
+        Await the call for `key`, starting it with `factory` if none is running.
+
+        The call runs in its own task, so a caller being cancelled does not
+        cancel it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._calls.get(key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(factory())
+            self._calls[key] = task
+            task.add_done_callback(lambda finished: self._forget(key, finished))
+        else:
+            LLM_COALESCED_CALLS.labels(operation=operation).inc()
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            task.exception()
+
+
+llm_flights = SingleFlight()
@@ -0,0 +1,106 @@
+"""
+In-process background task queue.
+
+A small asyncio worker pool for work that should not hold an HTTP response
+open (e.g. AI enrichment). Tasks enqueued before the queue is started are
+kept in a backlog and scheduled once the workers come up. Tasks may be
+enqueued from a threadpool thread (e.g. by a service running its database
+work off the event loop); they are handed to the queue's loop. Durability is the
+caller's responsibility: persist enough state to re-enqueue work on startup.
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Tuple, cast
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+TaskFunc = Callable[..., Awaitable[Any]]
+
+
+class BackgroundTaskQueue:
+    def __init__(self, name: str, workers: int = 2) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        self.name = name
+        self._worker_count = workers
+        self._queue: Optional[asyncio.Queue[Tuple[TaskFunc, Tuple[Any, ...]]]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._backlog: Deque[Tuple[TaskFunc, Tuple[Any, ...]]] = deque()
+        self._workers: List[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    def pending(self) -> int:
+        """Number of tasks waiting to be picked up by a worker."""
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return queued + len(self._backlog)
+
+    def enqueue(self, func: TaskFunc, *args: Any) -> None:
+        """Schedule `await func(*args)` on a worker."""
+        if self._queue is None:
+            self._backlog.append((func, args))
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._queue.put_nowait((func, args))
+        else:
+            # asyncio.Queue is not thread-safe; put from the queue's own loop.
+            cast(asyncio.AbstractEventLoop, self._loop).call_soon_threadsafe(self._queue.put_nowait, (func, args))
+
+    async def start(self) -> None:
+        """Start the worker pool on the running event loop and flush the backlog."""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        while self._backlog:
+            self._queue.put_nowait(self._backlog.popleft())
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"{self.name}-worker-{index}")
+            for index in range(self._worker_count)
+        ]
+
+    async def join(self) -> None:
+        """Wait until every enqueued task has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """Cancel the workers. Unfinished tasks are dropped; callers re-enqueue from persisted state."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._queue = None
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        queue = self._queue
+        while True:
+            func, args = await queue.get()
+            try:
+                await func(*args)
+            except Exception:
+                logger.exception("Background task %s failed in queue %s", getattr(func, "__name__", func), self.name)
+            finally:
+                queue.task_done()
+
+
+enrichment_queue = BackgroundTaskQueue(
+    "enrichment",
+    workers=settings.enrichment_workers,
+)
+
+analysis_queue = BackgroundTaskQueue(
+    "analysis",
+    workers=settings.analysis_workers,
+)
@@ -0,0 +1,304 @@
+"""
+Durable work queue backed by the ``work_queue_tasks`` table.
+
+Tasks are enqueued inside the caller's transaction and drained by any number
+of ``python -m app.worker`` processes on any number of hosts, without a
+separate broker. Workers claim batches with ``SELECT ... FOR UPDATE SKIP
+LOCKED`` on PostgreSQL, so concurrent claims never block on or return the
+same rows (SQLite, used in tests, serializes writers instead).
+
+A claim is a lease: the task stays ``running`` until ``locked_until`` and is
+claimable again once the lease expires, so work held by a crashed worker is
+picked up by another. Workers extend the leases of tasks they are still
+running. Every claim counts as an attempt; failed attempts are retried with
+exponential backoff until ``max_attempts`` is reached.
+
+Payloads can carry personal data (resume text, contact details), so once a
+task is done or has failed for good its payload is cut down to ``user_id``,
+which is all that is needed to authorize reading the result. Finished tasks
+are deleted after ``WORK_QUEUE_RETENTION_SECONDS``.
+
+    WORK_QUEUE_VISIBILITY_TIMEOUT_SECONDS  lease length of a claim
+    WORK_QUEUE_MAX_ATTEMPTS                default claims allowed per task
+    WORK_QUEUE_RETRY_BASE_SECONDS          backoff after the first failed attempt, doubled per attempt
+    WORK_QUEUE_RETRY_MAX_SECONDS           backoff ceiling
+    WORK_QUEUE_RETENTION_SECONDS           how long finished tasks and their results are kept
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+from uuid import UUID, uuid4
+
+from sqlalchemy import Engine, and_, delete, func, or_, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.database.work_task import WorkTask
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+WORK_QUEUE_VISIBILITY_TIMEOUT_SECONDS = settings.work_queue_visibility_timeout_seconds
+WORK_QUEUE_MAX_ATTEMPTS = settings.work_queue_max_attempts
+WORK_QUEUE_RETRY_BASE_SECONDS = settings.work_queue_retry_base_seconds
+WORK_QUEUE_RETRY_MAX_SECONDS = settings.work_queue_retry_max_seconds
+WORK_QUEUE_RETENTION_SECONDS = settings.work_queue_retention_seconds
+
+# Payload keys kept once a task has finished.
+RETAINED_PAYLOAD_KEYS = ("user_id",)
+
+_tasks = WorkTask.__table__
+
+
+@dataclass(frozen=True)
+class ClaimedTask:
+    """A task leased to one worker. `attempts` identifies this particular claim."""
+    id: UUID
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+_current_task: ContextVar[Optional[ClaimedTask]] = ContextVar("work_queue_task", default=None)
+
+
+def scrubbed_payload(payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The part of a finished task's payload that is kept."""
+    return {key: value for key, value in (payload or {}).items() if key in RETAINED_PAYLOAD_KEYS}
+
+
+def current_task() -> Optional[ClaimedTask]:
+    """The task whose handler is running, or None outside a worker."""
+    return _current_task.get()
+
+
+@contextmanager
+def running_task(task: ClaimedTask) -> Iterator[None]:
+    """Make `task` the ``current_task()`` while its handler runs."""
+    token = _current_task.set(task)
+    try:
+        yield
+    finally:
+        _current_task.reset(token)
+
+
+def enqueue(
+    db: Union[Session, Connection],
+    kind: str,
+    payload: Dict[str, Any],
+    max_attempts: int = WORK_QUEUE_MAX_ATTEMPTS,
+    delay: float = 0.0,
+) -> UUID:
+    """
+    Add a task in the caller's transaction; it becomes claimable on commit.
+
+    Args:
+        db: Session or connection whose transaction the insert joins
+        kind: Handler name
+        payload: JSON-serializable handler arguments
+        max_attempts: Claims allowed before the task is marked failed
+        delay: Seconds before the task may first be claimed
+
+    Returns:
+        The new task's ID
+    """
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be at least 1.")
+    task_id = uuid4()
+    now = time.time()
+    db.execute(_tasks.insert().values(
+        id=task_id,
+        kind=kind,
+        payload=payload,
+        status=QUEUED,
+        attempts=0,
+        max_attempts=max_attempts,
+        available_at=now + delay,
+        created_at=now,
+    ))
+    return task_id
+
+
+class WorkQueue:
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        visibility_timeout: float = WORK_QUEUE_VISIBILITY_TIMEOUT_SECONDS,
+        retry_base_delay: float = WORK_QUEUE_RETRY_BASE_SECONDS,
+        retry_max_delay: float = WORK_QUEUE_RETRY_MAX_SECONDS,
+        retention: float = WORK_QUEUE_RETENTION_SECONDS,
+    ) -> None:
+        if visibility_timeout <= 0:
+            raise ValueError("visibility_timeout must be positive.")
+        self._engine = engine
+        self._engine_lock = Lock()
+        self.visibility_timeout = visibility_timeout
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retention = retention
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            with self._engine_lock:
+                if self._engine is None:
+                    from app.core.database import engine
+                    self._engine = engine
+        return self._engine
+
+    def claim_statement(self, worker_id: str, limit: int, now: float, kinds: Optional[Sequence[str]] = None):
+        """UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED) RETURNING the claimed rows."""
+        claimable = or_(
+            and_(_tasks.c.status == QUEUED, _tasks.c.available_at <= now),
+            and_(
+                _tasks.c.status == RUNNING,
+                _tasks.c.locked_until < now,
+                _tasks.c.attempts < _tasks.c.max_attempts,
+            ),
+        )
+        candidates = select(_tasks.c.id).where(claimable)
+        if kinds:
+            candidates = candidates.where(_tasks.c.kind.in_(list(kinds)))
+        candidates = candidates.order_by(_tasks.c.available_at).limit(limit).with_for_update(skip_locked=True)
+        return (
+            update(_tasks)
+            .where(_tasks.c.id.in_(candidates.scalar_subquery()))
+            .values(
+                status=RUNNING,
+                attempts=_tasks.c.attempts + 1,
+                locked_by=worker_id,
+                locked_until=now + self.visibility_timeout,
+            )
+            .returning(_tasks.c.id, _tasks.c.kind, _tasks.c.payload, _tasks.c.attempts, _tasks.c.max_attempts)
+        )
+
+    def claim(self, worker_id: str, limit: int, kinds: Optional[Sequence[str]] = None) -> List[ClaimedTask]:
+        """
+        Lease up to `limit` claimable tasks to `worker_id`, oldest first.
+
+        Tasks whose lease expired on their last allowed attempt are marked
+        failed instead of being handed out again.
+        """
+        if limit < 1:
+            return []
+        now = time.time()
+        with self.engine.begin() as connection:
+            expired = connection.execute(
+                update(_tasks)
+                .where(
+                    _tasks.c.status == RUNNING,
+                    _tasks.c.locked_until < now,
+                    _tasks.c.attempts >= _tasks.c.max_attempts,
+                )
+                .values(
+                    status=FAILED,
+                    locked_by=None,
+                    locked_until=None,
+                    finished_at=now,
+                    last_error=func.coalesce(_tasks.c.last_error, "Lease expired on the final attempt."),
+                )
+                .returning(_tasks.c.id, _tasks.c.payload)
+            ).all()
+            for row in expired:
+                connection.execute(
+                    update(_tasks).where(_tasks.c.id == row.id).values(payload=scrubbed_payload(row.payload))
+                )
+            rows = connection.execute(self.claim_statement(worker_id, limit, now, kinds)).all()
+        return [
+            ClaimedTask(id=row.id, kind=row.kind, payload=row.payload or {}, attempts=row.attempts,
+                        max_attempts=row.max_attempts)
+            for row in rows
+        ]
+
+    def _held(self, worker_id: str, task: ClaimedTask):
+        return and_(
+            _tasks.c.id == task.id,
+            _tasks.c.status == RUNNING,
+            _tasks.c.locked_by == worker_id,
+            _tasks.c.attempts == task.attempts,
+        )
+
+    def heartbeat(self, worker_id: str, tasks: Sequence[ClaimedTask]) -> int:
+        """Extend the leases of `tasks`; returns how many are still held by `worker_id`."""
+        if not tasks:
+            return 0
+        now = time.time()
+        extended = 0
+        with self.engine.begin() as connection:
+            for task in tasks:
+                extended += connection.execute(
+                    update(_tasks).where(self._held(worker_id, task)).values(locked_until=now + self.visibility_timeout)
+                ).rowcount
+        return extended
+
+    def complete(self, worker_id: str, task: ClaimedTask, result: Optional[Dict[str, Any]] = None) -> bool:
+        """Mark a task done. Returns False if the lease was lost to another worker."""
+        with self.engine.begin() as connection:
+            return connection.execute(
+                update(_tasks).where(self._held(worker_id, task)).values(
+                    status=DONE,
+                    payload=scrubbed_payload(task.payload),
+                    result=result,
+                    locked_by=None,
+                    locked_until=None,
+                    finished_at=time.time(),
+                )
+            ).rowcount == 1
+
+    def retry_delay(self, attempts: int) -> float:
+        return min(self.retry_max_delay, self.retry_base_delay * 2 ** max(attempts - 1, 0))
+
+    def fail(self, worker_id: str, task: ClaimedTask, error: str, retryable: bool = True) -> Optional[str]:
+        """
+        Record a failed attempt.
+
+        The task is queued again after a backoff while attempts remain and the
+        error is retryable; otherwise it is marked failed.
+
+        Returns:
+            The task's new status, or None if the lease was lost to another worker
+        """
+        now = time.time()
+        if retryable and task.attempts < task.max_attempts:
+            values = {"status": QUEUED, "available_at": now + self.retry_delay(task.attempts)}
+        else:
+            values = {"status": FAILED, "finished_at": now, "payload": scrubbed_payload(task.payload)}
+        with self.engine.begin() as connection:
+            updated = connection.execute(
+                update(_tasks).where(self._held(worker_id, task)).values(
+                    locked_by=None,
+                    locked_until=None,
+                    last_error=error,
+                    **values,
+                )
+            ).rowcount
+        return values["status"] if updated == 1 else None
+
+    def purge(self) -> int:
+        """Delete tasks that finished more than ``retention`` seconds ago; returns how many."""
+        with self.engine.begin() as connection:
+            return connection.execute(
+                delete(_tasks).where(
+                    _tasks.c.status.in_((DONE, FAILED)),
+                    _tasks.c.finished_at < time.time() - self.retention,
+                )
+            ).rowcount
+
+    def pending(self, kind: Optional[str] = None) -> int:
+        """Number of tasks waiting to be claimed."""
+        query = select(func.count()).select_from(_tasks).where(_tasks.c.status == QUEUED)
+        if kind is not None:
+            query = query.where(_tasks.c.kind == kind)
+        with self.engine.connect() as connection:
+            return int(connection.execute(query).scalar() or 0)
+
+
+work_queue = WorkQueue()
@@ -1,22 +1,47 @@
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
+from app.core.blocking_detector import BlockingDetectorMiddleware, blocking_detector
+from app.core.compression import CompressionMiddleware
+from app.core.loop_monitor import loop_lag_monitor
+from app.core.metrics import MetricsMiddleware
+from app.core.model_routing import ModelOverrideMiddleware
+from app.core.profiling import ProfilingMiddleware
 from app.core.rate_limit import limiter
 from app.core.database import init_db
-from app.api import health, resume, auth, job_application, cover_letter
+from app.core.task_queue import analysis_queue, enrichment_queue
+from app.api import debug, health, metrics, resume, auth, job_application, cover_letter
+from app.services.analysis_job_service import requeue_analysis_jobs
+from app.services.job_application_service import requeue_pending_enrichments
 
 app = FastAPI(
     title="Recruiter First API",
     description="API for resume and job description matching",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Initialize database
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables on application startup"""
+    """Initialize database tables and background workers on application startup"""
     init_db()
+    await loop_lag_monitor.start()
+    await enrichment_queue.start()
+    await analysis_queue.start()
+    requeue_pending_enrichments()
+    requeue_analysis_jobs()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background workers; pending work is re-enqueued on next startup"""
+    await enrichment_queue.stop()
+    await analysis_queue.stop()
+    await loop_lag_monitor.stop()
+    blocking_detector.stop()
 
 # Add rate limit exceeded handler
 app.state.limiter = limiter
@@ -33,7 +58,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(BlockingDetectorMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(ModelOverrideMiddleware)
+
 app.include_router(health.router, tags=["Health"])
+app.include_router(metrics.router, tags=["Monitoring"])
+app.include_router(debug.router, tags=["Monitoring"])
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(resume.router, prefix="/api/v1", tags=["Resume"])
 app.include_router(job_application.router, prefix="/api/v1", tags=["Job Applications"])
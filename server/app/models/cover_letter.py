@@ -1,4 +1,6 @@
 from datetime import datetime
+from typing import Optional
+from uuid import UUID
 from pydantic import BaseModel, Field, AliasChoices, ConfigDict, field_validator
 
 
@@ -29,6 +31,11 @@ class CoverLetterGenerateRequest(BaseModel):
         description="Core job requirements",
     )
     company: str = Field(default="", max_length=255, description="Target company")
+    resume_id: Optional[UUID] = Field(
+        default=None,
+        validation_alias=AliasChoices("resume_id", "resumeId"),
+        description="Stored resume to draw the applicant's experience from",
+    )
 
     @field_validator("job_title", "hiring_manager_name", "company")
     @classmethod
@@ -77,3 +84,11 @@ class CoverLetterDocument(BaseModel):
 class CoverLetterGenerateResponse(BaseModel):
     document_id: str = Field(..., description="Generated cover letter document identifier")
     cover_letter: str = Field(..., description="Generated cover letter text")
+
+
+class CoverLetterJobResponse(BaseModel):
+    id: UUID = Field(..., description="Job ID to poll")
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    result: Optional[CoverLetterGenerateResponse] = Field(None, description="Generated cover letter once the job succeeded")
+    error: Optional[str] = Field(None, description="Error message once the job failed")
+    error_status: Optional[int] = Field(None, description="HTTP status the synchronous endpoint would have returned")
@@ -0,0 +1,51 @@
+"""
+Analysis job database model for SQLAlchemy.
+
+This module defines the table backing asynchronous resume analysis: the
+submitted inputs, the job's progress and its outcome, so any API worker can
+report the status of a job started by another.
+"""
+from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from datetime import datetime
+import uuid
+from app.core.database import Base
+
+
+class AnalysisJob(Base):
+    """
+    Resume analysis job submitted through the asynchronous API.
+
+    Attributes:
+        id: Unique identifier (UUID), also the client's handle for polling
+        user_id: Submitter, when signed in; only they can read the job
+        status: Job state (queued, running, succeeded, failed)
+        job_description: Normalized job description to analyze against
+        resume_text: Text extracted from the uploaded resume PDF; cleared once the job finishes
+        result: ResumeAnalysisResponse payload once the job succeeded
+        error: User-facing error message once the job failed
+        error_status: HTTP status the synchronous endpoint would have used for the error
+        created_at: Submission timestamp
+        started_at: When a worker picked the job up
+        finished_at: When the job succeeded or failed
+    """
+    __tablename__ = "analysis_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    status = Column(String(20), nullable=False, default="queued")
+    job_description = Column(Text, nullable=False)
+    resume_text = Column(Text, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    error_status = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('ix_analysis_jobs_status_created_at', 'status', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f"<AnalysisJob(id={self.id}, status={self.status})>"
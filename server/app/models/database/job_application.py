@@ -4,7 +4,7 @@ Job Application database model for SQLAlchemy.
 This module defines the JobApplication table structure with a foreign key
 relationship to the User table for tracking job applications per user.
 """
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, ARRAY
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, ARRAY, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -26,6 +26,8 @@ class JobApplication(Base):
         description: Job description text
         hiring_manager_name: Name of hiring manager
         requirements: List of job requirements
+        enrichment_status: AI requirement enrichment state (pending, running, complete, failed)
+        enrichment_claimed_at: When the running enrichment was claimed, to detect abandoned ones
         created_at: Record creation timestamp
         updated_at: Last modification timestamp
     """
@@ -39,7 +41,10 @@ class JobApplication(Base):
     status = Column(String(50), nullable=False)
     description = Column(Text, nullable=False, default="")
     hiring_manager_name = Column(String(255), nullable=False, default="")
-    requirements = Column(ARRAY(Text), nullable=False, default=list)
+    # JSON variant keeps the table creatable on the SQLite test backend
+    requirements = Column(ARRAY(Text).with_variant(JSON(), "sqlite"), nullable=False, default=list)
+    enrichment_status = Column(String(20), nullable=False, default="complete", server_default="complete")
+    enrichment_claimed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
@@ -0,0 +1,32 @@
+"""
+Requirement cache database model for SQLAlchemy.
+
+This module defines the table of AI-generated requirement lists keyed by a
+canonical hash of the job description, shared across users so a posting is
+only sent to the model once.
+"""
+from sqlalchemy import Column, String, Integer, DateTime, Text, ARRAY, JSON
+from datetime import datetime
+from app.core.database import Base
+
+
+class RequirementCacheEntry(Base):
+    """
+    Normalized requirements generated for one job description.
+
+    Attributes:
+        description_hash: Preflight digest of the description
+        max_requirements: Requirement limit the list was generated with
+        requirements: Normalized, deduplicated requirement list
+        created_at: When the list was generated
+    """
+    __tablename__ = "job_requirement_cache"
+
+    description_hash = Column(String(64), primary_key=True)
+    max_requirements = Column(Integer, primary_key=True)
+    # JSON variant keeps the table creatable on the SQLite test backend
+    requirements = Column(ARRAY(Text).with_variant(JSON(), "sqlite"), nullable=False, default=list)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<RequirementCacheEntry(description_hash={self.description_hash}, max_requirements={self.max_requirements})>"
@@ -0,0 +1,49 @@
+"""
+Stored resume database model for SQLAlchemy.
+
+This module defines the per-user resume library: each uploaded PDF is kept
+once, keyed by the SHA-256 digest of its bytes, together with the text
+extracted from it so later analyses and cover letters can reference it by ID
+instead of uploading and parsing the file again.
+"""
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import uuid
+from app.core.database import Base
+
+
+class StoredResume(Base):
+    """
+    Resume PDF saved to a user's library.
+
+    Attributes:
+        id: Unique identifier (UUID), referenced as resume_id by other endpoints
+        user_id: Foreign key to users table
+        digest: SHA-256 hex digest of the uploaded file, unique per user
+        filename: Name of the file as first uploaded
+        size_bytes: Size of the uploaded file
+        page_count: Number of pages in the PDF
+        text: Text extracted from the PDF
+        created_at: Upload timestamp
+    """
+    __tablename__ = "stored_resumes"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    digest = Column(String(64), nullable=False)
+    filename = Column(String(255), nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    page_count = Column(Integer, nullable=False)
+    text = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    user = relationship("User", backref="stored_resumes")
+
+    __table_args__ = (
+        UniqueConstraint('user_id', 'digest', name='uq_stored_resumes_user_id_digest'),
+    )
+
+    def __repr__(self):
+        return f"<StoredResume(id={self.id}, user_id={self.user_id}, filename={self.filename})>"
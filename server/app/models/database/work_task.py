@@ -0,0 +1,55 @@
+"""
+Work queue task database model for SQLAlchemy.
+
+This module defines the durable task table drained by ``python -m app.worker``
+processes. Timestamps are Unix epoch seconds so claims and lease checks are
+plain numeric comparisons on every backend.
+"""
+from sqlalchemy import Column, String, Integer, Float, Text, JSON, Index
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+from app.core.database import Base
+
+
+class WorkTask(Base):
+    """
+    Unit of background work claimed by worker processes.
+
+    Attributes:
+        id: Unique identifier (UUID)
+        kind: Handler name, e.g. "resume_analysis" or "cover_letter"
+        payload: JSON arguments for the handler
+        status: Task state (queued, running, done, failed)
+        attempts: Number of times the task has been claimed
+        max_attempts: Claims allowed before the task is marked failed
+        available_at: Earliest time the task may be claimed (retry backoff)
+        locked_by: Worker holding the current lease
+        locked_until: Lease expiry; a running task past it is claimable again
+        result: JSON returned by the handler once done
+        last_error: Error from the most recent failed attempt
+        created_at: Enqueue time
+        finished_at: When the task was done or failed for good
+    """
+    __tablename__ = "work_queue_tasks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(String(20), nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    available_at = Column(Float, nullable=False)
+    locked_by = Column(String(255), nullable=True)
+    locked_until = Column(Float, nullable=True)
+    result = Column(JSON, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(Float, nullable=False)
+    finished_at = Column(Float, nullable=True)
+
+    __table_args__ = (
+        Index('ix_work_queue_tasks_status_available_at', 'status', 'available_at'),
+        Index('ix_work_queue_tasks_status_locked_until', 'status', 'locked_until'),
+    )
+
+    def __repr__(self):
+        return f"<WorkTask(id={self.id}, kind={self.kind}, status={self.status}, attempts={self.attempts})>"
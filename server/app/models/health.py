@@ -1,5 +1,6 @@
+from datetime import datetime
 from pydantic import BaseModel
-from typing import List
+from typing import Dict, List, Optional
 
 
 class HealthCheckResponse(BaseModel):
@@ -14,3 +15,61 @@ class WelcomeResponse(BaseModel):
     version: str
     description: str
     endpoints: List[str]
+
+
+class DependencyCheck(BaseModel):
+    """Result of a single readiness check"""
+    status: str
+    latency_ms: Optional[float] = None
+    detail: Optional[str] = None
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness probe response model"""
+    status: str
+    checked_at: datetime
+    checks: Dict[str, DependencyCheck]
+
+
+class BlockingEventResponse(BaseModel):
+    """A callback that held the event loop beyond the blocking threshold"""
+    detected_at: datetime
+    duration_ms: float
+    route: Optional[str] = None
+    method: Optional[str] = None
+    location: Optional[str] = None
+    stack: List[str]
+
+
+class BlockingReportResponse(BaseModel):
+    """Blocking-call detector findings"""
+    threshold_ms: float
+    events: List[BlockingEventResponse]
+
+
+class LLMRouteThreshold(BaseModel):
+    """One size threshold of a task's routing table"""
+    min_tokens: int
+    model: str
+
+
+class LLMRouteStats(BaseModel):
+    """Accounting for one route (task, model and the rule that chose it)"""
+    task: str
+    model: str
+    tier: str
+    calls: int
+    failures: int
+    mean_latency_ms: float
+    input_tokens: int
+    output_tokens: int
+    cost_usd: float
+    cost_usd_per_call: float
+
+
+class LLMRouteReportResponse(BaseModel):
+    """Model routing table and per-route accounting"""
+    default_model: str
+    routes: Dict[str, List[LLMRouteThreshold]]
+    override_enabled: bool
+    stats: List[LLMRouteStats]
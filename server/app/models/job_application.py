@@ -5,12 +5,19 @@ This module defines the data schemas for job application operations
 including creation, updates, and responses.
 """
 from pydantic import BaseModel, Field, field_validator
-from typing import List
+from typing import Dict, List
 from datetime import datetime
 from uuid import UUID
 
 
 MAX_REQUIREMENTS = 5
+MAX_BULK_ITEMS = 500
+
+ENRICHMENT_PENDING = "pending"
+ENRICHMENT_RUNNING = "running"
+ENRICHMENT_COMPLETE = "complete"
+ENRICHMENT_FAILED = "failed"
+ALLOWED_STATUSES = ("Applied", "Interviewing", "Offer", "Rejected", "Replied", "Withdrawn")
 
 
 class JobApplicationBase(BaseModel):
@@ -27,9 +34,8 @@ class JobApplicationBase(BaseModel):
     @classmethod
     def validate_status(cls, v: str) -> str:
         """Validate that status is one of the allowed values"""
-        allowed_statuses = {"Applied", "Interviewing", "Offer", "Rejected", "Replied", "Withdrawn"}
-        if v not in allowed_statuses:
-            raise ValueError(f"Status must be one of: {', '.join(allowed_statuses)}")
+        if v not in ALLOWED_STATUSES:
+            raise ValueError(f"Status must be one of: {', '.join(ALLOWED_STATUSES)}")
         return v
 
     @field_validator("requirements")
@@ -75,9 +81,8 @@ class JobApplicationUpdate(BaseModel):
         """Validate that status is one of the allowed values"""
         if v is None:
             return v
-        allowed_statuses = {"Applied", "Interviewing", "Offer", "Rejected", "Replied", "Withdrawn"}
-        if v not in allowed_statuses:
-            raise ValueError(f"Status must be one of: {', '.join(allowed_statuses)}")
+        if v not in ALLOWED_STATUSES:
+            raise ValueError(f"Status must be one of: {', '.join(ALLOWED_STATUSES)}")
         return v
 
     @field_validator("requirements")
@@ -123,6 +128,10 @@ class JobApplicationResponse(JobApplicationBase):
     """
     id: UUID
     user_id: UUID
+    enrichment_status: str = Field(
+        default=ENRICHMENT_COMPLETE,
+        description="AI requirement enrichment state: pending, running, complete or failed"
+    )
     created_at: datetime
     updated_at: datetime
     
@@ -136,3 +145,49 @@ class JobApplicationListResponse(BaseModel):
     """
     applications: List[JobApplicationResponse]
     total: int
+
+
+class JobApplicationStatsResponse(BaseModel):
+    """
+    Response schema for per-status application counts.
+    Every allowed status is present so the frontend can render zero counts.
+    """
+    counts: Dict[str, int] = Field(default_factory=dict, description="Number of applications per status")
+    total: int
+
+
+class JobApplicationSearchHit(BaseModel):
+    """A single search result with its relevance rank."""
+    application: JobApplicationResponse
+    rank: float = Field(..., description="Relevance score, higher is better")
+
+
+class JobApplicationSearchResponse(BaseModel):
+    """Response schema for full-text search over job applications."""
+    query: str
+    results: List[JobApplicationSearchHit]
+
+
+class JobApplicationBulkCreate(BaseModel):
+    """Request schema for creating many job applications in one transaction."""
+    applications: List[JobApplicationCreate] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class JobApplicationBulkUpdateItem(JobApplicationUpdate):
+    """A partial update addressed to one job application by ID."""
+    id: UUID
+
+
+class JobApplicationBulkUpdate(BaseModel):
+    """Request schema for updating many job applications in one transaction."""
+    applications: List[JobApplicationBulkUpdateItem] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class JobApplicationBulkDelete(BaseModel):
+    """Request schema for deleting many job applications by ID."""
+    ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class JobApplicationBulkDeleteResponse(BaseModel):
+    """Response schema reporting how many applications were deleted."""
+    deleted: int
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List
+from datetime import datetime
+from uuid import UUID
 
 
 class ResumeAnalysisRequest(BaseModel):
@@ -15,3 +17,35 @@ class ResumeAnalysisResponse(BaseModel):
     strengths: List[str] = Field(default_factory=list, description="Candidate strengths")
     gaps: List[str] = Field(default_factory=list, description="Skills or experience gaps")
     recommendations: Optional[List[str]] = Field(default_factory=list, description="Improvement recommendations")
+
+
+ANALYSIS_QUEUED = "queued"
+ANALYSIS_RUNNING = "running"
+ANALYSIS_SUCCEEDED = "succeeded"
+ANALYSIS_FAILED = "failed"
+ANALYSIS_FINISHED = (ANALYSIS_SUCCEEDED, ANALYSIS_FAILED)
+
+
+class AnalysisJobResponse(BaseModel):
+    """Status of an asynchronous resume analysis job"""
+    id: UUID = Field(..., description="Job ID to poll")
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    result: Optional[ResumeAnalysisResponse] = Field(None, description="Analysis results once the job succeeded")
+    error: Optional[str] = Field(None, description="Error message once the job failed")
+    error_status: Optional[int] = Field(None, description="HTTP status the synchronous endpoint would have returned")
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class StoredResumeResponse(BaseModel):
+    """Resume saved to the caller's library"""
+    id: UUID = Field(..., description="Resume ID to pass as resume_id")
+    filename: str
+    digest: str = Field(..., description="SHA-256 of the uploaded file")
+    size_bytes: int
+    page_count: int
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,359 @@
+"""
+Asynchronous resume analysis jobs.
+
+Submitting a job persists the checked inputs and hands the job ID to a
+bounded worker pool; the client polls the job's row for the outcome. Because
+state lives in the database, any API worker can answer a status request.
+
+With ANALYSIS_BACKEND=inline (the default) jobs run on this process's
+``analysis_queue`` and jobs interrupted by a restart are re-enqueued on
+startup. With ANALYSIS_BACKEND=database they are written to the durable work
+queue in the same transaction as the job and run by ``python -m app.worker``
+processes, which may live on other hosts.
+
+A job is claimed with a conditional UPDATE before it runs, so a job enqueued
+by more than one process is still analyzed once. The resume text is cleared
+when the job finishes. Jobs submitted by a signed-in user can only be read
+by that user.
+
+    ANALYSIS_BACKEND                inline or database
+    ANALYSIS_MAX_QUEUED             submissions refused with 503 beyond this many waiting jobs
+    ANALYSIS_POLL_INTERVAL_SECONDS  how often a long-poll re-reads a job run by another worker
+    ANALYSIS_STALE_SECONDS          inline backend: running jobs older than this are re-run on startup
+"""
+import asyncio
+import weakref
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import or_, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.llm import LLMUnavailableError
+from app.core.task_queue import analysis_queue
+from app.core.work_queue import current_task, enqueue, work_queue
+from app.models.database.analysis_job import AnalysisJob
+from app.models.resume import (
+    ANALYSIS_FAILED,
+    ANALYSIS_FINISHED,
+    ANALYSIS_QUEUED,
+    ANALYSIS_RUNNING,
+    ANALYSIS_SUCCEEDED,
+)
+from app.services.resume_service import analyze_resume, validate_job_description
+
+
+ANALYSIS_BACKEND = settings.analysis_backend
+ANALYSIS_MAX_QUEUED = settings.analysis_max_queued
+ANALYSIS_POLL_INTERVAL_SECONDS = settings.analysis_poll_interval_seconds
+ANALYSIS_STALE_SECONDS = settings.analysis_stale_seconds
+
+RESUME_ANALYSIS_TASK = "resume_analysis"
+
+# Wakes long-polls on this worker as soon as a job it ran finishes. Entries
+# disappear once no request is waiting on them.
+_finished_events: "weakref.WeakValueDictionary[UUID, asyncio.Event]" = weakref.WeakValueDictionary()
+
+
+def schedule_analysis_job(job_id: UUID) -> None:
+    """Enqueue an analysis job on the in-process worker pool."""
+    analysis_queue.enqueue(run_analysis_job, job_id)
+
+
+def _waiting_jobs() -> int:
+    if ANALYSIS_BACKEND == "database":
+        return work_queue.pending(RESUME_ANALYSIS_TASK)
+    return analysis_queue.pending()
+
+
+def create_analysis_job(
+    db: Session,
+    job_description: str,
+    resume_text: str,
+    user_id: Optional[UUID] = None,
+) -> AnalysisJob:
+    """
+    Persist a checked analysis request and enqueue it.
+
+    Args:
+        db: Database session
+        job_description: Normalized job description that passed the input checks
+        resume_text: Text extracted from the resume PDF
+        user_id: Signed-in submitter, who alone may then read the job
+
+    Returns:
+        Queued AnalysisJob instance
+
+    Raises:
+        HTTPException: If too many jobs are waiting or the insert fails
+    """
+    if _waiting_jobs() >= ANALYSIS_MAX_QUEUED:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Resume analysis is busy right now. Please try again shortly.",
+            headers={"Retry-After": "30"},
+        )
+
+    try:
+        job = AnalysisJob(
+            id=uuid4(),
+            user_id=user_id,
+            status=ANALYSIS_QUEUED,
+            job_description=job_description,
+            resume_text=resume_text,
+        )
+        db.add(job)
+        if ANALYSIS_BACKEND == "database":
+            enqueue(db, RESUME_ANALYSIS_TASK, {"job_id": str(job.id)})
+        db.commit()
+        db.refresh(job)
+    except SQLAlchemyError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to start the resume analysis. Please try again."
+        )
+
+    if ANALYSIS_BACKEND != "database":
+        schedule_analysis_job(job.id)  # type: ignore[arg-type]
+    return job
+
+
+def _finish(job: AnalysisJob, job_status: str, **fields) -> None:
+    job.status = job_status  # type: ignore[assignment]
+    job.finished_at = datetime.utcnow()  # type: ignore[assignment]
+    # Only needed to run the job; do not keep the candidate's resume around.
+    job.resume_text = None  # type: ignore[assignment]
+    for name, value in fields.items():
+        setattr(job, name, value)
+
+
+def _claim(db: Session, job_id: UUID, claimable: Tuple[str, ...]) -> bool:
+    claimed = db.execute(
+        update(AnalysisJob)
+        .where(AnalysisJob.id == job_id, AnalysisJob.status.in_(claimable))
+        .values(status=ANALYSIS_RUNNING, started_at=datetime.utcnow())
+    ).rowcount
+    db.commit()
+    return claimed == 1
+
+
+def _is_server_error(error: Exception) -> bool:
+    from google.genai import errors
+
+    return isinstance(error, errors.ServerError)
+
+
+async def run_analysis_job(
+    job_id: UUID,
+    session_factory: Callable[[], Session] = SessionLocal,
+    reclaim_running: bool = False,
+    final_attempt: bool = True,
+) -> None:
+    """
+    Validate the job description and analyze the resume for a queued job.
+
+    Runs on the background queue with its own session. The job is claimed
+    (queued to running) with a conditional UPDATE first; if another process
+    claimed it already, nothing is done. The outcome, or the error and the
+    status code the synchronous endpoint would have answered with, is stored
+    on the job.
+
+    Args:
+        job_id: UUID of the job to run
+        session_factory: Factory for the database session to use
+        reclaim_running: Also claim a job left running, for callers that hold
+            an exclusive lease on it (a work queue task being retried)
+        final_attempt: When False, errors worth retrying (model unavailable or
+            a 5xx from Gemini) are raised instead of failing the job, which
+            is left running for the next attempt
+
+    Raises:
+        LLMUnavailableError: If the model is unavailable and this is not the final attempt
+        google.genai.errors.ServerError: If Gemini failed and this is not the final attempt
+    """
+    claimable = (ANALYSIS_QUEUED, ANALYSIS_RUNNING) if reclaim_running else (ANALYSIS_QUEUED,)
+    db = session_factory()
+    try:
+        if not _claim(db, job_id, claimable):
+            return
+        job = db.get(AnalysisJob, job_id)
+        if job is None:
+            return
+        job_description = str(job.job_description)
+        resume_text = str(job.resume_text)
+
+        try:
+            is_valid, reason = await validate_job_description(job_description)
+            if not is_valid:
+                _finish(
+                    job,
+                    ANALYSIS_FAILED,
+                    error=f"This doesn't look like a valid job description: {reason} Please enter a real job posting.",
+                    error_status=status.HTTP_400_BAD_REQUEST,
+                )
+            else:
+                result = await analyze_resume(None, job_description, resume_text=resume_text)  # type: ignore[arg-type]
+                _finish(job, ANALYSIS_SUCCEEDED, result=result.model_dump(mode="json"))
+        except LLMUnavailableError:
+            if not final_attempt:
+                raise
+            _finish(
+                job,
+                ANALYSIS_FAILED,
+                error="Resume analysis is temporarily unavailable. Please try again shortly.",
+                error_status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        except Exception as error:
+            if not final_attempt and _is_server_error(error):
+                raise
+            _finish(
+                job,
+                ANALYSIS_FAILED,
+                error=f"An error occurred while analyzing the resume: {str(error)}",
+                error_status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        try:
+            db.commit()
+        except SQLAlchemyError:
+            db.rollback()
+            raise
+    finally:
+        db.close()
+        event = _finished_events.get(job_id)
+        if event is not None:
+            event.set()
+
+
+async def run_analysis_task(payload: Dict[str, Any]) -> None:
+    """
+    Work queue handler for ``resume_analysis`` tasks.
+
+    Transient model failures are raised so the queue retries the task with
+    backoff; the job is only marked failed on the task's last attempt.
+    """
+    task = current_task()
+    # The task's lease makes this worker the job's only runner, including on a retry.
+    await run_analysis_job(
+        UUID(payload["job_id"]),
+        reclaim_running=True,
+        final_attempt=task is None or task.attempts >= task.max_attempts,
+    )
+
+
+def get_analysis_job(db: Session, job_id: UUID, user_id: Optional[UUID] = None) -> AnalysisJob:
+    """
+    Fetch an analysis job by ID.
+
+    Args:
+        db: Database session
+        job_id: UUID of the job
+        user_id: The caller, if signed in; a job submitted by someone else is not found
+
+    Raises:
+        HTTPException: If the job does not exist or belongs to another user
+    """
+    job = db.query(AnalysisJob).filter(AnalysisJob.id == job_id).populate_existing().first()
+    if job is None or (job.user_id is not None and job.user_id != user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Analysis job not found."
+        )
+    return job
+
+
+async def wait_for_analysis_job(
+    db: Session,
+    job_id: UUID,
+    timeout: float,
+    user_id: Optional[UUID] = None,
+) -> AnalysisJob:
+    """
+    Long-poll an analysis job until it finishes or `timeout` seconds pass.
+
+    Jobs run on this worker wake the wait as soon as they finish; jobs run
+    elsewhere are re-read every ANALYSIS_POLL_INTERVAL_SECONDS. Reads run in
+    the threadpool, so waiting clients do not hold up the event loop.
+
+    Returns:
+        The job as last read, finished or not
+
+    Raises:
+        HTTPException: If the job does not exist or belongs to another user
+    """
+    event = _finished_events.get(job_id)
+    if event is None:
+        event = asyncio.Event()
+        _finished_events[job_id] = event
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    job = await run_in_threadpool(get_analysis_job, db, job_id, user_id)
+    while job.status not in ANALYSIS_FINISHED:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        # Hand the connection back to the pool while waiting.
+        await run_in_threadpool(db.rollback)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=min(remaining, ANALYSIS_POLL_INTERVAL_SECONDS))
+        except asyncio.TimeoutError:
+            pass
+        job = await run_in_threadpool(get_analysis_job, db, job_id, user_id)
+    return job
+
+
+def requeue_analysis_jobs(session_factory: Callable[[], Session] = SessionLocal) -> int:
+    """
+    Re-enqueue jobs left queued or running by a restart.
+
+    Only needed for the inline backend; the work queue keeps its own tasks
+    and hands out those whose worker died once their lease expires.
+
+    Jobs running for longer than ANALYSIS_STALE_SECONDS are put back to
+    queued first; younger ones may be running in a sibling process and are
+    left alone. Queued jobs are enqueued by every process that starts, but
+    only one of them claims each job.
+
+    Args:
+        session_factory: Factory for the database session to use
+
+    Returns:
+        Number of jobs re-enqueued
+    """
+    if ANALYSIS_BACKEND == "database":
+        return 0
+
+    db = session_factory()
+    try:
+        db.execute(
+            update(AnalysisJob)
+            .where(
+                AnalysisJob.status == ANALYSIS_RUNNING,
+                or_(
+                    AnalysisJob.started_at.is_(None),
+                    AnalysisJob.started_at < datetime.utcnow() - timedelta(seconds=ANALYSIS_STALE_SECONDS),
+                ),
+            )
+            .values(status=ANALYSIS_QUEUED)
+        )
+        db.commit()
+        job_ids = [
+            job_id
+            for (job_id,) in db.query(AnalysisJob.id).filter(
+                AnalysisJob.status == ANALYSIS_QUEUED
+            ).order_by(AnalysisJob.created_at)
+        ]
+    finally:
+        db.close()
+
+    for job_id in job_ids:
+        schedule_analysis_job(job_id)  # type: ignore[arg-type]
+    return len(job_ids)
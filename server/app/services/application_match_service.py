@@ -0,0 +1,214 @@
+"""
+Match one resume against all of a user's job applications.
+
+Every application is scored locally first: TF-IDF vectors over the
+applications' title, company, requirements and description, compared with
+the resume by cosine similarity. Scores for all applications come out of a
+single pass over an inverted index (pure Python: about half a second for a
+thousand long postings, far less for a typical history). Only the top-K
+then go to the model, at most ANALYZE_ALL_CONCURRENCY at a time, and their
+analyses are yielded in the order they finish.
+
+    ANALYZE_ALL_CONCURRENCY  model analyses run at once per request
+    ANALYZE_ALL_MAX_TOP_K    most applications one request may send to the model
+"""
+import asyncio
+import math
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.llm import LLMUnavailableError
+from app.models.database.job_application import JobApplication
+from app.services.job_search_service import tokenize
+from app.services.resume_service import analyze_resume
+
+
+ANALYZE_ALL_CONCURRENCY = settings.analyze_all_concurrency
+ANALYZE_ALL_MAX_TOP_K = settings.analyze_all_max_top_k
+
+
+@dataclass(frozen=True)
+class RankedApplication:
+    """Plain snapshot of an application and its local score, safe to use after the session closes."""
+    application_id: UUID
+    job: str
+    company: str
+    job_description: str
+    local_score: float
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "application_id": str(self.application_id),
+            "job": self.job,
+            "company": self.company,
+            "local_score": self.local_score,
+        }
+
+
+def application_job_description(application: JobApplication) -> str:
+    """Job description text sent to the model for an application."""
+    parts = [f"Job title: {application.job}"]
+    if application.company:
+        parts.append(f"Company: {application.company}")
+    requirements: Sequence[str] = application.requirements or []  # type: ignore[assignment]
+    if requirements:
+        parts.append("Requirements:\n" + "\n".join(f"- {requirement}" for requirement in requirements))
+    description = str(application.description or "").strip()
+    if description:
+        parts.append(description)
+    return "\n\n".join(parts)
+
+
+def _weights(terms: List[str], idf: Dict[str, float], default_idf: float) -> Dict[str, float]:
+    # Sublinear term frequency keeps a keyword repeated ten times from dominating.
+    return {
+        term: (1.0 + math.log(count)) * idf.get(term, default_idf)
+        for term, count in Counter(terms).items()
+    }
+
+
+def score_documents(query: str, documents: Sequence[str]) -> List[float]:
+    """
+    Cosine similarity between the TF-IDF vectors of `query` and each document.
+
+    IDF is computed over `documents`, so terms every application shares count
+    for little and distinctive skills count for a lot.
+
+    Returns:
+        One score between 0 and 1 per document, in input order
+    """
+    document_terms = [tokenize(document) for document in documents]
+    total = len(documents)
+    document_frequency: Counter = Counter()
+    for terms in document_terms:
+        document_frequency.update(set(terms))
+    idf = {
+        term: math.log((1 + total) / (1 + frequency)) + 1.0
+        for term, frequency in document_frequency.items()
+    }
+    unseen_idf = math.log(1 + total) + 1.0
+
+    postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+    norms: List[float] = []
+    for position, terms in enumerate(document_terms):
+        weights = _weights(terms, idf, unseen_idf)
+        for term, weight in weights.items():
+            postings[term].append((position, weight))
+        norms.append(math.sqrt(sum(weight * weight for weight in weights.values())))
+
+    query_weights = _weights(tokenize(query), idf, unseen_idf)
+    query_norm = math.sqrt(sum(weight * weight for weight in query_weights.values()))
+
+    dots = [0.0] * total
+    for term, query_weight in query_weights.items():
+        for position, weight in postings.get(term, ()):
+            dots[position] += query_weight * weight
+
+    return [
+        dot / (norm * query_norm) if norm and query_norm else 0.0
+        for dot, norm in zip(dots, norms)
+    ]
+
+
+def rank_applications(resume_text: str, applications: Sequence[JobApplication]) -> List[RankedApplication]:
+    """
+    Score every application against the resume locally, best match first.
+
+    Args:
+        resume_text: Text extracted from the resume
+        applications: The user's job applications
+
+    Returns:
+        List[RankedApplication]: All applications ordered by descending local score
+    """
+    descriptions = [application_job_description(application) for application in applications]
+    scores = score_documents(resume_text, descriptions)
+    ranked = [
+        RankedApplication(
+            application_id=application.id,  # type: ignore[arg-type]
+            job=str(application.job),
+            company=str(application.company),
+            job_description=description,
+            local_score=round(score, 4),
+        )
+        for application, description, score in zip(applications, descriptions, scores)
+    ]
+    ranked.sort(key=lambda candidate: -candidate.local_score)
+    return ranked
+
+
+def rank_user_applications(db: Session, user_id: UUID, resume_text: str) -> List[RankedApplication]:
+    """
+    Load the user's job applications and rank them against the resume.
+
+    Blocking (a query and CPU-bound scoring); run it in the threadpool. The
+    session's connection is released afterwards, before any model call.
+
+    Args:
+        db: Database session
+        user_id: Owner of the applications
+        resume_text: Text extracted from the resume
+
+    Returns:
+        List[RankedApplication]: All applications ordered by descending local score
+    """
+    applications = db.query(JobApplication).filter(JobApplication.user_id == user_id).all()
+    ranked = rank_applications(resume_text, applications)
+    db.rollback()
+    return ranked
+
+
+async def _analyze(candidate: RankedApplication, resume_text: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    async with semaphore:
+        try:
+            result = await analyze_resume(None, candidate.job_description, resume_text=resume_text)  # type: ignore[arg-type]
+        except LLMUnavailableError:
+            return {
+                "event": "error",
+                **candidate.summary(),
+                "error": "Resume analysis is temporarily unavailable. Please try again shortly.",
+                "error_status": status.HTTP_503_SERVICE_UNAVAILABLE,
+            }
+        except Exception as error:
+            return {
+                "event": "error",
+                **candidate.summary(),
+                "error": f"An error occurred while analyzing the resume: {str(error)}",
+                "error_status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            }
+    return {"event": "analysis", **candidate.summary(), "result": result.model_dump(mode="json")}
+
+
+async def iter_application_analyses(
+    resume_text: str,
+    candidates: Sequence[RankedApplication],
+    concurrency: int = ANALYZE_ALL_CONCURRENCY,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run the model analysis for each candidate and yield results as they finish.
+
+    A failed analysis yields an ``error`` event instead of ending the stream.
+    Analyses still running when the consumer stops iterating are cancelled.
+
+    Args:
+        resume_text: Text extracted from the resume
+        candidates: Applications to analyze, typically the top of the local ranking
+        concurrency: Most model calls in flight at once
+
+    Yields:
+        ``analysis`` or ``error`` events, one per candidate
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    tasks = [asyncio.create_task(_analyze(candidate, resume_text, semaphore)) for candidate in candidates]
+    try:
+        for next_finished in asyncio.as_completed(tasks):
+            yield await next_finished
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,128 @@
+"""
+Cover letter generation on the durable work queue.
+
+Submissions are stored as ``cover_letter`` tasks and generated by
+``python -m app.worker`` processes; the task row carries the generated
+document back to whichever API worker the client polls.
+"""
+from typing import Any, Dict
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.work_queue import FAILED, QUEUED, RUNNING, enqueue
+from app.models.cover_letter import (
+    CoverLetterDocument,
+    CoverLetterGenerateRequest,
+    CoverLetterGenerateResponse,
+    CoverLetterJobResponse,
+)
+from app.models.database.work_task import WorkTask
+from app.services.cover_letter_service import generate_cover_letter
+from app.services.cover_letter_store import get_cover_letter_store
+
+
+COVER_LETTER_TASK = "cover_letter"
+
+_UNAVAILABLE_MESSAGE = "Cover letter generation is temporarily unavailable. Please try again shortly."
+
+
+def create_cover_letter_job(
+    db: Session,
+    user_id: UUID,
+    request_data: CoverLetterGenerateRequest,
+    applicant_full_name: str,
+    resume_text: str = "",
+) -> CoverLetterJobResponse:
+    """
+    Enqueue cover letter generation for a checked request.
+
+    The stored resume's text, if the request references one, travels with
+    the task so deleting the resume meanwhile does not affect the job. The
+    queue drops it, with the rest of the request, once the task finishes.
+
+    Raises:
+        HTTPException: If the task cannot be stored
+    """
+    try:
+        task_id = enqueue(db, COVER_LETTER_TASK, {
+            "user_id": str(user_id),
+            "request": request_data.model_dump(mode="json"),
+            "applicant_full_name": applicant_full_name,
+            "resume_text": resume_text,
+        })
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to start cover letter generation. Please try again."
+        )
+    return CoverLetterJobResponse(id=task_id, status="queued")
+
+
+async def run_cover_letter_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Work queue handler for ``cover_letter`` tasks.
+
+    Input the model rejects is a final outcome and is returned as an error;
+    other failures raise so the queue retries them.
+    """
+    request_data = CoverLetterGenerateRequest.model_validate(payload["request"])
+    try:
+        document = await generate_cover_letter(
+            request_data=request_data,
+            applicant_full_name=payload["applicant_full_name"],
+            resume_text=payload.get("resume_text", ""),
+        )
+    except ValueError as error:
+        return {"error": str(error), "error_status": status.HTTP_400_BAD_REQUEST}
+    return {"document": document.model_dump(mode="json")}
+
+
+def get_cover_letter_job(db: Session, user_id: UUID, task_id: UUID) -> CoverLetterJobResponse:
+    """
+    Report a cover letter job's status to the user who submitted it.
+
+    A finished document is saved to this worker's cover letter store so it
+    can be exported as a PDF like a synchronously generated one.
+
+    Raises:
+        HTTPException: If the job does not exist or belongs to another user
+    """
+    task = db.get(WorkTask, task_id, populate_existing=True)
+    if task is None or task.kind != COVER_LETTER_TASK or (task.payload or {}).get("user_id") != str(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cover letter job not found."
+        )
+
+    result: Dict[str, Any] = dict(task.result or {})  # type: ignore[arg-type]
+    if task.status in (QUEUED, RUNNING):
+        return CoverLetterJobResponse(id=task_id, status=str(task.status))
+    if task.status == FAILED:
+        return CoverLetterJobResponse(
+            id=task_id,
+            status="failed",
+            error=_UNAVAILABLE_MESSAGE,
+            error_status=status.HTTP_502_BAD_GATEWAY,
+        )
+    if "error" in result:
+        return CoverLetterJobResponse(
+            id=task_id,
+            status="failed",
+            error=result["error"],
+            error_status=result.get("error_status"),
+        )
+
+    document = CoverLetterDocument.model_validate(result["document"])
+    store = get_cover_letter_store()
+    if store.get(document.id) is None:
+        store.save(document)
+    return CoverLetterJobResponse(
+        id=task_id,
+        status="succeeded",
+        result=CoverLetterGenerateResponse(document_id=document.id, cover_letter=document.cover_letter),
+    )
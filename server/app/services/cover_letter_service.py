@@ -1,19 +1,13 @@
 import json
-import os
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from dotenv import load_dotenv
-from google import genai
-from google.genai import types
-
+from app.core.llm import gemini_client, llm_call
+from app.core.model_routing import GENERATION, model_router
 from app.models.cover_letter import CoverLetterDocument, CoverLetterGenerateRequest
 
 
-load_dotenv()
-
-client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
-GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+client = gemini_client
 
 
 def _resolve_hiring_manager_name(request_data: CoverLetterGenerateRequest) -> str:
@@ -42,6 +36,7 @@ def _normalize_cover_letter_text(value: str) -> str:
 async def generate_cover_letter(
     request_data: CoverLetterGenerateRequest,
     applicant_full_name: str,
+    resume_text: str = "",
 ) -> CoverLetterDocument:
     hiring_manager_name = _resolve_hiring_manager_name(request_data)
 
@@ -62,15 +57,25 @@ async def generate_cover_letter(
         f"APPLICANT PHONE: {request_data.phone}\n"
         f"CORE REQUIREMENTS: {json.dumps(request_data.requirements)}"
     )
+    if resume_text:
+        prompt += (
+            "\n\nAPPLICANT RESUME (base the strengths on this and claim nothing it does not state):\n"
+            f"{resume_text}"
+        )
+
+    route = model_router.route(GENERATION, prompt)
+
+    from google.genai import types
 
     try:
-        response = await client.aio.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.5,
-            ),
-        )
+        async with llm_call("generate_cover_letter", route) as call:
+            response = call.record(await client.aio.models.generate_content(
+                model=route.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.5,
+                ),
+            ))
 
         generated_text = _normalize_cover_letter_text(response.text or "")
         if not generated_text:
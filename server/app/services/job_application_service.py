@@ -4,20 +4,45 @@ Job application service layer for business logic.
 This module handles CRUD operations for job applications with proper
 error handling and database transaction management.
 """
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, or_, select, update
+from sqlalchemy.orm import Session, Query
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException, status
-from uuid import UUID
-from typing import List
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+from typing import Callable, Dict, Iterator, List, Optional, cast
+import csv
+import io
+import json
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.task_queue import enrichment_queue
 from app.models.database.job_application import JobApplication
 from app.models.job_application import (
+    JobApplicationBulkUpdateItem,
     JobApplicationCreate,
     JobApplicationUpdate,
+    ALLOWED_STATUSES,
+    ENRICHMENT_COMPLETE,
+    ENRICHMENT_FAILED,
+    ENRICHMENT_PENDING,
+    ENRICHMENT_RUNNING,
     MAX_REQUIREMENTS,
 )
+from app.services.requirements_cache import (
+    get_cached_requirements,
+    get_cached_requirements_many,
+    store_requirements,
+)
 from app.services.resume_service import generate_job_requirements_from_description
 
 
+# An enrichment still running after this long is taken to have died with its process.
+ENRICHMENT_STALE_SECONDS = settings.enrichment_stale_seconds
+# Tries to write an enrichment back while the user keeps editing the application.
+_WRITE_BACK_ATTEMPTS = 3
+
+
 def _normalize_requirement(value: str) -> str:
     return " ".join(value.split()).strip()
 
@@ -66,10 +91,26 @@ def _merge_manual_and_ai_requirements(
     return merged
 
 
+def _cached_ai_requirements(db: Session, description: str) -> Optional[List[str]]:
+    """Cached AI requirements for `description`; a failing lookup counts as a miss."""
+    try:
+        return get_cached_requirements(db, description, MAX_REQUIREMENTS)
+    except SQLAlchemyError:
+        db.rollback()
+        return None
+
+
+def schedule_requirement_enrichment(application_ids: List[UUID]) -> None:
+    """Enqueue AI requirement enrichment for applications persisted as pending."""
+    if application_ids:
+        enrichment_queue.enqueue(enrich_job_application_requirements, list(application_ids))
+
+
 async def create_job_application(
     db: Session,
     user_id: UUID,
-    application_data: JobApplicationCreate
+    application_data: JobApplicationCreate,
+    defer_enrichment: bool = False
 ) -> JobApplication:
     """
     Create a new job application for a user.
@@ -78,6 +119,10 @@ async def create_job_application(
         db: Database session
         user_id: UUID of the user creating the application
         application_data: Job application data
+        defer_enrichment: Persist with manual requirements right away and
+            generate AI requirements on the background queue instead of
+            waiting for the LLM (not needed when the posting's requirements
+            are already cached)
         
     Returns:
         Created JobApplication instance
@@ -93,9 +138,23 @@ async def create_job_application(
         )
 
     manual_requirements = _dedupe_requirements(application_data.requirements)
+    enrichment_status = ENRICHMENT_COMPLETE
+    generated_requirements: Optional[List[str]] = None
+    cached_requirements = (
+        _cached_ai_requirements(db, description) if len(manual_requirements) < MAX_REQUIREMENTS else None
+    )
 
     if len(manual_requirements) >= MAX_REQUIREMENTS:
         final_requirements = manual_requirements
+    elif cached_requirements is not None:
+        final_requirements = _merge_manual_and_ai_requirements(
+            manual_requirements=manual_requirements,
+            ai_requirements=cached_requirements,
+            max_items=MAX_REQUIREMENTS,
+        )
+    elif defer_enrichment:
+        final_requirements = manual_requirements
+        enrichment_status = ENRICHMENT_PENDING
     else:
         try:
             ai_response = await generate_job_requirements_from_description(
@@ -113,13 +172,16 @@ async def create_job_application(
                 detail="Unable to generate job requirements at the moment. Please try again.",
             ) from error
 
+        generated_requirements = ai_response.requirements
         final_requirements = _merge_manual_and_ai_requirements(
             manual_requirements=manual_requirements,
-            ai_requirements=ai_response.requirements,
+            ai_requirements=generated_requirements,
             max_items=MAX_REQUIREMENTS,
         )
 
     try:
+        if generated_requirements is not None:
+            store_requirements(db, description, MAX_REQUIREMENTS, generated_requirements)
         db_application = JobApplication(
             user_id=user_id,
             job=application_data.job,
@@ -129,11 +191,11 @@ async def create_job_application(
             description=description,
             hiring_manager_name=application_data.hiring_manager_name,
             requirements=final_requirements,
+            enrichment_status=enrichment_status,
         )
         db.add(db_application)
         db.commit()
         db.refresh(db_application)
-        return db_application
     except SQLAlchemyError as e:
         db.rollback()
         raise HTTPException(
@@ -141,36 +203,86 @@ async def create_job_application(
             detail="Failed to create job application. Please try again."
         )
 
+    if enrichment_status == ENRICHMENT_PENDING:
+        schedule_requirement_enrichment([cast(UUID, db_application.id)])
+    return db_application
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so the value is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _apply_filters(
+    query: Query,
+    user_id: UUID,
+    statuses: Optional[List[str]] = None,
+    company: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+) -> Query:
+    """
+    Restrict a job application query to one user and the optional filters.
+
+    The user_id/status predicates line up with ix_job_applications_user_id_status
+    and the date range with ix_job_applications_user_id_date. Dates are stored as
+    YYYY-MM-DD strings, so lexical comparison matches chronological order.
+    """
+    query = query.filter(JobApplication.user_id == user_id)
+    if statuses:
+        query = query.filter(JobApplication.status.in_(statuses))
+    company = company.strip() if company else ""
+    if company:
+        query = query.filter(JobApplication.company.ilike(f"%{_escape_like(company)}%", escape="\\"))
+    if date_from:
+        query = query.filter(JobApplication.date >= date_from)
+    if date_to:
+        query = query.filter(JobApplication.date <= date_to)
+    return query
+
 
 def get_user_job_applications(
     db: Session,
     user_id: UUID,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    statuses: Optional[List[str]] = None,
+    company: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
 ) -> tuple[List[JobApplication], int]:
     """
-    Retrieve all job applications for a specific user with pagination.
+    Retrieve job applications for a specific user with pagination and filters.
     
     Args:
         db: Database session
         user_id: UUID of the user
         skip: Number of records to skip (for pagination)
         limit: Maximum number of records to return
+        statuses: Only include applications with one of these statuses
+        company: Case-insensitive substring match on the company name
+        date_from: Earliest application date (YYYY-MM-DD, inclusive)
+        date_to: Latest application date (YYYY-MM-DD, inclusive)
         
     Returns:
-        Tuple of (list of applications, total count)
+        Tuple of (list of applications, total count matching the filters)
         
     Raises:
         HTTPException: If database operation fails
     """
     try:
-        total = db.query(JobApplication).filter(
-            JobApplication.user_id == user_id
-        ).count()
+        filtered = _apply_filters(
+            db.query(JobApplication),
+            user_id=user_id,
+            statuses=statuses,
+            company=company,
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+        total = filtered.count()
         
-        applications = db.query(JobApplication).filter(
-            JobApplication.user_id == user_id
-        ).order_by(
+        applications = filtered.order_by(
             JobApplication.date.desc(),
             JobApplication.created_at.desc()
         ).offset(skip).limit(limit).all()
@@ -183,6 +295,143 @@ def get_user_job_applications(
         )
 
 
+EXPORT_FORMATS = ("csv", "jsonl")
+EXPORT_BATCH_SIZE = 500
+
+_EXPORT_COLUMNS = (
+    JobApplication.id,
+    JobApplication.job,
+    JobApplication.company,
+    JobApplication.date,
+    JobApplication.status,
+    JobApplication.hiring_manager_name,
+    JobApplication.description,
+    JobApplication.requirements,
+    JobApplication.created_at,
+    JobApplication.updated_at,
+)
+_EXPORT_FIELDS = [column.key for column in _EXPORT_COLUMNS]
+
+
+def _export_record(row) -> Dict[str, object]:
+    record = dict(zip(_EXPORT_FIELDS, row))
+    record["id"] = str(record["id"])
+    record["requirements"] = list(record["requirements"] or [])
+    record["created_at"] = record["created_at"].isoformat()
+    record["updated_at"] = record["updated_at"].isoformat()
+    return record
+
+
+def iter_job_application_export(
+    db: Session,
+    user_id: UUID,
+    export_format: str = "csv",
+    statuses: Optional[List[str]] = None,
+    company: Optional[str] = None,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[str]:
+    """
+    Stream a user's job applications as CSV or JSONL text chunks.
+    
+    Rows are read as plain column tuples through a server-side cursor
+    (yield_per/stream_results) and emitted one chunk per batch, so memory
+    stays bounded by the batch size rather than the history size.
+    
+    Args:
+        db: Database session
+        user_id: UUID of the user
+        export_format: Either "csv" or "jsonl"
+        statuses: Only include applications with one of these statuses
+        company: Case-insensitive substring match on the company name
+        date_from: Earliest application date (YYYY-MM-DD, inclusive)
+        date_to: Latest application date (YYYY-MM-DD, inclusive)
+        batch_size: Rows fetched from the cursor and emitted per chunk
+        
+    Yields:
+        Encoded text chunks; CSV output starts with a header row
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Export format must be one of: {', '.join(EXPORT_FORMATS)}")
+
+    query = _apply_filters(
+        db.query(*_EXPORT_COLUMNS),
+        user_id=user_id,
+        statuses=statuses,
+        company=company,
+        date_from=date_from,
+        date_to=date_to,
+    ).order_by(
+        JobApplication.date.desc(),
+        JobApplication.created_at.desc()
+    ).yield_per(batch_size)
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=_EXPORT_FIELDS) if export_format == "csv" else None
+    if writer is not None:
+        writer.writeheader()
+
+    pending = 0
+    for row in query:
+        record = _export_record(row)
+        if writer is not None:
+            record["requirements"] = "; ".join(record["requirements"])  # type: ignore[arg-type]
+            writer.writerow(record)
+        else:
+            buffer.write(json.dumps(record, ensure_ascii=False))
+            buffer.write("\n")
+
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    remaining = buffer.getvalue()
+    if remaining:
+        yield remaining
+
+
+def get_job_application_status_counts(
+    db: Session,
+    user_id: UUID
+) -> Dict[str, int]:
+    """
+    Count a user's job applications per status with a single GROUP BY.
+    
+    Args:
+        db: Database session
+        user_id: UUID of the user
+        
+    Returns:
+        Mapping of every allowed status to its count (zero when absent)
+        
+    Raises:
+        HTTPException: If database operation fails
+    """
+    try:
+        rows = db.query(
+            JobApplication.status,
+            func.count(JobApplication.id)
+        ).filter(
+            JobApplication.user_id == user_id
+        ).group_by(
+            JobApplication.status
+        ).all()
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve job application statistics. Please try again."
+        )
+
+    counts = {application_status: 0 for application_status in ALLOWED_STATUSES}
+    for application_status, count in rows:
+        counts[application_status] = count
+    return counts
+
+
 def get_job_application_by_id(
     db: Session,
     application_id: UUID,
@@ -294,3 +543,358 @@ def delete_job_application(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete job application. Please try again."
         )
+
+
+def bulk_create_job_applications(
+    db: Session,
+    user_id: UUID,
+    applications_data: List[JobApplicationCreate]
+) -> List[JobApplication]:
+    """
+    Create many job applications in a single transaction.
+    
+    Rows are inserted with one batched executemany statement and one commit.
+    AI requirement generation is never awaited here; applications with fewer
+    than MAX_REQUIREMENTS manual requirements take cached requirements for
+    their posting when there are any, and are otherwise stored as pending and
+    handed to the background enrichment queue.
+    
+    Args:
+        db: Database session
+        user_id: UUID of the user creating the applications
+        applications_data: Job application data, in request order
+        
+    Returns:
+        Created applications in request order
+        
+    Raises:
+        HTTPException: If database operation fails
+    """
+    now = datetime.utcnow()
+    rows = []
+    pending_enrichment: List[UUID] = []
+
+    manual_requirements = [
+        _dedupe_requirements(application_data.requirements) for application_data in applications_data
+    ]
+    try:
+        cached = get_cached_requirements_many(
+            db,
+            {
+                application_data.description.strip()
+                for application_data, requirements in zip(applications_data, manual_requirements)
+                if len(requirements) < MAX_REQUIREMENTS
+            },
+            MAX_REQUIREMENTS,
+        )
+    except SQLAlchemyError:
+        db.rollback()
+        cached = {}
+
+    for application_data, requirements in zip(applications_data, manual_requirements):
+        application_id = uuid4()
+        enrichment_status = ENRICHMENT_COMPLETE
+        cached_requirements = cached.get(application_data.description.strip())
+        if len(requirements) < MAX_REQUIREMENTS and cached_requirements is not None:
+            requirements = _merge_manual_and_ai_requirements(
+                manual_requirements=requirements,
+                ai_requirements=cached_requirements,
+                max_items=MAX_REQUIREMENTS,
+            )
+        elif len(requirements) < MAX_REQUIREMENTS:
+            enrichment_status = ENRICHMENT_PENDING
+            pending_enrichment.append(application_id)
+        rows.append({
+            "id": application_id,
+            "user_id": user_id,
+            "job": application_data.job,
+            "company": application_data.company,
+            "date": application_data.date,
+            "status": application_data.status,
+            "description": application_data.description.strip(),
+            "hiring_manager_name": application_data.hiring_manager_name,
+            "requirements": requirements,
+            "enrichment_status": enrichment_status,
+            "created_at": now,
+            "updated_at": now,
+        })
+
+    try:
+        db.execute(insert(JobApplication), rows)
+        db.commit()
+
+        ids = [row["id"] for row in rows]
+        created = db.query(JobApplication).filter(JobApplication.id.in_(ids)).all()
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create job applications. Please try again."
+        )
+
+    schedule_requirement_enrichment(pending_enrichment)
+    by_id = {application.id: application for application in created}
+    return [by_id[application_id] for application_id in ids]
+
+
+def bulk_update_job_applications(
+    db: Session,
+    user_id: UUID,
+    updates: List[JobApplicationBulkUpdateItem]
+) -> List[JobApplication]:
+    """
+    Apply partial updates to many job applications in a single transaction.
+    
+    Args:
+        db: Database session
+        user_id: UUID of the user (for authorization)
+        updates: Per-application updates, each addressed by ID
+        
+    Returns:
+        Updated JobApplication instances in request order
+        
+    Raises:
+        HTTPException: If any application is not found or the update fails
+    """
+    ids = [item.id for item in updates]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each job application can only appear once per bulk update."
+        )
+
+    try:
+        owned_ids = {
+            application_id
+            for (application_id,) in db.query(JobApplication.id).filter(
+                JobApplication.id.in_(ids),
+                JobApplication.user_id == user_id
+            )
+        }
+        if len(owned_ids) != len(ids):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="One or more job applications were not found or you don't have permission to access them."
+            )
+
+        now = datetime.utcnow()
+        rows = []
+        for item in updates:
+            values = item.model_dump(exclude_unset=True)
+            values["id"] = item.id
+            values["updated_at"] = now
+            rows.append(values)
+
+        db.execute(update(JobApplication), rows)
+        db.commit()
+
+        updated = db.query(JobApplication).filter(JobApplication.id.in_(ids)).all()
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update job applications. Please try again."
+        )
+
+    by_id = {application.id: application for application in updated}
+    return [by_id[application_id] for application_id in ids]
+
+
+def bulk_delete_job_applications(
+    db: Session,
+    user_id: UUID,
+    application_ids: List[UUID]
+) -> int:
+    """
+    Delete many job applications with a single DELETE statement.
+    
+    IDs that do not exist or belong to another user are ignored.
+    
+    Args:
+        db: Database session
+        user_id: UUID of the user (for authorization)
+        application_ids: UUIDs of the applications to delete
+        
+    Returns:
+        Number of applications deleted
+        
+    Raises:
+        HTTPException: If delete fails
+    """
+    try:
+        deleted = db.query(JobApplication).filter(
+            JobApplication.id.in_(application_ids),
+            JobApplication.user_id == user_id
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+    except SQLAlchemyError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete job applications. Please try again."
+        )
+
+
+def _claim_enrichment(db: Session, application_id: UUID) -> bool:
+    try:
+        claimed = db.execute(
+            update(JobApplication)
+            .where(JobApplication.id == application_id, JobApplication.enrichment_status == ENRICHMENT_PENDING)
+            # Keep updated_at: it is the user's modification time, not the worker's.
+            .values(
+                enrichment_status=ENRICHMENT_RUNNING,
+                enrichment_claimed_at=datetime.utcnow(),
+                updated_at=JobApplication.updated_at,
+            )
+        ).rowcount
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        return False
+    return claimed == 1
+
+
+def _write_back_enrichment(db: Session, application_id: UUID, ai_requirements: Optional[List[str]]) -> None:
+    """
+    Finish a claimed enrichment: merge `ai_requirements` into the row, or mark it failed if None.
+
+    The merge is made against the requirements the row holds now and written
+    with a compare-and-set on updated_at, so an edit saved while the model
+    was running is merged with rather than overwritten. A row that is no
+    longer running (deleted, or reclaimed as stale) is left alone.
+    """
+    for _ in range(_WRITE_BACK_ATTEMPTS):
+        current = db.execute(
+            select(JobApplication.requirements, JobApplication.updated_at).where(
+                JobApplication.id == application_id,
+                JobApplication.enrichment_status == ENRICHMENT_RUNNING,
+            )
+        ).first()
+        if current is None:
+            return
+        if ai_requirements is None:
+            values = {"enrichment_status": ENRICHMENT_FAILED, "updated_at": current.updated_at}
+        else:
+            values = {
+                "enrichment_status": ENRICHMENT_COMPLETE,
+                "requirements": _merge_manual_and_ai_requirements(
+                    manual_requirements=list(current.requirements or []),
+                    ai_requirements=ai_requirements,
+                    max_items=MAX_REQUIREMENTS,
+                ),
+            }
+        written = db.execute(
+            update(JobApplication)
+            .where(
+                JobApplication.id == application_id,
+                JobApplication.enrichment_status == ENRICHMENT_RUNNING,
+                JobApplication.updated_at == current.updated_at,
+            )
+            .values(enrichment_claimed_at=None, **values)
+        ).rowcount
+        db.commit()
+        if written == 1:
+            return
+
+
+async def enrich_job_application_requirements(
+    application_ids: List[UUID],
+    session_factory: Callable[[], Session] = SessionLocal
+) -> None:
+    """
+    Fill in AI-generated requirements for already persisted applications.
+    
+    Runs on the background queue, so it opens its own session. Each
+    application is claimed (pending to running) with a conditional UPDATE
+    first, so when several processes enqueue the same application only one
+    of them calls the model. On failure the manual requirements are left
+    untouched and the application is marked as failed; on success the AI
+    requirements are merged into the application's current requirements,
+    including edits made while the model was running, and it is marked
+    complete.
+    
+    Args:
+        application_ids: UUIDs of the applications to enrich
+        session_factory: Factory for the database session to use
+    """
+    db = session_factory()
+    try:
+        for application_id in application_ids:
+            if not _claim_enrichment(db, application_id):
+                continue
+            description = db.execute(
+                select(JobApplication.description).where(JobApplication.id == application_id)
+            ).scalar()
+            if description is None:
+                continue
+
+            ai_requirements = _cached_ai_requirements(db, description)
+            if ai_requirements is None:
+                try:
+                    ai_response = await generate_job_requirements_from_description(
+                        description,
+                        max_requirements=MAX_REQUIREMENTS,
+                    )
+                except (ValueError, RuntimeError):
+                    pass
+                else:
+                    ai_requirements = ai_response.requirements
+                    store_requirements(db, description, MAX_REQUIREMENTS, ai_requirements)
+            try:
+                _write_back_enrichment(db, application_id, ai_requirements)
+            except SQLAlchemyError:
+                db.rollback()
+    finally:
+        db.close()
+
+
+def requeue_pending_enrichments(
+    session_factory: Callable[[], Session] = SessionLocal,
+    batch_size: int = 100
+) -> int:
+    """
+    Re-enqueue every application still marked as pending enrichment.
+    
+    Called on startup so work interrupted by a restart is picked up again.
+    Enrichments claimed more than ENRICHMENT_STALE_SECONDS ago are first
+    put back to pending; younger ones may belong to a sibling process and
+    are left alone. Every process enqueues the pending applications, but the
+    claim in ``enrich_job_application_requirements`` lets only one of them
+    call the model per application.
+    
+    Args:
+        session_factory: Factory for the database session to use
+        batch_size: Number of applications handed to each queued task
+        
+    Returns:
+        Number of applications re-enqueued
+    """
+    db = session_factory()
+    try:
+        db.execute(
+            update(JobApplication)
+            .where(
+                JobApplication.enrichment_status == ENRICHMENT_RUNNING,
+                or_(
+                    JobApplication.enrichment_claimed_at.is_(None),
+                    JobApplication.enrichment_claimed_at < datetime.utcnow() - timedelta(seconds=ENRICHMENT_STALE_SECONDS),
+                ),
+            )
+            .values(enrichment_status=ENRICHMENT_PENDING, enrichment_claimed_at=None, updated_at=JobApplication.updated_at)
+        )
+        db.commit()
+        pending_ids = [
+            application_id
+            for (application_id,) in db.query(JobApplication.id).filter(
+                JobApplication.enrichment_status == ENRICHMENT_PENDING
+            )
+        ]
+    finally:
+        db.close()
+
+    for offset in range(0, len(pending_ids), batch_size):
+        schedule_requirement_enrichment(pending_ids[offset:offset + batch_size])
+    return len(pending_ids)
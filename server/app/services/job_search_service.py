@@ -0,0 +1,225 @@
+"""
+Full-text search over a user's job applications.
+
+PostgreSQL uses a generated ``tsvector`` column with a GIN index so ranking
+happens inside the database. Other backends (SQLite in tests) fall back to a
+pure-Python inverted index built over the user's applications.
+"""
+import math
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Engine, func, literal_column, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.models.database.job_application import JobApplication
+
+
+SEARCH_CONFIG = "english"
+
+# Field weights mirror PostgreSQL's default ts_rank weights for labels A/B/C.
+FIELD_WEIGHTS: Dict[str, float] = {
+    "job": 1.0,
+    "company": 0.4,
+    "requirements": 0.4,
+    "description": 0.2,
+}
+
+_POSTGRES_SEARCH_DDL = (
+    # array_to_string is only STABLE, so wrap it for use in a generated column.
+    """
+    CREATE OR REPLACE FUNCTION job_application_requirements_text(text[])
+    RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    AS $$ SELECT coalesce(array_to_string($1, ' '), '') $$
+    """,
+    f"""
+    ALTER TABLE job_applications
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(job, '')), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(company, '')), 'B') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', job_application_requirements_text(requirements)), 'B') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_job_applications_search_vector
+    ON job_applications USING GIN (search_vector)
+    """,
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+
+def install_search_index(engine: Engine) -> None:
+    """
+    Create the generated search column and GIN index when running on PostgreSQL.
+
+    The statements are idempotent, so this is safe to run on every startup.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as connection:
+        for statement in _POSTGRES_SEARCH_DDL:
+            connection.execute(text(statement))
+
+
+def tokenize(value: str) -> List[str]:
+    """Lowercase a string and split it into search terms."""
+    return _TOKEN_PATTERN.findall(value.lower())
+
+
+class InvertedIndex:
+    """
+    In-memory inverted index with weighted BM25 ranking.
+
+    Used as the search backend when PostgreSQL full-text search is not
+    available. Documents are indexed by position and scored per field using
+    ``FIELD_WEIGHTS``; queries require every term to match.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self._k1 = k1
+        self._b = b
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._lengths: List[float] = []
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, fields: Dict[str, str]) -> int:
+        """Index a document given as a mapping of field name to text; returns its position."""
+        doc_id = len(self._lengths)
+        length = 0.0
+        for field, value in fields.items():
+            weight = FIELD_WEIGHTS.get(field, 0.1)
+            for term in tokenize(value):
+                postings = self._postings[term]
+                postings[doc_id] = postings.get(doc_id, 0.0) + weight
+                length += weight
+        self._lengths.append(length)
+        self._total_length += length
+        return doc_id
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[int, float]]:
+        """Return up to `limit` (position, score) pairs ordered by descending score."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._lengths:
+            return []
+
+        term_postings = [self._postings.get(term) for term in terms]
+        if any(not postings for postings in term_postings):
+            return []
+
+        # Intersect starting from the rarest term to keep the candidate set small.
+        ordered = sorted(term_postings, key=len)
+        candidates = set(ordered[0])
+        for postings in ordered[1:]:
+            candidates.intersection_update(postings)
+            if not candidates:
+                return []
+
+        total_docs = len(self._lengths)
+        average_length = (self._total_length / total_docs) or 1.0
+        scores: Dict[int, float] = {}
+        for postings in term_postings:
+            idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id in candidates:
+                frequency = postings[doc_id]
+                norm = self._k1 * (1 - self._b + self._b * self._lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self._k1 + 1) / (frequency + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
+
+
+def _application_fields(application: JobApplication) -> Dict[str, str]:
+    requirements: Iterable[str] = application.requirements or []  # type: ignore[assignment]
+    return {
+        "job": str(application.job or ""),
+        "company": str(application.company or ""),
+        "requirements": " ".join(requirements),
+        "description": str(application.description or ""),
+    }
+
+
+def _search_postgres(
+    db: Session,
+    user_id: UUID,
+    query: str,
+    limit: int,
+) -> List[Tuple[JobApplication, float]]:
+    search_vector = literal_column("job_applications.search_vector")
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+    rank = func.ts_rank_cd(search_vector, ts_query).label("rank")
+
+    rows = db.query(JobApplication, rank).filter(
+        JobApplication.user_id == user_id,
+        search_vector.op("@@")(ts_query),
+    ).order_by(
+        rank.desc(),
+        JobApplication.created_at.desc()
+    ).limit(limit).all()
+
+    return [(application, float(score)) for application, score in rows]
+
+
+def _search_in_memory(
+    db: Session,
+    user_id: UUID,
+    query: str,
+    limit: int,
+) -> List[Tuple[JobApplication, float]]:
+    applications: Sequence[JobApplication] = db.query(JobApplication).filter(
+        JobApplication.user_id == user_id
+    ).all()
+
+    index = InvertedIndex()
+    for application in applications:
+        index.add(_application_fields(application))
+
+    return [(applications[doc_id], score) for doc_id, score in index.search(query, limit=limit)]
+
+
+def search_job_applications(
+    db: Session,
+    user_id: UUID,
+    query: str,
+    limit: int = 20,
+) -> List[Tuple[JobApplication, float]]:
+    """
+    Search a user's job applications by title, company, requirements and description.
+
+    Args:
+        db: Database session
+        user_id: UUID of the user
+        query: Free-text search query
+        limit: Maximum number of results to return
+
+    Returns:
+        List of (application, rank) pairs ordered by descending rank
+
+    Raises:
+        HTTPException: If the query is empty or the database operation fails
+    """
+    if not tokenize(query):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query must contain at least one word."
+        )
+
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            return _search_postgres(db, user_id, query, limit)
+        return _search_in_memory(db, user_id, query, limit)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to search job applications. Please try again."
+        )
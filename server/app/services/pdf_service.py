@@ -1,8 +1,60 @@
-import pymupdf
+from typing import Tuple
+
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from app.core.metrics import timed_operation
 from app.utils.sanitization import MAX_PDF_BYTES
 from app.models.cover_letter import CoverLetterDocument
 
+
+PAGE_SEPARATOR = "\n\n\f"
+
+# pymupdf is imported where it is used: loading it adds noticeably to startup,
+# and most processes importing this module never touch a PDF.
+
+
+def _extract_pages(content: bytes) -> Tuple[str, int]:
+    import pymupdf
+
+    pdf_document = pymupdf.open(stream=content, filetype="pdf")
+
+    extracted_text = []
+    page_count = pdf_document.page_count
+    for page_num in range(page_count):
+        page = pdf_document[page_num]
+        text = page.get_text()
+        extracted_text.append(text)
+
+    pdf_document.close()
+
+    # The form feed lets prompt compaction tell pages apart (running headers and footers).
+    return PAGE_SEPARATOR.join(extracted_text).strip(), page_count
+
+
+def _validated_pages(content: bytes) -> Tuple[str, int]:
+    if len(content) > MAX_PDF_BYTES:
+        raise ValueError(
+            f"PDF file is too large ({len(content) / (1024 * 1024):.1f} MB). Maximum allowed size is 10 MB."
+        )
+
+    full_text, page_count = _extract_pages(content)
+
+    if not full_text:
+        raise ValueError("No text content found in the PDF")
+
+    return full_text, page_count
+
+
+async def _extract(content: bytes) -> Tuple[str, int]:
+    try:
+        # Parsing is CPU-bound; keep it off the event loop.
+        return await run_in_threadpool(_validated_pages, content)
+
+    except Exception as e:
+        raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+
+
+@timed_operation("pdf_extract")
 async def extract_text_from_pdf(resume: UploadFile) -> str:
     """
     Extracts text content from a PDF file using PyMuPDF.
@@ -19,29 +71,50 @@ async def extract_text_from_pdf(resume: UploadFile) -> str:
     try:
         content = await resume.read()
         await resume.seek(0)
+    except Exception as e:
+        raise ValueError(f"Failed to extract text from PDF: {str(e)}")
 
-        if len(content) > MAX_PDF_BYTES:
-            raise ValueError(
-                f"PDF file is too large ({len(content) / (1024 * 1024):.1f} MB). Maximum allowed size is 10 MB."
-            )
+    full_text, _ = await _extract(content)
+    return full_text
+
+
+@timed_operation("pdf_extract")
+async def extract_pdf_content(content: bytes) -> Tuple[str, int]:
+    """
+    Extracts text and the page count from PDF bytes already in memory.
+
+    Parameters:
+        content (bytes): Raw PDF file content
+
+    Returns:
+        Tuple[str, int]: Extracted text from all pages, and the number of pages
 
-        pdf_document = pymupdf.open(stream=content, filetype="pdf")
+    Raises:
+        ValueError: If the PDF exceeds 10 MB, cannot be opened, or contains no text
+    """
+    return await _extract(content)
 
-        extracted_text = []
-        for page_num in range(pdf_document.page_count):
-            page = pdf_document[page_num]
-            text = page.get_text()
-            extracted_text.append(text)
 
-        pdf_document.close()
+def extract_pdf_file(path: str) -> Tuple[str, int]:
+    """
+    Extracts text and the page count from a PDF file on disk.
 
-        full_text = "\n\n".join(extracted_text).strip()
+    Synchronous and free of shared state, so it can run in a worker process
+    (see ``app.cli``).
 
-        if not full_text:
-            raise ValueError("No text content found in the PDF")
+    Parameters:
+        path (str): Path to the PDF file
 
-        return full_text
+    Returns:
+        Tuple[str, int]: Extracted text from all pages, and the number of pages
 
+    Raises:
+        ValueError: If the file cannot be read, exceeds 10 MB, cannot be opened, or contains no text
+    """
+    try:
+        with open(path, "rb") as pdf_file:
+            content = pdf_file.read()
+        return _validated_pages(content)
     except Exception as e:
         raise ValueError(f"Failed to extract text from PDF: {str(e)}")
 
@@ -52,6 +125,8 @@ def _wrap_text_lines(
     font_name: str,
     font_size: float,
 ) -> list[str]:
+    import pymupdf
+
     lines: list[str] = []
     paragraphs = text.replace("\r\n", "\n").split("\n")
 
@@ -85,6 +160,7 @@ def _wrap_text_lines(
     return lines
 
 
+@timed_operation("pdf_render")
 def render_cover_letter_pdf(document: CoverLetterDocument) -> bytes:
     """
     Render a generated cover letter into PDF bytes.
@@ -119,6 +195,8 @@ def render_cover_letter_pdf(document: CoverLetterDocument) -> bytes:
     )
     all_lines = [*heading_lines, *body_lines]
 
+    import pymupdf
+
     pdf_document = pymupdf.open()
     page = pdf_document.new_page(width=page_width, height=page_height)
 
@@ -0,0 +1,169 @@
+"""
+Cache of AI-generated requirements per job description.
+
+Lists are keyed by the description's preflight digest (see
+``app.utils.sanitization``), the canonical key for request text, and the
+``max_requirements`` they were generated with, persisted in the
+``job_requirement_cache`` table and fronted by a per-process LRU. The table
+is shared by every user and worker, so adding a posting that anyone has
+added before is a database write instead of a model call.
+
+    REQUIREMENTS_CACHE_SIZE   entries kept in the in-process LRU (0 disables it)
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import REQUIREMENTS_CACHE_LOOKUPS
+from app.models.database.requirement_cache import RequirementCacheEntry
+from app.utils.sanitization import preflight
+
+
+REQUIREMENTS_CACHE_SIZE = settings.requirements_cache_size
+
+_Key = Tuple[str, int]
+
+
+def description_hash(description: str) -> str:
+    """Cache key of `description`: its preflight digest, so formatting-only differences share an entry."""
+    return preflight(description).digest
+
+
+class RequirementsLRU:
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._entries: "OrderedDict[_Key, Tuple[str, ...]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: _Key) -> Optional[List[str]]:
+        with self._lock:
+            requirements = self._entries.get(key)
+            if requirements is None:
+                return None
+            self._entries.move_to_end(key)
+            return list(requirements)
+
+    def put(self, key: _Key, requirements: Iterable[str]) -> None:
+        if self.capacity <= 0:
+            return
+        with self._lock:
+            self._entries[key] = tuple(requirements)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_memory = RequirementsLRU(REQUIREMENTS_CACHE_SIZE)
+
+
+def clear_memory_cache() -> None:
+    """Drop the in-process entries; persisted entries are kept."""
+    _memory.clear()
+
+
+def get_cached_requirements_many(
+    db: Session,
+    descriptions: Iterable[str],
+    max_requirements: int,
+) -> Dict[str, List[str]]:
+    """
+    Look up cached requirements for several descriptions at once.
+
+    The LRU is checked first; all misses are fetched in one query.
+
+    Args:
+        db: Database session
+        descriptions: Job descriptions to look up
+        max_requirements: Requirement limit the lists must have been generated with
+
+    Returns:
+        Requirements by description, for the descriptions that are cached
+    """
+    found: Dict[str, List[str]] = {}
+    missing: Dict[_Key, List[str]] = {}
+    for description in descriptions:
+        key = (description_hash(description), max_requirements)
+        requirements = _memory.get(key)
+        if requirements is not None:
+            REQUIREMENTS_CACHE_LOOKUPS.labels(result="memory").inc()
+            found[description] = requirements
+        else:
+            missing.setdefault(key, []).append(description)
+
+    if missing:
+        rows = db.execute(
+            select(
+                RequirementCacheEntry.description_hash,
+                RequirementCacheEntry.max_requirements,
+                RequirementCacheEntry.requirements,
+            ).where(
+                tuple_(RequirementCacheEntry.description_hash, RequirementCacheEntry.max_requirements).in_(
+                    list(missing)
+                )
+            )
+        ).all()
+        for description_digest, limit, requirements in rows:
+            if not requirements:
+                # Stored before empty lists were refused; let the posting be generated again.
+                continue
+            key = (description_digest, limit)
+            _memory.put(key, requirements)
+            for description in missing.pop(key, []):
+                REQUIREMENTS_CACHE_LOOKUPS.labels(result="database").inc()
+                found[description] = list(requirements)
+        for descriptions_missed in missing.values():
+            REQUIREMENTS_CACHE_LOOKUPS.labels(result="miss").inc(len(descriptions_missed))
+
+    return found
+
+
+def get_cached_requirements(db: Session, description: str, max_requirements: int) -> Optional[List[str]]:
+    """Return cached requirements for `description`, or None on a miss."""
+    return get_cached_requirements_many(db, [description], max_requirements).get(description)
+
+
+def store_requirements(
+    db: Session,
+    description: str,
+    max_requirements: int,
+    requirements: List[str],
+) -> None:
+    """
+    Add generated requirements to the cache.
+
+    The row is written in the caller's transaction and becomes visible to
+    other workers when the caller commits. A row stored concurrently for the
+    same posting is kept as is. An empty list is not cached, so the posting
+    is sent to the model again next time.
+    """
+    if not requirements:
+        return
+    key = (description_hash(description), max_requirements)
+    values = {
+        "description_hash": key[0],
+        "max_requirements": max_requirements,
+        "requirements": list(requirements),
+    }
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    db.execute(
+        insert(RequirementCacheEntry)
+        .values(**values)
+        .on_conflict_do_nothing(
+            index_elements=[RequirementCacheEntry.description_hash, RequirementCacheEntry.max_requirements]
+        )
+    )
+    _memory.put(key, requirements)
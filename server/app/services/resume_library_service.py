@@ -0,0 +1,136 @@
+"""
+Per-user resume library.
+
+Uploads are identified by the SHA-256 digest of their bytes, so storing a
+file the user already has returns the existing entry without parsing the
+PDF again. Analyses and cover letters can then reference the stored text by
+ID instead of re-uploading the file.
+"""
+import hashlib
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.metrics import RESUME_UPLOADS
+from app.models.database.stored_resume import StoredResume
+from app.services.pdf_service import extract_pdf_content
+
+
+def resume_digest(content: bytes) -> str:
+    """SHA-256 hex digest identifying an uploaded file."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def _find_by_digest(db: Session, user_id: UUID, digest: str) -> Optional[StoredResume]:
+    return db.query(StoredResume).filter(
+        StoredResume.user_id == user_id,
+        StoredResume.digest == digest,
+    ).first()
+
+
+def _insert(db: Session, stored: StoredResume, user_id: UUID, digest: str) -> Tuple[StoredResume, bool]:
+    try:
+        db.add(stored)
+        db.commit()
+        db.refresh(stored)
+    except IntegrityError:
+        # The same file was stored by a concurrent upload.
+        db.rollback()
+        existing = _find_by_digest(db, user_id, digest)
+        if existing is None:
+            raise
+        return existing, False
+    except SQLAlchemyError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to save the resume. Please try again."
+        )
+    return stored, True
+
+
+async def store_resume(db: Session, user_id: UUID, filename: str, content: bytes) -> Tuple[StoredResume, bool]:
+    """
+    Save a resume PDF to the user's library unless it is already there.
+
+    Args:
+        db: Database session
+        user_id: Owner of the library
+        filename: Name of the uploaded file
+        content: Raw PDF bytes
+
+    Returns:
+        Tuple[StoredResume, bool]: The stored resume, and whether it was newly created
+
+    Raises:
+        ValueError: If the PDF cannot be parsed or contains no text
+        HTTPException: If the insert fails
+    """
+    digest = resume_digest(content)
+    # Queries are blocking; keep them off the event loop.
+    existing = await run_in_threadpool(_find_by_digest, db, user_id, digest)
+    if existing is not None:
+        RESUME_UPLOADS.labels(result="duplicate").inc()
+        return existing, False
+
+    text, page_count = await extract_pdf_content(content)
+    stored = StoredResume(
+        user_id=user_id,
+        digest=digest,
+        filename=filename[:255],
+        size_bytes=len(content),
+        page_count=page_count,
+        text=text,
+    )
+    stored, created = await run_in_threadpool(_insert, db, stored, user_id, digest)
+    RESUME_UPLOADS.labels(result="stored" if created else "duplicate").inc()
+    return stored, created
+
+
+def list_resumes(db: Session, user_id: UUID) -> List[StoredResume]:
+    """Resumes in the user's library, newest first."""
+    return db.query(StoredResume).filter(
+        StoredResume.user_id == user_id
+    ).order_by(StoredResume.created_at.desc()).all()
+
+
+def get_resume(db: Session, user_id: UUID, resume_id: UUID) -> StoredResume:
+    """
+    Fetch one of the user's stored resumes.
+
+    Raises:
+        HTTPException: If the resume does not exist or belongs to another user
+    """
+    stored = db.query(StoredResume).filter(
+        StoredResume.id == resume_id,
+        StoredResume.user_id == user_id,
+    ).first()
+    if stored is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume not found."
+        )
+    return stored
+
+
+def delete_resume(db: Session, user_id: UUID, resume_id: UUID) -> None:
+    """
+    Remove a resume from the user's library.
+
+    Raises:
+        HTTPException: If the resume does not exist or the delete fails
+    """
+    stored = get_resume(db, user_id, resume_id)
+    try:
+        db.delete(stored)
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete the resume. Please try again."
+        )
@@ -1,19 +1,17 @@
 from fastapi import UploadFile
+from app.core.llm import gemini_client, llm_call
+from app.core.model_routing import ANALYSIS, CLASSIFICATION, EXTRACTION, model_router
+from app.core.profiling import span
+from app.core.single_flight import llm_flights, prompt_key
 from app.models.job_application import JobRequirementsResponse, MAX_REQUIREMENTS
 from app.models.resume import ResumeAnalysisResponse
 from app.services.pdf_service import extract_text_from_pdf
-import os
+from app.utils.prompt_compaction import compact_for_prompt
 import json
-from dotenv import load_dotenv
-from google import genai
-from google.genai import types
 
 
-load_dotenv()
-
-# Singleton client — created once at import time, reused across all requests
-client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
-GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+# Shared client, built on first use (see app.core.llm)
+client = gemini_client
 
 
 def _normalize_requirement_text(value: str) -> str:
@@ -41,21 +39,34 @@ async def validate_job_description(text: str) -> tuple[bool, str]:
         'Respond only in JSON: {"is_valid": true/false, "reason": "<brief reason>"}'
     )
 
-    response = await client.aio.models.generate_content(
-        model=GEMINI_MODEL,
-        contents=prompt,
-        config=types.GenerateContentConfig(
-            temperature=0.1,
-            response_mime_type="application/json",
-            response_schema={
-                "type": "object",
-                "properties": {
-                    "is_valid": {"type": "boolean"},
-                    "reason": {"type": "string"},
-                },
-                "required": ["is_valid", "reason"],
-            },
-        ),
+    route = model_router.route(CLASSIFICATION, prompt)
+
+    async def classify():
+        from google.genai import types
+
+        async with llm_call("validate_job_description", route) as call:
+            return call.record(await client.aio.models.generate_content(
+                model=route.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.1,
+                    response_mime_type="application/json",
+                    response_schema={
+                        "type": "object",
+                        "properties": {
+                            "is_valid": {"type": "boolean"},
+                            "reason": {"type": "string"},
+                        },
+                        "required": ["is_valid", "reason"],
+                    },
+                ),
+            ))
+
+    # Concurrent submissions of the same posting share one upstream call.
+    response = await llm_flights.do(
+        prompt_key("validate_job_description", route.model, prompt),
+        classify,
+        operation="validate_job_description",
     )
 
     data = json.loads(response.text or "{}")
@@ -82,24 +93,36 @@ async def generate_job_requirements_from_description(
         'Respond only in JSON: {"requirements": ["<requirement 1>", "<requirement 2>"]}'
     )
 
+    route = model_router.route(EXTRACTION, prompt)
+
+    async def extract():
+        from google.genai import types
+
+        async with llm_call("generate_requirements", route) as call:
+            return call.record(await client.aio.models.generate_content(
+                model=route.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.2,
+                    response_mime_type="application/json",
+                    response_schema={
+                        "type": "object",
+                        "properties": {
+                            "requirements": {
+                                "type": "array",
+                                "items": {"type": "string"}
+                            }
+                        },
+                        "required": ["requirements"]
+                    }
+                )
+            ))
+
     try:
-        response = await client.aio.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.2,
-                response_mime_type="application/json",
-                response_schema={
-                    "type": "object",
-                    "properties": {
-                        "requirements": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        }
-                    },
-                    "required": ["requirements"]
-                }
-            )
+        response = await llm_flights.do(
+            prompt_key("generate_requirements", route.model, prompt),
+            extract,
+            operation="generate_requirements",
         )
 
         response_text = response.text or ""
@@ -138,21 +161,8 @@ async def generate_job_requirements_from_description(
         raise RuntimeError("Failed to generate job requirements.") from error
 
 
-async def analyze_resume(resume: UploadFile, job_description: str) -> ResumeAnalysisResponse:
-    """
-    Analyzes resume against job description using Google Generative AI.
-
-    Parameters:
-        resume (UploadFile): PDF file containing the resume
-        job_description (str): Job description to match against
-
-    Returns:
-        ResumeAnalysisResponse: Analysis results including match score, strengths, gaps
-    """
-
-    resume_text = await extract_text_from_pdf(resume)
-
-    prompt = f"""You are an expert recruiter and HR professional. Analyze the following resume against the job description and provide a detailed assessment.
+def _build_analysis_prompt(resume_text: str, job_description: str) -> str:
+    return f"""You are an expert recruiter and HR professional. Analyze the following resume against the job description and provide a detailed assessment.
 
 RESUME:
 {resume_text}
@@ -178,41 +188,83 @@ Consider:
 
 Provide ONLY the JSON response, no additional text."""
 
-    try:
-        response = await client.aio.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.7,
-                response_mime_type="application/json",
-                response_schema={
-                    "type": "object",
-                    "properties": {
-                        "match_score": {"type": "number"},
-                        "summary": {"type": "string"},
-                        "strengths": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        },
-                        "gaps": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        },
-                        "recommendations": {
-                            "type": "array",
-                            "items": {"type": "string"}
-                        }
-                    },
-                    "required": ["match_score", "summary", "strengths", "gaps", "recommendations"]
-                }
-            )
-        )
 
-        response_text = response.text or ""
-        if not response_text:
-            raise ValueError("Empty response from LLM: response.text is None or empty")
+async def analyze_resume(
+    resume: UploadFile,
+    job_description: str,
+    resume_text: str | None = None,
+) -> ResumeAnalysisResponse:
+    """
+    Analyzes resume against job description using Google Generative AI.
 
-        analysis_data = json.loads(response_text)
+    Parameters:
+        resume (UploadFile): PDF file containing the resume
+        job_description (str): Job description to match against
+        resume_text (str | None): Text of `resume` already passed through
+            compact_for_prompt; skips extraction and compaction.
+
+    Returns:
+        ResumeAnalysisResponse: Analysis results including match score, strengths, gaps.
+            A response that is not valid JSON yields a zero score whose summary says so.
+
+    Raises:
+        LLMUnavailableError: If the circuit breaker is open
+        Exception: Whatever the Gemini client raised for a failed call
+    """
+
+    if resume_text is None:
+        with span("pdf_extraction"):
+            resume_text = await extract_text_from_pdf(resume)
+        resume_text = compact_for_prompt(resume_text)
+
+    with span("prompt_construction"):
+        prompt = _build_analysis_prompt(resume_text, job_description)
+        route = model_router.route(ANALYSIS, prompt)
+
+    from google.genai import types
+
+    with span("llm_wait"):
+        async with llm_call("analyze_resume", route) as call:
+            response = call.record(await client.aio.models.generate_content(
+                model=route.model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=0.7,
+                    response_mime_type="application/json",
+                    response_schema={
+                        "type": "object",
+                        "properties": {
+                            "match_score": {"type": "number"},
+                            "summary": {"type": "string"},
+                            "strengths": {
+                                "type": "array",
+                                "items": {"type": "string"}
+                            },
+                            "gaps": {
+                                "type": "array",
+                                "items": {"type": "string"}
+                            },
+                            "recommendations": {
+                                "type": "array",
+                                "items": {"type": "string"}
+                            }
+                        },
+                        "required": ["match_score", "summary", "strengths", "gaps", "recommendations"]
+                    }
+                )
+            ))
+
+    with span("response_parsing"):
+        try:
+            analysis_data = json.loads(response.text or "")
+        except json.JSONDecodeError as e:
+            return ResumeAnalysisResponse(
+                match_score=0.0,
+                summary=f"Error parsing LLM response: {str(e)}",
+                strengths=[],
+                gaps=[],
+                recommendations=[]
+            )
 
         return ResumeAnalysisResponse(
             match_score=float(analysis_data.get("match_score", 0)),
@@ -221,21 +273,3 @@ Provide ONLY the JSON response, no additional text."""
             gaps=analysis_data.get("gaps", []),
             recommendations=analysis_data.get("recommendations", [])
         )
-
-    except json.JSONDecodeError as e:
-        return ResumeAnalysisResponse(
-            match_score=0.0,
-            summary=f"Error parsing LLM response: {str(e)}",
-            strengths=[],
-            gaps=[],
-            recommendations=[]
-        )
-    except Exception as e:
-        return ResumeAnalysisResponse(
-            match_score=0.0,
-            summary=f"Error during analysis: {str(e)}",
-            strengths=[],
-            gaps=[],
-            recommendations=[]
-        )
-    
@@ -0,0 +1,133 @@
+"""
+Single-pass scanner for disallowed content in user-supplied text.
+
+Implements the rules listed in ``app.utils.sanitization._INJECTION_PATTERNS``
+with one compiled pattern. Each alternative is a short, named token (a
+keyword, ``<`` before a letter, a newline, ...) and rules that relate two
+tokens, such as "a SQL verb followed by FROM on the same line", are decided
+by a little state kept while iterating over the matches. No alternative can
+backtrack over more than a keyword, so a scan is linear in the input length;
+the equivalent stand-alone regexes are quadratic on inputs like a thousand
+repetitions of ``select``. Text is lowered once up front rather than matched
+case-insensitively, which is what keeps benign text as cheap as before.
+
+When several rules match, the message of the earliest rule in
+``_INJECTION_PATTERNS`` is returned, as checking the patterns in order did.
+"""
+import re
+from typing import Optional
+
+
+URL_MESSAGE = "URLs are not allowed in the job description."
+HTML_MESSAGE = "HTML tags are not allowed in the job description."
+SQL_MESSAGE = "SQL statements are not allowed in the job description."
+DISALLOWED_MESSAGE = "Your input contains disallowed content. Please enter a plain job description."
+
+# Lower number wins when a text breaks several rules.
+_PRIORITY = {URL_MESSAGE: 0, HTML_MESSAGE: 1, SQL_MESSAGE: 2, DISALLOWED_MESSAGE: 3}
+
+# Maximum gap between an override verb and its target ("ignore ... previous").
+_OVERRIDE_GAP = 30
+
+_SQL_VERB = "sql_verb"
+_SQL_CLAUSE = "sql_clause"
+_OVERRIDE_VERB = "override_verb"
+_OVERRIDE_TARGET = "override_target"
+
+_KEYWORDS = {
+    **dict.fromkeys(("select", "insert", "update", "delete", "drop", "union", "alter", "truncate"), _SQL_VERB),
+    **dict.fromkeys(("from", "into", "table", "where"), _SQL_CLAUSE),
+    **dict.fromkeys(("ignore", "disregard", "forget"), _OVERRIDE_VERB),
+    **dict.fromkeys(("previous", "prior", "above", "instructions", "rules", "prompt"), _OVERRIDE_TARGET),
+}
+
+# Characters that re.IGNORECASE matches to an ASCII letter but that str.lower()
+# does not lower to one. Folding them first keeps the scan over lowered text
+# equivalent to the case-insensitive rules, at the same string length.
+_ASCII_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+# Scanned against lowered text: a case-sensitive pattern lets the regex engine
+# reject most alternatives on their first character.
+_TOKENS = re.compile(
+    r"(?P<url>https?://)"
+    r"|(?P<tag_open><(?=[a-z]))"
+    r"|(?P<tag_close>>)"
+    r"|(?P<newline>\n)"
+    r"|\b(?:"
+    r"(?P<www>www\.(?=\S))"
+    r"|(?P<persona>you are now|act as|pretend (?:you are|to be)|new persona)\b"
+    r"|(?P<keyword>" + "|".join(_KEYWORDS) + r")\b"
+    r")"
+    r"|(?P<role_marker>(?:\[(?:system|inst|sys)\]|system|inst|sys)(?=\s*:))"
+)
+
+
+def _starts_line(text: str, index: int) -> bool:
+    """True if only whitespace containing a line break (or nothing) precedes ``index`` on its line."""
+    while index > 0 and text[index - 1].isspace():
+        if text[index - 1] in "\r\n":
+            return True
+        index -= 1
+    return index == 0
+
+
+def _scan(text: str) -> Optional[str]:
+    text = text.translate(_ASCII_FOLDS).lower()
+    found: Optional[str] = None
+    tag_open = False
+    sql_verb_on_line = False
+    override_end = -1
+
+    for match in _TOKENS.finditer(text):
+        kind = match.lastgroup
+        if kind == "keyword":
+            kind = _KEYWORDS[match.group("keyword")]
+        message = None
+        if kind == "newline":
+            # `.` in the original rules stops at a newline.
+            sql_verb_on_line = False
+            override_end = -1
+        elif kind == "url" or kind == "www":
+            return URL_MESSAGE
+        elif kind == "tag_open":
+            tag_open = True
+        elif kind == "tag_close":
+            if tag_open:
+                message = HTML_MESSAGE
+        elif kind == _SQL_VERB:
+            sql_verb_on_line = True
+        elif kind == _SQL_CLAUSE:
+            if sql_verb_on_line:
+                message = SQL_MESSAGE
+        elif kind == _OVERRIDE_VERB:
+            override_end = match.end()
+        elif kind == _OVERRIDE_TARGET:
+            if override_end != -1 and match.start() - override_end <= _OVERRIDE_GAP:
+                message = DISALLOWED_MESSAGE
+        elif kind == "persona":
+            message = DISALLOWED_MESSAGE
+        elif kind == "role_marker":
+            if _starts_line(text, match.start()):
+                message = DISALLOWED_MESSAGE
+
+        if message is not None and (found is None or _PRIORITY[message] < _PRIORITY[found]):
+            found = message
+    return found
+
+
+def find_disallowed_content(*texts: str) -> Optional[str]:
+    """
+    Scan each text once and report the first one containing disallowed content.
+
+    Parameters:
+        *texts (str): Values to check, e.g. every field of a request
+
+    Returns:
+        Optional[str]: User-facing rejection message, or None if all texts are allowed
+    """
+    for text in texts:
+        if text:
+            message = _scan(text)
+            if message is not None:
+                return message
+    return None
@@ -0,0 +1,284 @@
+"""
+Compaction of extracted resume text before it is placed in a prompt.
+
+PDF extraction keeps every layout artifact: runs of spaces and blank lines,
+bullet glyphs on lines of their own, and the header and footer repeated on
+every page. None of it helps the model, and all of it is billed as input
+tokens. Compaction
+
+- collapses whitespace and blank-line runs,
+- turns bullet glyphs into "- " and joins orphaned bullets with their text,
+- drops page numbers ("Page 2 of 3", "- 2 -") in the header or footer
+  zone of a page, lines repeated in that zone on most pages (kept once,
+  where they first appear) and boilerplate such as
+  "References available upon request",
+- and, if the result is still over the token budget, trims each section
+  from its end rather than cutting the document off at one point, so every
+  section heading and the start of every section survive.
+
+Pages are separated by a form feed (see ``app.services.pdf_service``); text
+without one is treated as a single page.
+
+Resume text is compacted once, where it enters a request, with
+``compact_for_prompt``; the services take that text as it is.
+
+    PROMPT_RESUME_TOKEN_BUDGET  most estimated tokens of resume text per prompt
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import PROMPT_COMPACTION_TOKENS
+from app.core.quota import CHARS_PER_TOKEN, estimate_tokens
+
+
+PROMPT_RESUME_TOKEN_BUDGET = settings.prompt_resume_token_budget
+
+PAGE_BREAK = "\f"
+TRUNCATION_MARKER = "[...]"
+
+# Header/footer candidates are looked for in this many non-blank lines at each end of a page.
+_EDGE_LINES = 3
+
+_BULLET_GLYPHS = "•●▪■◦○◆◇►▸‣⁃∙·*"
+_BULLET_PREFIX = re.compile(rf"^[{re.escape(_BULLET_GLYPHS)}]\s*")
+_DIGITS = re.compile(r"\d+")
+# Only explicit forms ("Page 2", "Page 2 of 3", "2 of 3", "- 2 -"); a bare "2019" or "06/2020" is a date.
+_PAGE_NUMBER = re.compile(r"^(page\s*\d+(\s*(of|/)\s*\d+)?|\d+\s+of\s+\d+|-\s*\d+\s*-)$", re.IGNORECASE)
+_BOILERPLATE = re.compile(
+    r"^(references\s+(are\s+)?available\s+(up)?on\s+request\.?"
+    r"|curriculum\s+vitae|r[eé]sum[eé]|cv|confidential)$",
+    re.IGNORECASE,
+)
+_HEADING_WORDS = {
+    "summary", "profile", "objective", "about", "experience", "employment", "work",
+    "history", "professional", "education", "skills", "technical", "projects",
+    "certifications", "certificates", "awards", "publications", "languages",
+    "interests", "volunteering", "volunteer", "leadership", "achievements",
+    "courses", "training", "activities", "and", "&",
+}
+
+
+@dataclass(frozen=True)
+class CompactedText:
+    """
+    Result of compacting a resume.
+
+    Attributes:
+        text: Compacted text to place in the prompt
+        original_tokens: Estimated tokens of the input text
+        tokens: Estimated tokens of the compacted text
+        truncated: Whether sections were trimmed to fit the budget
+    """
+    text: str
+    original_tokens: int
+    tokens: int
+    truncated: bool
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.tokens
+
+
+def _clean_lines(page: str) -> List[str]:
+    lines: List[str] = []
+    pending_bullet = False
+    for raw_line in page.splitlines():
+        line = " ".join(raw_line.split())
+        if not line:
+            if lines and lines[-1] and not pending_bullet:
+                lines.append("")
+            continue
+        if _BULLET_PREFIX.match(line):
+            line = _BULLET_PREFIX.sub("", line)
+            if not line:
+                pending_bullet = True
+                continue
+            line = f"- {line}"
+        elif pending_bullet:
+            line = f"- {line}"
+        pending_bullet = False
+        lines.append(line)
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _edge_positions(lines: List[str]) -> List[int]:
+    content = [position for position, line in enumerate(lines) if line]
+    return content[:_EDGE_LINES] + content[-_EDGE_LINES:]
+
+
+def _key(line: str) -> str:
+    # Page numbers and dates inside a running header change from page to page.
+    return _DIGITS.sub("#", line.lower())
+
+
+def _drop_furniture(pages: List[List[str]]) -> List[List[str]]:
+    """Drop page numbers, boilerplate and header/footer lines repeated across pages."""
+    repeated: set = set()
+    if len(pages) > 1:
+        counts: Dict[str, int] = {}
+        for lines in pages:
+            for key in {_key(lines[position]) for position in _edge_positions(lines)}:
+                # A line of digits alone ("2019", "06/2020") is a date, not a running header.
+                if any(character.isalpha() for character in key):
+                    counts[key] = counts.get(key, 0) + 1
+        threshold = max(2, (len(pages) + 1) // 2)
+        repeated = {key for key, count in counts.items() if count >= threshold}
+
+    seen: set = set()
+    compacted: List[List[str]] = []
+    for lines in pages:
+        edges = set(_edge_positions(lines))
+        kept: List[str] = []
+        for position, line in enumerate(lines):
+            if line and _BOILERPLATE.match(line):
+                continue
+            if position in edges:
+                if _PAGE_NUMBER.match(line):
+                    continue
+                key = _key(line)
+                if key in repeated:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+            if not line and (not kept or not kept[-1]):
+                continue
+            kept.append(line)
+        compacted.append(kept)
+    return compacted
+
+
+def _is_heading(line: str) -> bool:
+    if not line or line.startswith("- ") or len(line) > 40 or line.endswith((".", ",", ";")):
+        return False
+    words = line.rstrip(":").split()
+    if len(words) > 4:
+        return False
+    letters = [character for character in line if character.isalpha()]
+    if letters and all(character.isupper() for character in letters):
+        return True
+    return all(word.lower() in _HEADING_WORDS for word in words)
+
+
+def _sections(lines: List[str]) -> List[Tuple[Optional[str], List[str]]]:
+    sections: List[Tuple[Optional[str], List[str]]] = [(None, [])]
+    for line in lines:
+        if _is_heading(line):
+            sections.append((line, []))
+        else:
+            sections[-1][1].append(line)
+    return [(heading, body) for heading, body in sections if heading is not None or body]
+
+
+def _size(lines: List[str]) -> int:
+    return sum(len(line) + 1 for line in lines)
+
+
+def _fit_to_budget(lines: List[str], budget_chars: int) -> Tuple[List[str], bool]:
+    """
+    Trim each section from its end so the text fits in `budget_chars`.
+
+    Sections share the budget evenly; a section smaller than its share is
+    kept whole and the remainder goes to the larger ones.
+    """
+    if _size(lines) <= budget_chars:
+        return lines, False
+
+    sections = _sections(lines)
+    headings_size = sum(len(heading) + 1 for heading, _ in sections if heading is not None)
+    available = max(0, budget_chars - headings_size)
+
+    allotments: Dict[int, int] = {}
+    pending = sorted(range(len(sections)), key=lambda index: _size(sections[index][1]))
+    while pending:
+        share = available // len(pending)
+        index = pending[0]
+        body_size = _size(sections[index][1])
+        if body_size <= share:
+            allotments[index] = body_size
+            available -= body_size
+            pending.pop(0)
+            continue
+        for index in pending:
+            allotments[index] = share
+        break
+
+    marker_size = len(TRUNCATION_MARKER) + 1
+    result: List[str] = []
+    for index, (heading, body) in enumerate(sections):
+        if heading is not None:
+            result.append(heading)
+        allotment = allotments[index]
+        if _size(body) <= allotment:
+            result.extend(body)
+            continue
+        used = marker_size
+        for line in body:
+            if used + len(line) + 1 > allotment:
+                break
+            result.append(line)
+            used += len(line) + 1
+        result.append(TRUNCATION_MARKER)
+
+    text_size = _size(result)
+    if text_size > budget_chars:
+        # Even the headings do not fit; fall back to a hard cut.
+        return "\n".join(result)[:budget_chars].splitlines(), True
+    return result, True
+
+
+def compact_resume_text(text: str, token_budget: Optional[int] = None) -> CompactedText:
+    """
+    Compact extracted resume text for use in a prompt.
+
+    Idempotent: compacting already compacted text returns it unchanged.
+
+    Args:
+        text: Resume text as extracted from the PDF
+        token_budget: Most estimated tokens to keep; PROMPT_RESUME_TOKEN_BUDGET by default
+
+    Returns:
+        CompactedText: The compacted text and its estimated token savings
+    """
+    budget = PROMPT_RESUME_TOKEN_BUDGET if token_budget is None else token_budget
+    pages = [_clean_lines(page) for page in text.replace("\r\n", "\n").split(PAGE_BREAK)]
+    pages = _drop_furniture([page for page in pages if page])
+
+    lines: List[str] = []
+    for page in pages:
+        if lines and lines[-1] and page and page[0]:
+            lines.append("")
+        lines.extend(page)
+    while lines and not lines[-1]:
+        lines.pop()
+
+    lines, truncated = _fit_to_budget(lines, budget * CHARS_PER_TOKEN)
+    compacted = "\n".join(lines).strip()
+    return CompactedText(
+        text=compacted,
+        original_tokens=estimate_tokens(text),
+        tokens=estimate_tokens(compacted),
+        truncated=truncated,
+    )
+
+
+def compact_for_prompt(text: str) -> str:
+    """
+    Compact resume text once, where it enters a request, and record the savings.
+
+    The returned text is what the quota is charged for and what the prompt
+    contains; pass it on rather than compacting it again.
+
+    Args:
+        text: Resume text as extracted from the PDF
+
+    Returns:
+        str: The compacted text
+    """
+    compacted = compact_resume_text(text)
+    PROMPT_COMPACTION_TOKENS.labels(stage="input").inc(compacted.original_tokens)
+    PROMPT_COMPACTION_TOKENS.labels(stage="output").inc(compacted.tokens)
+    return compacted.text
@@ -1,18 +1,87 @@
+import hashlib
 import re
+from dataclasses import dataclass
+from typing import Optional
+
+from app.utils.injection_scanner import (
+    DISALLOWED_MESSAGE,
+    HTML_MESSAGE,
+    SQL_MESSAGE,
+    URL_MESSAGE,
+    find_disallowed_content,
+)
 
 MAX_WORDS = 1000
 MAX_PDF_BYTES = 10 * 1024 * 1024  # 10 MB
 
+# Reference definition of the injection rules, checked in order. Requests are
+# screened with app.utils.injection_scanner, which implements the same rules
+# in a single linear-time pass.
 _INJECTION_PATTERNS = [
     # URLs
-    (re.compile(r'https?://', re.IGNORECASE), "URLs are not allowed in the job description."),
-    (re.compile(r'\bwww\.[^\s]+', re.IGNORECASE), "URLs are not allowed in the job description."),
+    (re.compile(r'https?://', re.IGNORECASE), URL_MESSAGE),
+    (re.compile(r'\bwww\.[^\s]+', re.IGNORECASE), URL_MESSAGE),
     # HTML tags
-    (re.compile(r'<[a-z][^>]*>', re.IGNORECASE), "HTML tags are not allowed in the job description."),
+    (re.compile(r'<[a-z][^>]*>', re.IGNORECASE), HTML_MESSAGE),
     # SQL keywords in suspicious context
-    (re.compile(r'\b(SELECT|INSERT|UPDATE|DELETE|DROP|UNION|ALTER|TRUNCATE)\b.*\b(FROM|INTO|TABLE|WHERE)\b', re.IGNORECASE), "SQL statements are not allowed in the job description."),
+    (re.compile(r'\b(SELECT|INSERT|UPDATE|DELETE|DROP|UNION|ALTER|TRUNCATE)\b.*\b(FROM|INTO|TABLE|WHERE)\b', re.IGNORECASE), SQL_MESSAGE),
     # Prompt / system override injection
-    (re.compile(r'\b(ignore|disregard|forget)\b.{0,30}\b(previous|prior|above|instructions|rules|prompt)\b', re.IGNORECASE), "Your input contains disallowed content. Please enter a plain job description."),
-    (re.compile(r'(^|[\r\n])\s*(\[(SYSTEM|INST|SYS)\]|(SYSTEM|INST|SYS))\s*:', re.IGNORECASE), "Your input contains disallowed content. Please enter a plain job description."),
-    (re.compile(r'\b(you are now|act as|pretend (you are|to be)|new persona)\b', re.IGNORECASE), "Your input contains disallowed content. Please enter a plain job description."),
-]
\ No newline at end of file
+    (re.compile(r'\b(ignore|disregard|forget)\b.{0,30}\b(previous|prior|above|instructions|rules|prompt)\b', re.IGNORECASE), DISALLOWED_MESSAGE),
+    (re.compile(r'(^|[\r\n])\s*(\[(SYSTEM|INST|SYS)\]|(SYSTEM|INST|SYS))\s*:', re.IGNORECASE), DISALLOWED_MESSAGE),
+    (re.compile(r'\b(you are now|act as|pretend (you are|to be)|new persona)\b', re.IGNORECASE), DISALLOWED_MESSAGE),
+]
+
+
+@dataclass(frozen=True)
+class PreflightResult:
+    """
+    User text prepared for validation, prompting and caching.
+
+    Attributes:
+        text: Normalized text; what should be sent to the model
+        word_count: Number of whitespace-separated words
+        digest: SHA-256 of ``text``, a canonical key for caches
+        disallowed: Rejection message if the text breaks an injection rule
+    """
+    text: str
+    word_count: int
+    digest: str
+    disallowed: Optional[str]
+
+
+def preflight(text: str) -> PreflightResult:
+    """
+    Normalize, count, scan and hash user text in one pass.
+
+    Line endings become ``\\n``, whitespace inside a line collapses to single
+    spaces, lines are trimmed and runs of blank lines are reduced to one, so
+    texts differing only in formatting share a digest. The injection rules are
+    checked against the normalized text, i.e. what the model will see.
+
+    Parameters:
+        text (str): Raw user input
+
+    Returns:
+        PreflightResult: Normalized text with its word count, digest and any violation
+    """
+    lines = []
+    word_count = 0
+    pending_blank = False
+    for line in text.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        words = line.split()
+        if not words:
+            pending_blank = bool(lines)
+            continue
+        if pending_blank:
+            lines.append("")
+            pending_blank = False
+        word_count += len(words)
+        lines.append(" ".join(words))
+
+    normalized = "\n".join(lines)
+    return PreflightResult(
+        text=normalized,
+        word_count=word_count,
+        digest=hashlib.sha256(normalized.encode("utf-8")).hexdigest(),
+        disallowed=find_disallowed_content(normalized),
+    )
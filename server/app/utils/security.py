@@ -4,32 +4,39 @@ Security utilities for password hashing and JWT token management.
 This module provides functions for secure password handling and
 JWT token creation/validation using industry-standard algorithms.
 """
-from passlib.context import CryptContext
-from jose import JWTError, jwt
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
-import os
-from dotenv import load_dotenv
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.metrics import track_operation
 from app.models.auth import TokenData
 from app.models.database.user import User
 
-load_dotenv()
+JWT_SECRET_KEY = settings.jwt_secret_key
+JWT_ALGORITHM = settings.jwt_algorithm
+JWT_EXPIRATION_MINUTES = settings.jwt_expiration_minutes
 
-JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
-JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
-JWT_EXPIRATION_MINUTES = int(os.getenv("JWT_EXPIRATION_MINUTES", "1440"))
-
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12,
-    bcrypt__ident="2b"
-)
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+
+# passlib and jose (which pulls in cryptography) are imported on first use
+# rather than at startup; most requests never hash a password.
+@lru_cache
+def _password_context():
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=12,
+        bcrypt__ident="2b"
+    )
 
 
 def hash_password(password: str) -> str:
@@ -44,7 +51,8 @@ def hash_password(password: str) -> str:
     """
     if len(password.encode('utf-8')) > 72:
         password = password[:72]
-    return pwd_context.hash(password)
+    with track_operation("password_hash"):
+        return _password_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -60,7 +68,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     if len(plain_password.encode('utf-8')) > 72:
         plain_password = plain_password[:72]
-    return pwd_context.verify(plain_password, hashed_password)
+    with track_operation("password_verify"):
+        return _password_context().verify(plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -74,6 +83,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Returns:
         str: Encoded JWT token
     """
+    from jose import jwt
+
     to_encode = data.copy()
     
     if expires_delta:
@@ -100,6 +111,8 @@ def decode_access_token(token: str) -> TokenData:
     Raises:
         HTTPException: If token is invalid or expired
     """
+    from jose import JWTError, jwt
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials. Please sign in again.",
@@ -119,7 +132,7 @@ def decode_access_token(token: str) -> TokenData:
         raise credentials_exception
 
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -139,7 +152,13 @@ async def get_current_user(
     token = credentials.credentials
     token_data = decode_access_token(token)
     
-    user = db.query(User).filter(User.id == token_data.user_id).first()
+    # Compare as a UUID: only PostgreSQL casts a string parameter implicitly.
+    try:
+        user_id = UUID(str(token_data.user_id))
+    except ValueError:
+        user_id = None
+    
+    user = db.query(User).filter(User.id == user_id).first() if user_id else None
     
     if user is None:
         raise HTTPException(
@@ -155,3 +174,25 @@ async def get_current_user(
         )
     
     return user
+
+
+def get_optional_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    db: Session = Depends(get_db)
+) -> Optional[User]:
+    """
+    Dependency for endpoints that also serve anonymous callers.
+    
+    Args:
+        credentials: HTTP Bearer token from request, if any
+        db: Database session
+    
+    Returns:
+        Optional[User]: Current authenticated user, or None without a token
+    
+    Raises:
+        HTTPException: If a token is sent but authentication fails
+    """
+    if credentials is None:
+        return None
+    return get_current_user(credentials, db)
@@ -0,0 +1,190 @@
+"""
+Standalone worker draining the database work queue.
+
+    python -m app.worker --concurrency 8
+
+Runs the model calls behind cover letter jobs and, with
+ANALYSIS_BACKEND=database, resume analysis jobs. Start as many workers as
+needed on as many hosts as needed: they coordinate only through the
+``work_queue_tasks`` table (see ``app.core.work_queue``). SIGINT/SIGTERM stop
+claiming new work and let running tasks finish.
+
+Queue calls run on threads so claiming, heartbeats and recording outcomes
+never hold up the model calls in flight on the event loop. Finished tasks
+older than WORK_QUEUE_RETENTION_SECONDS are deleted between heartbeats.
+
+    WORKER_CONCURRENCY            tasks run at once per worker process
+    WORKER_BATCH_SIZE             most tasks claimed per query
+    WORKER_POLL_INTERVAL_SECONDS  wait between claims while the queue is empty
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Sequence
+
+from app.core.config import settings
+from app.core.work_queue import ClaimedTask, WorkQueue, running_task, work_queue
+from app.services.analysis_job_service import RESUME_ANALYSIS_TASK, run_analysis_task
+from app.services.cover_letter_job_service import COVER_LETTER_TASK, run_cover_letter_task
+
+
+logger = logging.getLogger(__name__)
+
+WORKER_CONCURRENCY = settings.worker_concurrency
+WORKER_BATCH_SIZE = settings.worker_batch_size
+WORKER_POLL_INTERVAL_SECONDS = settings.worker_poll_interval_seconds
+
+Handler = Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+
+HANDLERS: Dict[str, Handler] = {
+    RESUME_ANALYSIS_TASK: run_analysis_task,
+    COVER_LETTER_TASK: run_cover_letter_task,
+}
+
+
+class Worker:
+    """Claims tasks in batches and runs up to `concurrency` of them at a time."""
+
+    def __init__(
+        self,
+        queue: WorkQueue = work_queue,
+        handlers: Mapping[str, Handler] = HANDLERS,
+        worker_id: Optional[str] = None,
+        concurrency: int = WORKER_CONCURRENCY,
+        batch_size: int = WORKER_BATCH_SIZE,
+        poll_interval: float = WORKER_POLL_INTERVAL_SECONDS,
+        kinds: Optional[Sequence[str]] = None,
+    ) -> None:
+        if concurrency < 1 or batch_size < 1:
+            raise ValueError("concurrency and batch_size must be at least 1.")
+        self.queue = queue
+        self.handlers = dict(handlers)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.kinds = list(kinds) if kinds else None
+        self.processed = 0
+        self._running: Dict[asyncio.Task, ClaimedTask] = {}
+
+    async def run(self, stop: Optional[asyncio.Event] = None, drain: bool = False) -> int:
+        """
+        Process tasks until `stop` is set, or until the queue is empty when `drain` is True.
+
+        Returns:
+            Number of tasks processed
+        """
+        stop = stop or asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            while not stop.is_set():
+                claimed = []
+                free = self.concurrency - len(self._running)
+                if free > 0:
+                    claimed = await asyncio.to_thread(
+                        self.queue.claim, self.worker_id, min(self.batch_size, free), self.kinds
+                    )
+                    for task in claimed:
+                        self._running[asyncio.create_task(self._execute(task))] = task
+
+                if not self._running:
+                    if drain:
+                        break
+                    await _wait(stop, self.poll_interval)
+                elif not claimed or len(self._running) >= self.concurrency:
+                    await asyncio.wait(
+                        set(self._running),
+                        timeout=self.poll_interval,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+            if self._running:
+                await asyncio.wait(set(self._running))
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+        return self.processed
+
+    async def _execute(self, task: ClaimedTask) -> None:
+        try:
+            handler = self.handlers.get(task.kind)
+            if handler is None:
+                await asyncio.to_thread(
+                    self.queue.fail, self.worker_id, task, f"No handler for task kind {task.kind!r}.", retryable=False
+                )
+                return
+            try:
+                with running_task(task):
+                    result = await handler(task.payload)
+            except Exception as error:
+                logger.exception("Task %s (%s) failed on attempt %d", task.id, task.kind, task.attempts)
+                await asyncio.to_thread(self.queue.fail, self.worker_id, task, f"{type(error).__name__}: {error}")
+            else:
+                if not await asyncio.to_thread(self.queue.complete, self.worker_id, task, result):
+                    logger.warning("Lease on task %s was lost before it completed", task.id)
+        except Exception:
+            # The lease expires and another claim retries the task.
+            logger.exception("Failed to record the outcome of task %s", task.id)
+        finally:
+            self.processed += 1
+            self._running.pop(asyncio.current_task(), None)  # type: ignore[arg-type]
+
+    async def _heartbeat(self) -> None:
+        """Keep the leases of long-running tasks from expiring, and purge old finished tasks."""
+        interval = self.queue.visibility_timeout / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(self.queue.heartbeat, self.worker_id, list(self._running.values()))
+            except Exception:
+                logger.exception("Failed to extend task leases")
+            try:
+                await asyncio.to_thread(self.queue.purge)
+            except Exception:
+                logger.exception("Failed to purge finished tasks")
+
+
+async def _wait(stop: asyncio.Event, timeout: float) -> None:
+    try:
+        await asyncio.wait_for(stop.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from app.core.database import init_db
+
+    init_db()
+    worker = Worker(
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        poll_interval=args.poll_interval,
+        kinds=args.kinds,
+    )
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    logger.info("Worker %s started (concurrency=%d)", worker.worker_id, worker.concurrency)
+    processed = await worker.run(stop, drain=args.drain)
+    logger.info("Worker %s stopped after %d tasks", worker.worker_id, processed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=WORKER_CONCURRENCY)
+    parser.add_argument("--batch-size", type=int, default=WORKER_BATCH_SIZE)
+    parser.add_argument("--poll-interval", type=float, default=WORKER_POLL_INTERVAL_SECONDS)
+    parser.add_argument("--kinds", nargs="*", choices=sorted(HANDLERS), help="Only claim these task kinds")
+    parser.add_argument("--drain", action="store_true", help="Exit once the queue is empty")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Standalone performance benchmarks. Run modules with ``python -m benchmarks.<name>``."""
@@ -0,0 +1,103 @@
+"""
+Compare job application insert throughput: single-row path vs bulk path.
+
+The single-row path calls ``create_job_application`` once per row (one
+commit and refresh each); the bulk path sends batches through
+``bulk_create_job_applications``. Rows carry a full set of manual
+requirements so neither path calls the LLM.
+
+Usage:
+    python -m benchmarks.bulk_insert --rows 2000 --batch-size 500
+    python -m benchmarks.bulk_insert --database-url postgresql://...
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.database.job_application import JobApplication
+from app.models.database.user import User
+from app.models.job_application import JobApplicationCreate
+from app.services.job_application_service import (
+    bulk_create_job_applications,
+    create_job_application,
+)
+
+
+def _applications(count: int) -> list[JobApplicationCreate]:
+    return [
+        JobApplicationCreate(
+            job=f"Engineer {index}",
+            company=f"Company {index % 50}",
+            date="2026-03-28",
+            status="Applied",
+            description="Build and operate backend services. " * 10,
+            requirements=["Python", "FastAPI", "SQL", "Docker", "AWS"],
+        )
+        for index in range(count)
+    ]
+
+
+async def _single_row(session_factory, user_id, applications) -> float:
+    db = session_factory()
+    started = time.perf_counter()
+    for application in applications:
+        await create_job_application(db, user_id, application)
+    elapsed = time.perf_counter() - started
+    db.close()
+    return elapsed
+
+
+def _bulk(session_factory, user_id, applications, batch_size: int) -> float:
+    db = session_factory()
+    started = time.perf_counter()
+    for offset in range(0, len(applications), batch_size):
+        bulk_create_job_applications(db, user_id, applications[offset:offset + batch_size])
+    elapsed = time.perf_counter() - started
+    db.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        engine = create_engine(database_url)
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        with session_factory() as db:
+            user = User(email="bench@example.com", first_name="Bench", last_name="User", hashed_password="x")
+            db.add(user)
+            db.commit()
+            user_id = user.id
+
+        applications = _applications(args.rows)
+        single_seconds = asyncio.run(_single_row(session_factory, user_id, applications))
+        bulk_seconds = _bulk(session_factory, user_id, applications, args.batch_size)
+
+        with session_factory() as db:
+            db.query(JobApplication).filter(JobApplication.user_id == user_id).delete()
+            db.query(User).filter(User.id == user_id).delete()
+            db.commit()
+        engine.dispose()
+
+    print(f"backend:      {engine.dialect.name}")
+    print(f"rows:         {args.rows:,}")
+    print(f"single-row:   {args.rows / single_seconds:,.0f} rows/s ({single_seconds:.2f} s)")
+    print(f"bulk ({args.batch_size}):   {args.rows / bulk_seconds:,.0f} rows/s ({bulk_seconds:.2f} s)")
+    print(f"speedup:      {single_seconds / bulk_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+"""
+End-to-end load benchmark for the API.
+
+Boots ``app.main.app`` under uvicorn in a child process against a throwaway
+SQLite database (or any ``--database-url``, e.g. a local Postgres), with the
+Gemini client pointed at a local fake (see ``benchmarks.fake_gemini``) whose
+latency and token rates are configurable. A fixed number of concurrent
+virtual users then loop through the selected scenarios:
+
+    auth          sign up a new account, sign in
+    crud          create, list, read, update and delete a job application
+    resume        analyze a resume PDF against a job description
+    cover_letter  generate a cover letter and export it as a PDF
+
+Per-endpoint p50/p95/p99 latency and throughput are printed and written as
+JSON. Pass a previous result with ``--baseline`` to print the change for
+each endpoint.
+
+Rate limits are disabled and the LLM quota is raised in the server process,
+so the numbers reflect the application rather than its admission control.
+
+Usage:
+    python -m benchmarks.e2e --concurrency 16 --duration 30
+    python -m benchmarks.e2e --scenarios crud,resume --llm-latency-ms 0 --llm-output-rate 0
+    python -m benchmarks.e2e --baseline benchmarks/results/e2e-20260101-120000.json
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import socket
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import httpx
+
+
+SCENARIOS = ("auth", "crud", "resume", "cover_letter")
+PASSWORD = "Benchmark-password-1"
+
+JOB_DESCRIPTION = (
+    "Senior Backend Engineer. We are looking for an engineer to design, build and operate the APIs "
+    "behind our hiring platform. You will own services end to end, from schema design in PostgreSQL "
+    "to deployment on our container platform, and work closely with product and frontend engineers. "
+    "Requirements: five or more years of professional Python experience, experience with FastAPI or "
+    "a similar framework, strong SQL skills, familiarity with Docker and a major cloud provider, and "
+    "clear written communication. Nice to have: experience with background job systems, observability "
+    "tooling and mentoring other engineers. This is a full-time remote position with a competitive "
+    "salary, equity and a learning budget."
+)
+
+RESUME_TEXT = [
+    "Alex Example - Backend Engineer",
+    "alex@example.com | +1 555 0100",
+    "",
+    "Experience",
+    "Acme Corp - Senior Software Engineer (2020 - present)",
+    "- Built and operated Python REST APIs serving 2,000 requests per second",
+    "- Cut p95 latency of the search service by 40% through PostgreSQL query tuning",
+    "- Led migration of services to Docker on AWS ECS",
+    "Initech - Software Engineer (2016 - 2020)",
+    "- Developed Django applications and internal tooling",
+    "- Mentored three junior engineers",
+    "",
+    "Skills",
+    "Python, FastAPI, Django, PostgreSQL, Redis, Docker, AWS, CI/CD",
+    "",
+    "Education",
+    "B.Sc. Computer Science",
+]
+
+
+# --- servers ---------------------------------------------------------------
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve_fake_gemini(port: int, latency: float, prefill_rate: float, output_rate: float) -> None:
+    import uvicorn
+
+    from benchmarks.fake_gemini import create_app
+
+    uvicorn.run(create_app(latency, prefill_rate, output_rate), host="127.0.0.1", port=port, log_level="warning")
+
+
+def _serve_api(port: int, database_url: str, gemini_url: str) -> None:
+    # Environment must be in place before the app's modules read it at import time.
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+    os.environ["LLM_QUOTA_STORAGE_URI"] = "memory://"
+    os.environ["LLM_QUOTA_CAPACITY"] = str(10 ** 12)
+
+    import uvicorn
+    from google import genai
+    from google.genai import types
+
+    from app.core.rate_limit import limiter
+    from app.main import app
+    from app.services import cover_letter_service, resume_service
+
+    fake_client = genai.Client(api_key="benchmark", http_options=types.HttpOptions(base_url=gemini_url))
+    resume_service.client = fake_client
+    cover_letter_service.client = fake_client
+    limiter.enabled = False
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def _wait_until_serving(url: str, process: multiprocessing.Process, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not process.is_alive():
+            raise RuntimeError(f"Server for {url} exited with code {process.exitcode}.")
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server for {url} did not start within {timeout:.0f}s.")
+
+
+# --- load generation -------------------------------------------------------
+
+def _signup_payload() -> Dict[str, str]:
+    return {
+        "first_name": "Bench",
+        "last_name": "User",
+        "email": f"bench-{uuid.uuid4().hex}@example.com",
+        "password": PASSWORD,
+        "confirm_password": PASSWORD,
+    }
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.measuring = False
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, name: str, seconds: float, ok: bool) -> None:
+        if not self.measuring:
+            return
+        self.samples.setdefault(name, []).append(seconds)
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+
+class VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, resume_pdf: bytes) -> None:
+        self.client = client
+        self.recorder = recorder
+        self.resume_pdf = resume_pdf
+        self.headers: Dict[str, str] = {}
+
+    async def request(self, name: str, method: str, url: str, expected: int = 200, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(name, time.perf_counter() - started, ok=False)
+            raise
+        self.recorder.record(name, time.perf_counter() - started, ok=response.status_code == expected)
+        return response
+
+    async def log_in(self) -> None:
+        """Create this user's own account; not measured."""
+        response = await self.client.post("/api/v1/auth/signup", json=_signup_payload())
+        response.raise_for_status()
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    async def auth(self) -> None:
+        payload = _signup_payload()
+        signup = await self.request("POST /auth/signup", "POST", "/api/v1/auth/signup", expected=201, json=payload)
+        signup.raise_for_status()
+        await self.request("POST /auth/signin", "POST", "/api/v1/auth/signin", json={
+            "email": payload["email"],
+            "password": PASSWORD,
+        })
+
+    async def crud(self) -> None:
+        created = await self.request("POST /job-applications", "POST", "/api/v1/job-applications", expected=201, json={
+            "job": "Senior Backend Engineer",
+            "company": "Example Co",
+            "date": "2026-01-15",
+            "status": "Applied",
+            "description": JOB_DESCRIPTION,
+            "requirements": ["Python", "PostgreSQL"],
+        })
+        created.raise_for_status()
+        application_id = created.json()["id"]
+        path = f"/api/v1/job-applications/{application_id}"
+        await self.request("GET /job-applications", "GET", "/api/v1/job-applications")
+        await self.request("GET /job-applications/{id}", "GET", path)
+        await self.request("PATCH /job-applications/{id}", "PATCH", path, json={"status": "Interviewing"})
+        await self.request("DELETE /job-applications/{id}", "DELETE", path, expected=204)
+
+    async def resume(self) -> None:
+        await self.request(
+            "POST /resume/analyze",
+            "POST",
+            "/api/v1/resume/analyze",
+            files={"resume": ("resume.pdf", self.resume_pdf, "application/pdf")},
+            data={"job_description": JOB_DESCRIPTION},
+        )
+
+    async def cover_letter(self) -> None:
+        generated = await self.request("POST /cover-letter/generate", "POST", "/api/v1/cover-letter/generate", json={
+            "job_title": "Senior Backend Engineer",
+            "company": "Example Co",
+            "email": "bench@example.com",
+            "phone": "+1 555 0100",
+            "requirements": ["Python", "PostgreSQL", "Docker"],
+        })
+        generated.raise_for_status()
+        document_id = generated.json()["document_id"]
+        await self.request(
+            "GET /cover-letter/{id}/export-pdf",
+            "GET",
+            f"/api/v1/cover-letter/{document_id}/export-pdf",
+        )
+
+
+async def _run_user(user: VirtualUser, scenarios: List[str], stop_at: float) -> None:
+    await user.log_in()
+    while time.monotonic() < stop_at:
+        for scenario in scenarios:
+            try:
+                await getattr(user, scenario)()
+            except httpx.HTTPError:
+                # Already recorded as an error; move on to the next scenario.
+                continue
+
+
+async def _drive(
+    base_url: str,
+    scenarios: List[str],
+    concurrency: int,
+    warmup: float,
+    duration: float,
+    resume_pdf: bytes,
+) -> tuple[Recorder, float]:
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        started = time.monotonic()
+        stop_at = started + warmup + duration
+        users = [VirtualUser(client, recorder, resume_pdf) for _ in range(concurrency)]
+        tasks = [asyncio.create_task(_run_user(user, scenarios, stop_at)) for user in users]
+        await asyncio.sleep(max(0.0, started + warmup - time.monotonic()))
+        recorder.measuring = True
+        measured_from = time.monotonic()
+        await asyncio.gather(*tasks)
+        elapsed = time.monotonic() - measured_from
+    return recorder, elapsed
+
+
+def _resume_pdf() -> bytes:
+    import pymupdf
+
+    document = pymupdf.open()
+    page = document.new_page()
+    page.insert_text((72, 72), "\n".join(RESUME_TEXT), fontsize=11)
+    content = document.tobytes()
+    document.close()
+    return content
+
+
+# --- reporting -------------------------------------------------------------
+
+def _percentile(samples: List[float], percent: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def _summarize(samples: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": round(len(samples) / elapsed, 2),
+        "mean_ms": round(statistics.mean(samples) * 1000, 2),
+        "p50_ms": round(_percentile(samples, 50) * 1000, 2),
+        "p95_ms": round(_percentile(samples, 95) * 1000, 2),
+        "p99_ms": round(_percentile(samples, 99) * 1000, 2),
+    }
+
+
+def _report(recorder: Recorder, elapsed: float) -> Dict[str, object]:
+    endpoints = {
+        name: _summarize(samples, recorder.errors.get(name, 0), elapsed)
+        for name, samples in recorder.samples.items()
+    }
+    every_sample = [sample for samples in recorder.samples.values() for sample in samples]
+    overall = _summarize(every_sample, sum(recorder.errors.values()), elapsed) if every_sample else {}
+    return {"overall": overall, "endpoints": endpoints}
+
+
+def _print_table(report: Dict[str, object], baseline: Optional[Dict[str, object]]) -> None:
+    rows = list(report["endpoints"].items()) + [("overall", report["overall"])]
+    baseline_rows = {}
+    if baseline is not None:
+        baseline_rows = {**baseline["endpoints"], "overall": baseline["overall"]}
+
+    header = f"{'endpoint':<36} {'reqs':>7} {'errors':>6} {'req/s':>8} {'p50':>9} {'p95':>9} {'p99':>9}"
+    if baseline is not None:
+        header += f" {'p95 vs base':>12} {'req/s vs base':>14}"
+    print(header)
+    for name, stats in rows:
+        if not stats:
+            continue
+        line = (
+            f"{name:<36} {stats['requests']:>7} {stats['errors']:>6} {stats['throughput_rps']:>8.1f} "
+            f"{stats['p50_ms']:>7.1f}ms {stats['p95_ms']:>7.1f}ms {stats['p99_ms']:>7.1f}ms"
+        )
+        previous = baseline_rows.get(name)
+        if previous:
+            line += (
+                f" {_change(stats['p95_ms'], previous['p95_ms']):>12}"
+                f" {_change(stats['throughput_rps'], previous['throughput_rps']):>14}"
+            )
+        print(line)
+
+
+def _change(current: float, previous: float) -> str:
+    if not previous:
+        return "n/a"
+    return f"{(current - previous) / previous * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds before measuring")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated subset of: " + ", ".join(SCENARIOS))
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    parser.add_argument("--llm-latency-ms", type=float, default=250, help="Fake model time to first token")
+    parser.add_argument("--llm-prefill-rate", type=float, default=10_000, help="Fake model prompt tokens/s (0: instant)")
+    parser.add_argument("--llm-output-rate", type=float, default=250, help="Fake model output tokens/s (0: instant)")
+    parser.add_argument("--output", help="Result JSON path (default: benchmarks/results/e2e-<timestamp>.json)")
+    parser.add_argument("--baseline", help="Previous result JSON to compare against")
+    args = parser.parse_args()
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown or not scenarios:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown)) or '(none given)'}")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+
+    started_at = datetime.now(timezone.utc)
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        gemini_port, api_port = _free_port(), _free_port()
+        gemini_url = f"http://127.0.0.1:{gemini_port}"
+        api_url = f"http://127.0.0.1:{api_port}"
+
+        gemini = context.Process(
+            target=_serve_fake_gemini,
+            args=(gemini_port, args.llm_latency_ms / 1000, args.llm_prefill_rate, args.llm_output_rate),
+            daemon=True,
+        )
+        api = context.Process(target=_serve_api, args=(api_port, database_url, gemini_url), daemon=True)
+        gemini.start()
+        api.start()
+        try:
+            _wait_until_serving(f"{gemini_url}/stats", gemini)
+            _wait_until_serving(f"{api_url}/health", api)
+            recorder, elapsed = asyncio.run(
+                _drive(api_url, scenarios, args.concurrency, args.warmup, args.duration, _resume_pdf())
+            )
+            llm_stats = httpx.get(f"{gemini_url}/stats").json()
+        finally:
+            for process in (api, gemini):
+                process.terminate()
+                process.join(timeout=10)
+
+    report = _report(recorder, elapsed)
+    result = {
+        "benchmark": "e2e",
+        "started_at": started_at.isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "scenarios": scenarios,
+            "database": (args.database_url or "sqlite").split(":", 1)[0],
+            "llm_latency_ms": args.llm_latency_ms,
+            "llm_prefill_rate": args.llm_prefill_rate,
+            "llm_output_rate": args.llm_output_rate,
+        },
+        "elapsed_s": round(elapsed, 2),
+        "llm": llm_stats,
+        **report,
+    }
+
+    _print_table(report, baseline)
+    if baseline is not None and baseline.get("config") != result["config"]:
+        print("\nNote: the baseline was recorded with a different configuration.")
+
+    output = args.output or os.path.join(
+        "benchmarks", "results", f"e2e-{started_at.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(result, handle, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+A local stand-in for the Gemini ``generateContent`` REST endpoint.
+
+Serves the request/response shape the ``google-genai`` SDK speaks, so the
+application's real client can be pointed at it with
+``HttpOptions(base_url=...)``. Replies are canned but well-formed for each
+prompt the application sends (job description validation, requirement
+extraction, resume analysis, cover letters), and each reply is delayed to
+model a real deployment:
+
+    delay = latency + prompt_tokens / prefill_rate + output_tokens / output_rate
+
+A rate of 0 means that phase is instantaneous.
+
+``FakeClient`` gives the same replies and delays in-process, for tools that
+call the services directly rather than over HTTP (see ``app.cli``).
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+
+from google.genai import types
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.core.quota import estimate_tokens
+
+
+VALIDATION_REPLY = json.dumps({
+    "is_valid": True,
+    "reason": "The text describes a role, its responsibilities and required qualifications.",
+})
+
+REQUIREMENTS_REPLY = json.dumps({
+    "requirements": [
+        "5+ years of professional Python experience",
+        "Experience designing and operating REST APIs",
+        "Working knowledge of PostgreSQL and query tuning",
+        "Familiarity with containerised deployments on a major cloud",
+        "Clear written communication with cross-functional teams",
+    ],
+})
+
+ANALYSIS_REPLY = json.dumps({
+    "match_score": 78,
+    "summary": (
+        "The candidate has solid backend experience with Python and relational databases and has "
+        "shipped production APIs, which aligns well with the core of the role. Cloud operations "
+        "experience is present but less deep than the posting asks for."
+    ),
+    "strengths": [
+        "Several years building and maintaining Python web services in production",
+        "Hands-on PostgreSQL schema design and query optimisation",
+        "Track record of mentoring and cross-team collaboration",
+    ],
+    "gaps": [
+        "Limited evidence of owning infrastructure as code",
+        "No mention of on-call or incident response experience",
+    ],
+    "recommendations": [
+        "Quantify the impact of the API work (latency, traffic, cost)",
+        "Add any Terraform or Kubernetes exposure, even from side projects",
+    ],
+})
+
+COVER_LETTER_REPLY = "\n\n".join([
+    "Dear Hiring Manager,",
+    (
+        "I am writing to apply for the role on your engineering team. Over the past several years I "
+        "have designed, built and operated backend services that handle real production traffic, and "
+        "I would welcome the chance to bring that experience to your organisation."
+    ),
+    (
+        "The requirements you list map closely to my day-to-day work. I have owned REST APIs from "
+        "design through deployment, tuned PostgreSQL queries that sat on hot paths, and shipped "
+        "services to containerised cloud environments with the monitoring needed to run them "
+        "confidently. Just as importantly, I enjoy writing the design notes and runbooks that let "
+        "the rest of a team move quickly."
+    ),
+    (
+        "I would be glad to talk about how I can contribute to your roadmap. Thank you for your time "
+        "and consideration."
+    ),
+    "Sincerely,\nApplicant",
+])
+
+
+def _prompt_text(payload: dict) -> str:
+    parts = []
+    for content in payload.get("contents", []):
+        for part in content.get("parts", []):
+            parts.append(part.get("text") or "")
+    return "\n".join(parts)
+
+
+def _reply_for(payload: dict, prompt: str) -> str:
+    config = payload.get("generationConfig") or {}
+    schema = config.get("responseSchema") or config.get("responseJsonSchema") or {}
+    properties = set(schema.get("properties") or {})
+    if "is_valid" in properties:
+        return VALIDATION_REPLY
+    if "requirements" in properties:
+        return REQUIREMENTS_REPLY
+    if "match_score" in properties:
+        return ANALYSIS_REPLY
+    if '"is_valid"' in prompt:
+        return VALIDATION_REPLY
+    if '"requirements"' in prompt:
+        return REQUIREMENTS_REPLY
+    if '"match_score"' in prompt:
+        return ANALYSIS_REPLY
+    return COVER_LETTER_REPLY
+
+
+def _phase_seconds(tokens: int, rate: float) -> float:
+    return tokens / rate if rate > 0 else 0.0
+
+
+class _FakeModels:
+    def __init__(self, latency: float, prefill_rate: float, output_rate: float) -> None:
+        self.latency = latency
+        self.prefill_rate = prefill_rate
+        self.output_rate = output_rate
+        self.stats = {"requests": 0, "prompt_tokens": 0, "output_tokens": 0}
+
+    async def generate_content(self, *, model: str, contents: Any, config: Any = None) -> types.GenerateContentResponse:
+        prompt = contents if isinstance(contents, str) else str(contents)
+        schema = getattr(config, "response_schema", None)
+        payload = {"generationConfig": {"responseSchema": schema if isinstance(schema, dict) else {}}}
+        reply = _reply_for(payload, prompt)
+        prompt_tokens = estimate_tokens(prompt)
+        output_tokens = estimate_tokens(reply)
+
+        await asyncio.sleep(
+            self.latency
+            + _phase_seconds(prompt_tokens, self.prefill_rate)
+            + _phase_seconds(output_tokens, self.output_rate)
+        )
+
+        self.stats["requests"] += 1
+        self.stats["prompt_tokens"] += prompt_tokens
+        self.stats["output_tokens"] += output_tokens
+        return types.GenerateContentResponse(
+            candidates=[types.Candidate(
+                content=types.Content(role="model", parts=[types.Part(text=reply)]),
+                finish_reason=types.FinishReason.STOP,
+                index=0,
+            )],
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_tokens,
+                candidates_token_count=output_tokens,
+                total_token_count=prompt_tokens + output_tokens,
+            ),
+            model_version=model,
+        )
+
+
+class FakeClient:
+    """
+    In-process stand-in for ``genai.Client``; only ``client.aio.models.generate_content`` is provided.
+
+    Parameters:
+        latency (float): Fixed seconds before the first output token
+        prefill_rate (float): Prompt tokens processed per second
+        output_rate (float): Output tokens generated per second
+    """
+
+    def __init__(self, latency: float = 0.25, prefill_rate: float = 10_000, output_rate: float = 250) -> None:
+        self._models = _FakeModels(latency, prefill_rate, output_rate)
+        self.aio = SimpleNamespace(models=self._models)
+
+    @property
+    def stats(self) -> dict:
+        return self._models.stats
+
+
+def create_app(latency: float = 0.25, prefill_rate: float = 10_000, output_rate: float = 250) -> Starlette:
+    """
+    Build the fake Gemini app.
+
+    Parameters:
+        latency (float): Fixed seconds before the first output token
+        prefill_rate (float): Prompt tokens processed per second
+        output_rate (float): Output tokens generated per second
+    """
+    stats = {"requests": 0, "prompt_tokens": 0, "output_tokens": 0}
+
+    async def generate_content(request: Request) -> JSONResponse:
+        target = request.path_params["target"]
+        model, _, action = target.partition(":")
+        if action != "generateContent":
+            return JSONResponse({"error": {"code": 404, "message": f"Unsupported action {action!r}."}}, 404)
+
+        payload = await request.json()
+        prompt = _prompt_text(payload)
+        reply = _reply_for(payload, prompt)
+        prompt_tokens = estimate_tokens(prompt)
+        output_tokens = estimate_tokens(reply)
+
+        await asyncio.sleep(
+            latency
+            + _phase_seconds(prompt_tokens, prefill_rate)
+            + _phase_seconds(output_tokens, output_rate)
+        )
+
+        stats["requests"] += 1
+        stats["prompt_tokens"] += prompt_tokens
+        stats["output_tokens"] += output_tokens
+        return JSONResponse({
+            "candidates": [{
+                "content": {"role": "model", "parts": [{"text": reply}]},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": {
+                "promptTokenCount": prompt_tokens,
+                "candidatesTokenCount": output_tokens,
+                "totalTokenCount": prompt_tokens + output_tokens,
+            },
+            "modelVersion": model,
+        })
+
+    async def read_stats(request: Request) -> JSONResponse:
+        return JSONResponse(stats)
+
+    return Starlette(routes=[
+        Route("/{version}/models/{target}", generate_content, methods=["POST"]),
+        Route("/stats", read_stats, methods=["GET"]),
+    ])
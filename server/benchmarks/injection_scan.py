@@ -0,0 +1,68 @@
+"""
+Compare the single-pass injection scanner with checking each rule's regex in turn.
+
+Inputs are MAX_WORDS words long and built to make the stand-alone patterns
+backtrack (SQL verbs with no clause, unclosed tags, long whitespace runs),
+alongside a benign job description. Reports the mean time per scan.
+
+Usage:
+    python -m benchmarks.injection_scan --repeat 20
+"""
+import argparse
+import time
+from typing import Callable, Dict
+
+from app.utils.injection_scanner import find_disallowed_content
+from app.utils.sanitization import _INJECTION_PATTERNS, MAX_WORDS
+
+
+BENIGN = (
+    "We are hiring a backend engineer to design and operate the services behind our platform. "
+    "You will work with product and data teams, own features end to end and mentor others. "
+)
+
+
+def _inputs(words: int) -> Dict[str, str]:
+    benign = (BENIGN * (words // len(BENIGN.split()) + 1)).split()[:words]
+    return {
+        "benign description": " ".join(benign),
+        "sql verbs, no clause": " ".join(["select"] * words),
+        "sql verbs, clause on next line": " ".join(["update"] * (words - 1)) + "\nwhere",
+        "unclosed tags": " ".join(["<a"] * words),
+        "unclosed tags, no spaces": "<a" * words,
+        "override verbs": " ".join(["ignore"] * words),
+        "blank lines": "\n \n\t".join(["word"] * words),
+        "role markers mid-line": " ".join(["SYS"] * words) + ":",
+    }
+
+
+def _legacy(text: str):
+    for pattern, message in _INJECTION_PATTERNS:
+        if pattern.search(text):
+            return message
+    return None
+
+
+def _mean_us(scan: Callable[[str], object], text: str, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        scan(text)
+    return (time.perf_counter() - started) / repeat * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, default=MAX_WORDS)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'input':<32} {'per-pattern':>14} {'single-pass':>14} {'speedup':>9}")
+    for name, text in _inputs(args.words).items():
+        assert find_disallowed_content(text) == _legacy(text), name
+        legacy = _mean_us(_legacy, text, args.repeat)
+        scanner = _mean_us(find_disallowed_content, text, args.repeat)
+        print(f"{name:<32} {legacy:>12.0f}us {scanner:>12.0f}us {legacy / scanner:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
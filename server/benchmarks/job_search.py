@@ -0,0 +1,87 @@
+"""
+Benchmark the in-memory job application search index.
+
+Builds an inverted index over a synthetic corpus and reports build time,
+memory-independent query latency percentiles and throughput.
+
+Usage:
+    python -m benchmarks.job_search --postings 100000 --queries 1000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.services.job_search_service import InvertedIndex
+
+
+TITLES = ["Backend", "Frontend", "Data", "Platform", "Mobile", "Security", "ML", "DevOps", "QA", "Site Reliability"]
+ROLES = ["Engineer", "Developer", "Lead", "Architect", "Manager", "Analyst"]
+COMPANIES = [f"Company{index}" for index in range(500)]
+SKILLS = [
+    "python", "go", "rust", "java", "kotlin", "typescript", "react", "vue", "postgresql", "mysql",
+    "redis", "kafka", "spark", "airflow", "kubernetes", "terraform", "aws", "gcp", "azure", "docker",
+    "graphql", "grpc", "fastapi", "django", "flask", "pytorch", "tensorflow", "pandas", "linux", "c++",
+]
+FILLER = [
+    "team", "build", "scale", "own", "services", "customers", "product", "reliable", "design", "ship",
+    "collaborate", "mentor", "systems", "data", "platform", "quality", "fast", "remote", "growth", "impact",
+]
+
+
+def _posting(rng: random.Random) -> dict[str, str]:
+    skills = rng.sample(SKILLS, 5)
+    description = " ".join(rng.choices(FILLER + skills, k=60))
+    return {
+        "job": f"{rng.choice(TITLES)} {rng.choice(ROLES)}",
+        "company": rng.choice(COMPANIES),
+        "requirements": " ".join(skills),
+        "description": description,
+    }
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--postings", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [_posting(rng) for _ in range(args.postings)]
+
+    index = InvertedIndex()
+    started = time.perf_counter()
+    for posting in corpus:
+        index.add(posting)
+    build_seconds = time.perf_counter() - started
+
+    queries = [
+        " ".join(rng.sample(SKILLS, rng.choice([1, 1, 2, 3])))
+        for _ in range(args.queries)
+    ]
+    latencies_ms: list[float] = []
+    total_hits = 0
+    started = time.perf_counter()
+    for query in queries:
+        query_started = time.perf_counter()
+        total_hits += len(index.search(query, limit=20))
+        latencies_ms.append((time.perf_counter() - query_started) * 1000)
+    query_seconds = time.perf_counter() - started
+
+    print(f"postings:        {args.postings:,}")
+    print(f"index build:     {build_seconds:.2f} s ({args.postings / build_seconds:,.0f} docs/s)")
+    print(f"queries:         {args.queries:,} ({args.queries / query_seconds:,.1f} q/s)")
+    print(f"latency p50:     {statistics.median(latencies_ms):.2f} ms")
+    print(f"latency p95:     {_percentile(latencies_ms, 95):.2f} ms")
+    print(f"latency p99:     {_percentile(latencies_ms, 99):.2f} ms")
+    print(f"avg hits/query:  {total_hits / args.queries:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Report the prompt tokens saved by resume compaction over a synthetic corpus.
+
+Renders seeded random resumes of one to three pages to real PDFs with
+PyMuPDF, laid out like common templates: a contact header and a
+"Page n of m" footer on every page, bullet glyphs on their own lines,
+indented text and a references line. The text is extracted the same way
+the API extracts uploads, then compacted. Reports estimated tokens before
+and after, by page count, and how many resumes hit the token budget.
+
+Usage:
+    python -m benchmarks.prompt_compaction --resumes 200 --budget 3000
+"""
+import argparse
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import pymupdf
+
+from app.core.quota import estimate_tokens
+from app.services.pdf_service import _extract_pages
+from app.utils.prompt_compaction import PROMPT_RESUME_TOKEN_BUDGET, compact_resume_text
+
+
+WORDS = (
+    "designed built shipped operated scaled migrated automated reduced improved led mentored "
+    "python postgresql fastapi docker kubernetes aws terraform kafka redis react typescript "
+    "latency throughput reliability costs customers revenue pipelines services platform teams"
+).split()
+
+SECTIONS = ("SUMMARY", "EXPERIENCE", "PROJECTS", "EDUCATION", "SKILLS")
+LINES_PER_PAGE = 70
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choices(WORDS, k=rng.randint(8, 18))).capitalize() + "."
+
+
+def _body_lines(rng: random.Random, roles: int) -> List[str]:
+    lines: List[str] = []
+    for section in SECTIONS:
+        lines += ["", section, ""]
+        for _ in range(roles):
+            lines.append(f"    Senior Engineer,   Company {rng.randint(1, 99)}        20{rng.randint(10, 24)} - Present")
+            for _ in range(rng.randint(2, 4)):
+                lines += ["•", f"    {_sentence(rng)}"]
+    lines += ["", "References available upon request"]
+    return lines
+
+
+def _render(rng: random.Random, roles: int) -> bytes:
+    header = f"Jane Doe   |   jane@example.com   |   +1 555 0100   |   Updated {rng.randint(1, 12)}/2026"
+    lines = _body_lines(rng, roles)
+    chunks = [lines[start:start + LINES_PER_PAGE] for start in range(0, len(lines), LINES_PER_PAGE)]
+
+    document = pymupdf.open()
+    for number, chunk in enumerate(chunks):
+        page = document.new_page()
+        y = 40.0
+        for line in [header, ""] + chunk + ["", f"Page {number + 1} of {len(chunks)}"]:
+            page.insert_text((40, y), line, fontsize=8)
+            y += 10
+    content = document.tobytes()
+    document.close()
+    return content
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--budget", type=int, default=PROMPT_RESUME_TOKEN_BUDGET)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    totals: Dict[int, List[int]] = defaultdict(lambda: [0, 0, 0])
+    truncated = 0
+    elapsed = 0.0
+    for _ in range(args.resumes):
+        text, pages = _extract_pages(_render(rng, roles=rng.randint(1, 4)))
+        started = time.perf_counter()
+        compacted = compact_resume_text(text, token_budget=args.budget)
+        elapsed += time.perf_counter() - started
+        totals[pages][0] += 1
+        totals[pages][1] += estimate_tokens(text)
+        totals[pages][2] += compacted.tokens
+        truncated += compacted.truncated
+
+    print(f"{'pages':>5} {'resumes':>8} {'tokens before':>14} {'tokens after':>13} {'saved':>7}")
+    before_total = after_total = 0
+    for pages in sorted(totals):
+        count, before, after = totals[pages]
+        before_total += before
+        after_total += after
+        print(f"{pages:>5} {count:>8} {before // count:>14} {after // count:>13} {1 - after / before:>7.1%}")
+    print(f"{'all':>5} {args.resumes:>8} {before_total // args.resumes:>14} {after_total // args.resumes:>13} "
+          f"{1 - after_total / before_total:>7.1%}")
+    print(f"truncated to the {args.budget}-token budget: {truncated}/{args.resumes}; "
+          f"compaction {elapsed / args.resumes * 1000:.2f} ms per resume")
+
+
+if __name__ == "__main__":
+    main()
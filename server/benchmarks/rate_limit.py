@@ -0,0 +1,80 @@
+"""
+Measure per-request rate limiter overhead for each storage backend.
+
+Drives two otherwise identical routes, one decorated with a (never
+exhausted) limit and one without, through the ASGI stack and reports the
+mean latency difference per request.
+
+Usage:
+    python -m benchmarks.rate_limit --requests 2000
+    python -m benchmarks.rate_limit --storage redis://localhost:6379
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+from slowapi import Limiter
+
+import app.core.rate_limit_storage  # noqa: F401 - registers the sql:// storage scheme
+from app.core.rate_limit import get_rate_limit_key
+
+
+def _build_app(storage_uri: str) -> FastAPI:
+    limiter = Limiter(key_func=get_rate_limit_key, storage_uri=storage_uri, strategy="sliding-window-counter")
+    bench_app = FastAPI()
+    bench_app.state.limiter = limiter
+
+    @bench_app.get("/limited")
+    @limiter.limit("100000000/hour")
+    async def limited(request: Request):
+        return {"ok": True}
+
+    @bench_app.get("/unlimited")
+    async def unlimited(request: Request):
+        return {"ok": True}
+
+    return bench_app
+
+
+async def _mean_latency_us(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await client.get(path)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+        response.raise_for_status()
+    return statistics.mean(samples)
+
+
+async def _measure(storage_uri: str, requests: int) -> tuple[float, float]:
+    transport = httpx.ASGITransport(app=_build_app(storage_uri))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await _mean_latency_us(client, "/limited", 50)
+        await _mean_latency_us(client, "/unlimited", 50)
+        limited = await _mean_latency_us(client, "/limited", requests)
+        unlimited = await _mean_latency_us(client, "/unlimited", requests)
+    return limited, unlimited
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--storage", action="append", help="Storage URI to measure (repeatable)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        storages = args.storage or ["memory://", f"sql+sqlite:///{os.path.join(directory, 'limits.db')}"]
+        print(f"{'storage':<40} {'limited':>12} {'unlimited':>12} {'overhead':>12}")
+        for storage_uri in storages:
+            limited, unlimited = asyncio.run(_measure(storage_uri, args.requests))
+            label = storage_uri if len(storage_uri) <= 40 else storage_uri[:37] + "..."
+            print(f"{label:<40} {limited:>10.0f}us {unlimited:>10.0f}us {limited - unlimited:>10.0f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Measure JSON rendering and compression cost for a 100-row job application list.
+
+Serves the same JobApplicationListResponse through FastAPI with the stock
+JSONResponse and with ORJSONResponse, each with no compression, gzip and (if
+the brotli package is installed) brotli. Reports server-side CPU time per
+response, measured around the ASGI app only, and the bytes sent.
+
+Usage:
+    python -m benchmarks.responses --rows 100 --requests 500
+"""
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.core.compression import CompressionMiddleware, supported_encodings
+from app.models.job_application import JobApplicationListResponse, JobApplicationResponse
+
+
+WORDS = (
+    "we are hiring a backend engineer to design build and operate services behind our platform "
+    "you will work with product data and frontend teams own features end to end mentor others "
+    "python postgresql docker kubernetes aws gcp terraform kafka redis graphql rest grpc "
+    "remote hybrid equity salary benefits growth impact customers reliability scale quality"
+).split()
+
+
+def _payload(rows: int) -> JobApplicationListResponse:
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    user_id = uuid.uuid4()
+    applications = [
+        JobApplicationResponse(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            job=f"Backend Engineer {index}",
+            company=f"Company {index % 17}",
+            date="2026-01-15",
+            status="Applied",
+            description=" ".join(rng.choices(WORDS, k=120)),
+            hiring_manager_name="Alex Example",
+            requirements=[" ".join(rng.choices(WORDS, k=6)) for _ in range(5)],
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(rows)
+    ]
+    return JobApplicationListResponse(applications=applications, total=rows)
+
+
+class _CpuTimer:
+    """Accumulate process CPU time spent inside the wrapped ASGI app."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self.seconds = 0.0
+
+    async def __call__(self, scope, receive, send) -> None:
+        started = time.process_time()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.seconds += time.process_time() - started
+
+
+def _build_app(response_class, payload: JobApplicationListResponse) -> _CpuTimer:
+    bench_app = FastAPI(default_response_class=response_class)
+    bench_app.add_middleware(CompressionMiddleware)
+
+    @bench_app.get("/job-applications", response_model=JobApplicationListResponse)
+    def list_applications():
+        return payload
+
+    return _CpuTimer(bench_app)
+
+
+async def _measure(timer: _CpuTimer, encoding: str, requests: int) -> tuple[float, int]:
+    transport = httpx.ASGITransport(app=timer)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        headers = {"Accept-Encoding": encoding}
+        for _ in range(20):
+            await client.get("/job-applications", headers=headers)
+        timer.seconds = 0.0
+        wire_bytes = 0
+        for _ in range(requests):
+            response = await client.get("/job-applications", headers=headers)
+            response.raise_for_status()
+            wire_bytes = response.num_bytes_downloaded
+    return timer.seconds / requests * 1_000_000, wire_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    payload = _payload(args.rows)
+    encodings = ["identity", *reversed(supported_encodings())]
+    print(f"{'renderer':<14} {'encoding':<10} {'cpu/response':>14} {'bytes':>10}")
+    for name, response_class in (("JSONResponse", JSONResponse), ("ORJSONResponse", ORJSONResponse)):
+        for encoding in encodings:
+            cpu_us, wire_bytes = asyncio.run(_measure(_build_app(response_class, payload), encoding, args.requests))
+            print(f"{name:<14} {encoding:<10} {cpu_us:>12.0f}us {wire_bytes:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Measure how long a fresh interpreter takes to import the application.
+
+Runs ``python -X importtime -c "import app.main"`` in a new process several
+times and reports the median total import time and the slowest top-level
+packages (cumulative, so a package's time includes the packages it
+imports). Heavy libraries used only by some requests (google.genai,
+pymupdf, passlib, jose) are imported on first use, so they should not
+appear here; the list of those that do is printed at the end.
+
+Usage:
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --module app.worker --json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+
+SERVER_DIR = Path(__file__).resolve().parents[1]
+
+# Imported on first use by the code that needs them, never at startup.
+DEFERRED_PACKAGES = ("google.genai", "pymupdf", "passlib", "jose")
+
+
+class ImportProfile(NamedTuple):
+    total_us: int
+    # Cumulative microseconds per top-level package, including what it imports.
+    packages: Dict[str, int]
+    modules: List[str]
+
+
+def import_profile(module: str = "app.main") -> ImportProfile:
+    """Import `module` in a fresh interpreter under ``-X importtime`` and parse the report."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SERVER_DIR,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    packages: Dict[str, int] = {}
+    modules: List[str] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("| imported package"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        total += int(self_us)
+        modules.append(name.strip())
+        # A package's top-level module is imported once; its cumulative time covers the package.
+        if "." not in name.strip():
+            packages[name.strip()] = int(cumulative_us)
+    return ImportProfile(total, packages, modules)
+
+
+def imported(profile: ImportProfile, package: str) -> bool:
+    return any(name == package or name.startswith(package + ".") for name in profile.modules)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Print one JSON object instead of a table")
+    args = parser.parse_args()
+
+    profiles = [import_profile(args.module) for _ in range(args.runs)]
+    median_ms = statistics.median(profile.total_us for profile in profiles) / 1000
+    packages: Dict[str, List[int]] = defaultdict(list)
+    root = args.module.split(".")[0]
+    for profile in profiles:
+        for package, cumulative in profile.packages.items():
+            if package != root:
+                packages[package].append(cumulative)
+    slowest = sorted(
+        ((package, statistics.median(times) / 1000) for package, times in packages.items()),
+        key=lambda item: -item[1],
+    )[:args.top]
+    deferred_loaded = [package for package in DEFERRED_PACKAGES if imported(profiles[-1], package)]
+
+    if args.json:
+        print(json.dumps({
+            "module": args.module,
+            "runs": args.runs,
+            "median_import_ms": round(median_ms, 1),
+            "packages_ms": {package: round(ms, 1) for package, ms in slowest},
+            "deferred_packages_imported": deferred_loaded,
+        }))
+        return
+
+    print(f"import {args.module}: {median_ms:.0f} ms (median of {args.runs})")
+    print(f"{'package':<24} {'cumulative ms':>14}")
+    for package, ms in slowest:
+        print(f"{package:<24} {ms:>14.1f}")
+    print(f"deferred packages imported at startup: {', '.join(deferred_loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Pytest plugin that fails tests whose requests block the event loop.
+
+Tests marked ``@pytest.mark.no_blocking`` (or every test, with
+``--detect-blocking``) run with the blocking-call detector enabled. If a
+callback holds the loop longer than the threshold while code under one of the
+guarded paths is on the stack, the test fails with the offending stack.
+
+    [pytest]
+    blocking_threshold_ms = 50
+    blocking_guarded_paths = app/api/
+"""
+import os
+from typing import Iterable, List
+
+import pytest
+
+from app.core.blocking_detector import BlockingEvent, blocking_detector
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--detect-blocking",
+        action="store_true",
+        default=False,
+        help="Fail any test whose requests block the event loop in guarded code.",
+    )
+    parser.addini("blocking_threshold_ms", "Event-loop stall reported as blocking.", default="50")
+    parser.addini(
+        "blocking_guarded_paths",
+        "Path fragments whose presence on a blocked stack fails the test.",
+        type="linelist",
+        default=[f"app{os.sep}api{os.sep}"],
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "no_blocking(threshold_ms=None): fail if a request blocks the event loop in guarded code",
+    )
+
+
+def offending_events(events: Iterable[BlockingEvent], guarded_paths: Iterable[str]) -> List[BlockingEvent]:
+    """Events whose captured stack passes through any guarded path."""
+    guarded = [path.replace("/", os.sep) for path in guarded_paths]
+    return [
+        event for event in events
+        if any(path in line for line in event.stack for path in guarded)
+    ]
+
+
+def _format_report(events: List[BlockingEvent]) -> str:
+    sections = []
+    for event in events:
+        header = (
+            f"{event.method or '?'} {event.route or '<unknown route>'} blocked the event loop "
+            f"for {event.duration * 1000:.0f} ms at {event.location or '<unknown>'}"
+        )
+        sections.append(header + "\n" + "\n".join(event.stack[-8:]))
+    return "\n\n".join(sections)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("no_blocking")
+    if marker is None and not item.config.getoption("--detect-blocking"):
+        yield
+        return
+
+    threshold_ms = marker.kwargs.get("threshold_ms") if marker else None
+    if threshold_ms is None:
+        threshold_ms = float(item.config.getini("blocking_threshold_ms"))
+    previous = (blocking_detector.enabled, blocking_detector.threshold)
+    blocking_detector.enabled = True
+    blocking_detector.threshold = threshold_ms / 1000
+    blocking_detector.clear()
+    try:
+        outcome = yield
+        offending = offending_events(blocking_detector.events(), item.config.getini("blocking_guarded_paths"))
+        if offending and outcome.exception is None:
+            outcome.force_exception(pytest.fail.Exception(
+                "Blocking call detected on the event loop:\n\n" + _format_report(offending),
+                pytrace=False,
+            ))
+    finally:
+        blocking_detector.enabled, blocking_detector.threshold = previous
+        blocking_detector.clear()
@@ -1,6 +1,11 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.main import app
+from app.core.database import Base
+from app.models.database.user import User
 import os
 from unittest.mock import Mock
 from io import BytesIO
@@ -12,6 +17,45 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with all tables created"""
+    import app.models.database.analysis_job  # noqa: F401 - register table
+    import app.models.database.job_application  # noqa: F401 - register table
+    import app.models.database.requirement_cache  # noqa: F401 - register table
+    import app.models.database.stored_resume  # noqa: F401 - register table
+    import app.models.database.work_task  # noqa: F401 - register table
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def db_user(db_session):
+    """Persisted active user for database-backed tests"""
+    user = User(
+        email="jane@example.com",
+        first_name="Jane",
+        last_name="Doe",
+        hashed_password="not-a-real-hash",
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
 @pytest.fixture
 def sample_job_description():
     """Sample job description for testing"""
@@ -113,3 +157,33 @@ def sample_analysis_response():
 def env_setup(monkeypatch):
     """Set up environment variables for testing"""
     monkeypatch.setenv("GOOGLE_API_KEY", "test-api-key-12345")
+
+
+@pytest.fixture(autouse=True)
+def reset_llm_breaker():
+    """Keep mocked LLM failures in one test from opening the circuit for the next"""
+    from app.core.llm import llm_breaker
+
+    llm_breaker.reset()
+    yield
+    llm_breaker.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_requirements_cache():
+    """Keep requirements cached in memory by one test from answering the next"""
+    from app.services.requirements_cache import clear_memory_cache
+
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Keep requests made by one test from counting against the next one's rate limits"""
+    from app.core.rate_limit import limiter
+
+    limiter.reset()
+    yield
+    limiter.reset()
@@ -0,0 +1,261 @@
+"""Tests for asynchronous resume analysis jobs."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from io import BytesIO
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, status
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import get_db
+from app.core.llm import LLMUnavailableError
+from app.main import app
+from app.models.database.analysis_job import AnalysisJob
+from app.models.resume import ResumeAnalysisResponse
+from app.services import analysis_job_service
+from app.utils.security import get_optional_current_user
+from app.services.analysis_job_service import (
+    create_analysis_job,
+    requeue_analysis_jobs,
+    run_analysis_job,
+    wait_for_analysis_job,
+)
+
+
+RESULT = ResumeAnalysisResponse(match_score=80, summary="Good fit", strengths=["Python"], gaps=[], recommendations=[])
+
+
+@pytest.fixture
+def mock_schedule():
+    with patch("app.services.analysis_job_service.schedule_analysis_job") as mock:
+        yield mock
+
+
+@pytest.fixture
+def factory(db_session):
+    return sessionmaker(bind=db_session.get_bind())
+
+
+@pytest.fixture
+def mock_llm():
+    with patch(
+        "app.services.analysis_job_service.validate_job_description",
+        new_callable=AsyncMock,
+        return_value=(True, "Looks like a posting."),
+    ) as mock_validate, patch(
+        "app.services.analysis_job_service.analyze_resume",
+        new_callable=AsyncMock,
+        return_value=RESULT,
+    ) as mock_analyze:
+        yield mock_validate, mock_analyze
+
+
+def _queued_job(db_session, mock_schedule) -> AnalysisJob:
+    return create_analysis_job(db_session, "Backend engineer with Python.", "Jane Doe, Python developer")
+
+
+def test_submit_returns_202_and_status_reports_the_result(client, db_session, factory, mock_schedule, mock_llm):
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        with patch("app.api.resume.extract_text_from_pdf", new_callable=AsyncMock, return_value="Jane Doe resume"):
+            submitted = client.post(
+                "/api/v1/resume/analyze/jobs",
+                files={"resume": ("resume.pdf", BytesIO(b"%PDF-1.4"), "application/pdf")},
+                data={"job_description": "Backend engineer.\n\n\nPython and  SQL."},
+            )
+        job_id = submitted.json()["id"]
+        asyncio.run(run_analysis_job(UUID(job_id), session_factory=factory))
+        polled = client.get(submitted.headers["Location"])
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert submitted.status_code == status.HTTP_202_ACCEPTED
+    assert submitted.json()["status"] == "queued"
+    assert submitted.headers["Location"] == f"/api/v1/resume/analyze/jobs/{job_id}"
+    assert "X-Quota-Remaining" in submitted.headers
+    mock_schedule.assert_called_once()
+    mock_llm[1].assert_awaited_once_with(None, "Backend engineer.\n\nPython and SQL.", resume_text="Jane Doe resume")
+
+    assert polled.status_code == status.HTTP_200_OK
+    assert polled.json()["status"] == "succeeded"
+    assert polled.json()["result"]["match_score"] == 80
+    assert "Retry-After" not in polled.headers
+
+
+@pytest.mark.no_blocking
+def test_submit_and_poll_do_not_block_the_event_loop(client, db_session, mock_schedule, monkeypatch):
+    commit, query = db_session.commit, db_session.query
+
+    def slow(method):
+        def call(*args, **kwargs):
+            time.sleep(0.1)
+            return method(*args, **kwargs)
+        return call
+
+    monkeypatch.setattr(db_session, "commit", slow(commit))
+    monkeypatch.setattr(db_session, "query", slow(query))
+    monkeypatch.setattr(analysis_job_service, "ANALYSIS_POLL_INTERVAL_SECONDS", 0.05)
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        with patch("app.api.resume.extract_text_from_pdf", new_callable=AsyncMock, return_value="Jane Doe resume"):
+            submitted = client.post(
+                "/api/v1/resume/analyze/jobs",
+                files={"resume": ("resume.pdf", BytesIO(b"%PDF-1.4"), "application/pdf")},
+                data={"job_description": "Backend engineer with Python."},
+            )
+        location = submitted.headers["Location"]
+        polled = client.get(location)
+        waited = client.get(location, params={"wait": 0.2})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert submitted.status_code == status.HTTP_202_ACCEPTED
+    assert polled.json()["status"] == waited.json()["status"] == "queued"
+
+
+def test_submit_runs_the_synchronous_input_checks(client, mock_schedule):
+    response = client.post(
+        "/api/v1/resume/analyze/jobs",
+        files={"resume": ("resume.txt", BytesIO(b"text"), "text/plain")},
+        data={"job_description": "Backend engineer"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    mock_schedule.assert_not_called()
+
+
+def test_unknown_job_is_404(client, db_session):
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        response = client.get(f"/api/v1/resume/analyze/jobs/{uuid4()}")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_unfinished_job_carries_retry_after(client, db_session, mock_schedule):
+    job = _queued_job(db_session, mock_schedule)
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        response = client.get(f"/api/v1/resume/analyze/jobs/{job.id}")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert response.json()["status"] == "queued"
+    assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("validate, error_status", [
+    (AsyncMock(return_value=(False, "It is a recipe.")), status.HTTP_400_BAD_REQUEST),
+    (AsyncMock(side_effect=LLMUnavailableError("open")), status.HTTP_503_SERVICE_UNAVAILABLE),
+    (AsyncMock(side_effect=RuntimeError("boom")), status.HTTP_500_INTERNAL_SERVER_ERROR),
+])
+async def test_failures_record_the_synchronous_status(db_session, factory, mock_schedule, validate, error_status):
+    job = _queued_job(db_session, mock_schedule)
+
+    with patch("app.services.analysis_job_service.validate_job_description", validate):
+        await run_analysis_job(job.id, session_factory=factory)
+
+    db_session.expire_all()
+    assert job.status == "failed"
+    assert job.error_status == error_status
+    assert job.error
+    assert job.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_long_poll_wakes_when_the_job_finishes(db_session, factory, mock_schedule, mock_llm):
+    job = _queued_job(db_session, mock_schedule)
+
+    async def run_later():
+        await asyncio.sleep(0.05)
+        await run_analysis_job(job.id, session_factory=factory)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    polled, _ = await asyncio.gather(wait_for_analysis_job(db_session, job.id, timeout=10), run_later())
+
+    assert polled.status == "succeeded"
+    assert loop.time() - started < 1
+
+
+@pytest.mark.asyncio
+async def test_long_poll_times_out_with_the_current_status(db_session, mock_schedule):
+    job = _queued_job(db_session, mock_schedule)
+
+    polled = await wait_for_analysis_job(db_session, job.id, timeout=0.05)
+
+    assert polled.status == "queued"
+
+
+def test_finished_jobs_are_not_run_again(db_session, factory, mock_schedule, mock_llm):
+    job = _queued_job(db_session, mock_schedule)
+    asyncio.run(run_analysis_job(job.id, session_factory=factory))
+    asyncio.run(run_analysis_job(job.id, session_factory=factory))
+
+    assert mock_llm[1].await_count == 1
+
+
+def test_requeue_picks_up_interrupted_jobs(db_session, factory, mock_schedule):
+    jobs = [_queued_job(db_session, mock_schedule) for _ in range(4)]
+    jobs[0].status = "running"
+    jobs[0].started_at = datetime.utcnow() - timedelta(hours=1)
+    jobs[2].status = "succeeded"
+    # Running in a sibling process right now.
+    jobs[3].status = "running"
+    jobs[3].started_at = datetime.utcnow()
+    db_session.commit()
+    mock_schedule.reset_mock()
+
+    assert requeue_analysis_jobs(session_factory=factory) == 2
+
+    db_session.expire_all()
+    assert [job.status for job in jobs] == ["queued", "queued", "succeeded", "running"]
+    assert sorted(call.args[0] for call in mock_schedule.call_args_list) == sorted([jobs[0].id, jobs[1].id])
+
+
+@pytest.mark.asyncio
+async def test_job_enqueued_twice_is_analyzed_once(db_session, factory, mock_schedule, mock_llm):
+    job = _queued_job(db_session, mock_schedule)
+
+    await asyncio.gather(
+        run_analysis_job(job.id, session_factory=factory),
+        run_analysis_job(job.id, session_factory=factory),
+    )
+
+    assert mock_llm[1].await_count == 1
+    db_session.expire_all()
+    assert job.status == "succeeded"
+    assert job.resume_text is None
+
+
+def test_job_of_a_signed_in_user_is_hidden_from_others(client, db_session, db_user, mock_schedule):
+    job = create_analysis_job(db_session, "Backend engineer with Python.", "Jane Doe", user_id=db_user.id)
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        anonymous = client.get(f"/api/v1/resume/analyze/jobs/{job.id}")
+        app.dependency_overrides[get_optional_current_user] = lambda: db_user
+        owner = client.get(f"/api/v1/resume/analyze/jobs/{job.id}")
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_optional_current_user, None)
+
+    assert anonymous.status_code == status.HTTP_404_NOT_FOUND
+    assert owner.status_code == status.HTTP_200_OK
+
+
+def test_submission_is_refused_when_the_queue_is_full(db_session, mock_schedule, monkeypatch):
+    monkeypatch.setattr(analysis_job_service, "ANALYSIS_MAX_QUEUED", 0)
+
+    with pytest.raises(HTTPException) as error:
+        _queued_job(db_session, mock_schedule)
+
+    assert error.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert error.value.headers == {"Retry-After": "30"}
+    assert db_session.query(AnalysisJob).count() == 0
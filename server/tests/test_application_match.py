@@ -0,0 +1,208 @@
+"""Tests for matching one resume against all of a user's job applications."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from fastapi import status
+import pytest
+
+from app.core.database import get_db
+from app.core.llm import LLMUnavailableError, llm_breaker
+from app.main import app
+from app.models.database.job_application import JobApplication
+from app.models.resume import ResumeAnalysisResponse
+from app.services import application_match_service
+from app.services.application_match_service import (
+    RankedApplication,
+    iter_application_analyses,
+    rank_applications,
+    score_documents,
+)
+from app.utils.security import get_current_user
+
+
+RESUME = "Backend engineer. Python, FastAPI and PostgreSQL. Built data pipelines on AWS."
+RESULT = ResumeAnalysisResponse(match_score=80, summary="Good fit", strengths=[], gaps=[], recommendations=[])
+
+
+def _application(user_id, job, company, requirements, description=""):
+    return JobApplication(
+        user_id=user_id,
+        job=job,
+        company=company,
+        date="2026-01-01",
+        status="Applied",
+        description=description,
+        requirements=requirements,
+    )
+
+
+@pytest.fixture
+def applications(db_session, db_user):
+    rows = [
+        _application(db_user.id, "Pastry Chef", "Bakery", ["Baking", "Pastry", "Food safety"]),
+        _application(db_user.id, "Backend Engineer", "Acme", ["Python", "FastAPI", "PostgreSQL"]),
+        _application(db_user.id, "Data Engineer", "Initech", ["Python", "AWS"], "Own our data pipelines."),
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    return rows
+
+
+def _candidate(job: str) -> RankedApplication:
+    return RankedApplication(
+        application_id=uuid4(),
+        job=job,
+        company="Acme",
+        job_description=f"Job title: {job}",
+        local_score=0.5,
+    )
+
+
+def test_score_documents_prefers_shared_distinctive_terms():
+    scores = score_documents(
+        "python fastapi postgresql",
+        ["python fastapi postgresql engineer", "python engineer", "pastry chef"],
+    )
+
+    assert scores[0] > scores[1] > scores[2] == 0.0
+    assert scores[0] <= 1.0
+
+
+def test_score_documents_handles_empty_input():
+    assert score_documents("", ["python"]) == [0.0]
+    assert score_documents("python", []) == []
+
+
+def test_rank_applications_orders_best_match_first(applications):
+    ranked = rank_applications(RESUME, applications)
+
+    assert [candidate.job for candidate in ranked] == ["Backend Engineer", "Data Engineer", "Pastry Chef"]
+    assert ranked[-1].local_score == 0.0
+    assert "- FastAPI" in ranked[0].job_description
+
+
+@pytest.mark.asyncio
+async def test_analyses_are_bounded_and_failures_become_error_events():
+    running = 0
+    peak = 0
+
+    async def fake_analyze(resume, job_description, resume_text):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if "Broken" in job_description:
+            raise LLMUnavailableError("down")
+        return RESULT
+
+    candidates = [_candidate(f"Role {n}") for n in range(5)] + [_candidate("Broken")]
+    with patch("app.services.application_match_service.analyze_resume", side_effect=fake_analyze):
+        events = [event async for event in iter_application_analyses(RESUME, candidates, concurrency=2)]
+
+    assert peak == 2
+    assert sorted(event["event"] for event in events) == ["analysis"] * 5 + ["error"]
+    (error,) = [event for event in events if event["event"] == "error"]
+    assert error["error_status"] == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+def test_endpoint_streams_ranking_then_top_k_analyses(client, db_session, db_user, applications):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_user] = lambda: db_user
+    try:
+        with patch(
+            "app.api.resume.extract_text_from_pdf", new_callable=AsyncMock, return_value=RESUME
+        ), patch(
+            "app.services.application_match_service.analyze_resume", new_callable=AsyncMock, return_value=RESULT
+        ) as mock_analyze:
+            response = client.post(
+                "/api/v1/resume/analyze/applications?top_k=2",
+                files={"resume": ("resume.pdf", b"%PDF-1.4", "application/pdf")},
+            )
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "X-Quota-Remaining" in response.headers
+    events = [json.loads(line) for line in response.text.splitlines()]
+
+    assert events[0]["event"] == "ranking"
+    assert [item["job"] for item in events[0]["applications"]] == ["Backend Engineer", "Data Engineer", "Pastry Chef"]
+    analyzed = {event["job"] for event in events[1:-1]}
+    assert analyzed == {"Backend Engineer", "Data Engineer"}
+    assert events[-1] == {"event": "done", "analyzed": 2, "failed": 0}
+    assert mock_analyze.await_count == 2
+
+
+@pytest.mark.no_blocking
+def test_endpoint_loads_and_ranks_off_the_event_loop(client, db_session, db_user, applications, monkeypatch):
+    query, rank = db_session.query, application_match_service.rank_applications
+
+    def slow_query(*entities, **kwargs):
+        time.sleep(0.1)
+        return query(*entities, **kwargs)
+
+    def slow_rank(resume_text, candidates):
+        time.sleep(0.1)
+        return rank(resume_text, candidates)
+
+    monkeypatch.setattr(db_session, "query", slow_query)
+    monkeypatch.setattr(application_match_service, "rank_applications", slow_rank)
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_user] = lambda: db_user
+    try:
+        with patch(
+            "app.api.resume.extract_text_from_pdf", new_callable=AsyncMock, return_value=RESUME
+        ), patch("app.services.application_match_service.analyze_resume", new_callable=AsyncMock, return_value=RESULT):
+            response = client.post(
+                "/api/v1/resume/analyze/applications?top_k=1",
+                files={"resume": ("resume.pdf", b"%PDF-1.4", "application/pdf")},
+            )
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_endpoint_reports_real_analyses_as_errors_while_llm_unavailable(client, db_session, db_user, applications):
+    for _ in range(llm_breaker.failure_threshold):
+        llm_breaker.record_failure()
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_user] = lambda: db_user
+    try:
+        with patch("app.api.resume.extract_text_from_pdf", new_callable=AsyncMock, return_value=RESUME):
+            response = client.post(
+                "/api/v1/resume/analyze/applications?top_k=2",
+                files={"resume": ("resume.pdf", b"%PDF-1.4", "application/pdf")},
+            )
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["event"] for event in events[1:-1]] == ["error", "error"]
+    assert {event["error_status"] for event in events[1:-1]} == {status.HTTP_503_SERVICE_UNAVAILABLE}
+    assert events[-1] == {"event": "done", "analyzed": 0, "failed": 2}
+
+
+def test_endpoint_requires_applications(client, db_session, db_user):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_user] = lambda: db_user
+    try:
+        with patch("app.api.resume.extract_text_from_pdf", new_callable=AsyncMock, return_value=RESUME):
+            response = client.post(
+                "/api/v1/resume/analyze/applications",
+                files={"resume": ("resume.pdf", b"%PDF-1.4", "application/pdf")},
+            )
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
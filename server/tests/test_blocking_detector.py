@@ -0,0 +1,127 @@
+"""Tests for the event-loop blocking-call detector and its pytest plugin."""
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from app.core.blocking_detector import BlockingCallDetector, BlockingDetectorMiddleware, blocking_detector
+from app.core.database import get_db
+from app.main import app
+from tests.blocking_plugin import offending_events
+
+
+@pytest.fixture
+def detector():
+    detector = BlockingCallDetector(threshold=0.05, enabled=True)
+    yield detector
+    detector.stop()
+
+
+def _block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_detector_captures_stack_of_blocking_callback(detector):
+    detector.watch_current_loop()
+    await asyncio.sleep(0.05)
+
+    _block_the_loop(0.3)
+    await asyncio.sleep(0.05)
+
+    events = detector.events()
+    assert len(events) == 1
+    assert events[0].duration >= 0.2
+    assert any("_block_the_loop" in line for line in events[0].stack)
+
+
+@pytest.mark.asyncio
+async def test_short_pauses_are_not_reported(detector):
+    detector.watch_current_loop()
+    for _ in range(5):
+        _block_the_loop(0.005)
+        await asyncio.sleep(0.01)
+
+    assert detector.events() == []
+
+
+def test_events_name_the_route_being_served(detector):
+    demo = FastAPI()
+    demo.add_middleware(BlockingDetectorMiddleware, detector=detector)
+
+    @demo.get("/reports/{report_id}")
+    async def slow_report(report_id: int):
+        await asyncio.sleep(0.05)
+        _block_the_loop(0.25)
+        await asyncio.sleep(0.05)
+        return {"id": report_id}
+
+    assert TestClient(demo).get("/reports/7").status_code == 200
+
+    events = detector.events()
+    assert [(event.method, event.route) for event in events] == [("GET", "/reports/{report_id}")]
+
+
+def test_offending_events_filters_by_guarded_path(detector):
+    detector._events.append(_event(["  File \"/srv/app/api/auth.py\", line 10, in signup"]))
+    detector._events.append(_event(["  File \"/srv/app/core/other.py\", line 3, in helper"]))
+
+    offending = offending_events(detector.events(), ["app/api/"])
+
+    assert len(offending) == 1
+    assert "auth.py" in offending[0].stack[0]
+
+
+def _event(stack):
+    from datetime import datetime, timezone
+    from app.core.blocking_detector import BlockingEvent
+
+    return BlockingEvent(datetime.now(timezone.utc), 0.2, "/x", "GET", None, stack)
+
+
+@pytest.mark.no_blocking
+def test_auth_endpoints_do_not_block_the_event_loop(client, db_session):
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        signup = client.post("/api/v1/auth/signup", json={
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "email": "jane@example.com",
+            "password": "Correct-horse-battery-9",
+            "confirm_password": "Correct-horse-battery-9",
+        })
+        signin = client.post("/api/v1/auth/signin", json={
+            "email": "jane@example.com",
+            "password": "Correct-horse-battery-9",
+        })
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert signup.status_code == 201
+    assert signin.status_code == 200
+
+
+def test_debug_endpoint_is_hidden_when_disabled(client, monkeypatch):
+    monkeypatch.setattr(blocking_detector, "enabled", False)
+
+    assert client.get("/debug/blocking").status_code == 404
+    assert client.delete("/debug/blocking").status_code == 404
+
+
+def test_debug_endpoint_lists_and_clears_events(client, monkeypatch):
+    monkeypatch.setattr(blocking_detector, "enabled", True)
+    blocking_detector._events.append(_event(["  File \"app/api/auth.py\", line 10, in signup"]))
+
+    first = client.get("/debug/blocking").json()
+    again = client.get("/debug/blocking").json()
+    cleared = client.delete("/debug/blocking")
+    second = client.get("/debug/blocking").json()
+
+    assert first["events"][0]["route"] == "/x"
+    assert first["events"][0]["duration_ms"] == 200.0
+    assert again == first
+    assert cleared.status_code == 204
+    assert second["events"] == []
@@ -0,0 +1,131 @@
+"""Tests for the offline batch analyzer CLI."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pymupdf
+import pytest
+
+from app import cli
+from app.models.resume import ResumeAnalysisResponse
+from app.services import resume_service
+
+
+JOB_DESCRIPTION = "Senior Backend Engineer. Python, FastAPI and PostgreSQL. Build and operate REST APIs."
+
+
+def _pdf(text: str) -> bytes:
+    document = pymupdf.open()
+    document.new_page().insert_text((72, 72), text)
+    content = document.tobytes()
+    document.close()
+    return content
+
+
+@pytest.fixture
+def batch(tmp_path):
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    for name in ("alice", "bob", "carol"):
+        (resumes / f"{name}.pdf").write_bytes(_pdf(f"{name.title()} - Python developer"))
+    (resumes / "broken.pdf").write_bytes(b"not a pdf")
+    (resumes / "notes.txt").write_text("ignored")
+    job_description = tmp_path / "job.txt"
+    job_description.write_text(JOB_DESCRIPTION)
+    return resumes, job_description, tmp_path / "out" / "results.jsonl"
+
+
+def _records(output: Path):
+    return [json.loads(line) for line in output.read_text().splitlines()]
+
+
+def test_analyze_batch_against_the_fake_llm_and_resume(batch, monkeypatch):
+    resumes, job_description, output = batch
+    # --fake-llm swaps the service's client; put the real one back afterwards.
+    monkeypatch.setattr(resume_service, "client", resume_service.client)
+    argv = [
+        "analyze-batch", str(resumes), str(job_description), "--output", str(output),
+        "--fake-llm", "--fake-llm-latency-ms", "0", "--workers", "1",
+    ]
+
+    assert cli.main(argv) == 0
+    records = _records(output)
+    assert sorted(record["file"] for record in records) == ["alice.pdf", "bob.pdf", "broken.pdf", "carol.pdf"]
+    by_file = {record["file"]: record for record in records}
+    assert by_file["alice.pdf"]["status"] == cli.OK
+    assert by_file["alice.pdf"]["result"]["match_score"] == 78
+    assert by_file["broken.pdf"]["status"] == cli.EXTRACTION_FAILED
+
+    # An interrupted write and a changed file: only the changed file is redone.
+    with open(output, "a") as handle:
+        handle.write('{"file": "dave.pdf", "sha')
+    (resumes / "bob.pdf").write_bytes(_pdf("Bob - Go developer"))
+
+    assert cli.main(argv) == 0
+    lines = output.read_text().splitlines()
+    assert json.loads(lines[-1])["file"] == "bob.pdf"
+    assert len(lines) == 6
+
+
+def test_upstream_failures_are_recorded_and_retried(batch, monkeypatch):
+    resumes, job_description, output = batch
+    failing = MagicMock()
+    failing.aio.models.generate_content = AsyncMock(side_effect=RuntimeError("upstream 500"))
+    monkeypatch.setattr(resume_service, "client", failing)
+    argv = [
+        "analyze-batch", str(resumes), str(job_description), "--output", str(output),
+        "--skip-validation", "--workers", "1",
+    ]
+
+    assert cli.main(argv) == 1
+    by_file = {record["file"]: record for record in _records(output)}
+    for name in ("alice.pdf", "bob.pdf", "carol.pdf"):
+        assert by_file[name]["status"] == cli.ANALYSIS_FAILED
+        assert "upstream 500" in by_file[name]["error"]
+    # Only the unreadable file is settled; the failed analyses run again next time.
+    assert {name for name, _, _ in cli.load_checkpoint(output)} == {"broken.pdf"}
+
+
+def test_checkpoint_settles_only_final_outcomes(tmp_path):
+    output = tmp_path / "results.jsonl"
+    lines = [
+        {"file": "a.pdf", "sha256": "1", "job_description_sha256": "j", "status": cli.ANALYSIS_FAILED},
+        {"file": "a.pdf", "sha256": "1", "job_description_sha256": "j", "status": cli.OK},
+        {"file": "b.pdf", "sha256": "2", "job_description_sha256": "j", "status": cli.ANALYSIS_FAILED},
+        {"file": "c.pdf", "sha256": "3", "job_description_sha256": "j", "status": cli.EXTRACTION_FAILED},
+    ]
+    output.write_text("\n".join(json.dumps(line) for line in lines) + '\n{"file": "d.pdf"')
+
+    assert cli.load_checkpoint(output) == {("a.pdf", "1", "j"), ("c.pdf", "3", "j")}
+
+
+@pytest.mark.asyncio
+async def test_analyses_are_bounded_and_failures_recorded(batch):
+    resumes, _, output = batch
+    running = 0
+    peak = 0
+
+    async def fake_analyze(resume, job_description, resume_text):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            if "Bob" in resume_text:
+                raise RuntimeError("model timed out")
+            return ResumeAnalysisResponse(match_score=70, summary="ok", strengths=[], gaps=[], recommendations=[])
+        finally:
+            running -= 1
+
+    paths = [(path, "sha") for path in sorted(resumes.glob("*.pdf"))]
+    output.parent.mkdir()
+    with patch.object(resume_service, "analyze_resume", AsyncMock(side_effect=fake_analyze)), \
+            ThreadPoolExecutor(2) as pool, open(output, "w") as handle:
+        analyzer = cli.BatchAnalyzer(JOB_DESCRIPTION, handle, pool, concurrency=1, window=3)
+        await analyzer.run(paths)
+
+    assert peak == 1
+    assert analyzer.counts == {cli.OK: 2, cli.EXTRACTION_FAILED: 1, cli.ANALYSIS_FAILED: 1}
+    (failed,) = [record for record in _records(output) if record["status"] == cli.ANALYSIS_FAILED]
+    assert failed["file"] == "bob.pdf" and "model timed out" in failed["error"]
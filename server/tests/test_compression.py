@@ -0,0 +1,91 @@
+"""Tests for negotiated response compression."""
+
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+import pytest
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+from app.main import app
+
+
+ROWS = [{"id": index, "job": "Backend Engineer", "company": "Acme"} for index in range(100)]
+
+
+@pytest.fixture
+def demo_client():
+    demo = FastAPI(default_response_class=ORJSONResponse)
+    demo.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @demo.get("/rows")
+    def rows():
+        return ROWS
+
+    @demo.get("/small")
+    def small():
+        return {"ok": True}
+
+    @demo.get("/pdf")
+    def pdf():
+        return Response(b"%PDF-1.7" + b"0" * 5000, media_type="application/pdf")
+
+    @demo.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"id,job\n"] + [f"{i},Engineer\n".encode() for i in range(500)]), media_type="text/csv")
+
+    return TestClient(demo)
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate", "gzip"),
+    ("br;q=1.0, gzip;q=0.8", "br"),
+    ("br, gzip;q=0.5", "br"),
+    ("gzip;q=0, br;q=0", None),
+    ("*", "br"),
+    ("identity", None),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header, ("br", "gzip")) == expected
+
+
+def test_negotiate_encoding_falls_back_to_gzip_without_brotli():
+    assert negotiate_encoding("br, gzip;q=0.5", ("gzip",)) == "gzip"
+
+
+def test_large_json_is_gzipped(demo_client):
+    response = demo_client.get("/rows", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == ROWS
+
+
+def test_uncompressed_when_not_accepted_or_too_small(demo_client):
+    assert "content-encoding" not in demo_client.get("/rows", headers={"Accept-Encoding": "identity"}).headers
+    assert "content-encoding" not in demo_client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+
+
+def test_pdf_is_passed_through(demo_client):
+    response = demo_client.get("/pdf", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.content.startswith(b"%PDF")
+
+
+def test_streamed_response_is_compressed_incrementally(demo_client):
+    with demo_client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw).startswith(b"id,job\n0,Engineer\n")
+
+
+def test_app_serves_compressed_json(client):
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["info"]["title"] == app.title
@@ -74,6 +74,28 @@ class TestCoverLetterEndpoints:
         called_kwargs = mock_generate_cover_letter.await_args.kwargs
         assert called_kwargs["applicant_full_name"] == "John Doe"
 
+    @patch("app.api.cover_letter.generate_cover_letter", new_callable=AsyncMock)
+    @patch("app.api.cover_letter.get_cover_letter_store")
+    def test_generate_cover_letter_sends_the_scanned_text(self, mock_get_store, mock_generate_cover_letter, client):
+        mock_get_store.return_value = _FakeStore()
+        mock_generate_cover_letter.side_effect = RuntimeError("stop after the call")
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(first_name="  John ", last_name="Doe\t")
+
+        client.post(
+            "/api/v1/cover-letter/generate",
+            json={
+                "jobTitle": "Software Engineer",
+                "email": "candidate@example.com",
+                "phone": "+1  555  000",
+                "requirements": ["Python   and\r\n\r\n\r\n  SQL", "FastAPI", "  Docker  "],
+            },
+        )
+
+        called_kwargs = mock_generate_cover_letter.await_args.kwargs
+        assert called_kwargs["request_data"].requirements == ["Python and SQL", "FastAPI", "Docker"]
+        assert called_kwargs["request_data"].phone == "+1 555 000"
+        assert called_kwargs["applicant_full_name"] == "John Doe"
+
     def test_generate_cover_letter_rejects_injection_input(self, client):
         response = client.post(
             "/api/v1/cover-letter/generate",
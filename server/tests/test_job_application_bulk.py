@@ -0,0 +1,161 @@
+"""Tests for bulk job application create, update and delete."""
+
+from typing import cast
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, status
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import get_db
+from app.main import app
+from app.models.database.job_application import JobApplication
+from app.models.job_application import JobApplicationBulkUpdateItem, JobApplicationCreate
+from app.services.job_application_service import (
+    bulk_create_job_applications,
+    bulk_delete_job_applications,
+    bulk_update_job_applications,
+    enrich_job_application_requirements,
+)
+from app.utils.security import get_current_user
+
+
+def _application(job: str, requirements: list[str]) -> JobApplicationCreate:
+    return JobApplicationCreate(
+        job=job,
+        company="Acme",
+        date="2026-03-28",
+        status="Applied",
+        description=f"{job} role description.",
+        requirements=requirements,
+    )
+
+
+@pytest.fixture(autouse=True)
+def mock_schedule():
+    with patch("app.services.job_application_service.schedule_requirement_enrichment") as mock:
+        yield mock
+
+
+def _create(db_session, db_user, applications):
+    return bulk_create_job_applications(db_session, cast(UUID, db_user.id), applications)
+
+
+def test_bulk_create_preserves_order_and_defers_enrichment(db_session, db_user, mock_schedule):
+    full = ["Python", "FastAPI", "SQL", "Docker", "AWS"]
+    with patch(
+        "app.services.job_application_service.generate_job_requirements_from_description",
+        new_callable=AsyncMock,
+    ) as mock_generate:
+        created = _create(db_session, db_user, [_application("First", full), _application("Second", ["Go"])])
+
+    assert [application.job for application in created] == ["First", "Second"]
+    assert [application.enrichment_status for application in created] == ["complete", "pending"]
+    assert cast(list[str], created[0].requirements) == full
+    assert mock_generate.await_count == 0
+    mock_schedule.assert_called_once_with([created[1].id])
+    assert db_session.query(JobApplication).count() == 2
+
+
+@pytest.mark.asyncio
+async def test_enrichment_merges_ai_requirements(db_session, db_user):
+    created = _create(db_session, db_user, [_application("Backend", ["Python"])])
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    with patch(
+        "app.services.job_application_service.generate_job_requirements_from_description",
+        new_callable=AsyncMock,
+    ) as mock_generate:
+        mock_generate.return_value.requirements = ["python", "Docker", "SQL"]
+        await enrich_job_application_requirements([created[0].id], session_factory=factory)
+
+    db_session.expire_all()
+    refreshed = db_session.get(JobApplication, created[0].id)
+    assert cast(list[str], refreshed.requirements) == ["Python", "Docker", "SQL"]
+    assert refreshed.enrichment_status == "complete"
+
+
+@pytest.mark.asyncio
+async def test_enrichment_keeps_manual_requirements_on_failure(db_session, db_user):
+    created = _create(db_session, db_user, [_application("Backend", ["Python"])])
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    with patch(
+        "app.services.job_application_service.generate_job_requirements_from_description",
+        new_callable=AsyncMock,
+    ) as mock_generate:
+        mock_generate.side_effect = RuntimeError("Model unavailable")
+        await enrich_job_application_requirements([created[0].id], session_factory=factory)
+
+    db_session.expire_all()
+    refreshed = db_session.get(JobApplication, created[0].id)
+    assert cast(list[str], refreshed.requirements) == ["Python"]
+    assert refreshed.enrichment_status == "failed"
+
+
+def test_bulk_update_applies_each_partial_update(db_session, db_user):
+    created = _create(db_session, db_user, [_application("First", ["Python"]), _application("Second", ["Go"])])
+
+    updated = bulk_update_job_applications(
+        db_session,
+        cast(UUID, db_user.id),
+        [
+            JobApplicationBulkUpdateItem(id=created[0].id, status="Interviewing"),
+            JobApplicationBulkUpdateItem(id=created[1].id, company="Globex"),
+        ],
+    )
+
+    assert [application.status for application in updated] == ["Interviewing", "Applied"]
+    assert [application.company for application in updated] == ["Acme", "Globex"]
+
+
+def test_bulk_update_rejects_unknown_ids_without_changes(db_session, db_user):
+    created = _create(db_session, db_user, [_application("First", ["Python"])])
+
+    with pytest.raises(HTTPException) as error:
+        bulk_update_job_applications(
+            db_session,
+            cast(UUID, db_user.id),
+            [
+                JobApplicationBulkUpdateItem(id=created[0].id, status="Offer"),
+                JobApplicationBulkUpdateItem(id=uuid4(), status="Offer"),
+            ],
+        )
+
+    assert error.value.status_code == status.HTTP_404_NOT_FOUND
+    db_session.expire_all()
+    assert db_session.get(JobApplication, created[0].id).status == "Applied"
+
+
+def test_bulk_delete_only_removes_owned_applications(db_session, db_user):
+    created = _create(db_session, db_user, [_application("First", ["Python"]), _application("Second", ["Go"])])
+
+    deleted = bulk_delete_job_applications(
+        db_session, cast(UUID, db_user.id), [created[0].id, uuid4()]
+    )
+
+    assert deleted == 1
+    assert db_session.query(JobApplication).count() == 1
+
+
+def test_bulk_create_endpoint_schedules_enrichment(db_session, db_user, client, mock_schedule):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_user] = lambda: db_user
+    try:
+        response = client.post(
+            "/api/v1/job-applications/bulk",
+            json={"applications": [
+                _application("First", ["Python"]).model_dump(),
+                _application("Second", ["A", "B", "C", "D", "E"]).model_dump(),
+            ]},
+        )
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    data = response.json()
+    assert data["total"] == 2
+    assert data["applications"][0]["enrichment_status"] == "pending"
+    mock_schedule.assert_called_once_with([UUID(data["applications"][0]["id"])])
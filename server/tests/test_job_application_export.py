@@ -0,0 +1,122 @@
+"""Tests for streaming job application export."""
+
+import csv
+import io
+import json
+import tracemalloc
+from datetime import datetime
+from typing import cast
+from uuid import UUID, uuid4
+
+from fastapi import status
+import pytest
+from sqlalchemy import insert
+
+from app.core.database import get_db
+from app.main import app
+from app.models.database.job_application import JobApplication
+from app.services.job_application_service import iter_job_application_export
+from app.utils.security import get_current_user
+
+
+def _seed(db_session, user_id, count: int) -> None:
+    now = datetime.utcnow()
+    db_session.execute(insert(JobApplication), [
+        {
+            "id": uuid4(),
+            "user_id": user_id,
+            "job": f"Engineer {index}",
+            "company": "Acme" if index % 2 else "Globex",
+            "date": f"2026-{index % 12 + 1:02d}-01",
+            "status": "Applied",
+            "description": "Build, operate and scale backend services. " * 20,
+            "hiring_manager_name": "",
+            "requirements": ["Python", "SQL, Postgres"],
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(count)
+    ])
+    db_session.commit()
+
+
+def _export_peak_bytes(db_session, user_id, export_format: str) -> tuple[int, int]:
+    exported = 0
+    tracemalloc.start()
+    try:
+        for chunk in iter_job_application_export(db_session, user_id, export_format, batch_size=100):
+            exported += len(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, exported
+
+
+def test_csv_export_round_trips(db_session, db_user):
+    _seed(db_session, db_user.id, 3)
+
+    body = "".join(iter_job_application_export(db_session, cast(UUID, db_user.id), "csv", batch_size=2))
+    rows = list(csv.DictReader(io.StringIO(body)))
+
+    assert len(rows) == 3
+    assert rows[0]["requirements"] == "Python; SQL, Postgres"
+    assert {row["company"] for row in rows} == {"Acme", "Globex"}
+
+
+def test_jsonl_export_applies_filters(db_session, db_user):
+    _seed(db_session, db_user.id, 4)
+
+    body = "".join(iter_job_application_export(db_session, cast(UUID, db_user.id), "jsonl", company="acme"))
+    records = [json.loads(line) for line in body.splitlines()]
+
+    assert len(records) == 2
+    assert records[0]["requirements"] == ["Python", "SQL, Postgres"]
+    assert all(record["company"] == "Acme" for record in records)
+
+
+def test_export_rejects_unknown_format(db_session, db_user):
+    with pytest.raises(ValueError):
+        list(iter_job_application_export(db_session, cast(UUID, db_user.id), "xml"))
+
+
+@pytest.mark.slow
+def test_export_memory_stays_flat_as_history_grows(db_session, db_user):
+    user_id = cast(UUID, db_user.id)
+    _seed(db_session, user_id, 500)
+    small_peak, small_bytes = _export_peak_bytes(db_session, user_id, "jsonl")
+
+    _seed(db_session, user_id, 4_500)
+    large_peak, large_bytes = _export_peak_bytes(db_session, user_id, "jsonl")
+
+    assert large_bytes > 9 * small_bytes
+    # Ten times the history must not cost anywhere near ten times the memory.
+    assert large_peak < 2 * small_peak
+    assert large_peak < large_bytes / 5
+
+
+def test_export_endpoint_streams_attachment(db_session, db_user, client):
+    _seed(db_session, db_user.id, 3)
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_user] = lambda: db_user
+    try:
+        response = client.get("/api/v1/job-applications/export", params={"format": "jsonl"})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["content-disposition"] == 'attachment; filename="job-applications.jsonl"'
+    assert len(response.text.splitlines()) == 3
+
+
+def test_export_endpoint_rejects_unknown_status(db_session, db_user, client):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_user] = lambda: db_user
+    try:
+        response = client.get("/api/v1/job-applications/export", params={"status": "Ghosted"})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,151 @@
+"""Tests for job application filtering and status aggregation."""
+
+from typing import cast
+from uuid import UUID
+
+from fastapi import status
+import pytest
+
+from app.core.database import get_db
+from app.main import app
+from app.models.database.job_application import JobApplication
+from app.services.job_application_service import (
+    get_job_application_status_counts,
+    get_user_job_applications,
+)
+from app.utils.security import get_current_user
+
+
+def _seed(db_session, user_id, rows):
+    for job, company, date, application_status in rows:
+        db_session.add(JobApplication(
+            user_id=user_id,
+            job=job,
+            company=company,
+            date=date,
+            status=application_status,
+            description=f"{job} at {company}",
+            requirements=["Python"],
+        ))
+    db_session.commit()
+
+
+@pytest.fixture
+def seeded_user(db_session, db_user):
+    _seed(db_session, db_user.id, [
+        ("Backend Engineer", "Acme", "2026-01-10", "Applied"),
+        ("Data Engineer", "Acme Labs", "2026-02-01", "Interviewing"),
+        ("Platform Engineer", "Globex", "2026-02-15", "Applied"),
+        ("SRE", "Initech", "2026-03-01", "Rejected"),
+    ])
+    return db_user
+
+
+def test_filters_by_status(db_session, seeded_user):
+    applications, total = get_user_job_applications(
+        db_session, cast(UUID, seeded_user.id), statuses=["Applied"]
+    )
+
+    assert total == 2
+    assert {a.company for a in applications} == {"Acme", "Globex"}
+
+
+def test_filters_by_company_case_insensitive(db_session, seeded_user):
+    applications, total = get_user_job_applications(
+        db_session, cast(UUID, seeded_user.id), company="acme"
+    )
+
+    assert total == 2
+    assert {a.job for a in applications} == {"Backend Engineer", "Data Engineer"}
+
+
+@pytest.mark.parametrize("company", ["_", "%", "Ac_e"])
+def test_company_wildcards_match_literally(db_session, seeded_user, company):
+    _, total = get_user_job_applications(db_session, cast(UUID, seeded_user.id), company=company)
+
+    assert total == 0
+
+
+def test_company_with_wildcard_characters_is_found(db_session, seeded_user):
+    _seed(db_session, seeded_user.id, [("Analyst", "100% Pure_Co", "2026-04-01", "Applied")])
+
+    applications, total = get_user_job_applications(
+        db_session, cast(UUID, seeded_user.id), company="100% pure_"
+    )
+
+    assert total == 1
+    assert applications[0].company == "100% Pure_Co"
+
+
+def test_blank_company_is_ignored(db_session, seeded_user):
+    _, total = get_user_job_applications(db_session, cast(UUID, seeded_user.id), company="   ")
+
+    assert total == 4
+
+
+def test_filters_by_date_range(db_session, seeded_user):
+    applications, total = get_user_job_applications(
+        db_session,
+        cast(UUID, seeded_user.id),
+        date_from="2026-02-01",
+        date_to="2026-02-28",
+    )
+
+    assert total == 2
+    assert [a.date for a in applications] == ["2026-02-15", "2026-02-01"]
+
+
+def test_total_reflects_filters_not_page(db_session, seeded_user):
+    applications, total = get_user_job_applications(
+        db_session, cast(UUID, seeded_user.id), limit=1, statuses=["Applied", "Rejected"]
+    )
+
+    assert len(applications) == 1
+    assert total == 3
+
+
+def test_status_counts_include_every_status(db_session, seeded_user):
+    counts = get_job_application_status_counts(db_session, cast(UUID, seeded_user.id))
+
+    assert counts["Applied"] == 2
+    assert counts["Interviewing"] == 1
+    assert counts["Rejected"] == 1
+    assert counts["Offer"] == 0
+    assert sum(counts.values()) == 4
+
+
+class TestJobApplicationQueryEndpoints:
+    @pytest.fixture(autouse=True)
+    def _override_dependencies(self, db_session, seeded_user):
+        app.dependency_overrides[get_db] = lambda: db_session
+        app.dependency_overrides[get_current_user] = lambda: seeded_user
+        yield
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    def test_stats_endpoint(self, client):
+        response = client.get("/api/v1/job-applications/stats")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 4
+        assert data["counts"]["Applied"] == 2
+
+    def test_list_endpoint_accepts_repeated_status(self, client):
+        response = client.get(
+            "/api/v1/job-applications",
+            params=[("status", "Applied"), ("status", "Interviewing")],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 3
+
+    def test_list_endpoint_rejects_unknown_status(self, client):
+        response = client.get("/api/v1/job-applications", params={"status": "Ghosted"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_endpoint_rejects_malformed_date(self, client):
+        response = client.get("/api/v1/job-applications", params={"date_from": "01/02/2026"})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -1,5 +1,6 @@
 """Tests for job application service requirement generation and merge behavior."""
 
+from types import SimpleNamespace
 from uuid import uuid4
 from unittest.mock import AsyncMock, patch
 from typing import cast
@@ -31,6 +32,13 @@ class _FakeDB:
     def rollback(self) -> None:
         self.rolled_back = True
 
+    def execute(self, statement):
+        # Requirement cache lookups find nothing; cache writes are dropped.
+        return SimpleNamespace(all=lambda: [])
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="sqlite"))
+
 
 @pytest.mark.asyncio
 async def test_create_job_application_skips_ai_when_manual_has_five():
@@ -0,0 +1,95 @@
+"""Tests for full-text search over job applications."""
+
+from typing import cast
+from uuid import UUID
+
+from fastapi import HTTPException, status
+import pytest
+
+from app.core.database import get_db
+from app.main import app
+from app.models.database.job_application import JobApplication
+from app.services.job_search_service import InvertedIndex, search_job_applications, tokenize
+from app.utils.security import get_current_user
+
+
+@pytest.fixture
+def seeded_user(db_session, db_user):
+    rows = [
+        ("Backend Engineer", "Acme", "Build APIs in Python and Go.", ["Python", "PostgreSQL"]),
+        ("Data Engineer", "Globex", "Own Spark pipelines.", ["Spark", "Python"]),
+        ("Frontend Engineer", "Initech", "React and TypeScript UI work.", ["React", "CSS"]),
+        ("Kubernetes Platform Lead", "Hooli", "Operate clusters at scale.", ["Kubernetes", "Terraform"]),
+    ]
+    for job, company, description, requirements in rows:
+        db_session.add(JobApplication(
+            user_id=db_user.id,
+            job=job,
+            company=company,
+            date="2026-03-01",
+            status="Applied",
+            description=description,
+            requirements=requirements,
+        ))
+    db_session.commit()
+    return db_user
+
+
+def test_tokenize_keeps_language_names():
+    assert tokenize("C++ and C# with Node.js") == ["c++", "and", "c#", "with", "node", "js"]
+
+
+def test_inverted_index_requires_every_term():
+    index = InvertedIndex()
+    index.add({"job": "Python developer", "description": "APIs"})
+    index.add({"job": "Go developer", "description": "Python scripting"})
+    index.add({"job": "Designer", "description": "Figma"})
+
+    assert {doc_id for doc_id, _ in index.search("python developer")} == {0, 1}
+    assert index.search("python figma") == []
+
+
+def test_inverted_index_ranks_title_matches_above_description_matches():
+    index = InvertedIndex()
+    index.add({"job": "Analyst", "description": "Some kubernetes exposure"})
+    index.add({"job": "Kubernetes Engineer", "description": "Clusters"})
+
+    ranked = index.search("kubernetes")
+
+    assert [doc_id for doc_id, _ in ranked] == [1, 0]
+    assert ranked[0][1] > ranked[1][1]
+
+
+def test_search_falls_back_to_inverted_index_on_sqlite(db_session, seeded_user):
+    hits = search_job_applications(db_session, cast(UUID, seeded_user.id), "python")
+
+    assert {application.company for application, _ in hits} == {"Acme", "Globex"}
+    assert all(rank > 0 for _, rank in hits)
+
+
+def test_search_matches_requirements(db_session, seeded_user):
+    hits = search_job_applications(db_session, cast(UUID, seeded_user.id), "terraform")
+
+    assert [application.company for application, _ in hits] == ["Hooli"]
+
+
+def test_search_rejects_query_without_words(db_session, seeded_user):
+    with pytest.raises(HTTPException) as error:
+        search_job_applications(db_session, cast(UUID, seeded_user.id), "!!!")
+
+    assert error.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_search_endpoint(db_session, seeded_user, client):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_user] = lambda: seeded_user
+    try:
+        response = client.get("/api/v1/job-applications/search", params={"q": "react"})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["query"] == "react"
+    assert [hit["application"]["company"] for hit in data["results"]] == ["Initech"]
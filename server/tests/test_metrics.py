@@ -0,0 +1,147 @@
+"""Tests for in-process metrics, instrumentation hooks and the /metrics endpoint."""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core import metrics
+from app.core.llm import llm_call
+from app.core.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+    TimedQueuePool,
+    instrument_engine,
+    timed_operation,
+)
+
+
+def test_counter_sums_shards_from_many_threads():
+    counter = Counter("jobs_total", "Jobs.")
+
+    def work():
+        for _ in range(10_000):
+            counter.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.labels().value == 80_000
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value)
+
+    buckets, count, total = histogram.labels().snapshot()
+
+    assert buckets == [(0.1, 1), (1.0, 3), (float("inf"), 4)]
+    assert count == 4
+    assert total == pytest.approx(6.05)
+
+
+def test_labels_must_match_declared_names():
+    histogram = Histogram("latency_seconds", "Latency.", ("route",))
+
+    with pytest.raises(ValueError):
+        histogram.labels(path="/x")
+    with pytest.raises(ValueError):
+        histogram.observe(1.0)
+
+
+def test_render_uses_prometheus_text_format():
+    registry = Registry()
+    requests = registry.register(Histogram("req_seconds", "Request latency.", ("route",), buckets=(0.5,)))
+    in_flight = registry.register(Gauge("in_flight", "In flight."))
+    requests.labels(route='/a"b').observe(0.25)
+    in_flight.inc()
+
+    output = registry.render()
+
+    assert "# TYPE req_seconds histogram" in output
+    assert 'req_seconds_bucket{route="/a\\"b",le="0.5"} 1' in output
+    assert 'req_seconds_bucket{route="/a\\"b",le="+Inf"} 1' in output
+    assert 'req_seconds_count{route="/a\\"b"} 1' in output
+    assert "in_flight 1" in output
+
+
+def test_registry_rejects_duplicate_names():
+    registry = Registry()
+    registry.register(Counter("dup_total", "Dup."))
+
+    with pytest.raises(ValueError):
+        registry.register(Counter("dup_total", "Dup."))
+
+
+@pytest.mark.asyncio
+async def test_timed_operation_records_async_functions():
+    @timed_operation("unit_test_async")
+    async def work():
+        return 42
+
+    assert await work() == 42
+    assert metrics.OPERATION_DURATION.labels(operation="unit_test_async").count == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_call_records_outcome_and_in_flight():
+    success = metrics.LLM_REQUEST_DURATION.labels(operation="unit_test", outcome="success")
+    failure = metrics.LLM_REQUEST_DURATION.labels(operation="unit_test", outcome="error")
+    in_flight = metrics.LLM_REQUESTS_IN_FLIGHT.labels()
+    before = (success.count, failure.count, in_flight.value)
+
+    async with llm_call("unit_test"):
+        assert in_flight.value == before[2] + 1
+
+    with pytest.raises(RuntimeError):
+        async with llm_call("unit_test"):
+            raise RuntimeError("model unavailable")
+
+    assert success.count == before[0] + 1
+    assert failure.count == before[1] + 1
+    assert in_flight.value == before[2]
+
+
+def test_engine_instrumentation_records_queries_and_pool_usage(tmp_path, monkeypatch):
+    monkeypatch.setattr(metrics.DB_POOL_CONNECTIONS, "_function", None)
+    engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}", poolclass=TimedQueuePool, pool_size=2)
+    instrument_engine(engine)
+    selects = metrics.DB_QUERY_DURATION.labels(statement="SELECT")
+    waits_before = metrics.DB_POOL_CHECKOUT_WAIT.labels().count
+    selects_before = selects.count
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        samples = dict((labels["state"], value) for labels, value in metrics.DB_POOL_CONNECTIONS.samples())
+        assert samples["checked_out"] == 1
+
+    assert selects.count == selects_before + 1
+    assert metrics.DB_POOL_CHECKOUT_WAIT.labels().count == waits_before + 1
+    engine.dispose()
+
+
+def test_metrics_endpoint_reports_route_latency(client):
+    client.get("/health")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in response.text
+    assert "llm_requests_in_flight" in response.text
+
+
+def test_unmatched_paths_share_one_label(client):
+    client.get("/definitely/not/a/route/123")
+    client.get("/definitely/not/a/route/456")
+
+    body = client.get("/metrics").text
+
+    assert 'route="unmatched",status="404"' in body
+    assert "/definitely/not/a/route" not in body
@@ -0,0 +1,160 @@
+"""Tests for per-task, per-size model routing and its accounting."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.llm import LLMUnavailableError, llm_breaker, llm_call
+from app.core.model_routing import (
+    ANALYSIS,
+    CLASSIFICATION,
+    GENERATION,
+    ModelOverrideMiddleware,
+    ModelRouter,
+    _model_override,
+    model_router,
+    override_model,
+    parse_prices,
+    parse_routes,
+)
+from app.services.resume_service import validate_job_description
+
+
+@pytest.fixture
+def routed(monkeypatch):
+    monkeypatch.setattr(model_router, "routes", parse_routes(
+        "classification=gemini-2.5-flash-lite;analysis>1000=gemini-2.5-pro"
+    ))
+    model_router.reset_stats()
+    yield model_router
+    model_router.reset_stats()
+
+
+def _response(text: str, prompt_tokens: int, output_tokens: int) -> MagicMock:
+    response = MagicMock()
+    response.text = text
+    response.usage_metadata.prompt_token_count = prompt_tokens
+    response.usage_metadata.candidates_token_count = output_tokens
+    return response
+
+
+def test_parse_routes_sorts_thresholds():
+    routes = parse_routes("analysis>6000=pro; analysis=flash ;analysis>2000=flash-large")
+
+    assert routes == {"analysis": [(0, "flash"), (2000, "flash-large"), (6000, "pro")]}
+
+
+@pytest.mark.parametrize("spec", ["analysis", "translation=flash", "analysis>many=pro", "analysis="])
+def test_parse_routes_rejects_malformed_entries(spec):
+    with pytest.raises(ValueError):
+        parse_routes(spec)
+
+
+def test_parse_prices():
+    assert parse_prices("custom=0.5/1.5") == {"custom": (0.5, 1.5)}
+    with pytest.raises(ValueError):
+        parse_prices("custom=cheap")
+
+
+def test_route_by_task_and_prompt_size():
+    router = ModelRouter("flash", parse_routes("classification=lite;analysis>100=pro;analysis>1000=ultra"))
+
+    assert router.route(CLASSIFICATION, "x" * 10_000).model == "lite"
+    assert router.route(GENERATION, "x" * 10_000).model == "flash"
+    assert router.route(ANALYSIS, "x" * 400).model == "flash"
+
+    large = router.route(ANALYSIS, "x" * 404)
+    assert (large.model, large.tier, large.prompt_tokens) == ("pro", ">100", 101)
+    assert router.route(ANALYSIS, "x" * 8000).model == "ultra"
+
+
+def test_override_wins_over_the_table():
+    router = ModelRouter("flash", parse_routes("classification=lite"))
+
+    with override_model("experimental"):
+        route = router.route(CLASSIFICATION, "text")
+
+    assert (route.model, route.tier) == ("experimental", "override")
+    assert router.route(CLASSIFICATION, "text").model == "lite"
+
+
+@pytest.mark.asyncio
+async def test_llm_call_accounts_usage_and_cost_per_route(routed):
+    route = routed.route(ANALYSIS, "x" * 8000)
+
+    async with llm_call("analyze_resume", route) as call:
+        call.record(_response("{}", prompt_tokens=2000, output_tokens=500))
+    with pytest.raises(RuntimeError):
+        async with llm_call("analyze_resume", route):
+            raise RuntimeError("boom")
+
+    (stats,) = routed.report()["stats"]
+    assert (stats["task"], stats["model"], stats["tier"]) == ("analysis", "gemini-2.5-pro", ">1000")
+    assert stats["calls"] == 2 and stats["failures"] == 1
+    assert (stats["input_tokens"], stats["output_tokens"]) == (2000, 500)
+    assert stats["cost_usd"] == pytest.approx((2000 * 1.25 + 500 * 10.00) / 1_000_000)
+
+
+@pytest.mark.asyncio
+async def test_rejected_calls_are_accounted(routed, monkeypatch):
+    monkeypatch.setattr(llm_breaker, "allow", lambda: False)
+
+    with pytest.raises(LLMUnavailableError):
+        async with llm_call("validate_job_description", routed.route(CLASSIFICATION, "text")):
+            pass
+
+    (stats,) = routed.report()["stats"]
+    assert stats["failures"] == 1 and stats["input_tokens"] == 0
+
+
+@pytest.mark.asyncio
+async def test_validate_job_description_uses_the_classification_route(routed):
+    response = _response(json.dumps({"is_valid": True, "reason": "ok"}), prompt_tokens=80, output_tokens=10)
+
+    with patch(
+        "app.services.resume_service.client.aio.models.generate_content", new_callable=AsyncMock, return_value=response
+    ) as mock_generate:
+        assert await validate_job_description("Backend engineer, Python, 3 years") == (True, "ok")
+
+    assert mock_generate.await_args.kwargs["model"] == "gemini-2.5-flash-lite"
+    assert routed.report()["stats"][0]["model"] == "gemini-2.5-flash-lite"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("enabled, expected", [(True, "experimental"), (False, None)])
+async def test_override_header_is_honoured_only_when_enabled(enabled, expected):
+    seen = []
+
+    async def inner(scope, receive, send):
+        seen.append(_model_override.get())
+
+    middleware = ModelOverrideMiddleware(inner, ModelRouter("flash", override_enabled=enabled))
+    await middleware({"type": "http", "headers": [(b"x-llm-model", b"experimental")]}, None, None)
+
+    assert seen == [expected]
+
+
+def test_debug_report_is_hidden_when_disabled(client, routed, monkeypatch):
+    monkeypatch.setattr(routed, "report_enabled", False)
+    routed.record(routed.route(ANALYSIS, "text"), "success", 0.1)
+
+    assert client.get("/debug/llm-routes").status_code == 404
+    assert client.delete("/debug/llm-routes").status_code == 404
+    assert routed.report()["stats"] != []
+
+
+def test_debug_report_lists_routes(client, routed, monkeypatch):
+    monkeypatch.setattr(routed, "report_enabled", True)
+    response = client.get("/debug/llm-routes")
+
+    assert response.status_code == 200
+    assert response.json()["routes"]["analysis"] == [{"min_tokens": 1000, "model": "gemini-2.5-pro"}]
+
+
+def test_debug_report_resets_on_delete(client, routed, monkeypatch):
+    monkeypatch.setattr(routed, "report_enabled", True)
+    routed.record(routed.route(ANALYSIS, "text"), "success", 0.1)
+
+    assert client.delete("/debug/llm-routes").status_code == 204
+    assert client.get("/debug/llm-routes").json()["stats"] == []
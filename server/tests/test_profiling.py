@@ -0,0 +1,189 @@
+"""Tests for the per-request sampling profiler."""
+
+import asyncio
+import json
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from app.core import profiling
+from app.api.resume import _read_resume_text
+from app.core.profiling import Profiler, ProfilingMiddleware, RequestProfile, span
+from app.services.resume_service import analyze_resume
+
+
+def _busy_work(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _demo_app(profiler: Profiler) -> FastAPI:
+    demo = FastAPI()
+    demo.add_middleware(ProfilingMiddleware, profiler=profiler)
+
+    @demo.get("/reports/{report_id}")
+    async def report(report_id: int):
+        with span("compute"):
+            _busy_work(0.1)
+        with span("wait"):
+            await asyncio.sleep(0.1)
+        return {"id": report_id}
+
+    return demo
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    return Profiler(enabled=True, interval=0.002, output_dir=str(tmp_path), secret="let-me-in")
+
+
+def test_header_triggers_speedscope_profile(profiler, tmp_path):
+    response = TestClient(_demo_app(profiler)).get("/reports/1", headers={"X-Profile": "let-me-in"})
+
+    profile_id = response.headers["X-Profile-Id"]
+    [path] = tmp_path.glob(f"{profile_id}-*.speedscope.json")
+    document = json.loads(path.read_text())
+    names = [frame["name"] for frame in document["shared"]["frames"]]
+    samples = document["profiles"][0]
+
+    assert document["name"] == "GET /reports/{report_id}"
+    assert "[compute]" in names and "[wait]" in names and "<await>" in names
+    assert any(name.startswith("_busy_work (") for name in names)
+    assert len(samples["samples"]) == len(samples["weights"])
+    assert sum(samples["weights"]) > 0.1
+
+
+def test_collapsed_output_attributes_time_to_spans(profiler, tmp_path):
+    profiler.output_format = "collapsed"
+
+    response = TestClient(_demo_app(profiler)).get("/reports/2", headers={"X-Profile": "let-me-in"})
+
+    [path] = tmp_path.glob(f"{response.headers['X-Profile-Id']}-*.collapsed")
+    lines = path.read_text().splitlines()
+    counts = {}
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        root, first = stack.split(";")[:2]
+        assert root == "GET /reports/{report_id}"
+        counts[first] = counts.get(first, 0) + int(count)
+    assert counts["[compute]"] > 10
+    assert any(line.split(" ")[-2].endswith("<await>") for line in lines if "[wait]" in line)
+
+
+def test_requests_are_not_profiled_unless_selected(profiler, tmp_path):
+    client = TestClient(_demo_app(profiler))
+
+    response = client.get("/reports/3")
+
+    assert "X-Profile-Id" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disabled_profiler_ignores_header(profiler, tmp_path):
+    profiler.enabled = False
+
+    response = TestClient(_demo_app(profiler)).get("/reports/4", headers={"X-Profile": "let-me-in"})
+
+    assert "X-Profile-Id" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("value", ["1", "let-me-out"])
+def test_header_needs_the_secret(profiler, tmp_path, value):
+    response = TestClient(_demo_app(profiler)).get("/reports/6", headers={"X-Profile": value})
+
+    assert "X-Profile-Id" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_header_is_ignored_without_a_secret(profiler, tmp_path):
+    profiler.secret = ""
+
+    response = TestClient(_demo_app(profiler)).get("/reports/7", headers={"X-Profile": ""})
+
+    assert "X-Profile-Id" not in response.headers
+
+
+def test_oldest_profiles_are_rotated_out(profiler, tmp_path):
+    profiler.max_files = 2
+    profiler.output_format = "collapsed"
+    unrelated = tmp_path / "notes.txt"
+    unrelated.write_text("keep me")
+    ids = []
+    for number in range(4):
+        profile = RequestProfile(f"p{number}", MagicMock(), None)
+        profile.name = "GET /reports"
+        path = profiler.write(profile)
+        os.utime(path, (number, number))
+        ids.append(profile.id)
+
+    kept = sorted(path.name.split("-")[0] for path in tmp_path.glob("*.collapsed"))
+    assert kept == ids[2:]
+    assert unrelated.exists()
+
+
+def test_sample_rate_selects_requests(profiler, tmp_path):
+    profiler.sample_rate = 1.0
+
+    response = TestClient(_demo_app(profiler)).get("/reports/5")
+
+    assert "X-Profile-Id" in response.headers
+
+
+def test_span_is_a_no_op_without_an_active_profile():
+    with span("anything") as active:
+        assert active._profile is None
+
+
+@pytest.mark.asyncio
+async def test_resume_analysis_tags_its_phases():
+    profile = RequestProfile("test", asyncio.get_running_loop(), asyncio.current_task())
+    seen = {}
+
+    def fake_prompt(resume_text, job_description):
+        seen["prompt"] = list(profile.spans)
+        return "prompt"
+
+    async def fake_generate(**kwargs):
+        seen["llm"] = list(profile.spans)
+        response = MagicMock()
+        response.text = '{"match_score": 80, "summary": "ok", "strengths": [], "gaps": [], "recommendations": []}'
+        return response
+
+    token = profiling._current_profile.set(profile)
+    try:
+        with patch("app.services.resume_service.client") as mock_client:
+            mock_client.aio.models.generate_content = AsyncMock(side_effect=fake_generate)
+            with patch("app.services.resume_service._build_analysis_prompt", side_effect=fake_prompt):
+                result = await analyze_resume(MagicMock(), "Backend engineer", resume_text="Python developer")
+    finally:
+        profiling._current_profile.reset(token)
+
+    assert result.match_score == 80
+    assert seen["prompt"] == ["[prompt_construction]"]
+    assert seen["llm"] == ["[llm_wait]"]
+    assert profile.spans == []
+
+
+@pytest.mark.asyncio
+async def test_uploaded_resume_extraction_is_tagged():
+    profile = RequestProfile("test", asyncio.get_running_loop(), asyncio.current_task())
+    seen = {}
+
+    async def fake_extract(resume):
+        seen["extract"] = list(profile.spans)
+        return "Python developer"
+
+    token = profiling._current_profile.set(profile)
+    try:
+        with patch("app.api.resume.extract_text_from_pdf", side_effect=fake_extract):
+            await _read_resume_text(MagicMock(), None, None, None)
+    finally:
+        profiling._current_profile.reset(token)
+
+    assert seen["extract"] == ["[pdf_extraction]"]
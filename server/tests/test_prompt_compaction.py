@@ -0,0 +1,139 @@
+"""Tests for resume prompt compaction."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pymupdf
+import pytest
+
+from app.core.metrics import PROMPT_COMPACTION_TOKENS
+from app.services.pdf_service import _extract_pages
+from app.services.resume_service import analyze_resume
+from app.utils.prompt_compaction import PAGE_BREAK, TRUNCATION_MARKER, compact_for_prompt, compact_resume_text
+
+
+def _page(body: str, number: int, pages: int) -> str:
+    return f"Jane Doe | jane@example.com\n\n{body}\n\nPage {number} of {pages}"
+
+
+def test_whitespace_and_orphan_bullets_are_collapsed():
+    text = "EXPERIENCE\n\n\n\n    Built    the   API\n•\n   Led a team of four\n▪ Shipped weekly\n"
+
+    compacted = compact_resume_text(text)
+
+    assert compacted.text == "EXPERIENCE\n\nBuilt the API\n- Led a team of four\n- Shipped weekly"
+    assert compacted.tokens < compacted.original_tokens
+    assert compacted.truncated is False
+
+
+def test_page_numbers_and_boilerplate_are_dropped():
+    text = "SKILLS\nPython\n- 2 -\nReferences available upon request"
+
+    assert compact_resume_text(text).text == "SKILLS\nPython"
+
+
+def test_standalone_dates_are_kept():
+    body = "\n".join(["Acme Corp", "06/2020", "2019", "Built APIs", "Ran on-call", "Globex", "2014", "03/2012"])
+    pages = [body, "EDUCATION\n2010\nState University\n06/2009"]
+
+    text = compact_resume_text(PAGE_BREAK.join(pages)).text
+
+    for date in ("06/2020", "2019", "2014", "03/2012", "2010", "06/2009"):
+        assert date in text.splitlines()
+
+
+def test_repeated_header_is_kept_once_and_footers_dropped():
+    pages = [_page("SUMMARY\nBackend engineer", 1, 3), _page("Built APIs", 2, 3), _page("Ran on-call", 3, 3)]
+
+    text = compact_resume_text(PAGE_BREAK.join(pages)).text
+
+    assert text.count("Jane Doe | jane@example.com") == 1
+    assert text.startswith("Jane Doe | jane@example.com")
+    assert "Page" not in text
+    assert "Built APIs" in text and "Ran on-call" in text
+
+
+def test_body_lines_outside_the_page_edges_are_kept():
+    body = "\n".join(["SKILLS", "Python", "Go", "Rust", "Jane Doe | jane@example.com", "SQL", "Docker", "AWS"])
+    pages = [_page(body, 1, 2), _page("Built APIs", 2, 2)]
+
+    text = compact_resume_text(PAGE_BREAK.join(pages)).text
+
+    assert text.count("Jane Doe | jane@example.com") == 2
+
+
+def test_budget_trims_every_section_and_keeps_headings():
+    sections = ["SUMMARY", "EXPERIENCE", "EDUCATION"]
+    text = "\n".join(
+        heading + "\n" + "\n".join(f"- {heading.lower()} detail line {n}" for n in range(40))
+        for heading in sections
+    )
+
+    compacted = compact_resume_text(text, token_budget=100)
+
+    assert compacted.truncated is True
+    assert compacted.tokens <= 100
+    lines = compacted.text.splitlines()
+    assert all(heading in lines for heading in sections)
+    assert lines.count(TRUNCATION_MARKER) == 3
+    assert "- education detail line 0" in lines
+
+
+def test_compaction_is_idempotent():
+    text = PAGE_BREAK.join(_page("SUMMARY\n•\nBackend   engineer\n" + "x " * 400, n, 2) for n in (1, 2))
+    once = compact_resume_text(text, token_budget=150)
+
+    twice = compact_resume_text(once.text, token_budget=150)
+
+    assert twice.text == once.text
+    assert twice.truncated is False
+
+
+def test_extracted_pages_are_separated_by_a_form_feed():
+    document = pymupdf.open()
+    for number in range(2):
+        document.new_page().insert_text((72, 72), f"page {number + 1}")
+    text, page_count = _extract_pages(document.tobytes())
+    document.close()
+
+    assert page_count == 2
+    assert text.count(PAGE_BREAK) == 1
+
+
+@pytest.mark.asyncio
+async def test_analyze_resume_compacts_an_upload_once(sample_job_description):
+    response = MagicMock()
+    response.text = json.dumps(
+        {"match_score": 80, "summary": "Good fit", "strengths": [], "gaps": [], "recommendations": []}
+    )
+    raw = "SKILLS\n\n\n•\n   Python     and   SQL\nPage 1 of 1"
+    before = PROMPT_COMPACTION_TOKENS.labels(stage="input").value
+
+    with patch("app.services.resume_service.extract_text_from_pdf", new_callable=AsyncMock, return_value=raw), \
+            patch(
+                "app.services.resume_service.client.aio.models.generate_content",
+                new_callable=AsyncMock,
+                return_value=response,
+            ) as mock_generate:
+        await analyze_resume(MagicMock(), sample_job_description)
+
+    prompt = mock_generate.await_args.kwargs["contents"]
+    assert "RESUME:\nSKILLS\n\n- Python and SQL\n\nJOB DESCRIPTION:" in prompt
+    assert PROMPT_COMPACTION_TOKENS.labels(stage="input").value - before == compact_resume_text(raw).original_tokens
+
+
+@pytest.mark.asyncio
+async def test_compacted_text_is_not_compacted_again(sample_job_description):
+    response = MagicMock()
+    response.text = json.dumps(
+        {"match_score": 80, "summary": "Good fit", "strengths": [], "gaps": [], "recommendations": []}
+    )
+    resume_text = compact_for_prompt("SKILLS\n   Python     and   SQL")
+    before = PROMPT_COMPACTION_TOKENS.labels(stage="input").value
+
+    with patch(
+        "app.services.resume_service.client.aio.models.generate_content", new_callable=AsyncMock, return_value=response
+    ):
+        await analyze_resume(None, sample_job_description, resume_text=resume_text)
+
+    assert PROMPT_COMPACTION_TOKENS.labels(stage="input").value == before
@@ -0,0 +1,196 @@
+"""Tests for the token-bucket LLM quota."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from fastapi import status
+import pytest
+
+from app.core import quota
+from app.core.quota import (
+    InMemoryTokenBucketStore,
+    SQLTokenBucketStore,
+    TokenBucketQuota,
+    estimate_tokens,
+)
+from app.main import app
+from app.models.cover_letter import CoverLetterDocument
+from app.utils.security import get_current_user
+
+
+class _Clock:
+    def __init__(self, start: float = 1_000_000.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(quota.time, "monotonic", clock)
+    monkeypatch.setattr(quota.time, "time", clock)
+    return clock
+
+
+def test_estimate_tokens_scales_with_length():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+    assert estimate_tokens("x" * 4000) == 1000
+
+
+def test_bucket_admits_until_budget_is_spent(clock):
+    bucket = TokenBucketQuota(InMemoryTokenBucketStore(), capacity=1000, refill_per_second=10)
+
+    first = bucket.consume("user:1", 600)
+    second = bucket.consume("user:1", 600)
+
+    assert first.allowed and first.remaining == 400
+    assert not second.allowed
+    assert second.retry_after == pytest.approx(20.0)
+    assert second.headers()["Retry-After"] == "20"
+
+
+def test_bucket_refills_over_time(clock):
+    bucket = TokenBucketQuota(InMemoryTokenBucketStore(), capacity=1000, refill_per_second=10)
+    bucket.consume("user:1", 1000)
+
+    clock.now += 30
+
+    decision = bucket.consume("user:1", 250)
+    assert decision.allowed
+    assert decision.remaining == 50
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = TokenBucketQuota(InMemoryTokenBucketStore(), capacity=1000, refill_per_second=10)
+    bucket.consume("user:1", 100)
+
+    clock.now += 3600
+
+    assert bucket.consume("user:1", 0).remaining == 1000
+
+
+def test_refilled_buckets_are_dropped(clock):
+    store = InMemoryTokenBucketStore(sweep_interval=60)
+    bucket = TokenBucketQuota(store, capacity=1000, refill_per_second=10)
+    for user in range(100):
+        bucket.consume(f"user:{user}", 100)
+    bucket.consume("user:heavy", 1000)
+
+    clock.now += 60
+    bucket.consume("user:new", 0)
+
+    # Refilled in 10 s; the heavy user needs 100 s and keeps its bucket.
+    assert set(store._buckets) == {"user:heavy", "user:new"}
+    assert bucket.consume("user:0", 0).remaining == 1000
+    assert bucket.consume("user:heavy", 0).remaining == 600
+
+
+def test_small_requests_are_not_starved_by_large_ones(clock):
+    bucket = TokenBucketQuota(InMemoryTokenBucketStore(), capacity=1000, refill_per_second=10)
+
+    assert bucket.consume("user:1", 900).allowed
+    assert not bucket.consume("user:1", 500).allowed
+    assert bucket.consume("user:1", 100).allowed
+
+
+def test_keys_have_independent_budgets(clock):
+    bucket = TokenBucketQuota(InMemoryTokenBucketStore(), capacity=1000, refill_per_second=10)
+    bucket.consume("user:1", 1000)
+
+    assert bucket.consume("user:2", 1000).allowed
+
+
+def test_request_larger_than_capacity_is_never_admitted(clock):
+    bucket = TokenBucketQuota(InMemoryTokenBucketStore(), capacity=1000, refill_per_second=10)
+
+    decision = bucket.consume("user:1", 1001)
+
+    assert not decision.allowed
+    assert decision.retry_after is None
+
+
+def test_sql_store_shares_budget_between_workers(tmp_path, clock):
+    uri = f"sql+sqlite:///{tmp_path / 'quota.db'}"
+    first_worker = TokenBucketQuota(SQLTokenBucketStore(uri), capacity=1000, refill_per_second=10)
+    second_worker = TokenBucketQuota(SQLTokenBucketStore(uri), capacity=1000, refill_per_second=10)
+
+    assert first_worker.consume("user:1", 700).allowed
+    denied = second_worker.consume("user:1", 700)
+    assert not denied.allowed
+    assert denied.remaining == 300
+
+    clock.now += 40
+    assert second_worker.consume("user:1", 700).allowed
+
+
+class TestQuotaOnEndpoints:
+    @pytest.fixture(autouse=True)
+    def _override_current_user(self):
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(
+            first_name="John",
+            last_name="Doe",
+        )
+        yield
+        app.dependency_overrides.pop(get_current_user, None)
+
+    @pytest.fixture
+    def small_quota(self, monkeypatch, clock):
+        bucket = TokenBucketQuota(InMemoryTokenBucketStore(), capacity=300, refill_per_second=1)
+        monkeypatch.setattr(quota, "llm_quota", bucket)
+        return bucket
+
+    @staticmethod
+    def _payload():
+        return {
+            "jobTitle": "Software Engineer",
+            "hiringManagerName": "",
+            "email": "candidate@example.com",
+            "phone": "+1-555-000-0000",
+            "requirements": ["Python", "FastAPI", "SQL"],
+            "company": "Acme",
+        }
+
+    @staticmethod
+    def _document():
+        return CoverLetterDocument(
+            id="doc-123",
+            job_title="Software Engineer",
+            hiring_manager_name="Hiring Team",
+            email="candidate@example.com",
+            phone="+1-555-000-0000",
+            company="Acme",
+            requirements=["Python", "FastAPI", "SQL"],
+            cover_letter="Dear Hiring Team,\n\nI am excited to apply.",
+            created_at=datetime.now(timezone.utc),
+        )
+
+    @patch("app.api.cover_letter.generate_cover_letter", new_callable=AsyncMock)
+    @patch("app.api.cover_letter.get_cover_letter_store")
+    def test_generate_reports_remaining_budget(self, mock_get_store, mock_generate, client, small_quota):
+        mock_generate.return_value = self._document()
+
+        response = client.post("/api/v1/cover-letter/generate", json=self._payload())
+
+        assert response.status_code == status.HTTP_200_OK
+        cost = int(response.headers["X-Quota-Cost"])
+        assert cost > quota.COVER_LETTER_PROMPT_TOKENS
+        assert response.headers["X-Quota-Limit"] == "300"
+        assert int(response.headers["X-Quota-Remaining"]) == 300 - cost
+
+    @patch("app.api.cover_letter.generate_cover_letter", new_callable=AsyncMock)
+    @patch("app.api.cover_letter.get_cover_letter_store")
+    def test_generate_returns_429_when_budget_exhausted(self, mock_get_store, mock_generate, client, small_quota):
+        mock_generate.return_value = self._document()
+
+        first = client.post("/api/v1/cover-letter/generate", json=self._payload())
+        second = client.post("/api/v1/cover-letter/generate", json=self._payload())
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(second.headers["Retry-After"]) > 0
+        assert mock_generate.await_count == 1
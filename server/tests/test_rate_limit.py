@@ -0,0 +1,90 @@
+"""Tests for the shared rate limit storage and request key function."""
+
+from types import SimpleNamespace
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import SlidingWindowCounterRateLimiter
+import pytest
+
+from app.core import rate_limit_storage
+from app.core.rate_limit import get_rate_limit_key
+from app.core.rate_limit_storage import SQLStorage
+from app.utils.security import create_access_token
+
+
+@pytest.fixture
+def storage_uri(tmp_path):
+    return f"sql+sqlite:///{tmp_path / 'limits.db'}"
+
+
+def _request(headers: dict[str, str]):
+    return SimpleNamespace(headers=headers, client=SimpleNamespace(host="10.0.0.7"))
+
+
+def test_storage_registers_sql_scheme(storage_uri):
+    assert isinstance(storage_from_string(storage_uri), SQLStorage)
+
+
+def test_counters_are_shared_between_workers(storage_uri):
+    first_worker = storage_from_string(storage_uri)
+    second_worker = storage_from_string(storage_uri)
+
+    assert first_worker.incr("key", expiry=60) == 1
+    assert second_worker.incr("key", expiry=60) == 2
+    assert first_worker.get("key") == 2
+
+
+def test_expired_counter_restarts(storage_uri, monkeypatch):
+    storage = storage_from_string(storage_uri)
+    now = 1_000_000.0
+    monkeypatch.setattr(rate_limit_storage.time, "time", lambda: now)
+    storage.incr("key", expiry=10, amount=3)
+
+    now += 11
+    assert storage.get("key") == 0
+    assert storage.incr("key", expiry=10) == 1
+
+
+def test_decr_never_goes_below_zero(storage_uri):
+    storage = storage_from_string(storage_uri)
+    storage.incr("key", expiry=60)
+
+    assert storage.decr("key", amount=5) == 0
+
+
+def test_sliding_window_limit_enforced_across_workers(storage_uri):
+    limit = parse("5/hour")
+    workers = [
+        SlidingWindowCounterRateLimiter(storage_from_string(storage_uri))
+        for _ in range(3)
+    ]
+
+    allowed = sum(workers[index % 3].hit(limit, "ip:1.2.3.4") for index in range(12))
+
+    assert allowed == 5
+    assert workers[0].hit(limit, "ip:5.6.7.8") is True
+
+
+def test_clear_sliding_window(storage_uri):
+    storage = storage_from_string(storage_uri)
+    limiter = SlidingWindowCounterRateLimiter(storage)
+    limit = parse("1/minute")
+
+    assert limiter.hit(limit, "key") is True
+    assert limiter.hit(limit, "key") is False
+    limiter.clear(limit, "key")
+    assert limiter.hit(limit, "key") is True
+
+
+def test_key_uses_user_id_for_valid_token():
+    token = create_access_token({"sub": "user-123"})
+
+    key = get_rate_limit_key(_request({"authorization": f"Bearer {token}"}))  # type: ignore[arg-type]
+
+    assert key == "user:user-123"
+
+
+def test_key_falls_back_to_ip_for_invalid_or_missing_token():
+    assert get_rate_limit_key(_request({"authorization": "Bearer not-a-jwt"})) == "ip:10.0.0.7"  # type: ignore[arg-type]
+    assert get_rate_limit_key(_request({})) == "ip:10.0.0.7"  # type: ignore[arg-type]
@@ -0,0 +1,183 @@
+"""Tests for the readiness probe, LLM circuit breaker and event-loop lag monitor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from app.core import llm
+from app.core.llm import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, LLMUnavailableError, llm_call
+from app.core.loop_monitor import EventLoopLagMonitor
+from app.core.readiness import ReadinessProbe, readiness_probe
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ready.db'}", poolclass=QueuePool, pool_size=2, max_overflow=0)
+    yield engine
+    engine.dispose()
+
+
+def _probe(engine, **kwargs) -> ReadinessProbe:
+    kwargs.setdefault("breaker", CircuitBreaker(failure_threshold=2, reset_timeout=60))
+    kwargs.setdefault("loop_monitor", EventLoopLagMonitor())
+    kwargs.setdefault("pool_max_overflow", 0)
+    return ReadinessProbe(engine=engine, **kwargs)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED
+
+    def test_half_open_allows_a_single_trial(self, monkeypatch):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+        breaker.record_failure()
+        now = time.monotonic()
+        monkeypatch.setattr(llm.time, "monotonic", lambda: now + 11)
+
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_llm_call_rejects_while_open(self, monkeypatch):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        monkeypatch.setattr(llm, "llm_breaker", breaker)
+
+        with pytest.raises(ValueError):
+            async with llm_call("unit_test"):
+                raise ValueError("bad response")
+
+        with pytest.raises(LLMUnavailableError):
+            async with llm_call("unit_test"):
+                pytest.fail("the model must not be called while the circuit is open")
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_measures_blocking_callbacks():
+    monitor = EventLoopLagMonitor(interval=0.01)
+    await monitor.start()
+    await asyncio.sleep(0.02)
+    time.sleep(0.1)  # block the loop
+    await asyncio.sleep(0.03)
+    await monitor.stop()
+
+    assert monitor.max_recent_lag is not None
+    assert monitor.max_recent_lag >= 0.05
+    assert not monitor.running
+
+
+class TestReadinessProbe:
+    @pytest.mark.asyncio
+    async def test_ready_when_all_dependencies_are_healthy(self, sqlite_engine):
+        result = await _probe(sqlite_engine).check()
+
+        assert result.status == "ready"
+        assert set(result.checks) == {"database", "database_pool", "llm", "event_loop"}
+        assert result.checks["database"].latency_ms is not None
+        assert result.checks["database_pool"].detail == "0/2 connections in use."
+
+    @pytest.mark.asyncio
+    async def test_not_ready_when_pool_is_saturated(self, sqlite_engine):
+        probe = _probe(sqlite_engine, pool_saturation_limit=0.5)
+
+        with sqlite_engine.connect():
+            result = await probe.check()
+
+        assert result.status == "not_ready"
+        assert result.checks["database_pool"].status == "fail"
+
+    @pytest.mark.asyncio
+    async def test_database_check_is_bounded_by_timeout(self, sqlite_engine, monkeypatch):
+        probe = _probe(sqlite_engine, db_timeout=0.05)
+        monkeypatch.setattr(probe, "_ping_database", lambda: time.sleep(0.5))
+
+        start = time.perf_counter()
+        result = await probe.check()
+
+        assert time.perf_counter() - start < 0.4
+        assert result.checks["database"].status == "fail"
+
+    @pytest.mark.asyncio
+    async def test_hung_database_holds_one_thread_and_later_probes_fail_fast(self, sqlite_engine, monkeypatch):
+        probe = _probe(sqlite_engine, db_timeout=0.05, cache_seconds=0)
+        release = threading.Event()
+        calls = []
+
+        def hang():
+            calls.append(threading.current_thread().name)
+            release.wait(5)
+
+        monkeypatch.setattr(probe, "_ping_database", hang)
+        try:
+            first = await probe.check()
+            start = time.perf_counter()
+            second = await probe.check()
+            elapsed = time.perf_counter() - start
+        finally:
+            release.set()
+
+        assert first.checks["database"].status == second.checks["database"].status == "fail"
+        assert elapsed < 0.05
+        assert len(calls) == 1 and calls[0].startswith("readiness-db")
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_and_loop_lag_fail_the_probe(self, sqlite_engine):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        breaker.record_failure()
+        monitor = EventLoopLagMonitor()
+        monitor.record(2.0)
+
+        result = await _probe(sqlite_engine, breaker=breaker, loop_monitor=monitor).check()
+
+        assert result.checks["llm"].status == "fail"
+        assert result.checks["event_loop"].status == "fail"
+
+    @pytest.mark.asyncio
+    async def test_result_is_cached(self, sqlite_engine, monkeypatch):
+        probe = _probe(sqlite_engine, cache_seconds=60)
+        calls = []
+        monkeypatch.setattr(probe, "_ping_database", lambda: calls.append(1))
+
+        results = await asyncio.gather(*(probe.check() for _ in range(5)))
+        await probe.check()
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+
+def test_ready_endpoint_returns_503_when_not_ready(client, sqlite_engine, monkeypatch):
+    monkeypatch.setattr(readiness_probe, "engine", sqlite_engine)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    monkeypatch.setattr(readiness_probe, "breaker", breaker)
+
+    assert client.get("/ready").status_code == 200
+
+    breaker.record_failure()
+    readiness_probe.invalidate()
+    response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["checks"]["llm"]["status"] == "fail"
+    readiness_probe.invalidate()
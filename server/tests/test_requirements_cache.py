@@ -0,0 +1,166 @@
+"""Tests for the per-description requirements cache."""
+
+from typing import cast
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.database.job_application import JobApplication
+from app.models.database.requirement_cache import RequirementCacheEntry
+from app.models.database.user import User
+from app.models.job_application import JobApplicationCreate
+from app.services.job_application_service import (
+    bulk_create_job_applications,
+    create_job_application,
+    enrich_job_application_requirements,
+)
+from app.services.requirements_cache import (
+    RequirementsLRU,
+    clear_memory_cache,
+    description_hash,
+    get_cached_requirements,
+    store_requirements,
+)
+from app.utils.sanitization import preflight
+
+
+DESCRIPTION = "Backend engineer.\nPython, FastAPI and PostgreSQL."
+
+
+def _application(description: str = DESCRIPTION, requirements: list[str] | None = None) -> JobApplicationCreate:
+    return JobApplicationCreate(
+        job="Backend Engineer",
+        company="Acme",
+        date="2026-03-28",
+        status="Applied",
+        description=description,
+        requirements=requirements or [],
+    )
+
+
+@pytest.fixture
+def other_user(db_session):
+    user = User(email="sam@example.com", first_name="Sam", last_name="Roe", hashed_password="x", is_active=True)
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def mock_generate():
+    with patch(
+        "app.services.job_application_service.generate_job_requirements_from_description",
+        new_callable=AsyncMock,
+    ) as mock:
+        mock.return_value.requirements = ["Python", "FastAPI", "PostgreSQL"]
+        yield mock
+
+
+def test_description_hash_ignores_whitespace_only():
+    assert description_hash("Python  developer\n") == description_hash("Python developer")
+    assert description_hash("Python developer") != description_hash("python developer")
+    assert description_hash("Python  developer\r\n") == preflight("Python developer").digest
+
+
+@pytest.mark.asyncio
+async def test_known_posting_is_created_without_a_model_call(db_session, db_user, other_user, mock_generate):
+    first = await create_job_application(cast(Session, db_session), cast(UUID, db_user.id), _application())
+    clear_memory_cache()
+    second = await create_job_application(
+        cast(Session, db_session),
+        cast(UUID, other_user.id),
+        _application("Backend engineer.\n  Python, FastAPI and   PostgreSQL.", ["Docker"]),
+    )
+
+    assert mock_generate.await_count == 1
+    assert cast(list[str], first.requirements) == ["Python", "FastAPI", "PostgreSQL"]
+    assert cast(list[str], second.requirements) == ["Docker", "Python", "FastAPI", "PostgreSQL"]
+    assert second.enrichment_status == "complete"
+    assert db_session.query(RequirementCacheEntry).count() == 1
+
+
+@pytest.mark.asyncio
+async def test_deferred_create_uses_cached_requirements(db_session, db_user, mock_generate):
+    store_requirements(db_session, DESCRIPTION, 5, ["Python", "SQL"])
+    db_session.commit()
+
+    with patch("app.services.job_application_service.schedule_requirement_enrichment") as mock_schedule:
+        created = await create_job_application(
+            cast(Session, db_session), cast(UUID, db_user.id), _application(), defer_enrichment=True
+        )
+
+    assert mock_generate.await_count == 0
+    mock_schedule.assert_not_called()
+    assert created.enrichment_status == "complete"
+    assert cast(list[str], created.requirements) == ["Python", "SQL"]
+
+
+def test_bulk_create_fills_known_postings_and_defers_the_rest(db_session, db_user):
+    store_requirements(db_session, DESCRIPTION, 5, ["Python", "SQL"])
+    db_session.commit()
+    clear_memory_cache()
+
+    with patch("app.services.job_application_service.schedule_requirement_enrichment") as mock_schedule:
+        known, unknown = bulk_create_job_applications(
+            db_session,
+            cast(UUID, db_user.id),
+            [_application(requirements=["Go"]), _application("Frontend role.")],
+        )
+
+    assert known.enrichment_status == "complete"
+    assert cast(list[str], known.requirements) == ["Go", "Python", "SQL"]
+    assert unknown.enrichment_status == "pending"
+    mock_schedule.assert_called_once_with([unknown.id])
+
+
+@pytest.mark.asyncio
+async def test_enrichment_stores_and_reuses_requirements(db_session, db_user, mock_generate):
+    with patch("app.services.job_application_service.schedule_requirement_enrichment"):
+        created = bulk_create_job_applications(
+            db_session, cast(UUID, db_user.id), [_application(), _application()]
+        )
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    await enrich_job_application_requirements([created[0].id, created[1].id], session_factory=factory)
+
+    db_session.expire_all()
+    assert mock_generate.await_count == 1
+    assert [db_session.get(JobApplication, item.id).enrichment_status for item in created] == ["complete"] * 2
+    assert get_cached_requirements(db_session, DESCRIPTION, 5) == ["Python", "FastAPI", "PostgreSQL"]
+
+
+def test_cache_is_keyed_by_max_requirements(db_session):
+    store_requirements(db_session, DESCRIPTION, 3, ["Python"])
+    db_session.commit()
+
+    assert get_cached_requirements(db_session, DESCRIPTION, 3) == ["Python"]
+    assert get_cached_requirements(db_session, DESCRIPTION, 5) is None
+
+
+def test_empty_requirements_are_not_cached(db_session):
+    store_requirements(db_session, DESCRIPTION, 5, [])
+    db_session.commit()
+
+    assert get_cached_requirements(db_session, DESCRIPTION, 5) is None
+
+
+def test_lru_evicts_least_recently_used():
+    lru = RequirementsLRU(capacity=2)
+    lru.put(("a", 5), ["A"])
+    lru.put(("b", 5), ["B"])
+    assert lru.get(("a", 5)) == ["A"]
+    lru.put(("c", 5), ["C"])
+
+    assert lru.get(("b", 5)) is None
+    assert lru.get(("a", 5)) == ["A"]
+    assert len(lru) == 2
+
+
+def test_memory_hit_skips_the_database(db_session, monkeypatch):
+    store_requirements(db_session, DESCRIPTION, 5, ["Python"])
+    db_session.commit()
+    monkeypatch.setattr(db_session, "execute", None)
+
+    assert get_cached_requirements(db_session, DESCRIPTION, 5) == ["Python"]
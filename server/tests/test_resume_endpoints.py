@@ -6,6 +6,18 @@ from fastapi import status
 from unittest.mock import AsyncMock, patch, MagicMock
 from io import BytesIO
 
+import pymupdf
+
+from app.core.llm import llm_breaker
+
+
+def _pdf(text: str) -> bytes:
+    document = pymupdf.open()
+    document.new_page().insert_text((72, 72), text)
+    content = document.tobytes()
+    document.close()
+    return content
+
 
 class TestResumeAnalyzeEndpoint:
     """Test cases for resume analysis endpoint"""
@@ -153,3 +165,18 @@ class TestResumeAnalyzeEndpoint:
         )
         
         assert response.status_code == status.HTTP_200_OK
+    
+    @patch('app.api.resume.validate_job_description', new_callable=AsyncMock, return_value=(True, "ok"))
+    def test_analyze_endpoint_returns_503_while_llm_unavailable(self, mock_validate, client, sample_job_description):
+        """Test the real service's breaker rejection becomes 503, not a zero-score result"""
+        for _ in range(llm_breaker.failure_threshold):
+            llm_breaker.record_failure()
+        
+        response = client.post(
+            "/api/v1/resume/analyze",
+            files={"resume": ("resume.pdf", BytesIO(_pdf("Jane Doe - Python developer")), "application/pdf")},
+            data={"job_description": sample_job_description}
+        )
+        
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert "temporarily unavailable" in response.json()["detail"]
@@ -0,0 +1,188 @@
+"""Tests for the per-user resume library."""
+
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from fastapi import HTTPException, status
+import pymupdf
+import pytest
+
+from app.core.database import get_db
+from app.main import app
+from app.models.cover_letter import CoverLetterDocument
+from app.models.database.user import User
+from app.models.resume import ResumeAnalysisResponse
+from app.services import resume_library_service
+from app.utils.security import get_current_user, get_optional_current_user
+
+
+def _pdf(text: str, pages: int = 1) -> bytes:
+    document = pymupdf.open()
+    for page_number in range(pages):
+        document.new_page().insert_text((72, 72), f"{text} page {page_number + 1}")
+    content = document.tobytes()
+    document.close()
+    return content
+
+
+@pytest.fixture
+def as_user(db_session, db_user):
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_user] = lambda: db_user
+    app.dependency_overrides[get_optional_current_user] = lambda: db_user
+    yield db_user
+    for dependency in (get_db, get_current_user, get_optional_current_user):
+        app.dependency_overrides.pop(dependency, None)
+
+
+@pytest.fixture
+def other_user(db_session):
+    user = User(email="eve@example.com", first_name="Eve", last_name="Smith", hashed_password="x", is_active=True)
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def _upload(client, content: bytes, filename: str = "resume.pdf"):
+    return client.post("/api/v1/resumes", files={"resume": (filename, content, "application/pdf")})
+
+
+def test_same_file_is_stored_once(client, as_user):
+    content = _pdf("Jane Doe Python developer", pages=2)
+    extract = AsyncMock(wraps=resume_library_service.extract_pdf_content)
+
+    with patch("app.services.resume_library_service.extract_pdf_content", extract):
+        first = _upload(client, content)
+        second = _upload(client, content, filename="copy.pdf")
+
+    assert first.status_code == status.HTTP_201_CREATED
+    assert second.status_code == status.HTTP_200_OK
+    assert second.json()["id"] == first.json()["id"]
+    assert second.json()["filename"] == "resume.pdf"
+    assert first.json()["page_count"] == 2
+    assert first.json()["digest"] == resume_library_service.resume_digest(content)
+    extract.assert_awaited_once()
+    assert len(client.get("/api/v1/resumes").json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_libraries_are_per_user(db_session, db_user, other_user):
+    content = _pdf("Jane Doe")
+
+    mine, _ = await resume_library_service.store_resume(db_session, db_user.id, "resume.pdf", content)
+    theirs, created = await resume_library_service.store_resume(db_session, other_user.id, "resume.pdf", content)
+
+    assert created is True
+    assert theirs.id != mine.id
+    with pytest.raises(HTTPException) as excinfo:
+        resume_library_service.get_resume(db_session, other_user.id, mine.id)
+    assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_unreadable_pdf_is_rejected(client, as_user):
+    response = _upload(client, b"not a pdf")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert client.get("/api/v1/resumes").json() == []
+
+
+def test_get_and_delete(client, as_user):
+    resume_id = _upload(client, _pdf("Jane Doe")).json()["id"]
+
+    assert client.get(f"/api/v1/resumes/{resume_id}").status_code == status.HTTP_200_OK
+    assert client.delete(f"/api/v1/resumes/{resume_id}").status_code == status.HTTP_204_NO_CONTENT
+    assert client.get(f"/api/v1/resumes/{resume_id}").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_analyze_reads_a_stored_resume(client, as_user, sample_job_description):
+    resume_id = _upload(client, _pdf("Jane Doe Python developer")).json()["id"]
+    result = ResumeAnalysisResponse(match_score=80, summary="Good fit", strengths=[], gaps=[], recommendations=[])
+
+    with patch("app.api.resume.validate_job_description", new_callable=AsyncMock, return_value=(True, "ok")), patch(
+        "app.api.resume.analyze_resume", new_callable=AsyncMock, return_value=result
+    ) as mock_analyze, patch("app.api.resume.extract_text_from_pdf", new_callable=AsyncMock) as mock_extract:
+        response = client.post(
+            "/api/v1/resume/analyze",
+            data={"job_description": sample_job_description, "resume_id": resume_id},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    mock_extract.assert_not_called()
+    assert "Jane Doe Python developer page 1" in mock_analyze.await_args.kwargs["resume_text"]
+
+
+@pytest.mark.no_blocking
+def test_library_queries_do_not_block_the_event_loop(client, as_user, db_session, sample_job_description):
+    query = db_session.query
+
+    def slow_query(*entities, **kwargs):
+        time.sleep(0.1)
+        return query(*entities, **kwargs)
+
+    result = ResumeAnalysisResponse(match_score=80, summary="Good fit", strengths=[], gaps=[], recommendations=[])
+    with patch.object(db_session, "query", slow_query), patch(
+        "app.api.resume.validate_job_description", new_callable=AsyncMock, return_value=(True, "ok")
+    ), patch("app.api.resume.analyze_resume", new_callable=AsyncMock, return_value=result):
+        resume_id = _upload(client, _pdf("Jane Doe")).json()["id"]
+        assert len(client.get("/api/v1/resumes").json()) == 1
+        assert client.get(f"/api/v1/resumes/{resume_id}").status_code == status.HTTP_200_OK
+        analysis = client.post(
+            "/api/v1/resume/analyze",
+            data={"job_description": sample_job_description, "resume_id": resume_id},
+        )
+        assert analysis.status_code == status.HTTP_200_OK
+        assert client.delete(f"/api/v1/resumes/{resume_id}").status_code == status.HTTP_204_NO_CONTENT
+
+
+def test_analyze_with_resume_id_requires_sign_in(client, sample_job_description):
+    response = client.post(
+        "/api/v1/resume/analyze",
+        data={"job_description": sample_job_description, "resume_id": str(uuid4())},
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_analyze_rejects_both_a_file_and_a_resume_id(client, as_user, sample_job_description):
+    response = client.post(
+        "/api/v1/resume/analyze",
+        files={"resume": ("resume.pdf", _pdf("Jane Doe"), "application/pdf")},
+        data={"job_description": sample_job_description, "resume_id": str(uuid4())},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_cover_letter_uses_a_stored_resume(client, as_user):
+    resume_id = _upload(client, _pdf("Jane Doe Python developer")).json()["id"]
+    document = CoverLetterDocument(
+        id="doc-123",
+        job_title="Software Engineer",
+        hiring_manager_name="Hiring Team",
+        email="jane@example.com",
+        phone="+1-555-000-0000",
+        company="Acme",
+        requirements=["Python", "FastAPI", "SQL"],
+        cover_letter="Dear Hiring Team,",
+        created_at=datetime.now(timezone.utc),
+    )
+
+    with patch(
+        "app.api.cover_letter.generate_cover_letter", new_callable=AsyncMock, return_value=document
+    ) as mock_generate, patch("app.api.cover_letter.get_cover_letter_store"):
+        response = client.post(
+            "/api/v1/cover-letter/generate",
+            json={
+                "jobTitle": "Software Engineer",
+                "email": "jane@example.com",
+                "phone": "+1-555-000-0000",
+                "requirements": ["Python", "FastAPI", "SQL"],
+                "company": "Acme",
+                "resumeId": resume_id,
+            },
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "Jane Doe Python developer" in mock_generate.await_args.kwargs["resume_text"]
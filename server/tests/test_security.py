@@ -0,0 +1,28 @@
+"""Tests for bearer-token authentication of the current user."""
+
+from fastapi import status
+
+from app.core.database import get_db
+from app.main import app
+from app.utils.security import create_access_token
+
+
+def _me(client, db_session, token):
+    app.dependency_overrides[get_db] = lambda: db_session
+    try:
+        return client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {token}"})
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+def test_token_resolves_to_its_user(client, db_session, db_user):
+    response = _me(client, db_session, create_access_token({"sub": str(db_user.id)}))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["email"] == db_user.email
+
+
+def test_token_with_non_uuid_subject_is_rejected(client, db_session, db_user):
+    response = _me(client, db_session, create_access_token({"sub": "not-a-uuid"}))
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
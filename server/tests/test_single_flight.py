@@ -0,0 +1,128 @@
+"""Tests for single-flight coalescing of identical LLM calls."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.core.metrics import LLM_COALESCED_CALLS
+from app.core.single_flight import SingleFlight, llm_flights, prompt_key
+from app.services.resume_service import (
+    generate_job_requirements_from_description,
+    validate_job_description,
+)
+
+
+class _SlowClient:
+    """Stands in for the Gemini client: answers after a delay and counts calls."""
+
+    def __init__(self, payload: dict, delay: float = 0.05, error: Exception | None = None) -> None:
+        self.calls = 0
+        self._payload = payload
+        self._delay = delay
+        self._error = error
+        self.aio = SimpleNamespace(models=SimpleNamespace(generate_content=self._generate_content))
+
+    async def _generate_content(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        if self._error is not None:
+            raise self._error
+        return SimpleNamespace(text=json.dumps(self._payload))
+
+
+def _coalesced(operation: str) -> float:
+    return LLM_COALESCED_CALLS.labels(operation=operation).value
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_validations_make_one_upstream_call():
+    fake = _SlowClient({"is_valid": True, "reason": "Looks like a job posting."})
+    before = _coalesced("validate_job_description")
+
+    with patch("app.services.resume_service.client", fake):
+        results = await asyncio.gather(
+            validate_job_description("Senior Python developer. FastAPI and PostgreSQL."),
+            validate_job_description("Senior Python developer.  FastAPI and PostgreSQL."),
+            validate_job_description("  Senior Python developer.\tFastAPI and PostgreSQL.\r\n"),
+            *(validate_job_description("Senior Python developer. FastAPI and PostgreSQL.") for _ in range(5)),
+        )
+
+    assert fake.calls == 1
+    assert results == [(True, "Looks like a job posting.")] * 8
+    assert _coalesced("validate_job_description") - before == 7
+    assert llm_flights.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_different_descriptions_are_not_coalesced():
+    fake = _SlowClient({"requirements": ["Python"]})
+
+    with patch("app.services.resume_service.client", fake):
+        await asyncio.gather(
+            generate_job_requirements_from_description("Backend engineer with Python"),
+            generate_job_requirements_from_description("Frontend engineer with React"),
+            generate_job_requirements_from_description("Backend engineer with Python", max_requirements=3),
+        )
+
+    assert fake.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_requirements_are_shared_and_the_next_wave_calls_again():
+    fake = _SlowClient({"requirements": ["5+ years of Python", "FastAPI"]})
+
+    with patch("app.services.resume_service.client", fake):
+        first = await asyncio.gather(
+            *(generate_job_requirements_from_description("Backend engineer with Python") for _ in range(4))
+        )
+        second = await generate_job_requirements_from_description("Backend engineer with Python")
+
+    assert fake.calls == 2
+    assert all(result.requirements == ["5+ years of Python", "FastAPI"] for result in first)
+    assert second.requirements == first[0].requirements
+
+
+@pytest.mark.asyncio
+async def test_upstream_failure_reaches_every_waiter():
+    fake = _SlowClient({}, error=ConnectionError("upstream down"))
+
+    with patch("app.services.resume_service.client", fake):
+        results = await asyncio.gather(
+            *(generate_job_requirements_from_description("Backend engineer with Python") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    assert fake.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_shared_call():
+    flights = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.ensure_future(flights.do("key", work, operation="test"))
+    second = asyncio.ensure_future(flights.do("key", work, operation="test"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == "done"
+    assert first.cancelled()
+    assert calls == 1
+
+
+def test_prompt_key_ignores_whitespace_but_not_operation_or_model():
+    base = prompt_key("generate_requirements", "gemini-2.5-flash", "Python   3\r\n\r\n\r\n  developer ")
+
+    assert base == prompt_key("generate_requirements", "gemini-2.5-flash", "Python 3\n\ndeveloper")
+    assert base != prompt_key("validate_job_description", "gemini-2.5-flash", "Python 3\n\ndeveloper")
+    assert base != prompt_key("generate_requirements", "gemini-2.5-pro", "Python 3\n\ndeveloper")
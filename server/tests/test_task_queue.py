@@ -0,0 +1,227 @@
+"""Tests for the in-process background task queue and deferred enrichment."""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import cast
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.task_queue import BackgroundTaskQueue
+from app.models.database.job_application import JobApplication
+from app.models.job_application import JobApplicationCreate, JobRequirementsResponse
+from app.services.job_application_service import (
+    create_job_application,
+    enrich_job_application_requirements,
+    requeue_pending_enrichments,
+)
+
+
+@pytest.mark.asyncio
+async def test_tasks_enqueued_before_start_run_after_start():
+    queue = BackgroundTaskQueue("test", workers=2)
+    results: list[int] = []
+
+    async def record(value: int) -> None:
+        results.append(value)
+
+    queue.enqueue(record, 1)
+    queue.enqueue(record, 2)
+    assert queue.pending() == 2
+
+    await queue.start()
+    queue.enqueue(record, 3)
+    await queue.join()
+    await queue.stop()
+
+    assert sorted(results) == [1, 2, 3]
+    assert queue.running is False
+
+
+@pytest.mark.asyncio
+async def test_tasks_can_be_enqueued_from_a_thread():
+    queue = BackgroundTaskQueue("test", workers=1)
+    results: list[int] = []
+
+    async def record(value: int) -> None:
+        results.append(value)
+
+    await queue.start()
+    await asyncio.to_thread(queue.enqueue, record, 1)
+    await asyncio.wait_for(queue.join(), timeout=1)
+    await queue.stop()
+
+    assert results == [1]
+
+
+@pytest.mark.asyncio
+async def test_failing_task_does_not_stop_worker():
+    queue = BackgroundTaskQueue("test", workers=1)
+    results: list[str] = []
+
+    async def explode() -> None:
+        raise RuntimeError("boom")
+
+    async def record() -> None:
+        results.append("ran")
+
+    await queue.start()
+    queue.enqueue(explode)
+    queue.enqueue(record)
+    await asyncio.wait_for(queue.join(), timeout=1)
+    await queue.stop()
+
+    assert results == ["ran"]
+
+
+@pytest.mark.asyncio
+async def test_deferred_create_skips_llm_and_enqueues(db_session, db_user):
+    application = JobApplicationCreate(
+        job="Backend Engineer",
+        company="Acme",
+        date="2026-03-28",
+        status="Applied",
+        description="Backend role.",
+        requirements=["Python"],
+    )
+
+    with patch(
+        "app.services.job_application_service.generate_job_requirements_from_description",
+        new_callable=AsyncMock,
+    ) as mock_generate, patch(
+        "app.services.job_application_service.schedule_requirement_enrichment"
+    ) as mock_schedule:
+        created = await create_job_application(
+            cast(Session, db_session), cast(UUID, db_user.id), application, defer_enrichment=True
+        )
+
+    assert mock_generate.await_count == 0
+    assert created.enrichment_status == "pending"
+    assert cast(list[str], created.requirements) == ["Python"]
+    mock_schedule.assert_called_once_with([created.id])
+
+
+def test_requeue_pending_enrichments_on_startup(db_session, db_user):
+    for index, enrichment_status in enumerate(["pending", "complete", "pending"]):
+        db_session.add(JobApplication(
+            user_id=db_user.id,
+            job=f"Job {index}",
+            company="Acme",
+            date="2026-03-28",
+            status="Applied",
+            description="Role.",
+            requirements=[],
+            enrichment_status=enrichment_status,
+        ))
+    db_session.commit()
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    with patch("app.services.job_application_service.schedule_requirement_enrichment") as mock_schedule:
+        requeued = requeue_pending_enrichments(session_factory=factory, batch_size=1)
+
+    assert requeued == 2
+    assert mock_schedule.call_count == 2
+
+
+def _add_application(db_session, db_user, enrichment_status: str, **fields) -> JobApplication:
+    application = JobApplication(
+        user_id=db_user.id,
+        job="Job",
+        company="Acme",
+        date="2026-03-28",
+        status="Applied",
+        description="Role.",
+        enrichment_status=enrichment_status,
+        **{"requirements": [], **fields},
+    )
+    db_session.add(application)
+    db_session.commit()
+    return application
+
+
+def test_requeue_reclaims_only_stale_running_enrichments(db_session, db_user):
+    stale = _add_application(
+        db_session, db_user, "running", enrichment_claimed_at=datetime.utcnow() - timedelta(hours=1)
+    )
+    fresh = _add_application(
+        db_session, db_user, "running",
+        enrichment_claimed_at=datetime.utcnow(),
+        updated_at=datetime.utcnow() - timedelta(hours=1),
+    )
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    with patch("app.services.job_application_service.schedule_requirement_enrichment") as mock_schedule:
+        requeued = requeue_pending_enrichments(session_factory=factory)
+
+    assert requeued == 1
+    mock_schedule.assert_called_once_with([stale.id])
+    db_session.expire_all()
+    assert fresh.enrichment_status == "running"
+
+
+@pytest.mark.asyncio
+async def test_enrichment_enqueued_by_several_processes_calls_the_model_once(db_session, db_user):
+    application = _add_application(db_session, db_user, "pending")
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    with patch(
+        "app.services.job_application_service.generate_job_requirements_from_description",
+        new_callable=AsyncMock,
+        return_value=JobRequirementsResponse(requirements=["Python"]),
+    ) as mock_generate:
+        await enrich_job_application_requirements([application.id], session_factory=factory)
+        await enrich_job_application_requirements([application.id], session_factory=factory)
+
+    assert mock_generate.await_count == 1
+    db_session.expire_all()
+    assert application.enrichment_status == "complete"
+
+
+@pytest.mark.asyncio
+async def test_enrichment_keeps_updated_at_and_merges_edits_made_while_running(db_session, db_user):
+    edited_at = datetime(2026, 3, 1, 12, 0)
+    application = _add_application(db_session, db_user, "pending", requirements=["Python"], updated_at=edited_at)
+    application_id = application.id
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    async def generate(description, max_requirements):
+        other = factory()
+        try:
+            claimed = other.get(JobApplication, application_id)
+            assert claimed.enrichment_status == "running"
+            assert claimed.updated_at == edited_at
+            # The user edits the application while the model is running.
+            claimed.requirements = ["Python", "Kubernetes"]
+            other.commit()
+        finally:
+            other.close()
+        return JobRequirementsResponse(requirements=["FastAPI"])
+
+    with patch("app.services.job_application_service.generate_job_requirements_from_description", side_effect=generate):
+        await enrich_job_application_requirements([application_id], session_factory=factory)
+
+    db_session.expire_all()
+    assert application.enrichment_status == "complete"
+    assert application.requirements == ["Python", "Kubernetes", "FastAPI"]
+    assert application.enrichment_claimed_at is None
+
+
+@pytest.mark.asyncio
+async def test_failed_enrichment_keeps_updated_at(db_session, db_user):
+    edited_at = datetime(2026, 3, 1, 12, 0)
+    application = _add_application(db_session, db_user, "pending", requirements=["Python"], updated_at=edited_at)
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    with patch(
+        "app.services.job_application_service.generate_job_requirements_from_description",
+        new_callable=AsyncMock,
+        side_effect=RuntimeError("model down"),
+    ):
+        await enrich_job_application_requirements([application.id], session_factory=factory)
+
+    db_session.expire_all()
+    assert application.enrichment_status == "failed"
+    assert application.requirements == ["Python"]
+    assert application.updated_at == edited_at
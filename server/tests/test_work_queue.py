@@ -0,0 +1,395 @@
+"""Tests for the database work queue and the standalone worker."""
+
+import asyncio
+import functools
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import UUID, uuid4
+
+from fastapi import status
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from app.core import work_queue as work_queue_module
+from app.core.database import get_db
+from app.core.llm import LLMUnavailableError
+from app.core.work_queue import DONE, FAILED, QUEUED, RUNNING, WorkQueue, enqueue
+from app.main import app
+from app.models.cover_letter import CoverLetterDocument
+from app.models.database.analysis_job import AnalysisJob
+from app.models.database.work_task import WorkTask
+from app.models.resume import ResumeAnalysisResponse
+from app.services import analysis_job_service
+from app.services.analysis_job_service import (
+    RESUME_ANALYSIS_TASK,
+    create_analysis_job,
+    run_analysis_job,
+    run_analysis_task,
+)
+from app.services.cover_letter_job_service import COVER_LETTER_TASK, run_cover_letter_task
+from app.utils.security import get_current_user
+from app.worker import Worker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(work_queue_module, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def queue(db_session):
+    return WorkQueue(engine=db_session.get_bind(), visibility_timeout=30, retry_base_delay=5, retry_max_delay=60)
+
+
+def _enqueue(db_session, count=1, kind="echo", **kwargs):
+    task_ids = [enqueue(db_session, kind, {"n": n}, **kwargs) for n in range(count)]
+    db_session.commit()
+    return task_ids
+
+
+def _task(db_session, task_id) -> WorkTask:
+    return db_session.get(WorkTask, task_id, populate_existing=True)
+
+
+def test_claim_leases_a_batch_oldest_first(db_session, queue, clock):
+    task_ids = _enqueue(db_session, 3)
+
+    first = queue.claim("worker-a", 2)
+    second = queue.claim("worker-b", 2)
+
+    assert {task.id for task in first} | {task.id for task in second} == set(task_ids)
+    assert len(first) == 2 and len(second) == 1
+    assert all(task.attempts == 1 for task in first + second)
+    assert queue.claim("worker-c", 2) == []
+    assert _task(db_session, second[0].id).locked_by == "worker-b"
+
+
+def test_delayed_task_is_not_claimed_early(db_session, queue, clock):
+    _enqueue(db_session, delay=10)
+
+    assert queue.claim("worker-a", 1) == []
+    clock[0] += 11
+    assert len(queue.claim("worker-a", 1)) == 1
+
+
+def test_expired_lease_is_reclaimed_and_stale_worker_cannot_complete(db_session, queue, clock):
+    _enqueue(db_session)
+    (stale,) = queue.claim("worker-a", 1)
+
+    clock[0] += 31
+    (reclaimed,) = queue.claim("worker-b", 1)
+
+    assert reclaimed.id == stale.id
+    assert reclaimed.attempts == 2
+    assert queue.complete("worker-a", stale, {"from": "a"}) is False
+    assert queue.complete("worker-b", reclaimed, {"from": "b"}) is True
+    task = _task(db_session, reclaimed.id)
+    assert task.status == DONE
+    assert task.result == {"from": "b"}
+
+
+def test_heartbeat_keeps_the_lease(db_session, queue, clock):
+    _enqueue(db_session)
+    (claimed,) = queue.claim("worker-a", 1)
+
+    clock[0] += 20
+    assert queue.heartbeat("worker-a", [claimed]) == 1
+    clock[0] += 20
+
+    assert queue.claim("worker-b", 1) == []
+
+
+def test_failed_attempts_back_off_then_fail_for_good(db_session, queue, clock):
+    (task_id,) = _enqueue(db_session, max_attempts=2)
+
+    (first,) = queue.claim("worker-a", 1)
+    assert queue.fail("worker-a", first, "boom") == QUEUED
+    assert _task(db_session, task_id).available_at == clock[0] + 5
+    assert queue.claim("worker-a", 1) == []
+
+    clock[0] += 5
+    (second,) = queue.claim("worker-a", 1)
+    assert second.attempts == 2
+    assert queue.fail("worker-a", second, "boom again") == FAILED
+
+    task = _task(db_session, task_id)
+    assert task.status == FAILED
+    assert task.last_error == "boom again"
+
+
+def test_expired_lease_on_final_attempt_is_marked_failed(db_session, queue, clock):
+    (task_id,) = _enqueue(db_session, max_attempts=1)
+    queue.claim("worker-a", 1)
+
+    clock[0] += 31
+
+    assert queue.claim("worker-b", 1) == []
+    task = _task(db_session, task_id)
+    assert task.status == FAILED
+    assert task.last_error == "Lease expired on the final attempt."
+
+
+def test_finished_tasks_keep_only_the_owner_in_their_payload(db_session, queue, clock):
+    payload = {"user_id": "owner", "resume_text": "Jane Doe, jane@example.com", "request": {"phone": "555"}}
+    done_id, retried_id, failed_id = [enqueue(db_session, "echo", payload, max_attempts=1) for _ in range(3)]
+    expired_id = enqueue(db_session, "echo", payload, max_attempts=1, delay=1)
+    db_session.commit()
+    claimed = {task.id: task for task in queue.claim("worker-a", 3)}
+    done, retried, failed = (claimed[task_id] for task_id in (done_id, retried_id, failed_id))
+
+    queue.complete("worker-a", done, {"ok": True})
+    queue.fail("worker-a", retried, "boom")
+    queue.fail("worker-a", failed, "boom", retryable=False)
+    clock[0] += 1
+    queue.claim("worker-a", 1)
+    clock[0] += 31
+    queue.claim("worker-b", 1)
+
+    for task_id in (done_id, retried_id, failed_id, expired_id):
+        assert _task(db_session, task_id).status in (DONE, FAILED)
+        assert _task(db_session, task_id).payload == {"user_id": "owner"}
+
+
+def test_retried_task_keeps_its_payload(db_session, queue, clock):
+    (task_id,) = _enqueue(db_session, max_attempts=2)
+    (claimed,) = queue.claim("worker-a", 1)
+
+    assert queue.fail("worker-a", claimed, "boom") == QUEUED
+    assert _task(db_session, task_id).payload == {"n": 0}
+
+
+def test_purge_deletes_tasks_finished_before_the_retention(db_session, queue, clock):
+    queue.retention = 60
+    old_id, recent_id, queued_id = _enqueue(db_session, 3)
+    old, recent = queue.claim("worker-a", 2)
+    queue.complete("worker-a", old, None)
+    clock[0] += 30
+    queue.fail("worker-a", recent, "boom", retryable=False)
+    clock[0] += 31
+
+    assert queue.purge() == 1
+    assert _task(db_session, old_id) is None
+    assert _task(db_session, recent_id).status == FAILED
+    assert _task(db_session, queued_id).status == QUEUED
+
+
+def test_pending_counts_queued_tasks_by_kind(db_session, queue, clock):
+    _enqueue(db_session, 2)
+    _enqueue(db_session, kind="other")
+    queue.claim("worker-a", 1, kinds=["other"])
+
+    assert queue.pending("echo") == 2
+    assert queue.pending("other") == 0
+
+
+def test_claim_uses_skip_locked_on_postgresql(queue):
+    sql = str(queue.claim_statement("worker-a", 5, 0.0).compile(dialect=postgresql.dialect()))
+
+    assert "FOR UPDATE SKIP LOCKED" in sql
+    assert "RETURNING" in sql
+
+
+def test_worker_drains_the_queue(db_session, queue, clock):
+    echo_id, flaky_id = _enqueue(db_session, 2)
+    (unknown_id,) = _enqueue(db_session, kind="unknown")
+    seen = []
+
+    async def echo(payload):
+        seen.append(payload["n"])
+        if payload["n"] == 1:
+            raise RuntimeError("flaky")
+        return {"echo": payload["n"]}
+
+    worker = Worker(queue, {"echo": echo}, worker_id="worker-a", concurrency=2, batch_size=2, poll_interval=0.01)
+    processed = asyncio.run(worker.run(drain=True))
+
+    assert processed == 3
+    assert sorted(seen) == [0, 1]
+    assert _task(db_session, echo_id).result == {"echo": 0}
+    flaky = _task(db_session, flaky_id)
+    assert flaky.status == QUEUED
+    assert flaky.last_error == "RuntimeError: flaky"
+    assert _task(db_session, unknown_id).status == FAILED
+
+
+def test_worker_queue_calls_do_not_stall_running_handlers(db_session, queue):
+    _enqueue(db_session, 2)
+    for name in ("claim", "complete"):
+        call = getattr(queue, name)
+        setattr(queue, name, functools.partial(lambda call, *args: (time.sleep(0.1), call(*args))[1], call))
+
+    async def run():
+        gaps = []
+
+        async def tick():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        async def echo(payload):
+            await asyncio.sleep(0.05)
+            return {"echo": payload["n"]}
+
+        ticker = asyncio.create_task(tick())
+        worker = Worker(queue, {"echo": echo}, worker_id="worker-a", concurrency=1, poll_interval=0.01)
+        processed = await worker.run(drain=True)
+        ticker.cancel()
+        return processed, max(gaps)
+
+    processed, longest_gap = asyncio.run(run())
+
+    assert processed == 2
+    assert longest_gap < 0.08
+
+
+def test_database_backend_runs_analysis_on_a_worker(db_session, queue, clock, monkeypatch):
+    monkeypatch.setattr(analysis_job_service, "ANALYSIS_BACKEND", "database")
+    monkeypatch.setattr(analysis_job_service, "work_queue", queue)
+    factory = sessionmaker(bind=db_session.get_bind())
+
+    async def run_task(payload):
+        await run_analysis_job(UUID(payload["job_id"]), session_factory=factory)
+
+    result = ResumeAnalysisResponse(match_score=80, summary="Good fit", strengths=[], gaps=[], recommendations=[])
+    with patch("app.services.analysis_job_service.schedule_analysis_job") as mock_schedule, patch(
+        "app.services.analysis_job_service.validate_job_description",
+        new_callable=AsyncMock,
+        return_value=(True, "Looks like a posting."),
+    ), patch("app.services.analysis_job_service.analyze_resume", new_callable=AsyncMock, return_value=result):
+        job = create_analysis_job(db_session, "Backend engineer with Python.", "Jane Doe")
+        assert queue.pending(RESUME_ANALYSIS_TASK) == 1
+        # One task at a time: the test engine shares a single SQLite connection across threads.
+        worker = Worker(queue, {RESUME_ANALYSIS_TASK: run_task}, worker_id="worker-a", concurrency=1,
+                        poll_interval=0.01)
+        asyncio.run(worker.run(drain=True))
+
+    mock_schedule.assert_not_called()
+    assert db_session.get(AnalysisJob, job.id, populate_existing=True).status == "succeeded"
+
+
+def test_unavailable_model_is_retried_before_the_analysis_job_fails(db_session, queue, clock, monkeypatch):
+    monkeypatch.setattr(analysis_job_service, "ANALYSIS_BACKEND", "database")
+    monkeypatch.setattr(analysis_job_service, "work_queue", queue)
+    factory = sessionmaker(bind=db_session.get_bind())
+    monkeypatch.setattr(
+        analysis_job_service, "run_analysis_job", functools.partial(run_analysis_job, session_factory=factory)
+    )
+    # One task at a time: the test engine shares a single SQLite connection across threads.
+    worker = Worker(queue, {RESUME_ANALYSIS_TASK: run_analysis_task}, worker_id="worker-a", concurrency=1,
+                    poll_interval=0.01)
+
+    with patch(
+        "app.services.analysis_job_service.validate_job_description",
+        new_callable=AsyncMock,
+        side_effect=LLMUnavailableError("open"),
+    ) as mock_validate:
+        job = create_analysis_job(db_session, "Backend engineer with Python.", "Jane Doe")
+        (task_id,) = [task.id for task in db_session.query(WorkTask)]
+        asyncio.run(worker.run(drain=True))
+
+        assert db_session.get(AnalysisJob, job.id, populate_existing=True).status == "running"
+        assert _task(db_session, task_id).status == QUEUED
+
+        for _ in range(2):
+            clock[0] += 120
+            asyncio.run(worker.run(drain=True))
+
+    assert mock_validate.await_count == 3
+    failed = db_session.get(AnalysisJob, job.id, populate_existing=True)
+    assert (failed.status, failed.error_status) == ("failed", status.HTTP_503_SERVICE_UNAVAILABLE)
+    assert _task(db_session, task_id).status == DONE
+
+
+def test_cover_letter_task_returns_model_rejections_as_results():
+    payload = {
+        "user_id": str(uuid4()),
+        "applicant_full_name": "John Doe",
+        "request": {
+            "jobTitle": "Software Engineer",
+            "email": "candidate@example.com",
+            "phone": "+1-555-000-0000",
+            "requirements": ["Python", "FastAPI", "SQL"],
+            "company": "Acme",
+        },
+    }
+    with patch(
+        "app.services.cover_letter_job_service.generate_cover_letter",
+        new_callable=AsyncMock,
+        side_effect=ValueError("AI returned an empty cover letter."),
+    ):
+        result = asyncio.run(run_cover_letter_task(payload))
+
+    assert result == {"error": "AI returned an empty cover letter.", "error_status": status.HTTP_400_BAD_REQUEST}
+
+
+def test_cover_letter_job_endpoints(client, db_session, queue, clock):
+    owner = SimpleNamespace(id=uuid4(), first_name="John", last_name="Doe")
+    document = CoverLetterDocument(
+        id="doc-123",
+        job_title="Software Engineer",
+        hiring_manager_name="Hiring Team",
+        email="candidate@example.com",
+        phone="+1-555-000-0000",
+        company="Acme",
+        requirements=["Python", "FastAPI", "SQL"],
+        cover_letter="Dear Hiring Team,\n\nI am excited to apply.",
+        created_at=datetime.now(timezone.utc),
+    )
+    saved = []
+    store = SimpleNamespace(get=lambda document_id: None, save=saved.append)
+
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_user] = lambda: owner
+    try:
+        submitted = client.post(
+            "/api/v1/cover-letter/generate/jobs",
+            json={
+                "jobTitle": "Software Engineer",
+                "email": "candidate@example.com",
+                "phone": "+1-555-000-0000",
+                "requirements": ["Python", "FastAPI", "SQL"],
+                "company": "Acme",
+            },
+        )
+        pending = client.get(submitted.headers["Location"])
+
+        with patch(
+            "app.services.cover_letter_job_service.generate_cover_letter",
+            new_callable=AsyncMock,
+            return_value=document,
+        ) as mock_generate, patch("app.services.cover_letter_job_service.get_cover_letter_store", return_value=store):
+            worker = Worker(queue, {COVER_LETTER_TASK: run_cover_letter_task}, worker_id="worker-a",
+                            poll_interval=0.01)
+            asyncio.run(worker.run(drain=True))
+            finished = client.get(submitted.headers["Location"])
+
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=uuid4(), first_name="Eve",
+                                                                             last_name="")
+        other_user = client.get(submitted.headers["Location"])
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(get_current_user, None)
+
+    job_id = submitted.json()["id"]
+    assert submitted.status_code == status.HTTP_202_ACCEPTED
+    assert submitted.headers["Location"] == f"/api/v1/cover-letter/generate/jobs/{job_id}"
+    assert pending.json()["status"] == QUEUED
+    assert pending.headers["Retry-After"] == "1"
+
+    assert mock_generate.await_args.kwargs["applicant_full_name"] == "John Doe"
+    assert finished.status_code == status.HTTP_200_OK
+    assert finished.json()["status"] == "succeeded"
+    assert finished.json()["result"]["document_id"] == "doc-123"
+    assert "Retry-After" not in finished.headers
+    assert [saved_document.id for saved_document in saved] == ["doc-123"]
+
+    assert other_user.status_code == status.HTTP_404_NOT_FOUND
+    assert RUNNING not in {task.status for task in db_session.query(WorkTask).all()}